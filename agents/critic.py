@@ -4,26 +4,35 @@
 전문가별 평가를 수행하는 비평가 에이전트입니다.
 OpenAI SDK 직접 호출.
 """
-import json
 import logging
-import re
+import os
+from typing import Callable
 
+from agents.schemas import CritiqueSummary, CritiqueVerdict, SpecialistVerdict
 from data.guidelines import CRITIQUE_RUBRIC
-from utils.llm import call_gpt
+from utils.executor import Priority, get_agent_executor
+from utils.llm import call_gpt_json
+from utils.streaming import make_delta_emitter
+from workflow.rounds import round_label
 from workflow.state import AgentState, CritiqueResult
 from tools.web_search import web_search
 
 logger = logging.getLogger(__name__)
 
+# 5/5 만점이고 남은 개선 조치가 없을 때 Critic이 피드백에 적는 문구
+# (agents.scientist가 다음 라운드 수정 생략 여부를 판단할 때 사용)
+CONVERGED_FEEDBACK_MARKER = "추가 수정 불필요"
 
-SYSTEM_PROMPT = f"""당신은 과학적 타당성을 검증하는 독립적 비평가입니다.
+# 비평 방식: fanout(전문가별 동시 평가 + 요약 호출) | single(전체를 한 번에 평가)
+DEFAULT_CRITIC_MODE = "fanout"
+
+
+# 단일 호출·전문가별 호출이 공유하는 앞부분 (같은 앞부분 → 프롬프트 캐시 공유)
+_PROMPT_HEAD = f"""당신은 과학적 타당성을 검증하는 독립적 비평가입니다.
 
 ## 참고 기준
 {CRITIQUE_RUBRIC}
 
-## 당신의 임무
-각 과학자 에이전트의 분석 결과를 개별적으로 검토하세요.
-
 ## 전문가별 평가 기준
 각 전문가에 대해 다음을 평가하세요:
 1. **근거의 적절성**: 주장을 뒷받침하는 과학적 근거가 충분한가?
@@ -42,75 +51,92 @@ SYSTEM_PROMPT = f"""당신은 과학적 타당성을 검증하는 독립적 비
   1. 이전 라운드 대비 개선된 점 (있다면)
   2. 여전히 남아있는 약점
   3. 5/5 만점을 받기 위해 필요한 구체적 조치
+- 5/5 만점이고 더 이상 개선할 점이 없으면 피드백 끝에 "{CONVERGED_FEEDBACK_MARKER}"라고 적으세요
+- 참고 정보가 제공된 경우 이를 활용하여 더 정확한 검증을 수행하세요."""
+
+SYSTEM_PROMPT = f"""{_PROMPT_HEAD}
+
+## 당신의 임무
+각 과학자 에이전트의 분석 결과를 개별적으로 검토하세요.
 
 ## 출력 형식 (JSON)
-{{
-  "decision": "continue",
-  "feedback": "전체 요약 피드백 (주요 쟁점, 합의된 사항, 미해결 사항)",
-  "scores": {{"전문가역할명1": 4, "전문가역할명2": 3}},
-  "specialist_feedback": {{
-    "전문가역할명1": "구체적 피드백 (강점, 약점, 개선 지시)",
-    "전문가역할명2": "구체적 피드백 ..."
-  }}
-}}
-
-★ scores 필드는 반드시 포함하세요. 각 전문가에 대해 1~5 사이의 정수 점수를 부여하세요.
-  예: "scores": {{"NGT 분자생물학 전문가": 4, "식품안전성 평가 전문가": 3}}
-
-참고 정보가 제공된 경우 이를 활용하여 더 정확한 검증을 수행하세요.
-반드시 JSON만 출력하세요. 다른 설명은 불필요합니다.
+- decision: "continue" 또는 "approve" (참고용 - 회의 진행 여부는 라운드 정책이 점수로 결정)
+- feedback: 전체 요약 피드백 (주요 쟁점, 합의된 사항, 미해결 사항)
+- specialists: 전문가별 평가 배열
+  - role: 분석 결과 헤더의 전문가 역할명 그대로
+  - score: 1~5 사이의 정수 점수
+  - feedback: 구체적 피드백 (강점, 약점, 개선 지시)
+
+★ 모든 전문가를 specialists에 빠짐없이 포함하세요.
 """.strip()
 
+# 전문가별 개별 비평(fan-out) - 한 번에 전문가 1명만 평가
+SPECIALIST_SYSTEM_PROMPT = f"""{_PROMPT_HEAD}
 
-def run_critic(state: AgentState) -> dict:
-    """Critic 에이전트 실행 - 전문가별 평가"""
-    current_round = state.get("current_round", 1)
-    specialist_outputs = state.get("specialist_outputs", [])
+## 당신의 임무
+요청에 포함된 전문가 1명의 분석 결과만 검토하세요. 팀 전체 요약은 별도 단계에서 작성됩니다.
 
-    print(f"\n{'#'*80}")
-    print(f"[CRITIC] Starting Critic agent - Round {current_round}/3")
-    print(f"  Specialist outputs: {len(specialist_outputs)}")
-    print(f"{'#'*80}\n")
+## 출력 형식 (JSON)
+- role: 평가 대상 전문가의 역할명 그대로
+- score: 1~5 사이의 정수 점수
+- feedback: 이 전문가에 대한 구체적 피드백 (강점, 약점, 개선 지시)
+""".strip()
 
-    # Step 1: 웹 검색으로 검증 정보 수집
-    web_context = ""
-    try:
-        web_result = web_search.invoke({"query": f"{state['topic']} NGT safety regulation verification"})
-        web_context = f"\n\n## [웹 검색 결과 - 검증 참고]\n{web_result}"
-        logger.info("Critic web search completed")
-    except Exception as e:
-        logger.warning(f"Critic web search failed: {e}")
 
-    # Step 2: 전문가별 분석 결과 구성
-    specialist_context = ""
-    for so in specialist_outputs:
-        specialist_context += (
-            f"\n\n### [{so.get('role', '전문가')}] ({so.get('focus', '')})\n"
-            f"{so.get('output', '')}\n"
-        )
+# 전문가별 개별 비평(fan-out) 응답 최대 토큰 수
+FANOUT_MAX_TOKENS = 4096
+
+# 전문가별 비평 결과를 합치는 요약 호출 최대 토큰 수
+SUMMARY_MAX_TOKENS = 2048
+
+SUMMARY_SYSTEM_PROMPT = """당신은 과학적 타당성을 검증하는 독립적 비평가입니다.
+각 전문가에 대한 개별 평가(점수와 피드백)가 주어집니다.
+전문가 간 공통 쟁점, 합의된 사항, 상충하거나 미해결된 사항을 중심으로
+팀 전체에 대한 요약 피드백을 간결하게 작성하세요.
+
+## 출력 형식 (JSON)
+- decision: "continue" 또는 "approve" (참고용 - 회의 진행 여부는 라운드 정책이 점수로 결정)
+- feedback: 전체 요약 피드백 (주요 쟁점, 합의된 사항, 미해결 사항)"""
 
-    # 이전 라운드 기록 참조 (전문가별 점수·피드백 누적)
-    meeting_history = state.get("meeting_history", [])
+
+def _history_lines(meeting_history: list[dict], role: str | None = None) -> str:
+    """이전 라운드 비평 기록 (role을 주면 해당 전문가의 점수·피드백만)"""
     history_context = ""
-    if meeting_history:
-        for record in meeting_history:
-            round_num = record.get("round", 0)
-            scores = record.get("critique_scores", {})
-            feedback = record.get("critique_feedback", "")
-            spec_fb = record.get("specialist_feedback", {})
-            history_context += f"\n[라운드 {round_num} 비평 기록]\n"
-            history_context += f"전체 피드백: {feedback}\n"
-            if scores:
-                history_context += "전문가별 점수:\n"
-                for role, score in scores.items():
-                    history_context += f"  - {role}: {score}/5\n"
-            if spec_fb:
-                history_context += "전문가별 상세 피드백:\n"
-                for role, fb in spec_fb.items():
-                    history_context += f"  - {role}: {fb}\n"
-
-    # Step 3: 프롬프트 구성
-    user_message = f"""[팀 회의 라운드 {current_round}/3 - 비평 단계]
+    for record in meeting_history:
+        round_num = record.get("round", 0)
+        scores = record.get("critique_scores", {})
+        feedback = record.get("critique_feedback", "")
+        spec_fb = record.get("specialist_feedback", {})
+        if role is not None:
+            scores = {role: scores[role]} if role in scores else {}
+            spec_fb = {role: spec_fb[role]} if role in spec_fb else {}
+        history_context += f"\n[라운드 {round_num} 비평 기록]\n"
+        history_context += f"전체 피드백: {feedback}\n"
+        if scores:
+            history_context += "전문가별 점수:\n"
+            for r, score in scores.items():
+                history_context += f"  - {r}: {score}/5\n"
+        if spec_fb:
+            history_context += "전문가별 상세 피드백:\n"
+            for r, fb in spec_fb.items():
+                history_context += f"  - {r}: {fb}\n"
+    return history_context
+
+
+def _specialist_block(so: dict) -> str:
+    return (
+        f"\n\n### [{so.get('role', '전문가')}] ({so.get('focus', '')})\n"
+        f"{so.get('output', '')}\n"
+    )
+
+
+def _critique_single(state: AgentState, web_context: str) -> CritiqueResult:
+    """전체 전문가 결과를 한 번의 호출로 평가 (CRITIC_MODE=single, fan-out 전체 실패 시)"""
+    current_round = state.get("current_round", 1)
+    specialist_context = "".join(_specialist_block(so) for so in state.get("specialist_outputs", []))
+    history_context = _history_lines(state.get("meeting_history", []))
+
+    user_message = f"""[팀 회의 라운드 {round_label(state)} - 비평 단계]
 
 [전문가별 분석 결과]
 {specialist_context}
@@ -119,86 +145,250 @@ def run_critic(state: AgentState) -> dict:
 {f'[이전 라운드 비평 기록]{history_context}' if history_context else ''}
 
 위 전문가들의 분석 결과를 개별적으로 검토하고, JSON 형식으로 응답하세요.
-각 전문가의 역할명을 키로 사용하세요.
+specialists의 role에는 각 전문가의 역할명을 그대로 사용하세요.
 
 ★ 라운드 {current_round} 채점 원칙:
 - 이전 라운드에서 지적한 약점이 해결되었으면 점수를 반드시 올려주세요.
 - 이전 강점이 유지되고 있으면 점수를 내리지 마세요.
-- specialist_feedback에 "개선된 점", "남은 약점", "5점을 위한 조치"를 포함하세요."""
+- 전문가별 feedback에 "개선된 점", "남은 약점", "5점을 위한 조치"를 포함하세요."""
 
-    # Step 4: OpenAI 직접 호출
-    print(f"[CRITIC] Calling OpenAI API via call_gpt")
+    print(f"[CRITIC] Calling OpenAI API via call_gpt_json")
     logger.info("Critic: Calling OpenAI directly...")
 
+    # 구조화 출력(JSON schema) 조각은 타임라인에 그대로 보여줄 수 없으므로 스트리밍하지 않고
+    # 검증된 피드백을 한 번에 전달
+    on_delta = make_delta_emitter("Critic", "critique", round=current_round)
     try:
-        response_content = call_gpt(SYSTEM_PROMPT, user_message)
-        print(f"[CRITIC] OpenAI call succeeded - Response: {len(response_content)} chars")
-    except Exception as e:
-        print(f"[CRITIC ERROR] {type(e).__name__}: {e}")
-        raise
+        verdict = call_gpt_json(SYSTEM_PROMPT, user_message, CritiqueVerdict, call_site="critique")
+        if on_delta:
+            on_delta(_verdict_text(verdict.specialists, verdict.feedback))
+        return verdict.to_critique_result()
+    except ValueError as e:
+        # 재요청 후에도 스키마 검증 실패 (응답 잘림 등) - 점수 없이 진행
+        logger.warning(f"Critic verdict invalid: {e}, defaulting to continue")
+        return CritiqueResult(
+            decision="continue",
+            feedback="비평 응답 검증 실패",
+            scores={},
+            specialist_feedback={},
+        )
+
 
-    # JSON 파싱
+def _fanout_prefix(state: AgentState, web_context: str) -> str:
+    """전문가별 비평 호출의 공통 앞부분 (모든 전문가에게 동일 → 프롬프트 캐시 공유)"""
+    current_round = state.get("current_round", 1)
+    overall_history = "".join(
+        f"\n[라운드 {record.get('round', 0)} 전체 피드백]\n{record.get('critique_feedback', '')}\n"
+        for record in state.get("meeting_history", [])
+    )
+    return f"""[팀 회의 라운드 {round_label(state)} - 비평 단계 (전문가별 개별 평가)]
+{web_context}
+
+{f'[이전 라운드 전체 비평 기록]{overall_history}' if overall_history else ''}
+
+★ 라운드 {current_round} 채점 원칙:
+- 이전 라운드에서 지적한 약점이 해결되었으면 점수를 반드시 올려주세요.
+- 이전 강점이 유지되고 있으면 점수를 내리지 마세요.
+- feedback에 "개선된 점", "남은 약점", "5점을 위한 조치"를 포함하세요.
+
+아래 전문가 1명의 분석 결과만 평가하고 JSON(role, score, feedback)으로 응답하세요.
+"""
+
+
+def critique_specialist(
+    state: AgentState, so: dict, web_context: str, on_delta: Callable[[str], None] | None = None
+) -> SpecialistVerdict:
+    """전문가 1명의 분석 결과 평가 (fan-out 비평 단위)
+
+    state의 current_round, meeting_history로 라운드 표기와 이전 비평 기록을 구성합니다.
+    on_delta에는 응답 JSON 조각 대신 검증된 점수·피드백을 한 번 전달합니다.
+
+    Raises:
+        ValueError: 응답이 스키마를 만족하지 않는 경우
+    """
+    role = so.get("role", "전문가")
+    history = _history_lines(state.get("meeting_history", []), role)
+    user_message = (
+        f"{_fanout_prefix(state, web_context)}\n[평가 대상 전문가]{_specialist_block(so)}"
+        f"{f'{chr(10)}[이 전문가의 이전 라운드 비평 기록]{history}' if history else ''}"
+    )
+    verdict = call_gpt_json(
+        SPECIALIST_SYSTEM_PROMPT, user_message, SpecialistVerdict, max_tokens=FANOUT_MAX_TOKENS,
+        call_site="critique.specialist",
+    )
+    # 역할명은 응답이 아니라 입력 기준으로 고정 (점수 매핑 키)
+    verdict = verdict.model_copy(update={"role": role})
+    if on_delta:
+        on_delta(_verdict_text([verdict]))
+    return verdict
+
+
+def _verdict_text(verdicts: list[SpecialistVerdict], feedback: str = "") -> str:
+    """타임라인에 표시할 비평 결과 (검증된 구조화 응답 기준)"""
+    lines = [f"### {v.role} ({v.score}/5)\n{v.feedback}" for v in verdicts]
+    if feedback:
+        lines.append(feedback)
+    return "\n\n".join(lines)
+
+
+def merge_critiques(state: AgentState, verdicts: list[SpecialistVerdict]) -> CritiqueResult:
+    """전문가별 비평을 하나의 CritiqueResult로 합침 (전체 피드백은 짧은 요약 호출)"""
+    summary_input = "\n\n".join(f"### {v.role} ({v.score}/5)\n{v.feedback}" for v in verdicts)
     try:
-        content = response_content.strip()
-        if content.startswith("```"):
-            lines = content.split("\n")
-            content = "\n".join(lines[1:-1])
-
-        data = json.loads(content)
-        raw_scores = data.get("scores", {})
-        scores = {}
-        for k, v in raw_scores.items():
-            try:
-                scores[k] = int(v)
-            except (ValueError, TypeError):
-                # "4/5", "4점", "4 점" 등 변형 파싱
-                m = re.search(r'(\d)', str(v))
-                scores[k] = int(m.group(1)) if m else 3
-
-        decision = data.get("decision", "continue")
-        feedback = data.get("feedback", "")
-        specialist_feedback = data.get("specialist_feedback", {})
-
-        # 점수가 비어있으면 content에서 점수 패턴 추출 시도
-        if not scores and specialist_feedback:
-            for role in specialist_feedback:
-                scores[role] = 3
-            logger.info(f"Critic scores empty, assigned default 3 for {list(scores.keys())}")
-
-        # 전문가별 피드백은 있는데 점수에 해당 키가 없는 경우 보충
-        for role in specialist_feedback:
-            if role not in scores:
-                scores[role] = 3
-
-        critique = CritiqueResult(
-            decision=decision,
-            feedback=feedback,
-            scores=scores,
-            specialist_feedback=specialist_feedback,
+        summary = call_gpt_json(
+            SUMMARY_SYSTEM_PROMPT,
+            f"[팀 회의 라운드 {round_label(state)} - 전문가별 평가]\n\n{summary_input}",
+            CritiqueSummary,
+            max_tokens=SUMMARY_MAX_TOKENS,
+            call_site="critique.summary",
         )
+        decision, feedback = summary.decision, summary.feedback
+    except Exception as e:
+        logger.warning(f"Critic summary failed: {e}, using per-specialist scores only")
+        decision = "continue"
+        feedback = "\n".join(f"- {v.role}: {v.score}/5" for v in verdicts)
 
-        print(f"[CRITIC] Decision: {decision}, Scores: {scores}")
-        if specialist_feedback:
-            print(f"[CRITIC] Specialist feedback keys: {list(specialist_feedback.keys())}")
-
-    except (json.JSONDecodeError, KeyError) as e:
-        logger.warning(f"Critic JSON parse failed: {e}, defaulting to continue")
-        # 파싱 실패 시 content에서 점수 패턴 추출 시도
-        fallback_scores = {}
-        for m in re.finditer(r'["\']([^"\']+)["\']\s*:\s*(\d)\s*/\s*5', response_content):
-            fallback_scores[m.group(1)] = int(m.group(2))
-        if not fallback_scores:
-            # "전문가명": 4 패턴도 시도
-            for m in re.finditer(r'["\']([^"\']+)["\']\s*:\s*(\d)', response_content):
-                name, val = m.group(1), int(m.group(2))
-                if 1 <= val <= 5 and name not in ("decision", "feedback", "scores", "specialist_feedback"):
-                    fallback_scores[name] = val
-        critique = CritiqueResult(
-            decision="continue",
-            feedback=response_content[:500] if not fallback_scores else "JSON 파싱 실패, 점수만 추출됨",
-            scores=fallback_scores,
-            specialist_feedback={},
+    return CritiqueVerdict(decision=decision, feedback=feedback, specialists=verdicts).to_critique_result()
+
+
+def _critique_fanout(state: AgentState, web_context: str) -> CritiqueResult | None:
+    """전문가별 개별 비평을 동시에 실행한 뒤 요약 호출로 합침
+
+    모든 호출이 같은 system prompt(SPECIALIST_SYSTEM_PROMPT)와 공통 맥락(웹 검색, 라운드 요약)으로 시작하고
+    전문가별 내용은 맨 뒤에 두어, 동일한 앞부분이 OpenAI 프롬프트 캐시를 공유합니다.
+
+    수렴하여 이번 라운드 수정을 생략한(carried_forward) 전문가는 다시 평가하지 않고 이전 라운드
+    점수·피드백을 그대로 사용합니다 (같은 글을 다시 채점하면 점수가 흔들려 수렴 여부가 바뀔 수 있음).
+    일부 전문가 비평이 실패하면 그 전문가들만 단일 호출로 다시 평가합니다.
+
+    Returns:
+        CritiqueResult. 모든 전문가 비평이 실패하면 None (호출 측에서 단일 호출로 대체)
+    """
+    current_round = state.get("current_round", 1)
+    specialist_outputs = state.get("specialist_outputs", [])
+
+    verdicts: dict[int, SpecialistVerdict] = {}
+    for i, so in enumerate(specialist_outputs):
+        carried = _carried_verdict(state, so)
+        if carried is not None:
+            verdicts[i] = carried
+    pending = [i for i in range(len(specialist_outputs)) if i not in verdicts]
+    if verdicts:
+        print(f"[CRITIC] FAN-OUT: reusing previous verdicts for {', '.join(v.role for v in verdicts.values())}")
+    print(f"[CRITIC] FAN-OUT: {len(pending)} specialist critiques running concurrently")
+    executor = get_agent_executor()
+    futures = {
+        executor.submit(
+            critique_specialist,
+            state,
+            so,
+            web_context,
+            make_delta_emitter(f"Critic ({so.get('role', '전문가')})", "critique", round=current_round),
+            priority=Priority.CRITICAL,
+            run_id=state.get("run_id", ""),
+        ): i
+        for i, so in enumerate(specialist_outputs)
+        if i in pending
+    }
+    for future in executor.as_completed(futures):
+        i = futures[future]
+        try:
+            verdicts[i] = future.result()
+        except Exception as e:
+            logger.warning(f"Critic fan-out failed for {specialist_outputs[i].get('role', '전문가')}: {e}")
+
+    if pending and not any(i in verdicts for i in pending):
+        return None
+
+    missing = [i for i in range(len(specialist_outputs)) if i not in verdicts]
+    if missing:
+        # 점수가 빠지면 적응형 라운드 정책이 남은 전문가만 보고 "target"으로 종료할 수 있으므로
+        # 실패한 전문가만 모아 단일 호출로 다시 평가
+        verdicts.update(_critique_missing(state, web_context, missing))
+
+    # 입력(팀) 순서 유지
+    return merge_critiques(state, [verdicts[i] for i in sorted(verdicts)])
+
+
+def _carried_verdict(state: AgentState, so: dict) -> SpecialistVerdict | None:
+    """수정을 생략한 전문가의 가장 최근 라운드 평가 (meeting_history 기준, 없으면 None)"""
+    if not so.get("carried_forward"):
+        return None
+    role = so.get("role", "전문가")
+    for record in reversed(state.get("meeting_history", [])):
+        score = record.get("critique_scores", {}).get(role)
+        if score is not None:
+            return SpecialistVerdict(
+                role=role, score=int(score), feedback=record.get("specialist_feedback", {}).get(role, "")
+            )
+    return None
+
+
+def _critique_missing(state: AgentState, web_context: str, indices: list[int]) -> dict[int, SpecialistVerdict]:
+    """fan-out에서 실패한 전문가들을 단일 호출로 평가 (실패 시 빈 dict)"""
+    specialist_outputs = state.get("specialist_outputs", [])
+    roles = [specialist_outputs[i].get("role", "전문가") for i in indices]
+    print(f"[CRITIC] FAN-OUT fallback: single-call critique for {', '.join(roles)}")
+    try:
+        result = _critique_single(
+            {**state, "specialist_outputs": [specialist_outputs[i] for i in indices]}, web_context
         )
+    except Exception as e:
+        logger.warning(f"Critic fallback failed for {', '.join(roles)}: {e}")
+        return {}
+
+    recovered = {}
+    for i, role in zip(indices, roles):
+        try:
+            recovered[i] = SpecialistVerdict(
+                role=role, score=int(result.scores[role]), feedback=result.specialist_feedback.get(role, "")
+            )
+        except (KeyError, TypeError, ValueError):
+            logger.warning(f"Critic fallback returned no score for {role}")
+    return recovered
+
+
+def critic_web_context(topic: str) -> str:
+    """비평 검증용 웹 검색 결과 (실패 시 빈 문자열)"""
+    try:
+        web_result = web_search.invoke({"query": f"{topic} NGT safety regulation verification"})
+        logger.info("Critic web search completed")
+        return f"\n\n## [웹 검색 결과 - 검증 참고]\n{web_result}"
+    except Exception as e:
+        logger.warning(f"Critic web search failed: {e}")
+        return ""
+
+
+def run_critic(state: AgentState) -> dict:
+    """Critic 에이전트 실행 - 전문가별 평가
+
+    CRITIC_MODE=fanout(기본)이면 전문가별로 동시에 평가한 뒤 짧은 요약 호출로 합치고,
+    single이면 전체 결과를 한 번의 호출로 평가합니다.
+    """
+    current_round = state.get("current_round", 1)
+    specialist_outputs = state.get("specialist_outputs", [])
+    mode = os.environ.get("CRITIC_MODE", DEFAULT_CRITIC_MODE).lower()
+
+    print(f"\n{'#'*80}")
+    print(f"[CRITIC] Starting Critic agent - Round {round_label(state)}")
+    print(f"  Specialist outputs: {len(specialist_outputs)}")
+    print(f"  Mode: {mode}")
+    print(f"{'#'*80}\n")
+
+    # Step 1: 웹 검색으로 검증 정보 수집
+    web_context = critic_web_context(state["topic"])
+
+    # Step 2: 평가 (전문가별 동시 평가 또는 단일 호출)
+    try:
+        critique = None
+        if mode == "fanout" and specialist_outputs:
+            critique = _critique_fanout(state, web_context)
+        if critique is None:
+            critique = _critique_single(state, web_context)
+        print(f"[CRITIC] Decision: {critique.decision}, Scores: {critique.scores}")
+    except Exception as e:
+        print(f"[CRITIC ERROR] {type(e).__name__}: {e}")
+        raise
 
     # 메시지 로그
     messages = list(state.get("messages", []))
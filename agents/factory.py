@@ -6,11 +6,15 @@
 전문가 프로필을 받아 동적으로 System Prompt를 생성하고
 LangChain ChatOpenAI 인스턴스를 래핑한 에이전트를 반환합니다.
 """
-from typing import Any
+from typing import Any, Callable, TypeVar
 
-from utils.llm import call_gpt
+from pydantic import BaseModel
+
+from utils.llm import LONG_OUTPUT_CONTINUATIONS, call_gpt, call_gpt_json
 from data.guidelines import RESEARCH_AGENDA
 
+T = TypeVar("T", bound=BaseModel)
+
 
 def generate_system_prompt(profile: dict) -> str:
     """프로필로부터 System Prompt 생성
@@ -61,17 +65,49 @@ class SpecialistAgent:
         """
         self.system_prompt = system_prompt
 
-    def invoke(self, query: str, max_tokens: int = 32768) -> str:
+    def invoke(
+        self,
+        query: str,
+        max_tokens: int = 32768,
+        on_delta: Callable[[str], None] | None = None,
+        continuations: int = LONG_OUTPUT_CONTINUATIONS,
+        call_site: str = "specialist",
+    ) -> str:
         """전문가 에이전트 실행
 
         Args:
             query: 사용자 질문
             max_tokens: 최대 생성 토큰 수 (기본: 32768)
+            on_delta: 생성 중인 텍스트 조각을 받을 콜백 (지정 시 스트리밍)
+            continuations: max_tokens에 걸려 잘린 경우 이어쓰기 요청 최대 횟수
+            call_site: 호출 지점 이름 (속도 제한 포화 시 호출 순서 결정에 사용)
 
         Returns:
             str: LLM 응답 내용
         """
-        return call_gpt(self.system_prompt, query, max_tokens=max_tokens)
+        return call_gpt(
+            self.system_prompt, query, max_tokens=max_tokens, on_delta=on_delta, continuations=continuations,
+            call_site=call_site,
+        )
+
+    def invoke_json(
+        self, query: str, output_type: type[T], max_tokens: int = 8192, call_site: str = "specialist"
+    ) -> T:
+        """전문가 에이전트 구조화 출력 실행
+
+        Args:
+            query: 사용자 질문
+            output_type: 응답 스키마 (strict JSON schema로 요청)
+            max_tokens: 최대 생성 토큰 수
+            call_site: 호출 지점 이름
+
+        Returns:
+            output_type 인스턴스
+
+        Raises:
+            ValueError: 응답이 스키마를 만족하지 않는 경우
+        """
+        return call_gpt_json(self.system_prompt, query, output_type, max_tokens=max_tokens, call_site=call_site)
 
 
 def create_specialist(profile: dict) -> SpecialistAgent:
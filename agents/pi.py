@@ -1,18 +1,31 @@
 """PI (Principal Investigator) Agent
 
 연구 프로젝트의 총괄 책임자 역할을 수행합니다.
-3라운드 팀 회의 워크플로우: planning, round summary, final synthesis.
+라운드별 팀 회의 워크플로우: planning, round summary, final synthesis.
 OpenAI SDK 직접 호출.
 """
-import json
+import hashlib
 import logging
+import math
+import os
 import re
+import uuid
 from collections import Counter
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List
 
-from utils.llm import call_gpt
+from agents.schemas import IntroductionBatch, RoleClustering, TeamDecision, TeamSelection
+from agents.synthesis import round_blocks, round_stages, synthesize_report
+from utils.cache import CacheBackend, create_cache_backend
+from utils.clustering import cluster_by_similarity
+from utils.embeddings import EmbeddingClient, get_embedding_client
+from utils.executor import Priority, get_agent_executor, run_context
+from utils.llm import LONG_OUTPUT_CONTINUATIONS, call_gpt, call_gpt_json, call_gpt_json_samples
+from utils.planning_cache import get_planning_cache
+from utils.prefetch import discard_run, prefetch, resolve_prefetched
+from utils.role_registry import get_role_registry
+from utils.streaming import make_delta_emitter
 from data.guidelines import RESEARCH_AGENDA
+from workflow.rounds import DEFAULT_MAX_ROUNDS, completed_rounds, round_label
 from workflow.state import AgentState
 from tools.web_search import web_search
 
@@ -65,7 +78,23 @@ def _extract_sources(text: str) -> list[str]:
 logger = logging.getLogger(__name__)
 
 
-SYSTEM_PROMPT = f"""당신은 연구 프로젝트의 총괄 책임자(PI)입니다.
+def _deepening_flow(num_rounds: int) -> str:
+    """라운드별 심화 흐름 한 줄 요약 (단일 호출 보고서 프롬프트용)"""
+    if num_rounds <= 1:
+        return "라운드 1에서 전문가 분석 → Critic 검증 → PI 종합을 거쳐 결론 도출."
+    if num_rounds == 2:
+        return "라운드 1의 초기 분석 → 라운드 2에서 Critic 피드백 반영 보완 및 최종 정제."
+    middle = "라운드 2" if num_rounds == 3 else f"라운드 2~{num_rounds - 1}"
+    return f"라운드 1의 초기 분석 → {middle}에서 Critic 피드백 반영 보완 → 라운드 {num_rounds}에서 최종 정제."
+
+
+def build_system_prompt(num_rounds: int = DEFAULT_MAX_ROUNDS) -> str:
+    """단일 호출 최종 보고서 프롬프트 (보고서 구조를 실제 진행된 라운드 수에 맞춤)"""
+    process_steps = "\n".join(
+        f"{r}. **{title.split(':')[0]}**: {flow}" for r, (title, flow) in enumerate(round_stages(num_rounds), start=1)
+    )
+    same_structure = "\n\n".join(f"### {title}\n(위와 동일한 구조)" for title, _ in round_stages(num_rounds))
+    return f"""당신은 연구 프로젝트의 총괄 책임자(PI)입니다.
 
 ## 연구 아젠다
 {RESEARCH_AGENDA}
@@ -91,10 +120,8 @@ Scientist와 Critic의 논의를 거쳐 승인된 초안을 바탕으로, 아래
 - **전문가 패널(Specialists)**: PI가 연구 주제에 맞게 구성한 다학제 전문가들이 각자 전문 분야의 분석 수행
 - **독립 비평가(Critic)**: 전문가별 분석의 과학적 타당성, 논리적 일관성, 근거 충분성을 독립적으로 검증하고 1-5점 척도로 평가
 
-### 3라운드 반복 심화 프로세스
-1. **라운드 1**: 전문가 초기 분석 → 비평가 엄격 검증 → PI 쟁점 정리 및 임시 결론
-2. **라운드 2**: 비평가 피드백 반영한 전문가 보완 분석 → 재검증 → PI 중간 종합
-3. **라운드 3**: 최종 정제 분석 → 최종 검증 → PI 최종 종합 및 보고서 작성
+### {num_rounds}라운드 반복 심화 프로세스
+{process_steps}
 
 각 라운드에서 비평가의 전문가별 점수와 구체적 피드백이 다음 라운드의 분석 개선에 직접 반영되며,
 이 반복 과정을 통해 분석의 깊이와 정확성이 점진적으로 향상된다.
@@ -107,12 +134,14 @@ Scientist와 Critic의 논의를 거쳐 승인된 초안을 바탕으로, 아래
 ### 연구 팀 구성 과정
 
 #### 통계적 팀 구성 방법
-본 연구의 재현성을 확보하기 위해, PI는 10회 독립적 팀 구성 실험을 수행하고
+본 연구의 재현성을 확보하기 위해, PI는 K회 독립적 팀 구성 실험을 수행하고
 역할별 등장 빈도를 분석하여 최종 연구팀을 선정하였다.
 
-##### 10회 시뮬레이션 전체 결과
-(아래 정보가 제공되면 포함할 것)
-- **총 생성된 과학자 에이전트 수**: 10회 실험에서 총 N명의 과학자 에이전트가 생성됨
+##### 팀 구성 실험 전체 결과
+(아래 정보가 제공되면 포함할 것. 실험 횟수 K는 제공된 팀 구성 데이터의 값을 그대로 사용할 것 -
+역할 순위가 안정되어 조기 종료한 경우 요청 횟수보다 적으며, 이 경우 조기 종료 사실도 서술)
+- **실험 횟수**: 최대 요청 횟수와 실제 수행 횟수(K회)
+- **총 생성된 과학자 에이전트 수**: K회 실험에서 총 N명의 과학자 에이전트가 생성됨
 - **시행별 팀 구성 테이블**:
 
 | 시행 | 팀 규모 | 구성원 역할 |
@@ -125,7 +154,7 @@ Scientist와 Critic의 논의를 거쳐 승인된 초안을 바탕으로, 아래
 
 | 역할 | 등장 횟수 | 백분율 | 전문분야 변형 |
 |------|----------|--------|-------------|
-| 역할1 | N회/10회 | N% | 변형1, 변형2 |
+| 역할1 | N회/K회 | N% | 변형1, 변형2 |
 | ... | ... | ... | ... |
 
 ##### 팀 규모 분포
@@ -159,72 +188,31 @@ off-target 빈도와 특성을 비교 분석하는 역할을 담당하겠습니
 
 ## 핵심 질문 1: 식품에 적용되는 유전자편집기술의 분류 기준과 특성
 
-### 라운드 1: 초기 분석
-각 과학자 에이전트의 초기 분석 결과를 전문가별로 제시.
-Critic의 평가 점수(1-5점) 및 구체적 피드백 포함.
-PI의 1라운드 종합: 주요 쟁점, 합의 사항, 임시 결론.
-
-### 라운드 2: 비평 반영 보완
-Critic 피드백을 반영한 각 과학자의 보완 분석.
-Critic의 재평가 및 점수 변화 포함.
-PI의 2라운드 종합: 개선된 분석 포인트, 잔여 쟁점.
-
-### 라운드 3: 최종 정제
-각 과학자의 최종 정제된 분석.
-Critic의 최종 평가 포함.
-PI의 최종 종합 및 결론: 이 질문에 대한 확정된 답변.
+{round_blocks(num_rounds)}
 
 ---
 
 ## 핵심 질문 2: 유전자편집기술 분류별 우선 고려 위험요소
 
-### 라운드 1: 초기 분석
-(위와 동일한 구조: 전문가별 분석 → Critic 평가 → PI 종합)
-
-### 라운드 2: 비평 반영 보완
-(위와 동일한 구조)
-
-### 라운드 3: 최종 정제
-(위와 동일한 구조)
+{same_structure}
 
 ---
 
 ## 핵심 질문 3: 기존 위험평가 지침의 적용 가능성과 충분성
 
-### 라운드 1: 초기 분석
-(위와 동일한 구조)
-
-### 라운드 2: 비평 반영 보완
-(위와 동일한 구조)
-
-### 라운드 3: 최종 정제
-(위와 동일한 구조)
+{same_structure}
 
 ---
 
 ## 핵심 질문 4: 평가 항목 보완 및 기술적·실험적 평가 방법
 
-### 라운드 1: 초기 분석
-(위와 동일한 구조)
-
-### 라운드 2: 비평 반영 보완
-(위와 동일한 구조)
-
-### 라운드 3: 최종 정제
-(위와 동일한 구조)
+{same_structure}
 
 ---
 
 ## 핵심 질문 5: 단계적 의사결정 흐름 구성
 
-### 라운드 1: 초기 분석
-(위와 동일한 구조)
-
-### 라운드 2: 비평 반영 보완
-(위와 동일한 구조)
-
-### 라운드 3: 최종 정제
-(위와 동일한 구조)
+{same_structure}
 
 ---
 
@@ -267,24 +255,28 @@ graph TD
 ```
 
 **중요**:
-- 반드시 위 5개 핵심 질문 각각에 대해 3라운드 구조를 빠짐없이 포함해야 합니다.
+- 팀 회의는 {num_rounds}라운드로 진행되었습니다. 위 5개 핵심 질문 각각에 대해 {num_rounds}라운드 구조를 빠짐없이 포함하고, 진행되지 않은 라운드를 지어내지 마세요.
 - 각 라운드에서 전문가별 분석, Critic 평가(점수 포함), PI 종합을 모두 서술하세요.
-- 각 핵심 질문의 최종 라운드(라운드 3)에서는 해당 질문에 대한 확정된 결론을 명확히 도출하세요.
+- 각 핵심 질문의 최종 라운드(라운드 {num_rounds})에서는 해당 질문에 대한 확정된 결론을 명확히 도출하세요.
 - 각 항목은 충분한 분량(최소 5-10문단)으로 상세히 서술하세요. 단순 나열이 아닌 분석적 서술이 필요합니다.
 - 과학적 근거와 출처를 명시하세요.
 - 참고 정보가 제공된 경우 이를 활용하여 보고서의 근거를 강화하세요.
 - 의사결정 흐름도(Mermaid Decision Tree)는 반드시 포함하세요. `graph TD` 형식으로 SDN-1/2/3/ODM 경로를 모두 포함해야 합니다.
-- '연구 방법론' 섹션에 팀 구성 과정(10회 시뮬레이션 전체 결과, 빈도 테이블, 선정 근거), 전문가 자기소개, 에이전트별 기여도 통계를 반드시 포함하세요.
+- '연구 방법론' 섹션에 팀 구성 과정(팀 구성 실험 전체 결과, 빈도 테이블, 선정 근거), 전문가 자기소개, 에이전트별 기여도 통계를 반드시 포함하세요.
 
 **★ 핵심 원칙: 질문별 심화 (Question-Driven Deepening)**
-- 5개 핵심 질문 각각이 3라운드에 걸쳐 점진적으로 심화되어야 합니다.
-- 라운드 1의 초기 분석 → 라운드 2에서 Critic 피드백 반영 보완 → 라운드 3에서 최종 정제.
+- 5개 핵심 질문 각각이 {num_rounds}라운드에 걸쳐 점진적으로 심화되어야 합니다.
+- {_deepening_flow(num_rounds)}
 - 각 질문의 최종 결론은 이전 라운드의 논의를 종합한 것이어야 합니다.
 - 핵심 질문 4에서는 반드시 핵심 질문 1-2에서 식별한 위험 요소와 핵심 질문 3에서 발견한 지침 한계점을 직접 참조하고, 각각에 대한 구체적 해결방안을 제시하세요.
 - 핵심 질문 5의 의사결정 흐름은 핵심 질문 1-4의 결론을 통합하여 도출하세요.
 """
 
 
+# 기본 라운드 수 기준 프롬프트
+SYSTEM_PROMPT = build_system_prompt(DEFAULT_MAX_ROUNDS)
+
+
 PI_SUMMARY_PROMPT = """당신은 연구 프로젝트의 총괄 책임자(PI)입니다.
 
 ## 당신의 임무
@@ -309,6 +301,9 @@ PI_SUMMARY_PROMPT = """당신은 연구 프로젝트의 총괄 책임자(PI)입
 """
 
 
+# 팀 구성 JSON 응답은 짧으므로 속도 제한 예산을 과다 예약하지 않도록 작게 설정
+TEAM_DECISION_MAX_TOKENS = 2048
+
 TEAM_DECISION_PROMPT = f"""당신은 연구 프로젝트의 총괄 책임자(PI)입니다.
 
 ## 연구 아젠다
@@ -321,53 +316,71 @@ TEAM_DECISION_PROMPT = f"""당신은 연구 프로젝트의 총괄 책임자(PI)
 기여할 수 있는 전문가 조합을 선정하세요.
 
 ## 출력 형식 (JSON)
-반드시 다음과 같은 JSON 배열 형식으로 답변하세요:
-```json
-[
-  {{
-    "role": "전문가 역할",
-    "focus": "구체적인 집중 분야"
-  }}
-]
-```
+team 배열에 전문가별 role(전문가 역할)과 focus(구체적인 집중 분야)를 담아 답변하세요.
 
-**중요**: JSON 형식만 출력하세요. 최소 1명, 최대 5명.
+**중요**: 최소 1명, 최대 5명.
 """
 
 
-def decide_team(user_query: str) -> List[dict]:
-    """PI가 쿼리 분석 후 팀 구성 결정"""
-    user_message = (
+def _team_decision_message(user_query: str) -> str:
+    return (
         f"사용자 질문: {user_query}\n\n"
-        "위 질문에 답변하기 위해 필요한 전문가 팀을 구성하세요.\n"
-        "JSON 배열 형식으로만 답변하세요."
+        "위 질문에 답변하기 위해 필요한 전문가 팀을 구성하세요."
     )
 
-    response = call_gpt(TEAM_DECISION_PROMPT, user_message)
 
-    try:
-        content = response.strip()
-        if content.startswith("```"):
-            lines = content.split("\n")
-            content = "\n".join(lines[1:-1])
+def decide_team(user_query: str, trial: int | None = None) -> List[dict]:
+    """PI가 쿼리 분석 후 팀 구성 결정
 
-        team = json.loads(content)
+    Args:
+        user_query: 연구 주제 + 제약 조건
+        trial: 독립 시행 번호. LLM 응답 캐시에서 시행마다 별도 항목으로 저장되어
+            재실행 시에도 각 시행이 서로 다른 팀 구성을 유지합니다.
 
-        if not isinstance(team, list):
-            raise ValueError("응답이 리스트 형식이 아닙니다.")
+    Raises:
+        ValueError: 응답이 TeamDecision 스키마(1~5명, role/focus)를 만족하지 않는 경우
+    """
+    cache_tag = f"team-trial-{trial}" if trial is not None else ""
+    decision = call_gpt_json(
+        TEAM_DECISION_PROMPT,
+        _team_decision_message(user_query),
+        TeamDecision,
+        max_tokens=TEAM_DECISION_MAX_TOKENS,
+        cache_tag=cache_tag,
+        call_site="planning.team_decision",
+    )
+    return decision.to_profiles()
 
-        for expert in team:
-            if "role" not in expert or "focus" not in expert:
-                raise ValueError("각 전문가는 role과 focus 필드가 필요합니다.")
 
-        return team
+def decide_teams(user_query: str, n_trials: int, cache_tag: str = "team-trial") -> list[List[dict]]:
+    """독립적인 팀 구성 n_trials개를 한 번의 요청(n choices)으로 생성
 
-    except json.JSONDecodeError as e:
-        raise ValueError(f"LLM 응답을 JSON으로 파싱할 수 없습니다: {e}\n응답: {response}")
+    모델이 n을 지원하지 않으면 utils.llm이 개별 요청 동시 실행으로 대체합니다.
+    스키마 검증에 실패한 샘플은 제외되므로 n_trials개보다 적을 수 있습니다.
+
+    Args:
+        cache_tag: LLM 응답 캐시 구분자. 같은 요청을 여러 번(웨이브) 보낼 때
+            서로 다른 값을 주어야 캐시된 동일 샘플이 재사용되지 않습니다.
+    """
+    decisions = call_gpt_json_samples(
+        TEAM_DECISION_PROMPT,
+        _team_decision_message(user_query),
+        TeamDecision,
+        n_trials,
+        max_tokens=TEAM_DECISION_MAX_TOKENS,
+        cache_tag=cache_tag,
+        call_site="planning.team_decision",
+    )
+    return [decision.to_profiles() for decision in decisions]
 
 
 def _cluster_similar_roles(unique_roles: list[str]) -> dict[str, str]:
-    """GPT를 사용하여 유사한 역할명을 대표 역할명으로 매핑.
+    """유사한 역할명을 대표 역할명으로 매핑.
+
+    기본은 역할명 임베딩의 코사인 유사도 군집화(ROLE_CLUSTERING=embedding)로,
+    LLM 호출 없이 로컬에서 계산하며 임베딩 캐시 덕분에 재실행 시 결과가 같습니다.
+    임계값은 ROLE_CLUSTER_THRESHOLD (기본: openai 0.7, local 0.5).
+    ROLE_CLUSTERING=llm이면 기존처럼 GPT로 그룹핑합니다.
 
     Returns:
         dict: {원래역할명: 대표역할명} 매핑
@@ -375,6 +388,25 @@ def _cluster_similar_roles(unique_roles: list[str]) -> dict[str, str]:
     if len(unique_roles) <= 1:
         return {r: r for r in unique_roles}
 
+    if os.environ.get("ROLE_CLUSTERING", "embedding").lower() == "llm":
+        return _cluster_similar_roles_llm(unique_roles)
+
+    roles = sorted(set(unique_roles))
+    client = get_embedding_client()
+    try:
+        vectors = client.embed(roles)
+    except Exception as e:
+        logger.warning(f"Role embedding failed ({client.backend}): {e}, using local embeddings")
+        client = EmbeddingClient(backend="local")
+        vectors = client.embed(roles)
+
+    default_threshold = "0.7" if client.backend == "openai" else "0.5"
+    threshold = float(os.environ.get("ROLE_CLUSTER_THRESHOLD", default_threshold))
+    return cluster_by_similarity(roles, vectors, threshold)
+
+
+def _cluster_similar_roles_llm(unique_roles: list[str]) -> dict[str, str]:
+    """GPT를 사용하여 유사한 역할명을 대표 역할명으로 매핑 (ROLE_CLUSTERING=llm)"""
     role_list = "\n".join(f"- {r}" for r in unique_roles)
     prompt = f"""다음은 연구팀 구성 실험에서 나온 전문가 역할명 목록입니다.
 의미적으로 유사한 역할들을 하나의 대표 역할명으로 그룹핑하세요.
@@ -388,84 +420,191 @@ def _cluster_similar_roles(unique_roles: list[str]) -> dict[str, str]:
 3. 서로 다른 분야의 역할은 별도 그룹으로 유지하세요.
 
 ## 출력 형식 (JSON)
-```json
-{{
-  "clusters": [
-    {{
-      "canonical": "대표 역할명",
-      "members": ["원래 역할명1", "원래 역할명2"]
-    }}
-  ]
-}}
-```
-JSON만 출력하세요."""
+clusters 배열에 그룹별 canonical(대표 역할명)과 members(원래 역할명 목록)를 담으세요.
+모든 역할명이 정확히 하나의 그룹에 포함되어야 합니다."""
 
-    response = call_gpt(prompt, "역할명 클러스터링을 수행하세요.", temperature=0.2)
     try:
-        content = response.strip()
-        if content.startswith("```"):
-            lines = content.split("\n")
-            content = "\n".join(lines[1:-1])
-        data = json.loads(content)
-
-        mapping = {}
-        for cluster in data.get("clusters", []):
-            canonical = cluster["canonical"]
-            for member in cluster["members"]:
-                mapping[member] = canonical
-
-        # 매핑에 없는 역할은 자기 자신으로
-        for r in unique_roles:
-            if r not in mapping:
-                mapping[r] = r
-        return mapping
-    except (json.JSONDecodeError, KeyError):
+        clustering = call_gpt_json(
+            prompt, "역할명 클러스터링을 수행하세요.", RoleClustering, temperature=0.2, call_site="planning.clustering"
+        )
+    except ValueError as e:
+        logger.warning(f"Role clustering invalid: {e}, using raw role names")
         return {r: r for r in unique_roles}
+    return clustering.to_mapping(unique_roles)
 
 
-def decide_team_statistically(user_query: str, n_trials: int = 10) -> dict:
-    """10회 독립적 팀 구성 실험 후 빈도 분석으로 최종 팀 선정.
+def _canonicalize_roles(unique_roles: list[str]) -> dict[str, str]:
+    """역할명 정규화 사전을 먼저 조회하고, 처음 보는 역할명만 클러스터링
 
-    Args:
-        user_query: 연구 주제 + 제약 조건
-        n_trials: 실험 횟수 (기본 10회)
+    처음 보는 역할명은 기존 대표 역할명과 함께 클러스터링하여, 같은 그룹에 기존
+    대표명이 있으면 그 이름으로 합류시킵니다. 결과는 사전에 저장되어 다음 실행에서는
+    클러스터링 없이 바로 매핑됩니다.
 
     Returns:
-        dict: {all_teams, frequency_analysis, final_team, rationale, frequency_table}
+        dict: {원래역할명: 대표역할명} 매핑
     """
-    print(f"\n[STATISTICAL TEAM SELECTION] Running {n_trials} independent team compositions...")
+    registry = get_role_registry()
+    if registry is None:
+        return _cluster_similar_roles(unique_roles)
 
-    all_teams = []
+    try:
+        known = registry.lookup(unique_roles)
+        existing = set(registry.canonicals())
+    except Exception as e:
+        logger.warning(f"Role registry lookup failed: {e}, clustering all roles")
+        return _cluster_similar_roles(unique_roles)
 
-    def _single_trial(trial_idx: int) -> list[dict] | None:
-        try:
-            team = decide_team(user_query)
-            print(f"  Trial {trial_idx+1}/{n_trials}: {len(team)} specialists - {[m['role'] for m in team]}")
-            return team
-        except Exception as e:
-            logger.warning(f"Trial {trial_idx+1} failed: {e}")
-            return None
+    unseen = sorted(set(unique_roles) - set(known))
+    if not unseen:
+        print(f"  [ROLE REGISTRY] all {len(unique_roles)} roles known, clustering skipped")
+        return known
+
+    clustered = _cluster_similar_roles(sorted(set(unseen) | existing))
+    members_by_label: dict[str, list[str]] = {}
+    for role, label in clustered.items():
+        members_by_label.setdefault(label, []).append(role)
+
+    new_mapping = {}
+    for role in unseen:
+        label = clustered.get(role, role)
+        existing_in_cluster = sorted(m for m in members_by_label.get(label, []) if m in existing)
+        new_mapping[role] = existing_in_cluster[0] if existing_in_cluster else label
+
+    try:
+        registry.add(new_mapping)
+    except Exception as e:
+        logger.warning(f"Role registry update failed: {e}")
+    print(f"  [ROLE REGISTRY] {len(known)} known, {len(unseen)} new roles clustered")
+    return {**known, **new_mapping}
+
+
+def _unique_roles(teams: list[List[dict]]) -> list[str]:
+    return sorted({member["role"] for team in teams for member in team})
+
+
+def _ranking_signature(teams: list[List[dict]], role_mapping: dict[str, str]) -> tuple[int, set[str]]:
+    """(최빈 팀 규모, 빈도 상위 역할 집합)
+
+    상위 역할은 대표 역할명 기준 빈도순 상위 '최빈 팀 규모'개입니다 (경계 동률 포함).
+    """
+    role_counter = Counter()
+    team_size_counter = Counter()
+    for team in teams:
+        team_size_counter[len(team)] += 1
+        for member in team:
+            role_counter[role_mapping.get(member["role"], member["role"])] += 1
+    modal_size = team_size_counter.most_common(1)[0][0]
+    # 경계에서 동률인 역할은 모두 포함 (동률 순서에 따라 안정으로 오판하지 않도록)
+    ranked = role_counter.most_common()
+    cutoff = ranked[min(modal_size, len(ranked)) - 1][1]
+    return modal_size, {role for role, count in ranked if count >= cutoff}
 
-    # 병렬 실행 (5 workers)
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        futures = [executor.submit(_single_trial, i) for i in range(n_trials)]
-        for future in as_completed(futures):
-            result = future.result()
-            if result:
-                all_teams.append(result)
+
+def _is_ranking_stable(before: tuple[int, set[str]], after: tuple[int, set[str]], threshold: float) -> bool:
+    """최빈 팀 규모가 같고 상위 역할 집합의 Jaccard 유사도가 threshold 이상이면 안정"""
+    (size_before, top_before), (size_after, top_after) = before, after
+    if size_before != size_after:
+        return False
+    union = top_before | top_after
+    overlap = len(top_before & top_after) / len(union) if union else 1.0
+    return overlap >= threshold
+
+
+def _run_adaptive_trials(
+    user_query: str, max_trials: int
+) -> tuple[list[List[dict]], dict[str, str] | None, int, bool]:
+    """웨이브 단위로 팀 구성 시행을 추가하다가 빈도 순위가 안정되면 중단
+
+    웨이브마다 직전 웨이브까지의 순위와 이번 웨이브를 포함한 순위를 같은 클러스터
+    매핑으로 비교합니다. 클러스터링은 비교 시점에만 수행하므로, 두 번째 웨이브에서
+    안정되면 시행 요청 2회 + 클러스터링 1회(기본: 로컬 임베딩)로 끝납니다.
+
+    웨이브 수는 ceil(max_trials / 웨이브 크기)로 제한합니다. 검증 실패 등으로 시행이 덜 모여도
+    추가 웨이브를 요청하지 않으며, 유효한 팀이 하나도 없는 웨이브가 나오면 바로 중단합니다.
+
+    Returns:
+        (all_teams, role_mapping, waves, stopped_early): role_mapping은 비교를 한 번도
+        하지 못한 경우(시행이 한 웨이브로 끝남) None
+    """
+    wave_size = max(1, int(os.environ.get("TEAM_TRIALS_WAVE_SIZE", "3")))
+    threshold = float(os.environ.get("TEAM_TRIALS_STABILITY", "1.0"))
+    max_waves = math.ceil(max_trials / wave_size)
+
+    all_teams: list[List[dict]] = []
+    role_mapping: dict[str, str] | None = None
+    waves = 0
+
+    while len(all_teams) < max_trials and waves < max_waves:
+        n = min(wave_size, max_trials - len(all_teams))
+        wave = decide_teams(user_query, n, cache_tag=f"team-wave-{waves}")
+        waves += 1
+        prev_count = len(all_teams)
+        all_teams.extend(wave)
+        print(f"  [WAVE {waves}] +{len(wave)} trials (total {len(all_teams)}/{max_trials})")
+
+        if not wave:
+            # 모든 시행이 실패한 웨이브 (같은 요청을 반복해도 비용만 듦)
+            logger.warning(f"[TEAM SELECTION] wave {waves} returned no valid team, stopping trials")
+            break
+        if not prev_count:
+            continue
+
+        roles = _unique_roles(all_teams)
+        if role_mapping is None or any(r not in role_mapping for r in roles):
+            role_mapping = _canonicalize_roles(roles)
+
+        before = _ranking_signature(all_teams[:prev_count], role_mapping)
+        after = _ranking_signature(all_teams, role_mapping)
+        if _is_ranking_stable(before, after, threshold):
+            print(f"  [EARLY STOP] Ranking stable after {len(all_teams)} trials (size={after[0]}, top={sorted(after[1])})")
+            return all_teams, role_mapping, waves, len(all_teams) < max_trials
+
+    return all_teams, role_mapping, waves, False
+
+
+def decide_team_statistically(
+    user_query: str, n_trials: int = 10, adaptive: bool | None = None
+) -> dict:
+    """독립적 팀 구성 실험(최대 n_trials회) 후 빈도 분석으로 최종 팀 선정.
+
+    adaptive 모드는 시행을 웨이브(TEAM_TRIALS_WAVE_SIZE, 기본 3)로 나눠 실행하고,
+    웨이브 추가 전후로 대표 역할 빈도 순위와 최빈 팀 규모가 안정되면
+    (상위 역할 Jaccard >= TEAM_TRIALS_STABILITY, 기본 1.0) 남은 시행을 생략합니다.
+
+    Args:
+        user_query: 연구 주제 + 제약 조건
+        n_trials: 최대 실험 횟수 (기본 10회)
+        adaptive: 조기 종료 사용 여부 (None이면 TEAM_SELECTION_MODE=adaptive 여부)
+
+    Returns:
+        dict: {all_teams, frequency_analysis, final_team, rationale, frequency_table,
+               n_trials, trials_requested, waves, stopped_early, selection_mode}
+    """
+    if adaptive is None:
+        adaptive = os.environ.get("TEAM_SELECTION_MODE", "fixed").lower() == "adaptive"
+    mode = "adaptive" if adaptive else "fixed"
+    print(f"\n[STATISTICAL TEAM SELECTION] Running up to {n_trials} independent team compositions ({mode})...")
+
+    role_mapping = None
+    if adaptive:
+        all_teams, role_mapping, waves, stopped_early = _run_adaptive_trials(user_query, n_trials)
+    else:
+        # n choices 단일 요청 (미지원 모델은 동시 개별 요청)
+        all_teams = decide_teams(user_query, n_trials)
+        waves, stopped_early = 1, False
+    for trial_idx, team in enumerate(all_teams):
+        print(f"  Trial {trial_idx+1}/{n_trials}: {len(team)} specialists - {[m['role'] for m in team]}")
 
     if not all_teams:
         raise RuntimeError("모든 팀 구성 시도가 실패했습니다.")
 
     # 역할별 빈도 분석 (클러스터링 적용)
     # 1) 유니크 역할명 수집
-    unique_roles = set()
-    for team in all_teams:
-        for member in team:
-            unique_roles.add(member["role"])
+    unique_roles = _unique_roles(all_teams)
 
-    # 2) GPT로 유사 역할 클러스터링
-    role_mapping = _cluster_similar_roles(list(unique_roles))
+    # 2) 정규화 사전 조회 + 새 역할명만 클러스터링 (adaptive 모드에서 이미 수행했으면 재사용)
+    if role_mapping is None:
+        role_mapping = _canonicalize_roles(unique_roles)
     print(f"  [CLUSTERING] {len(unique_roles)} unique roles → {len(set(role_mapping.values()))} clusters")
 
     # 3) 매핑된 대표명으로 빈도 카운트
@@ -506,7 +645,7 @@ def decide_team_statistically(user_query: str, n_trials: int = 10) -> dict:
 
     selection_prompt = f"""당신은 연구 프로젝트의 총괄 책임자(PI)입니다.
 
-10회 독립적 팀 구성 실험 결과를 분석하여 최종 연구팀을 확정하세요.
+{len(all_teams)}회 독립적 팀 구성 실험 결과를 분석하여 최종 연구팀을 확정하세요.
 
 ## 역할별 등장 빈도
 {freq_summary}
@@ -521,35 +660,25 @@ def decide_team_statistically(user_query: str, n_trials: int = 10) -> dict:
 4. 선정 근거를 간략히 설명하세요.
 
 ## 출력 형식 (JSON)
-```json
-{{
-  "team": [
-    {{"role": "전문가 역할", "focus": "집중 분야"}}
-  ],
-  "rationale": "선정 근거 설명"
-}}
-```
-JSON만 출력하세요.
+team 배열(전문가별 role, focus)과 rationale(선정 근거 설명)을 담으세요.
 """
 
-    response = call_gpt(selection_prompt, f"연구 주제: {user_query}")
     try:
-        content = response.strip()
-        if content.startswith("```"):
-            lines = content.split("\n")
-            content = "\n".join(lines[1:-1])
-        data = json.loads(content)
-        final_team = data.get("team", [])
-        rationale = data.get("rationale", "")
-    except (json.JSONDecodeError, KeyError):
-        # 파싱 실패 시 가장 빈번한 역할들로 구성
+        selection = call_gpt_json(
+            selection_prompt, f"연구 주제: {user_query}", TeamSelection, call_site="planning.team_selection"
+        )
+        final_team = selection.to_profiles()
+        rationale = selection.rationale
+    except ValueError as e:
+        # 스키마 검증 실패 시 가장 빈번한 역할들로 구성
+        logger.warning(f"Team selection invalid: {e}, falling back to frequency ranking")
         final_team = []
         for ft in frequency_table[:most_common_size]:
             final_team.append({
                 "role": ft["role"],
                 "focus": ft["focus_variants"][0] if ft["focus_variants"] else "",
             })
-        rationale = "빈도 분석 기반 자동 선정 (LLM 응답 파싱 실패)"
+        rationale = "빈도 분석 기반 자동 선정 (LLM 응답 검증 실패)"
 
     print(f"[STATISTICAL TEAM SELECTION] Final team: {len(final_team)} specialists")
     for m in final_team:
@@ -563,21 +692,69 @@ JSON만 출력하세요.
         "frequency_table": freq_summary,
         "team_sizes": size_summary,
         "n_trials": len(all_teams),
+        "trials_requested": n_trials,
+        "waves": waves,
+        "stopped_early": stopped_early,
+        "selection_mode": mode,
     }
 
 
-def generate_self_introductions(team: List[dict]) -> list[dict]:
-    """최종 선별된 전문가들의 자기소개를 병렬로 생성합니다.
+INTRODUCTION_MAX_TOKENS = 500
 
-    Args:
-        team: 전문가 팀 리스트 [{role, focus}, ...]
+INTRODUCTION_SYSTEM_PROMPT = "당신은 연구 전문가입니다. 한글 서술체로 자기소개를 작성하세요."
 
-    Returns:
-        list[dict]: [{role, focus, introduction}, ...]
-    """
-    print(f"\n[INTRODUCTIONS] Generating self-introductions for {len(team)} specialists...")
+INTRODUCTION_GUIDE = (
+    "반드시 '저는 ~입니다' 형식의 대화형으로 작성하세요.\n"
+    "포함할 내용:\n"
+    "1. 자신의 전문 분야와 경험 (구체적 연구 경력)\n"
+    "2. 핵심 전문성 (특화된 기술/방법론)\n"
+    "3. 이 연구에서 담당할 구체적 역할과 기대 기여\n\n"
+    "예시 형식:\n"
+    "저는 [분야] 분야에서 [N]년간 연구해온 전문가입니다. "
+    "특히 [구체적 전문성]에 전문성을 가지고 있습니다. "
+    "이번 연구에서 저는 [구체적 역할]을 담당하겠습니다."
+)
+
+_introduction_cache: CacheBackend | None = None
+_introduction_cache_initialized = False
+
+
+def get_introduction_cache() -> CacheBackend | None:
+    """(역할, 집중 분야)별 자기소개 캐시 (INTRODUCTION_CACHE_BACKEND, 비활성화 시 None)"""
+    global _introduction_cache, _introduction_cache_initialized
+    if not _introduction_cache_initialized:
+        kind = os.environ.get("INTRODUCTION_CACHE_BACKEND", "memory").strip()
+        if kind and kind.lower() not in ("none", "off", "false", "0"):
+            try:
+                _introduction_cache = create_cache_backend(
+                    kind,
+                    namespace="introductions",
+                    max_entries=int(os.environ.get("INTRODUCTION_CACHE_MAX_ENTRIES", "500")),
+                    path=os.environ.get("INTRODUCTION_CACHE_PATH", "introduction_cache.db"),
+                )
+            except Exception as e:
+                logger.warning(f"[INTRODUCTIONS] cache disabled ({kind}): {e}")
+        _introduction_cache_initialized = True
+    return _introduction_cache
+
+
+def set_introduction_cache(cache: CacheBackend | None) -> None:
+    """자기소개 캐시 교체 (테스트 및 런타임 설정용)"""
+    global _introduction_cache, _introduction_cache_initialized
+    _introduction_cache = cache
+    _introduction_cache_initialized = True
 
-    introductions = []
+
+def _introduction_cache_key(role: str, focus: str) -> str:
+    return hashlib.sha256(f"{role}\x00{focus}".encode("utf-8")).hexdigest()
+
+
+def _fallback_introduction(role: str, focus: str) -> dict:
+    return {"role": role, "focus": focus, "introduction": f"{role}으로서 {focus} 분야를 담당합니다."}
+
+
+def _generate_introductions_parallel(team: List[dict]) -> list[dict]:
+    """전문가별 개별 요청으로 자기소개 생성 (팀 순서 유지)"""
 
     def _generate_one(profile: dict, idx: int) -> dict:
         role = profile.get("role", "")
@@ -585,30 +762,130 @@ def generate_self_introductions(team: List[dict]) -> list[dict]:
         prompt = (
             f"당신은 '{role}'입니다. 전문 분야는 '{focus}'입니다.\n\n"
             f"이 연구에 참여하는 전문가로서 한글 서술체 자기소개를 3-5문장으로 작성하세요.\n"
-            f"반드시 '저는 ~입니다' 형식의 대화형으로 작성하세요.\n"
-            f"포함할 내용:\n"
-            f"1. 자신의 전문 분야와 경험 (구체적 연구 경력)\n"
-            f"2. 핵심 전문성 (특화된 기술/방법론)\n"
-            f"3. 이 연구에서 담당할 구체적 역할과 기대 기여\n\n"
-            f"예시 형식:\n"
-            f"저는 [분야] 분야에서 [N]년간 연구해온 전문가입니다. "
-            f"특히 [구체적 전문성]에 전문성을 가지고 있습니다. "
-            f"이번 연구에서 저는 [구체적 역할]을 담당하겠습니다."
+            f"{INTRODUCTION_GUIDE}"
         )
         try:
-            intro = call_gpt("당신은 연구 전문가입니다. 한글 서술체로 자기소개를 작성하세요.", prompt, max_tokens=500)
+            intro = call_gpt(
+                INTRODUCTION_SYSTEM_PROMPT, prompt, max_tokens=INTRODUCTION_MAX_TOKENS, call_site="introduction"
+            )
             print(f"  [{idx+1}/{len(team)}] {role}: intro generated ({len(intro)} chars)")
             return {"role": role, "focus": focus, "introduction": intro.strip()}
         except Exception as e:
             logger.warning(f"Introduction generation failed for {role}: {e}")
-            return {"role": role, "focus": focus, "introduction": f"{role}으로서 {focus} 분야를 담당합니다."}
+            return _fallback_introduction(role, focus)
+
+    # 자기소개는 이후 단계를 막지 않으므로 낮은 우선순위
+    return get_agent_executor().map(_generate_one, team, range(len(team)), priority=Priority.BACKGROUND)
+
+
+def _generate_introductions_batched(team: List[dict]) -> list[dict]:
+    """전체 팀의 자기소개를 구조화 출력 요청 1회로 생성 (팀 순서 유지)
+
+    Raises:
+        ValueError: 응답이 IntroductionBatch 스키마를 만족하지 않거나 인원 수가 다른 경우
+    """
+    roster = "\n".join(
+        f"{i+1}. {p.get('role', '')} — 전문 분야: {p.get('focus', '')}" for i, p in enumerate(team)
+    )
+    prompt = (
+        f"다음 전문가들이 이 연구에 참여합니다.\n\n{roster}\n\n"
+        f"각 전문가의 입장에서 한글 서술체 자기소개를 3-5문장씩 작성하세요.\n"
+        f"introductions 배열에 위 순서대로 role(위 역할명 그대로)과 introduction을 담아 답변하세요.\n"
+        f"{INTRODUCTION_GUIDE}"
+    )
+    batch = call_gpt_json(
+        INTRODUCTION_SYSTEM_PROMPT,
+        prompt,
+        IntroductionBatch,
+        max_tokens=INTRODUCTION_MAX_TOKENS * len(team),
+        call_site="introduction.batch",
+    )
+    if len(batch.introductions) != len(team):
+        raise ValueError(f"자기소개 {len(team)}개를 요청했으나 {len(batch.introductions)}개를 받았습니다")
+
+    # 역할명으로 매칭하고, 모델이 역할명을 바꿔 쓴 경우 순서로 매칭
+    by_role = {item.role: item.introduction for item in batch.introductions}
+    return [
+        {
+            "role": p.get("role", ""),
+            "focus": p.get("focus", ""),
+            "introduction": by_role.get(p.get("role", ""), batch.introductions[i].introduction).strip(),
+        }
+        for i, p in enumerate(team)
+    ]
+
+
+def generate_self_introductions(team: List[dict]) -> list[dict]:
+    """최종 선별된 전문가들의 자기소개를 생성합니다.
+
+    (역할, 집중 분야)가 같은 전문가는 캐시된 자기소개를 재사용하고, 나머지는
+    INTRODUCTION_MODE에 따라 생성합니다:
+    - batched (기본): 구조화 출력 요청 1회로 일괄 생성. 실패 시 parallel로 대체
+    - parallel: 전문가별 개별 요청을 병렬 실행
+
+    Args:
+        team: 전문가 팀 리스트 [{role, focus}, ...]
+
+    Returns:
+        list[dict]: 팀 순서대로 [{role, focus, introduction}, ...]
+    """
+    print(f"\n[INTRODUCTIONS] Generating self-introductions for {len(team)} specialists...")
+
+    cache = get_introduction_cache()
+    results: list[dict | None] = [None] * len(team)
+    if cache is not None:
+        for i, profile in enumerate(team):
+            cached = cache.get(_introduction_cache_key(profile.get("role", ""), profile.get("focus", "")))
+            if cached is not None:
+                results[i] = {"role": profile.get("role", ""), "focus": profile.get("focus", ""), "introduction": cached}
+
+    missing = [i for i, r in enumerate(results) if r is None]
+    print(f"[INTRODUCTIONS] cache hits: {len(team) - len(missing)}, to generate: {len(missing)}")
+    if not missing:
+        return results
+
+    pending = [team[i] for i in missing]
+    mode = os.environ.get("INTRODUCTION_MODE", "batched").lower()
+    generated = None
+    if mode == "batched":
+        try:
+            generated = _generate_introductions_batched(pending)
+            print(f"[INTRODUCTIONS] batched: {len(generated)} intros in 1 call")
+        except Exception as e:
+            logger.warning(f"Batched introduction generation failed: {e}, falling back to parallel calls")
+    if generated is None:
+        generated = _generate_introductions_parallel(pending)
+
+    for i, intro in zip(missing, generated):
+        results[i] = intro
+        # 실패 시 기본 문구는 캐시하지 않음
+        if cache is not None and intro != _fallback_introduction(intro["role"], intro["focus"]):
+            cache.set(_introduction_cache_key(intro["role"], intro["focus"]), intro["introduction"])
 
-    with ThreadPoolExecutor(max_workers=len(team)) as executor:
-        futures = [executor.submit(_generate_one, p, i) for i, p in enumerate(team)]
-        for future in as_completed(futures):
-            introductions.append(future.result())
+    return results
 
-    return introductions
+
+def _synthesis_web_query(topic: str) -> str:
+    return f"{topic} NGT safety framework 2025"
+
+
+def _synthesis_efsa_query(topic: str) -> str:
+    return f"{topic} NGT safety assessment EFSA"
+
+
+def start_synthesis_prefetch(run_id: str, topic: str) -> None:
+    """최종 합성에 필요한 검색을 백그라운드에서 미리 시작
+
+    두 검색 모두 연구 주제에만 의존하므로 기획 직후 시작해 두면, 3라운드 회의가
+    끝날 무렵 run_final_synthesis는 이미 완료된 결과를 바로 사용합니다.
+    EFSA 검색어는 라운드 1 전문가 검색과 같아 그 결과도 공유됩니다.
+    """
+    from tools.web_search import efsa_search
+
+    web_query = _synthesis_web_query(topic)
+    efsa_query = _synthesis_efsa_query(topic)
+    prefetch(run_id, f"web_search:{web_query}", web_search.invoke, {"query": web_query})
+    prefetch(run_id, f"efsa_search:{efsa_query}", efsa_search.invoke, {"query": efsa_query})
 
 
 def run_pi_planning(state: AgentState) -> dict:
@@ -621,23 +898,44 @@ def run_pi_planning(state: AgentState) -> dict:
     topic = state["topic"]
     constraints = state.get("constraints", "")
     query = f"{topic}\n제약 조건: {constraints}"
-
-    # 10팀 통계적 선별
-    team_selection_data = None
-    try:
-        team_selection_data = decide_team_statistically(query)
-        team = team_selection_data["final_team"]
-        logger.info(f"PI decided team statistically: {len(team)} specialists from {team_selection_data['n_trials']} trials")
-    except Exception as e:
-        logger.warning(f"decide_team_statistically failed: {e}, using default team")
-        team = [
-            {"role": "NGT 분자생물학 전문가", "focus": "유전자편집 과정의 off-target 효과 및 분자적 특성 분석"},
-            {"role": "식품안전성 평가 전문가", "focus": "독성, 알레르기, 영양성 평가 방법론"},
-            {"role": "규제과학 전문가", "focus": "국제 규제 프레임워크 비교 및 지침 적용 가능성 분석"},
-        ]
-
-    # 전문가 자기소개 생성
-    introductions = generate_self_introductions(team)
+    run_id = state.get("run_id") or uuid.uuid4().hex
+
+    planning_cache = get_planning_cache()
+    cached = planning_cache.get(topic, constraints) if planning_cache else None
+
+    if cached:
+        # 같은(또는 거의 같은) 주제·제약 조건의 이전 기획 결과 재사용
+        team = cached["team"]
+        team_selection_data = {**cached["team_selection_data"], "cache_hit": True}
+        introductions = cached["specialist_introductions"]
+        print(f"[PI PLANNING] Planning cache hit: {len(team)} specialists (cached topic: {cached.get('topic', '')})")
+    else:
+        # 통계적 선별 (최대 10회, adaptive 모드는 순위 안정 시 조기 종료)
+        team_selection_data = None
+        try:
+            with run_context(run_id):
+                team_selection_data = decide_team_statistically(query)
+            team = team_selection_data["final_team"]
+            logger.info(f"PI decided team statistically: {len(team)} specialists from {team_selection_data['n_trials']} trials")
+        except Exception as e:
+            logger.warning(f"decide_team_statistically failed: {e}, using default team")
+            team = [
+                {"role": "NGT 분자생물학 전문가", "focus": "유전자편집 과정의 off-target 효과 및 분자적 특성 분석"},
+                {"role": "식품안전성 평가 전문가", "focus": "독성, 알레르기, 영양성 평가 방법론"},
+                {"role": "규제과학 전문가", "focus": "국제 규제 프레임워크 비교 및 지침 적용 가능성 분석"},
+            ]
+
+        # 전문가 자기소개 생성
+        with run_context(run_id):
+            introductions = generate_self_introductions(team)
+
+        # 통계적 선별에 성공한 결과만 캐시 (기본 팀은 저장하지 않음)
+        if planning_cache and team_selection_data:
+            planning_cache.set(topic, constraints, {
+                "team": team,
+                "team_selection_data": team_selection_data,
+                "specialist_introductions": introductions,
+            })
 
     # 팀 구성 내용을 메시지로 기록
     team_summary = "\n".join(
@@ -646,17 +944,26 @@ def run_pi_planning(state: AgentState) -> dict:
     intro_summary = "\n".join(
         [f"- **{intro['role']}**: {intro['introduction']}" for intro in introductions]
     )
+    selection_note = (
+        f"{team_selection_data['n_trials']}회 통계적 선별" if team_selection_data else "기본 팀"
+    )
     messages = list(state.get("messages", []))
     messages.append({
         "role": "pi",
-        "content": f"연구 팀을 구성했습니다 (10회 통계적 선별).\n\n{team_summary}\n\n### 전문가 자기소개\n{intro_summary}",
+        "content": f"연구 팀을 구성했습니다 ({selection_note}).\n\n{team_summary}\n\n### 전문가 자기소개\n{intro_summary}",
     })
 
     print(f"[PI PLANNING] Team composed: {len(team)} specialists")
     for m in team:
         print(f"  - {m['role']}: {m['focus']}")
 
+    try:
+        start_synthesis_prefetch(run_id, topic)
+    except Exception as e:
+        logger.warning(f"Synthesis search prefetch failed to start: {e}")
+
     return {
+        "run_id": run_id,
         "team": team,
         "messages": messages,
         "team_selection_data": team_selection_data,
@@ -672,7 +979,7 @@ def run_pi_summary(state: AgentState) -> dict:
     meeting_history = state.get("meeting_history", [])
 
     print(f"\n{'#'*80}")
-    print(f"[PI SUMMARY] Starting PI summary - Round {current_round}/3")
+    print(f"[PI SUMMARY] Starting PI summary - Round {round_label(state)}")
     print(f"  Specialist outputs: {len(specialist_outputs)}")
     print(f"{'#'*80}\n")
 
@@ -703,7 +1010,7 @@ def run_pi_summary(state: AgentState) -> dict:
                 critique_text += f"- {role}: {fb}\n"
 
     user_message = (
-        f"[팀 회의 라운드 {current_round}/3]\n"
+        f"[팀 회의 라운드 {round_label(state)}]\n"
         f"연구 주제: {state['topic']}\n\n"
         f"{'[이전 라운드 임시 결론]' + prev_summaries if prev_summaries else ''}\n\n"
         f"[이번 라운드 전문가 발표]\n{specialist_context}\n\n"
@@ -718,7 +1025,12 @@ def run_pi_summary(state: AgentState) -> dict:
     logger.info("PI summary: Calling OpenAI directly...")
 
     try:
-        summary = call_gpt(PI_SUMMARY_PROMPT, user_message)
+        summary = call_gpt(
+            PI_SUMMARY_PROMPT,
+            user_message,
+            on_delta=make_delta_emitter("PI", "summary", round=current_round),
+            call_site="pi_summary",
+        )
         print(f"[PI SUMMARY] OpenAI call succeeded - Summary: {len(summary)} chars")
     except Exception as e:
         print(f"[PI SUMMARY ERROR] {type(e).__name__}: {e}")
@@ -772,22 +1084,44 @@ def _compute_word_counts(messages: list[dict]) -> dict:
     return stats
 
 
+def _trials_summary(tsd: dict) -> str:
+    """팀 구성 실험 횟수 요약 (요청 횟수, 실제 수행 횟수, 조기 종료·재사용 여부)"""
+    summary = f"최대 {tsd.get('trials_requested', tsd.get('n_trials', 0))}회 중 {tsd.get('n_trials', 0)}회 독립적 팀 구성 실험 수행"
+    if tsd.get("stopped_early"):
+        summary += " (역할 순위가 안정되어 조기 종료)"
+    if tsd.get("cache_hit"):
+        summary += " (이전 기획 결과 재사용)"
+    return summary
+
+
 def run_final_synthesis(state: AgentState) -> dict:
-    """PI가 3라운드 전체 내용에서 베스트 파트를 선별하여 최종 보고서를 작성합니다."""
+    """PI가 전체 라운드 내용에서 베스트 파트를 선별하여 최종 보고서를 작성합니다.
+
+    기본은 섹션별 동시 생성(agents.synthesis)이며, 실패하거나 SYNTHESIS_MODE=single이면
+    전체 보고서를 단일 호출로 생성합니다. 두 경로 모두 보고서의 라운드 구조를
+    실제 진행된 라운드 수(적응형 조기 종료·요청별 max_rounds 반영)에 맞춥니다.
+    """
     meeting_history = state.get("meeting_history", [])
     current_round = state.get("current_round", 3)
+    num_rounds = completed_rounds(state)
 
     print(f"\n{'#'*80}")
     print(f"[PI FINAL SYNTHESIS] Starting final report synthesis")
     print(f"  Meeting history: {len(meeting_history)} rounds archived")
-    print(f"  Current round: {current_round}")
+    print(f"  Current round: {current_round} ({num_rounds} rounds completed)")
     print(f"{'#'*80}\n")
 
     # 웹 검색으로 최신 정보 보강
     web_context = ""
+    web_result = ""
     pi_sources = []
+    run_id = state.get("run_id", "")
     try:
-        web_result = web_search.invoke({"query": f"{state['topic']} NGT safety framework 2025"})
+        # 기획 단계에서 prefetch한 결과가 있으면 바로 사용
+        web_query = _synthesis_web_query(state["topic"])
+        web_result = resolve_prefetched(
+            run_id, f"web_search:{web_query}", web_search.invoke, {"query": web_query}
+        )
         web_context = f"\n\n## [웹 검색 결과 - 최신 정보]\n{web_result}"
         pi_sources.extend(_extract_sources(web_context))
         logger.info("PI final synthesis web search completed")
@@ -799,14 +1133,20 @@ def run_final_synthesis(state: AgentState) -> dict:
     if not efsa_context:
         try:
             from tools.web_search import efsa_search
-            efsa_result = efsa_search.invoke({"query": f"{state['topic']} NGT safety assessment EFSA"})
+            efsa_query = _synthesis_efsa_query(state["topic"])
+            efsa_result = resolve_prefetched(
+                run_id, f"efsa_search:{efsa_query}", efsa_search.invoke, {"query": efsa_query}
+            )
             efsa_context = f"\n\n## [EFSA Journal 검색 결과]\n{efsa_result}"
             pi_sources.extend(_extract_sources(efsa_context))
             logger.info("PI final synthesis EFSA search completed")
         except Exception as e:
             logger.warning(f"PI final synthesis EFSA search failed: {e}")
 
-    # 3라운드 전체 PI 요약 구성
+    # 이 실행의 prefetch 결과는 더 이상 필요 없음
+    discard_run(run_id)
+
+    # 전체 라운드 PI 요약 구성
     pi_summaries_text = ""
     for record in meeting_history:
         pi_summaries_text += (
@@ -844,14 +1184,16 @@ def run_final_synthesis(state: AgentState) -> dict:
 
     # 출처 목록 텍스트
     sources_text = ""
+    sources_list = ""
     if unique_sources:
         sources_list = "\n".join(f"{i+1}. {s}" for i, s in enumerate(unique_sources))
         sources_text = f"\n\n[참조 출처 목록 - 반드시 보고서에 포함할 것]\n{sources_list}"
 
     print(f"[PI FINAL SYNTHESIS] Sources collected: {len(unique_sources)}")
 
-    # 팀 구성 과정 데이터 (Phase 5) - 10회 시뮬레이션 전체 결과 포함
+    # 팀 구성 과정 데이터 (Phase 5) - 팀 구성 실험 전체 결과 포함
     team_composition_text = ""
+    team_composition_body = ""
     tsd = state.get("team_selection_data")
     if tsd:
         n_trials = tsd.get('n_trials', 0)
@@ -879,17 +1221,20 @@ def run_final_synthesis(state: AgentState) -> dict:
                 variants = ", ".join(ft.get("focus_variants", [])[:3])
                 freq_detail += f"| {ft['role']} | {ft['frequency']} | {ft['percentage']}% | {variants} |\n"
 
-        team_composition_text = (
-            f"\n\n[연구 팀 구성 과정 - 보고서 '연구 방법론' 섹션에 포함할 것]\n"
-            f"10회 독립적 팀 구성 실험 수행 ({n_trials}회 성공)\n\n"
+        team_composition_body = (
+            f"{_trials_summary(tsd)}\n\n"
             f"{trials_detail}\n"
             f"{freq_detail}\n"
             f"팀 규모 분포: {tsd.get('team_sizes', '')}\n\n"
             f"PI의 최종 선정 근거: {tsd.get('rationale', '')}\n"
         )
+        team_composition_text = (
+            f"\n\n[연구 팀 구성 과정 - 보고서 '연구 방법론' 섹션에 포함할 것]\n{team_composition_body}"
+        )
 
     # 전문가 자기소개 (Phase 4) - 이미지 스타일 한글 대화형
     intro_text = ""
+    intro_lines = ""
     intros = state.get("specialist_introductions", [])
     if intros:
         intro_lines = "\n\n".join(
@@ -901,16 +1246,20 @@ def run_final_synthesis(state: AgentState) -> dict:
     all_messages = list(state.get("messages", []))
     word_counts = _compute_word_counts(all_messages)
     word_counts_text = ""
+    wc_lines = ""
     if word_counts:
         wc_lines = "| 에이전트 | 발화 횟수 | 총 글자수 |\n|---|---|---|\n"
         for agent, stats in sorted(word_counts.items()):
             wc_lines += f"| {agent} | {stats['count']}회 | {stats['chars']:,}자 |\n"
         word_counts_text = f"\n\n[에이전트별 기여도 통계 - 보고서 '연구 방법론' 섹션에 포함할 것]\n{wc_lines}\n"
 
+    round_titles = ", ".join(
+        "{}({})".format(*title.split(": ", 1)) for title, _ in round_stages(num_rounds)
+    )
     user_message = (
         f"연구 주제: {state['topic']}\n"
         f"제약 조건: {state.get('constraints', '')}\n\n"
-        f"[3라운드 팀 회의 전체 요약]\n{pi_summaries_text}\n\n"
+        f"[{num_rounds}라운드 팀 회의 전체 요약]\n{pi_summaries_text}\n\n"
         f"[최종 라운드 전문가 분석 (정제본)]\n{round3_text}\n\n"
         f"{web_context}\n\n"
         f"{efsa_context}\n\n"
@@ -918,12 +1267,12 @@ def run_final_synthesis(state: AgentState) -> dict:
         f"{intro_text}\n"
         f"{word_counts_text}\n"
         f"{sources_text}\n\n"
-        f"위 3라운드 팀 회의의 모든 내용에서 가장 우수한 분석, 근거, 결론을 선별하여\n"
-        f"최종 보고서를 작성하세요. 5개 핵심 질문 각각에 대해 3라운드 구조를 빠짐없이 포함하세요.\n\n"
-        f"★ 핵심 1: 보고서를 5개 핵심 질문별 3라운드 회의록 구조로 작성하세요.\n"
-        f"각 핵심 질문에 대해 라운드 1(초기 분석), 라운드 2(비평 반영 보완), 라운드 3(최종 정제)을 포함하고,\n"
+        f"위 {num_rounds}라운드 팀 회의의 모든 내용에서 가장 우수한 분석, 근거, 결론을 선별하여\n"
+        f"최종 보고서를 작성하세요. 5개 핵심 질문 각각에 대해 {num_rounds}라운드 구조를 빠짐없이 포함하세요.\n\n"
+        f"★ 핵심 1: 보고서를 5개 핵심 질문별 {num_rounds}라운드 회의록 구조로 작성하세요.\n"
+        f"각 핵심 질문에 대해 {round_titles}을 포함하고,\n"
         f"각 라운드에서 전문가별 분석, Critic 평가(점수 포함), PI 종합을 모두 서술하세요.\n\n"
-        f"★ 핵심 2: '연구 방법론' 섹션에 팀 구성 과정(10회 시뮬레이션 전체 결과, 빈도 테이블, 선정 근거),\n"
+        f"★ 핵심 2: '연구 방법론' 섹션에 팀 구성 과정(팀 구성 실험 전체 결과, 빈도 테이블, 선정 근거),\n"
         f"전문가 자기소개(한글 대화형), 에이전트별 기여도 통계를 반드시 포함하세요.\n\n"
         f"★ 핵심 3: 보고서 마지막에 '의사결정 흐름도 (Decision Tree)' 섹션을 반드시 포함하세요.\n"
         f"Mermaid `graph TD` 형식으로 SDN-1/SDN-2/SDN-3/ODM 각 카테고리의 위험평가 경로를\n"
@@ -931,22 +1280,56 @@ def run_final_synthesis(state: AgentState) -> dict:
         f"★ 핵심 4: 참고문헌(References) 섹션에 5-1(Web), 5-2(RAG), 5-3(EFSA) 출처를 정리하세요.\n"
     )
 
-    print(f"[PI FINAL SYNTHESIS] Calling OpenAI API via call_gpt")
-    logger.info("PI final synthesis: Calling OpenAI directly...")
+    final_report = None
+    if os.environ.get("SYNTHESIS_MODE", "sectioned").lower() == "sectioned":
+        # 섹션별 동시 생성 (섹션마다 필요한 컨텍스트만 전달)
+        try:
+            with run_context(run_id):
+                final_report = synthesize_report(
+                    state["topic"],
+                    state.get("constraints", ""),
+                    {
+                        "pi_summaries": pi_summaries_text,
+                        "specialist_outputs": round3_text,
+                        "web": web_result,
+                        "efsa": efsa_context,
+                        "team_composition": team_composition_body,
+                        "introductions": intro_lines,
+                        "word_counts": wc_lines,
+                        "sources": sources_list,
+                    },
+                    num_rounds=num_rounds,
+                )
+            final_report = _sanitize_mermaid(final_report)
+            print(f"[PI FINAL SYNTHESIS] Sectioned synthesis succeeded - Final report: {len(final_report)} chars")
+        except Exception as e:
+            logger.warning(f"Sectioned synthesis failed: {e}, falling back to single call")
+            final_report = None
 
-    try:
-        final_report = call_gpt(SYSTEM_PROMPT, user_message, max_tokens=65536)
-        final_report = _sanitize_mermaid(final_report)
-        print(f"[PI FINAL SYNTHESIS] OpenAI call succeeded - Final report: {len(final_report)} chars")
-    except Exception as e:
-        print(f"[PI FINAL SYNTHESIS ERROR] {type(e).__name__}: {e}")
-        raise
+    if final_report is None:
+        print(f"[PI FINAL SYNTHESIS] Calling OpenAI API via call_gpt")
+        logger.info("PI final synthesis: Calling OpenAI directly...")
+
+        try:
+            final_report = call_gpt(
+                build_system_prompt(num_rounds),
+                user_message,
+                max_tokens=65536,
+                on_delta=make_delta_emitter("PI", "synthesis"),
+                continuations=LONG_OUTPUT_CONTINUATIONS,
+                call_site="synthesis",
+            )
+            final_report = _sanitize_mermaid(final_report)
+            print(f"[PI FINAL SYNTHESIS] OpenAI call succeeded - Final report: {len(final_report)} chars")
+        except Exception as e:
+            print(f"[PI FINAL SYNTHESIS ERROR] {type(e).__name__}: {e}")
+            raise
 
     # 메시지 로그
     messages = list(state.get("messages", []))
     messages.append({
         "role": "pi",
-        "content": "3라운드 팀 회의 결과를 종합하여 최종 보고서를 작성했습니다.",
+        "content": f"{num_rounds}라운드 팀 회의 결과를 종합하여 최종 보고서를 작성했습니다.",
     })
 
     return {
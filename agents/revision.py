@@ -0,0 +1,102 @@
+"""라운드 수정 패치 적용 (Diff-based Revision)
+
+Round 2, 3에서 전문가가 분석 전체를 다시 쓰는 대신 이전 분석에 대한
+섹션 단위 편집(RevisionPatch)만 반환하면, 여기서 로컬로 적용해 새 분석을 만듭니다.
+섹션은 Markdown 제목(#, ## ...) 줄 기준으로 나눕니다.
+
+패치를 적용할 수 없으면 ValueError를 발생시키며, 호출 측은 전체 재작성으로 대체합니다.
+"""
+import re
+
+from agents.schemas import SectionEdit
+
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+
+
+def normalize_heading(title: str) -> str:
+    """섹션 제목 비교용 정규화 (# 기호, 강조 표시, 공백/대소문자 차이 무시)"""
+    title = _HEADING_RE.sub(r"\2", title.strip())
+    title = re.sub(r"[*_`]", "", title)
+    return re.sub(r"\s+", " ", title).strip().lower()
+
+
+def split_sections(text: str) -> list[tuple[str, str]]:
+    """Markdown 텍스트를 (제목 줄, 섹션 전체 텍스트) 목록으로 분할
+
+    첫 제목 이전의 서문은 제목 줄이 빈 문자열인 섹션이 됩니다.
+    섹션 텍스트를 순서대로 이어 붙이면 원문과 같습니다.
+    """
+    sections: list[tuple[str, str]] = []
+    heading, lines = "", []
+    in_code = False
+    for line in text.splitlines(keepends=True):
+        if line.lstrip().startswith("```"):
+            in_code = not in_code
+        if not in_code and _HEADING_RE.match(line.rstrip("\n")):
+            if heading or lines:
+                sections.append((heading, "".join(lines)))
+            heading, lines = line.rstrip("\n"), []
+        lines.append(line)
+    if heading or lines:
+        sections.append((heading, "".join(lines)))
+    return sections
+
+
+def outline(text: str) -> list[str]:
+    """이전 분석의 섹션 제목 목록 (패치 프롬프트에 제시)"""
+    return [heading for heading, _ in split_sections(text) if heading]
+
+
+def _find_section(sections: list[tuple[str, str]], title: str) -> int:
+    target = normalize_heading(title)
+    matches = [i for i, (heading, _) in enumerate(sections) if heading and normalize_heading(heading) == target]
+    if not matches:
+        raise ValueError(f"섹션을 찾을 수 없습니다: {title!r}")
+    if len(matches) > 1:
+        raise ValueError(f"같은 제목의 섹션이 여러 개입니다: {title!r}")
+    return matches[0]
+
+
+def _as_block(content: str) -> str:
+    return content.strip("\n") + "\n\n"
+
+
+def apply_edits(text: str, edits: list[SectionEdit]) -> str:
+    """이전 분석에 섹션 편집을 순서대로 적용
+
+    Args:
+        text: 이전 분석 (Markdown)
+        edits: 적용할 편집 목록
+
+    Returns:
+        str: 편집이 적용된 분석
+
+    Raises:
+        ValueError: 이전 분석에 제목이 없거나, 편집 대상 섹션이 없거나 모호한 경우
+    """
+    sections = split_sections(text)
+    if not any(heading for heading, _ in sections):
+        raise ValueError("이전 분석에 섹션 제목이 없어 패치를 적용할 수 없습니다")
+
+    for edit in edits:
+        if edit.op == "append":
+            if sections and not sections[-1][1].endswith("\n\n"):
+                heading, body = sections[-1]
+                sections[-1] = (heading, body.rstrip("\n") + "\n\n")
+            sections.append(("", _as_block(edit.content)))
+            continue
+
+        index = _find_section(sections, edit.section)
+        content = _as_block(edit.content)
+        if edit.op == "replace":
+            heading = sections[index][0]
+            # 본문만 보낸 경우 원래 제목 유지
+            if not _HEADING_RE.match(content.split("\n", 1)[0]):
+                content = f"{heading}\n\n{content}"
+            sections[index] = (heading, content)
+        else:  # insert_after
+            sections.insert(index + 1, ("", content))
+        # 새로 추가된 제목도 이후 편집에서 찾을 수 있도록 다시 분할
+        sections = split_sections("".join(body for _, body in sections))
+
+    return "".join(body for _, body in sections).rstrip("\n") + "\n"
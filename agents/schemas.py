@@ -0,0 +1,157 @@
+"""에이전트 구조화 출력 스키마
+
+PI 팀 구성, 역할 클러스터링, 자기소개, 전문가 수정 패치, Critic 평가 응답의 JSON schema입니다.
+utils.llm.call_gpt_json()에 넘기면 OpenAI strict 구조화 출력으로 요청되고
+응답은 이 모델로 검증·파싱됩니다.
+
+strict 모드 제약: 모든 필드는 required(기본값 없음)이고 additionalProperties는 false,
+동적 키 dict는 허용되지 않으므로 전문가별 값은 배열로 표현합니다.
+"""
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, field_validator
+
+from workflow.state import CritiqueResult
+
+# 팀 규모 제한 (TEAM_DECISION_PROMPT: 최소 1명, 최대 5명)
+MIN_TEAM_SIZE = 1
+MAX_TEAM_SIZE = 5
+
+
+class TeamMember(BaseModel):
+    """전문가 프로필"""
+
+    model_config = ConfigDict(extra="forbid")
+
+    role: str
+    focus: str
+
+
+class TeamDecision(BaseModel):
+    """decide_team 응답: 전문가 팀 구성"""
+
+    model_config = ConfigDict(extra="forbid")
+
+    team: list[TeamMember]
+
+    @field_validator("team")
+    @classmethod
+    def _check_size(cls, team: list[TeamMember]) -> list[TeamMember]:
+        if not MIN_TEAM_SIZE <= len(team) <= MAX_TEAM_SIZE:
+            raise ValueError(f"팀 규모는 {MIN_TEAM_SIZE}~{MAX_TEAM_SIZE}명이어야 합니다: {len(team)}명")
+        return team
+
+    def to_profiles(self) -> list[dict]:
+        return [member.model_dump() for member in self.team]
+
+
+class TeamSelection(TeamDecision):
+    """decide_team_statistically 응답: 빈도 분석 기반 최종 팀 + 선정 근거"""
+
+    rationale: str
+
+
+class RoleCluster(BaseModel):
+    """의미적으로 유사한 역할명 그룹"""
+
+    model_config = ConfigDict(extra="forbid")
+
+    canonical: str
+    members: list[str]
+
+
+class RoleClustering(BaseModel):
+    """_cluster_similar_roles 응답"""
+
+    model_config = ConfigDict(extra="forbid")
+
+    clusters: list[RoleCluster]
+
+    def to_mapping(self, roles: list[str]) -> dict[str, str]:
+        """{원래역할명: 대표역할명} 매핑 (클러스터에 없는 역할은 자기 자신)"""
+        mapping = {}
+        for cluster in self.clusters:
+            for member in cluster.members:
+                mapping[member] = cluster.canonical
+        for role in roles:
+            mapping.setdefault(role, role)
+        return mapping
+
+
+class SpecialistIntroduction(BaseModel):
+    """전문가 한 명의 자기소개"""
+
+    model_config = ConfigDict(extra="forbid")
+
+    role: str
+    introduction: str
+
+
+class IntroductionBatch(BaseModel):
+    """generate_self_introductions 일괄 응답: 요청한 순서대로 전문가별 자기소개"""
+
+    model_config = ConfigDict(extra="forbid")
+
+    introductions: list[SpecialistIntroduction]
+
+
+class SectionEdit(BaseModel):
+    """이전 분석의 섹션 단위 편집 1건
+
+    section은 이전 분석의 Markdown 제목 텍스트(# 제외)입니다.
+    - replace: 해당 섹션(제목 + 본문)을 content로 교체
+    - insert_after: 해당 섹션 뒤에 content(새 섹션)를 삽입
+    - append: 분석 끝에 content를 추가 (section은 빈 문자열)
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    op: Literal["replace", "insert_after", "append"]
+    section: str
+    content: str
+
+
+class RevisionPatch(BaseModel):
+    """라운드 수정 응답: 이전 분석에 적용할 편집 목록"""
+
+    model_config = ConfigDict(extra="forbid")
+
+    summary: str
+    edits: list[SectionEdit]
+
+
+class SpecialistVerdict(BaseModel):
+    """전문가 1명에 대한 Critic 평가"""
+
+    model_config = ConfigDict(extra="forbid")
+
+    role: str
+    score: Literal[1, 2, 3, 4, 5]
+    feedback: str
+
+
+class CritiqueSummary(BaseModel):
+    """전문가별 개별 비평(fan-out)을 합친 뒤의 전체 요약 응답"""
+
+    model_config = ConfigDict(extra="forbid")
+
+    decision: Literal["continue", "approve"]
+    feedback: str
+
+
+class CritiqueVerdict(BaseModel):
+    """run_critic 응답"""
+
+    model_config = ConfigDict(extra="forbid")
+
+    decision: Literal["continue", "approve"]
+    feedback: str
+    specialists: list[SpecialistVerdict]
+
+    def to_critique_result(self) -> CritiqueResult:
+        return CritiqueResult(
+            decision=self.decision,
+            feedback=self.feedback,
+            scores={v.role: v.score for v in self.specialists},
+            specialist_feedback={v.role: v.feedback for v in self.specialists},
+        )
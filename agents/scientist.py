@@ -8,13 +8,23 @@ Phase 1 최적화:
 - 검색 캐싱 + 병렬화 (20-30초 단축)
 """
 import logging
+import os
 import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Callable
 
+from workflow.rounds import round_label
 from workflow.state import AgentState
-from tools.rag_search import rag_search_tool
+from tools.rag_search import rag_search_many, rag_search_tool
 from tools.web_search import web_search, efsa_search
+from agents.critic import CONVERGED_FEEDBACK_MARKER
 from agents.factory import create_specialist
+from agents.revision import apply_edits, outline
+from agents.schemas import RevisionPatch
+from utils.executor import Priority, get_agent_executor
+from utils.prefetch import resolve_prefetched
+from utils.streaming import make_delta_emitter
 
 logger = logging.getLogger(__name__)
 
@@ -35,74 +45,153 @@ def _extract_sources(text: str) -> list[str]:
     return sources
 
 
-def _perform_searches(topic: str, state: AgentState) -> tuple[str, str, str]:
-    """RAG + Web + EFSA 검색을 병렬로 수행하고 캐싱합니다.
+# 라운드 1 전문가가 반드시 기다리는 검색 (나머지는 마감 시각까지만 대기)
+REQUIRED_SEARCHES = ("rag",)
+
+# 검색 시작 후 선택 검색(web, efsa)을 기다리는 최대 시간 (초)
+DEFAULT_SEARCH_DEADLINE_SECONDS = 20.0
+
+# 전문가별 RAG 검색 문서 수 (전체 공통 검색의 settings.TOP_K보다 작게)
+DEFAULT_SPECIALIST_RAG_TOP_K = 3
+
+# 수렴한 전문가의 라운드 수정 생략 정책:
+#   converged: 점수가 기준 이상이고 Critic 피드백이 비었거나 수렴 표시(CONVERGED_FEEDBACK_MARKER)를 포함
+#   score: 점수만 기준 이상이면 생략 / off: 항상 수정
+DEFAULT_REVISION_SKIP_POLICY = "converged"
+DEFAULT_REVISION_SKIP_MIN_SCORE = 5
+
+# 라운드 수정 방식: patch(섹션 편집만 요청 후 로컬 적용) | rewrite(전체 재작성)
+DEFAULT_REVISION_MODE = "patch"
+
+# 패치 응답 최대 토큰 수 (전체 재작성의 32768보다 작게)
+REVISION_PATCH_MAX_TOKENS = 8192
+
+REVISION_PATCH_GUIDE = """[응답 형식 - 섹션 편집]
+분석 전체를 다시 쓰지 말고, 이전 분석에 적용할 편집만 반환하세요.
+- op="replace": section에 적힌 섹션(제목 + 본문)을 content로 교체합니다.
+- op="insert_after": section에 적힌 섹션 뒤에 content(새 섹션, 제목 포함)를 삽입합니다.
+- op="append": 분석 끝에 content를 추가합니다. section은 빈 문자열로 두세요.
+section에는 아래 [이전 분석의 섹션 목록]의 제목을 # 없이 그대로 적으세요.
+바뀌지 않는 섹션은 편집에 포함하지 마세요. summary에는 수정 내용을 한두 문장으로 요약하세요."""
+
+
+def _search_rag(topic: str) -> str:
+    try:
+        result = rag_search_tool.invoke({"query": f"{topic} NGT safety assessment"})
+        logger.info(f"RAG search completed")
+        return f"\n\n[참고 규제 문서]\n{result}"
+    except Exception as e:
+        logger.warning(f"RAG search failed: {e}")
+        return ""
+
+
+def _specialist_rag_query(topic: str, profile: dict) -> str:
+    """전문가 역할·집중 분야로 좁힌 RAG 검색어"""
+    return f"{profile.get('role', '')}: {profile.get('focus', '')} - {topic} NGT safety assessment"
+
+
+def _search_rag_per_specialist(topic: str, team: list[dict]) -> list[str]:
+    """전문가별 검색어로 RAG를 한 번에 검색 (배치 임베딩 + 다중 벡터 조회)
+
+    실패하면 기존 공통 검색 결과를 모든 전문가에게 사용합니다.
 
     Returns:
-        tuple[str, str, str]: (rag_context, web_context, efsa_context)
+        team과 같은 순서의 전문가별 RAG 컨텍스트
     """
-    current_round = state.get("current_round", 1)
-
-    # Round 2 이상이면 캐시 사용
-    if current_round > 1:
-        cached_rag = state.get("cached_rag_context", "")
-        cached_web = state.get("cached_web_context", "")
-        cached_efsa = state.get("cached_efsa_context", "")
-        if cached_rag or cached_web:
-            print(f"  [CACHE] Using cached search results from Round 1")
-            logger.info(f"Using cached search results (Round {current_round})")
-            return cached_rag, cached_web, cached_efsa
-
-    # Round 1: 검색 수행 (병렬)
-    print(f"  [SEARCH] Running parallel RAG + Web + EFSA searches...")
-
-    rag_context = ""
-    web_context = ""
-    efsa_context_result = ""
-
-    def do_rag_search():
-        try:
-            result = rag_search_tool.invoke({"query": f"{topic} NGT safety assessment"})
-            logger.info(f"RAG search completed")
-            return f"\n\n[참고 규제 문서]\n{result}"
-        except Exception as e:
-            logger.warning(f"RAG search failed: {e}")
-            return ""
+    queries = [_specialist_rag_query(topic, profile) for profile in team]
+    try:
+        top_k = int(os.environ.get("SPECIALIST_RAG_TOP_K", DEFAULT_SPECIALIST_RAG_TOP_K))
+        results = rag_search_many(queries, top_k=top_k)
+        logger.info(f"Specialist RAG search completed: {len(queries)} queries")
+        return [f"\n\n[참고 규제 문서]\n{result}" for result in results]
+    except Exception as e:
+        logger.warning(f"Specialist RAG search failed: {e}, falling back to shared query")
+        return [_search_rag(topic)] * len(team)
 
-    def do_web_search():
-        try:
-            result = web_search.invoke({"query": f"{topic} NGT regulation 2025"})
-            logger.info(f"Web search completed")
-            return f"\n\n[최신 웹 검색 결과]\n{result}"
-        except Exception as e:
-            logger.warning(f"Web search failed: {e}")
-            return ""
 
-    def do_efsa_search():
-        try:
-            result = efsa_search.invoke({"query": f"{topic} NGT safety assessment EFSA"})
-            logger.info(f"EFSA search completed")
-            return f"\n\n[EFSA Journal 검색 결과]\n{result}"
-        except Exception as e:
-            logger.warning(f"EFSA search failed: {e}")
-            return ""
+def _search_web(topic: str) -> str:
+    try:
+        result = web_search.invoke({"query": f"{topic} NGT regulation 2025"})
+        logger.info(f"Web search completed")
+        return f"\n\n[최신 웹 검색 결과]\n{result}"
+    except Exception as e:
+        logger.warning(f"Web search failed: {e}")
+        return ""
 
-    # 병렬 실행
-    with ThreadPoolExecutor(max_workers=3) as executor:
-        rag_future = executor.submit(do_rag_search)
-        web_future = executor.submit(do_web_search)
-        efsa_future = executor.submit(do_efsa_search)
 
-        rag_context = rag_future.result()
-        web_context = web_future.result()
-        efsa_context_result = efsa_future.result()
+def _search_efsa(topic: str, run_id: str) -> str:
+    try:
+        # PI 기획 단계에서 최종 합성용으로 prefetch한 같은 검색어 결과를 공유
+        query = f"{topic} NGT safety assessment EFSA"
+        result = resolve_prefetched(run_id, f"efsa_search:{query}", efsa_search.invoke, {"query": query})
+        logger.info(f"EFSA search completed")
+        return f"\n\n[EFSA Journal 검색 결과]\n{result}"
+    except Exception as e:
+        logger.warning(f"EFSA search failed: {e}")
+        return ""
+
+
+def _cached_searches(state: AgentState) -> tuple[str, str, str] | None:
+    """Round 2 이상이면 Round 1 검색 캐시 (rag_context, web_context, efsa_context)"""
+    if state.get("current_round", 1) <= 1:
+        return None
+    cached_rag = state.get("cached_rag_context", "")
+    cached_web = state.get("cached_web_context", "")
+    cached_efsa = state.get("cached_efsa_context", "")
+    if cached_rag or cached_web:
+        print(f"  [CACHE] Using cached search results from Round 1")
+        logger.info(f"Using cached search results (Round {state.get('current_round')})")
+        return cached_rag, cached_web, cached_efsa
+    return None
 
-    print(f"  [SEARCH] Parallel searches completed")
-    print(f"    - RAG: {len(rag_context)} chars")
-    print(f"    - Web: {len(web_context)} chars")
-    print(f"    - EFSA: {len(efsa_context_result)} chars")
 
-    return rag_context, web_context, efsa_context_result
+class _SearchPipeline:
+    """RAG + Web + EFSA 검색을 백그라운드로 실행하고 전문가에게 준비된 컨텍스트를 제공
+
+    RAG는 전문가별 역할·집중 분야로 만든 검색어로 한 번에 검색하므로
+    전문가마다 더 작고 관련성 높은 컨텍스트를 받습니다.
+
+    전문가는 모든 검색이 끝날 때까지 기다리지 않습니다. REQUIRED_SEARCHES만 완료를
+    기다리고, 나머지는 마감 시각(deadline_seconds)까지 끝난 결과만 사용합니다.
+    늦게 끝난 검색 결과도 final()에서 모아 Round 2, 3 캐시에 저장됩니다.
+    """
+
+    def __init__(self, topic: str, state: AgentState, deadline_seconds: float):
+        executor = get_agent_executor()
+        run_id = state.get("run_id", "")
+        self.futures = {
+            # 전문가 분석(CRITICAL)보다 먼저 제출되므로 같은 우선순위에서 먼저 실행됨
+            # (낮은 우선순위면 전문가 작업이 실행별 한도를 채워 마감까지 시작되지 못할 수 있음)
+            "rag": executor.submit(
+                _search_rag_per_specialist, topic, state.get("team", []), priority=Priority.CRITICAL, run_id=run_id
+            ),
+            "web": executor.submit(_search_web, topic, priority=Priority.CRITICAL, run_id=run_id),
+            "efsa": executor.submit(_search_efsa, topic, run_id, priority=Priority.CRITICAL, run_id=run_id),
+        }
+        self.deadline = time.monotonic() + deadline_seconds
+        print(f"  [SEARCH] Started RAG + Web + EFSA searches (deadline {deadline_seconds:.0f}s for web/efsa)")
+
+    def context(self, index: int) -> tuple[str, str, str]:
+        """index번째 전문가의 (rag, web, efsa) 컨텍스트
+
+        필수 검색은 완료를, 선택 검색은 마감 시각까지 기다립니다.
+        """
+        results = {}
+        for name, future in self.futures.items():
+            if name in REQUIRED_SEARCHES:
+                results[name] = future.result()
+                continue
+            try:
+                results[name] = future.result(timeout=max(0.0, self.deadline - time.monotonic()))
+            except FutureTimeoutError:
+                print(f"  [SEARCH] {name} not ready by deadline, proceeding without it")
+                results[name] = ""
+        return results["rag"][index], results["web"], results["efsa"]
+
+    def final(self) -> tuple[str, str, str]:
+        """모든 검색 결과 (늦게 끝난 것 포함, RAG는 전문가별 결과를 중복 없이 결합)"""
+        rag = "".join(dict.fromkeys(self.futures["rag"].result()))
+        return rag, self.futures["web"].result(), self.futures["efsa"].result()
 
 
 def _run_single_specialist(
@@ -113,9 +202,12 @@ def _run_single_specialist(
     web_context: str,
     index: int,
     total: int,
+    on_delta: Callable[[str], None] | None = None,
 ) -> dict:
     """단일 전문가 분석 실행 (병렬화용)
 
+    on_delta가 주어지면 분석 텍스트를 생성되는 대로 전달합니다.
+
     Returns:
         dict: {"role": str, "focus": str, "output": str, "message": dict}
     """
@@ -136,7 +228,7 @@ def _run_single_specialist(
             f"과학적 근거와 출처를 [출처: ...] 형식으로 명시하세요."
             f"{rag_context}{web_context}"
         )
-        output = agent.invoke(query)
+        output = agent.invoke(query, on_delta=on_delta)
 
         output_preview = output[:200] + "..." if len(output) > 200 else output
         message = {
@@ -172,6 +264,8 @@ def run_specialists(state: AgentState) -> dict:
     Phase 1 최적화:
     - 검색 병렬화 + 캐싱
     - 전문가 병렬 실행 (5배 속도 향상)
+    - 검색→전문가 파이프라인: 느린 웹 검색이 전체 전문가 시작을 막지 않음
+      (SEARCH_DEADLINE_SECONDS 이후에는 준비된 컨텍스트만으로 시작)
     """
     team = state.get("team", [])
     topic = state["topic"]
@@ -183,8 +277,19 @@ def run_specialists(state: AgentState) -> dict:
     print(f"  PARALLEL MODE: {len(team)} specialists running concurrently")
     print(f"{'#'*80}\n")
 
-    # 검색 병렬 수행 + 캐싱
-    rag_context, web_context, efsa_context = _perform_searches(topic, state)
+    # 검색은 백그라운드로 시작하고, 전문가는 필요한 컨텍스트가 준비되는 대로 시작
+    cached = _cached_searches(state)
+    pipeline = None
+    if cached is None:
+        deadline = float(os.environ.get("SEARCH_DEADLINE_SECONDS", DEFAULT_SEARCH_DEADLINE_SECONDS))
+        pipeline = _SearchPipeline(topic, state, deadline)
+
+    def _run_when_ready(profile: dict, index: int, on_delta) -> dict:
+        rag_context, web_context, efsa_context = cached or pipeline.context(index)
+        # EFSA context를 web_context에 합쳐서 전달
+        return _run_single_specialist(
+            profile, topic, constraints, rag_context, web_context + efsa_context, index, len(team), on_delta
+        )
 
     # 전문가들 병렬 실행
     specialist_outputs = []
@@ -192,27 +297,31 @@ def run_specialists(state: AgentState) -> dict:
 
     print(f"\n  [PARALLEL EXECUTION] Launching {len(team)} specialist threads...")
 
-    with ThreadPoolExecutor(max_workers=len(team)) as executor:
-        futures = []
-        for i, profile in enumerate(team):
-            # EFSA context를 web_context에 합쳐서 전달
-            combined_web = web_context + efsa_context
-            future = executor.submit(
-                _run_single_specialist,
-                profile, topic, constraints, rag_context, combined_web, i, len(team)
-            )
-            futures.append(future)
-
-        # 완료된 순서대로 결과 수집
-        for future in as_completed(futures):
-            result = future.result()
-            specialist_outputs.append({
-                "role": result["role"],
-                "focus": result["focus"],
-                "output": result["output"],
-            })
-            if result["message"]:
-                messages.append(result["message"])
+    executor = get_agent_executor()
+    futures = []
+    for i, profile in enumerate(team):
+        # delta emitter는 노드 스레드에서 만들어야 워커 스레드에서도 스트림에 쓸 수 있음
+        on_delta = make_delta_emitter(
+            profile.get("role", f"전문가 {i+1}"), "specialist", round=1
+        )
+        futures.append(executor.submit(
+            _run_when_ready, profile, i, on_delta, priority=Priority.CRITICAL, run_id=state.get("run_id", "")
+        ))
+
+    # 완료된 순서대로 결과 수집
+    for future in executor.as_completed(futures):
+        result = future.result()
+        specialist_outputs.append({
+            "role": result["role"],
+            "focus": result["focus"],
+            "output": result["output"],
+        })
+        if result["message"]:
+            messages.append(result["message"])
+
+    # 마감 이후 도착한 검색 결과까지 포함해 캐싱 (Round 2, 3에서 재사용)
+    rag_context, web_context, efsa_context = cached or pipeline.final()
+    print(f"  [SEARCH] RAG: {len(rag_context)} chars, Web: {len(web_context)} chars, EFSA: {len(efsa_context)} chars")
 
     # 출처 수집
     collected_sources = list(state.get("sources", []))
@@ -242,6 +351,53 @@ def run_specialists(state: AgentState) -> dict:
     }
 
 
+def _is_converged(score, feedback: str) -> bool:
+    """Critic 평가가 수렴 기준(REVISION_SKIP_POLICY)을 만족하는지 판단"""
+    policy = os.environ.get("REVISION_SKIP_POLICY", DEFAULT_REVISION_SKIP_POLICY).lower()
+    if policy == "off":
+        return False
+    try:
+        score = int(score)
+        min_score = int(os.environ.get("REVISION_SKIP_MIN_SCORE", DEFAULT_REVISION_SKIP_MIN_SCORE))
+    except (TypeError, ValueError):
+        return False
+    if score < min_score:
+        return False
+    if policy == "score":
+        return True
+    feedback = (feedback or "").strip()
+    return not feedback or CONVERGED_FEEDBACK_MARKER in feedback
+
+
+def _revise_with_patch(
+    agent, query: str, prev_output: str, role: str, on_delta: Callable[[str], None] | None = None
+) -> str | None:
+    """섹션 편집(RevisionPatch)을 요청해 이전 분석에 로컬로 적용
+
+    Returns:
+        str: 편집이 적용된 분석. 요청·파싱·적용에 실패하거나 편집이 없으면 None
+            (호출 측에서 전체 재작성으로 대체)
+    """
+    sections = "\n".join(f"- {heading.lstrip('#').strip()}" for heading in outline(prev_output))
+    patch_query = f"{query}\n[이전 분석의 섹션 목록]\n{sections}\n\n{REVISION_PATCH_GUIDE}\n"
+    try:
+        patch = agent.invoke_json(
+            patch_query, RevisionPatch, max_tokens=REVISION_PATCH_MAX_TOKENS, call_site="revision.patch"
+        )
+        if not patch.edits:
+            raise ValueError("편집이 없습니다")
+        output = apply_edits(prev_output, patch.edits)
+    except Exception as e:
+        logger.warning(f"Specialist {role} patch revision failed, falling back to full rewrite: {e}")
+        print(f"  [PATCH] {role}: fallback to full rewrite ({e})")
+        return None
+
+    print(f"  [PATCH] {role}: {len(patch.edits)} edits applied ({len(prev_output)} -> {len(output)} chars)")
+    if on_delta is not None:
+        on_delta(f"(수정 {len(patch.edits)}건) {patch.summary}")
+    return output
+
+
 def run_round_revision(state: AgentState) -> dict:
     """전문가들이 이전 라운드 피드백을 반영하여 분석을 수정/보완합니다.
 
@@ -258,7 +414,7 @@ def run_round_revision(state: AgentState) -> dict:
     constraints = state.get("constraints", "")
 
     print(f"\n{'#'*80}")
-    print(f"[ROUND REVISION] Running {len(team)} specialist revisions - Round {current_round}/3")
+    print(f"[ROUND REVISION] Running {len(team)} specialist revisions - Round {round_label(state)}")
     print(f"  Topic: {topic}")
     print(f"  PARALLEL MODE: {len(team)} specialists running concurrently")
     print(f"{'#'*80}\n")
@@ -272,6 +428,8 @@ def run_round_revision(state: AgentState) -> dict:
     # 이전 라운드 누적 피드백 수집
     meeting_history = state.get("meeting_history", [])
 
+    revision_mode = os.environ.get("REVISION_MODE", DEFAULT_REVISION_MODE).lower()
+
     def _build_cumulative_feedback(role: str) -> str:
         """모든 이전 라운드의 피드백을 누적 수집"""
         cumulative = []
@@ -283,7 +441,9 @@ def run_round_revision(state: AgentState) -> dict:
                 cumulative.append(f"  [라운드 {round_num}] 점수: {prev_sc}/5\n  피드백: {prev_fb}")
         return "\n".join(cumulative)
 
-    def _run_single_revision(profile: dict, index: int) -> dict:
+    def _run_single_revision(
+        profile: dict, index: int, on_delta: Callable[[str], None] | None = None
+    ) -> dict:
         """단일 전문가 수정 실행 (병렬화용)"""
         role = profile.get("role", f"전문가 {index+1}")
         focus = profile.get("focus", "")
@@ -330,15 +490,17 @@ def run_round_revision(state: AgentState) -> dict:
 
         print(f"  [{index+1}/{len(team)}] START {role}: {focus} (Round {current_round}){my_score} (parallel execution...)")
 
+        prev_output = prev_map.get(role, "")
+
         try:
             agent = create_specialist(profile)
 
             query = (
-                f"[라운드 {current_round}/3 - 수정/보완 단계]\n"
+                f"[라운드 {round_label(state)} - 수정/보완 단계]\n"
                 f"연구 주제: {topic}\n"
                 f"제약 조건: {constraints}\n"
                 f"당신의 전문 분야: {focus}\n\n"
-                f"[당신의 이전 분석]\n{prev_map.get(role, '')}\n\n"
+                f"[당신의 이전 분석]\n{prev_output}\n\n"
                 f"[비평가의 최신 피드백]{my_score}\n{my_feedback}\n\n"
                 f"{'[이전 라운드 누적 피드백]' + chr(10) + cumulative_fb + chr(10) if cumulative_fb else ''}"
                 f"[PI의 이전 라운드 결론]\n{pi_summary}\n\n"
@@ -353,7 +515,11 @@ def run_round_revision(state: AgentState) -> dict:
                 f"3. 각 주장에 과학적 근거와 출처를 [출처: ...] 형식으로 명시하세요.\n"
                 f"4. 이전 분석보다 반드시 더 깊이 있고 구체적인 내용을 작성하세요.\n"
             )
-            output = agent.invoke(query, max_tokens=32768)
+            output = None
+            if revision_mode == "patch" and outline(prev_output):
+                output = _revise_with_patch(agent, query, prev_output, role, on_delta)
+            if output is None:
+                output = agent.invoke(query, max_tokens=32768, on_delta=on_delta, call_site="revision")
 
             output_preview = output[:200] + "..." if len(output) > 200 else output
             message = {
@@ -383,25 +549,51 @@ def run_round_revision(state: AgentState) -> dict:
                 "message": None,
             }
 
-    # 전문가들 병렬 실행
-    print(f"\n  [PARALLEL EXECUTION] Launching {len(team)} revision threads...")
-
-    with ThreadPoolExecutor(max_workers=len(team)) as executor:
-        futures = []
-        for i, profile in enumerate(team):
-            future = executor.submit(_run_single_revision, profile, i)
-            futures.append(future)
-
-        # 완료된 순서대로 결과 수집
-        for future in as_completed(futures):
-            result = future.result()
+    # 수렴한 전문가는 이전 분석을 그대로 이어받고(carried forward) 나머지만 수정
+    to_revise = []
+    for i, profile in enumerate(team):
+        role = profile.get("role", f"전문가 {i+1}")
+        score = critique.scores.get(role) if critique and critique.scores else None
+        feedback = critique.specialist_feedback.get(role, "") if critique and critique.specialist_feedback else ""
+        if prev_map.get(role) and _is_converged(score, feedback):
+            print(f"  [{i+1}/{len(team)}] CARRIED FORWARD {role}: converged ({score}/5), revision skipped")
             specialist_outputs.append({
-                "role": result["role"],
-                "focus": result["focus"],
-                "output": result["output"],
+                "role": role,
+                "focus": profile.get("focus", ""),
+                "output": prev_map[role],
+                "carried_forward": True,
             })
-            if result["message"]:
-                messages.append(result["message"])
+            messages.append({
+                "role": "specialist",
+                "name": role,
+                "content": f"[라운드 {current_round}] [{role}] 이전 분석이 수렴({score}/5)하여 그대로 유지합니다.",
+            })
+        else:
+            to_revise.append((i, profile))
+
+    # 전문가들 병렬 실행
+    print(f"\n  [PARALLEL EXECUTION] Launching {len(to_revise)} revision threads...")
+
+    executor = get_agent_executor()
+    futures = []
+    for i, profile in to_revise:
+        on_delta = make_delta_emitter(
+            profile.get("role", f"전문가 {i+1}"), "revision", round=current_round
+        )
+        futures.append(executor.submit(
+            _run_single_revision, profile, i, on_delta, priority=Priority.CRITICAL, run_id=state.get("run_id", "")
+        ))
+
+    # 완료된 순서대로 결과 수집
+    for future in executor.as_completed(futures):
+        result = future.result()
+        specialist_outputs.append({
+            "role": result["role"],
+            "focus": result["focus"],
+            "output": result["output"],
+        })
+        if result["message"]:
+            messages.append(result["message"])
 
     # 출처 수집 (기존 + 새로운)
     collected_sources = list(state.get("sources", []))
@@ -414,7 +606,10 @@ def run_round_revision(state: AgentState) -> dict:
             seen.add(s)
             unique_sources.append(s)
 
-    print(f"\n[ROUND REVISION] All {len(team)} specialists revised (PARALLEL)")
+    print(
+        f"\n[ROUND REVISION] {len(to_revise)} specialists revised (PARALLEL), "
+        f"{len(team) - len(to_revise)} carried forward"
+    )
     print(f"  Sources collected: {len(unique_sources)}\n")
 
     return {
@@ -0,0 +1,335 @@
+"""최종 보고서 섹션 병렬 합성 (map-reduce)
+
+run_final_synthesis의 단일 대형 호출(최대 65,536 출력 토큰)을 섹션별 동시 호출로 나눕니다.
+
+- map: 연구 방법론, 핵심 질문 1~5, 참고문헌, 의사결정 흐름도를 각각 별도 요청으로 생성.
+  섹션마다 필요한 컨텍스트만 넘기므로 입력도 작아집니다.
+- reduce: 섹션을 정해진 순서로 이어 붙이고(제목 정리), 각 섹션 결론을 바탕으로
+  짧은 요약(Executive Summary)만 한 번 더 생성합니다.
+
+전체 소요 시간은 대략 가장 긴 섹션 하나의 생성 시간이 됩니다.
+"""
+import logging
+import re
+from dataclasses import dataclass
+
+from data.guidelines import RESEARCH_AGENDA
+from utils.executor import Priority, get_agent_executor
+from utils.llm import LONG_OUTPUT_CONTINUATIONS, call_gpt
+from utils.streaming import make_delta_emitter
+from workflow.rounds import DEFAULT_MAX_ROUNDS
+
+logger = logging.getLogger(__name__)
+
+REPORT_TITLE = "# 유전자편집식품(NGT) 표준 안전성 평가 프레임워크 (Final Report)"
+
+# 요약 생성 시 섹션별로 참고할 결론부 길이 (글자)
+SUMMARY_EXCERPT_CHARS = 1500
+SUMMARY_MAX_TOKENS = 2048
+
+SECTION_SYSTEM_PROMPT = f"""당신은 연구 프로젝트의 총괄 책임자(PI)입니다.
+
+## 연구 아젠다
+{RESEARCH_AGENDA}
+
+## 당신의 임무
+Scientist와 Critic의 라운드별 논의를 거쳐 승인된 결과를 바탕으로 최종 보고서를 작성합니다.
+보고서는 여러 섹션으로 나뉘어 동시에 작성되며, 당신은 그중 **요청받은 한 섹션만** 작성합니다.
+
+**작성 원칙**:
+- 요청받은 섹션의 `##` 제목으로 시작하고, 다른 섹션이나 보고서 전체 제목(`#`)은 쓰지 마세요.
+- 모든 하위 항목을 빠짐없이, 충분한 분량으로 상세히 서술하세요. 단순 나열이 아닌 분석적 서술이 필요합니다.
+- 과학적 근거와 출처를 명시하세요. 제공된 참고 정보를 활용해 근거를 강화하세요.
+- Markdown으로 작성하세요.
+"""
+
+
+
+def round_stages(num_rounds: int) -> list[tuple[str, str]]:
+    """라운드별 (제목, 진행 내용) - 방법론 서술과 질문별 회의록 구조의 공통 뼈대"""
+    if num_rounds <= 1:
+        return [("라운드 1: 분석 및 결론", "전문가 분석 → 비평가 검증 → PI 최종 종합")]
+    stages = [("라운드 1: 초기 분석", "초기 분석 → 비평 → PI 임시 결론")]
+    stages += [(f"라운드 {r}: 비평 반영 보완", "피드백 반영 보완 → 재검증 → 중간 종합") for r in range(2, num_rounds)]
+    stages.append((f"라운드 {num_rounds}: 최종 정제", "최종 정제 → 최종 검증 → 최종 종합"))
+    return stages
+
+
+def rounds_process(num_rounds: int) -> str:
+    """방법론의 반복 심화 프로세스 문장 (예: "라운드 1(초기 분석 → …), 라운드 2(…)")"""
+    return ", ".join(f"{title.split(':')[0]}({flow})" for title, flow in round_stages(num_rounds))
+
+
+def round_blocks(num_rounds: int) -> str:
+    """핵심 질문 하나의 라운드별 회의록 구조 (실제 진행된 라운드 수만큼)"""
+    blocks = []
+    for r, (title, _) in enumerate(round_stages(num_rounds), start=1):
+        if r == num_rounds:
+            body = (
+                "각 과학자의 최종 정제된 분석.\nCritic의 최종 평가 포함.\n"
+                if r > 1
+                else "각 과학자 에이전트의 분석 결과를 전문가별로 제시.\nCritic의 평가 점수(1-5점) 및 구체적 피드백 포함.\n"
+            ) + "PI의 최종 종합 및 결론: 이 질문에 대한 확정된 답변."
+        elif r == 1:
+            body = (
+                "각 과학자 에이전트의 초기 분석 결과를 전문가별로 제시.\n"
+                "Critic의 평가 점수(1-5점) 및 구체적 피드백 포함.\n"
+                "PI의 1라운드 종합: 주요 쟁점, 합의 사항, 임시 결론."
+            )
+        else:
+            body = (
+                "Critic 피드백을 반영한 각 과학자의 보완 분석.\n"
+                "Critic의 재평가 및 점수 변화 포함.\n"
+                f"PI의 {r}라운드 종합: 개선된 분석 포인트, 잔여 쟁점."
+            )
+        blocks.append(f"### {title}\n{body}")
+    return "\n\n".join(blocks)
+
+
+def rounds_instructions(num_rounds: int) -> str:
+    """핵심 질문 섹션 작성 지침 (라운드별 구조 + 결론 요구)"""
+    return (
+        round_blocks(num_rounds)
+        + f"\n\n- 팀 회의는 {num_rounds}라운드로 진행되었습니다. 진행되지 않은 라운드를 지어내지 마세요."
+        + f"\n- 라운드 {num_rounds}에서는 이 질문에 대한 확정된 결론을 명확히 도출하세요."
+        + "\n- 각 라운드는 최소 5-10문단으로 상세히 서술하세요."
+    )
+
+
+@dataclass
+class SynthesisSection:
+    """보고서 섹션 하나의 생성 명세"""
+
+    key: str
+    title: str  # "## " 제목 (접두어 제외)
+    instructions: str  # 섹션 작성 지침
+    context_keys: tuple[str, ...]  # 이 섹션에 넘길 컨텍스트 (synthesize_report의 context 키)
+    max_tokens: int
+
+
+def _question_section(number: int, title: str, num_rounds: int, extra: str = "") -> SynthesisSection:
+    return SynthesisSection(
+        key=f"q{number}",
+        title=f"핵심 질문 {number}: {title}",
+        instructions=f"5대 핵심 질문 중 Q{number}에 대한 {num_rounds}라운드 회의록을 아래 구조로 작성하세요.\n\n"
+        f"{rounds_instructions(num_rounds)}\n{extra}",
+        context_keys=("pi_summaries", "specialist_outputs", "web", "efsa"),
+        max_tokens=12288,
+    )
+
+
+def _methodology_section(num_rounds: int) -> SynthesisSection:
+    return SynthesisSection(
+        key="methodology",
+        title="연구 방법론 (Research Methodology)",
+        instructions=f"""본 연구는 AI 기반 Virtual Lab 시스템을 활용하여 다학제 전문가 팀의 체계적 협업을 통해 수행되었음을 서술하세요.
+
+아래 하위 항목을 모두 포함하세요:
+### 연구 수행 체계
+PI(연구 방향 설정, 팀 구성, 라운드별 종합, 최종 보고서), 전문가 패널(Specialists),
+독립 비평가(Critic, 1-5점 척도 평가)의 역할.
+
+### {num_rounds}라운드 반복 심화 프로세스
+{rounds_process(num_rounds)}. 비평가 피드백이 다음 라운드에 반영되는 방식.
+
+### 정보 검색 체계
+RAG(Pinecone 벡터 DB의 규제 문서·학술 문헌), Web Search(Tavily), EFSA Journal Search.
+
+### 연구 팀 구성 과정
+#### 통계적 팀 구성 방법
+제공된 팀 구성 데이터로 실험 횟수(요청 횟수, 실제 수행 횟수, 조기 종료 여부 - 제공된 값 그대로),
+시행별 팀 구성 테이블(| 시행 | 팀 규모 | 구성원 역할 |),
+총 생성된 과학자 에이전트 수, 역할별 등장 빈도 테이블(| 역할 | 등장 횟수 | 백분율 | 전문분야 변형 |),
+팀 규모 분포, PI의 최종 선정 과정 및 근거를 상세히 작성하세요.
+
+#### 전문가 소개
+제공된 전문가 자기소개를 "🤖 **역할명**" 다음 줄에 자기소개 형식 그대로 포함하세요.
+
+### 에이전트별 기여도 통계
+제공된 통계를 | 에이전트 | 발화 횟수 | 총 글자수 | 표로 포함하세요.
+
+(제공되지 않은 데이터는 지어내지 말고 해당 항목을 생략하세요.)""",
+        context_keys=("team_composition", "introductions", "word_counts"),
+        max_tokens=8192,
+    )
+
+
+_REFERENCES_SECTION = SynthesisSection(
+    key="references",
+    title="참고문헌 (References)",
+    instructions="""제공된 출처 목록과 검색 결과를 아래 하위 섹션으로 분류해 번호 목록으로 정리하세요.
+### 5-1. Web Search Sources
+(Tavily 웹 검색 자료의 URL과 제목)
+### 5-2. Regulatory Documents (RAG)
+(규제 문서·학술 문헌의 파일명, 페이지, 제목)
+### 5-3. EFSA Journal Sources
+(EFSA 공식 학술지 자료의 URL과 제목)
+
+제공되지 않은 출처를 지어내지 마세요.""",
+    context_keys=("sources", "web", "efsa"),
+    max_tokens=4096,
+)
+
+_DECISION_TREE_SECTION = SynthesisSection(
+    key="decision_tree",
+    title="의사결정 흐름도 (Decision Tree)",
+    instructions="""NGT 식품의 위험평가 의사결정 흐름을 Mermaid `graph TD` 다이어그램으로 제시하세요.
+SDN-1, SDN-2, SDN-3, ODM 각 카테고리에 대한 단계적·비례적 평가 경로를 모두 포함하고,
+각 분기점의 판단 기준, 필요한 평가 항목, 최종 결정(승인/추가검토/거부)을 명시하세요.
+다이어그램 앞뒤로 흐름도를 설명하는 서술도 포함하세요.
+
+**Mermaid 문법 주의사항 (필수 준수)**:
+- 모든 노드 레이블은 반드시 큰따옴표로 감싸세요: `A["텍스트"]`, `B{"텍스트"}` 형식.
+- 노드 텍스트에 괄호를 쓰지 마세요: `C3["GM-rDNA 동등 심사"]` (괄호를 하이픈으로 대체).
+- 링크 레이블도 특수문자를 피하세요: `-->|"레이블"| 노드`""",
+    context_keys=("pi_summaries",),
+    max_tokens=4096,
+)
+
+
+def build_sections(num_rounds: int) -> list[SynthesisSection]:
+    """실제 진행된 라운드 수에 맞춘 보고서 섹션 명세 (질문별 회의록 구조·방법론 문장이 라운드 수를 따름)"""
+    return [
+        _methodology_section(num_rounds),
+        _question_section(1, "식품에 적용되는 유전자편집기술의 분류 기준과 특성", num_rounds),
+        _question_section(2, "유전자편집기술 분류별 우선 고려 위험요소", num_rounds),
+        _question_section(3, "기존 위험평가 지침의 적용 가능성과 충분성", num_rounds),
+        _question_section(
+            4,
+            "평가 항목 보완 및 기술적·실험적 평가 방법",
+            num_rounds,
+            "- 핵심 질문 1-2에서 식별한 위험 요소와 핵심 질문 3에서 발견한 지침 한계점(라운드별 PI 요약 참조)을 "
+            "직접 참조하고, 각각에 대한 구체적 해결방안을 제시하세요.",
+        ),
+        _question_section(
+            5,
+            "단계적 의사결정 흐름 구성",
+            num_rounds,
+            "- 의사결정 흐름은 핵심 질문 1-4의 결론(라운드별 PI 요약 참조)을 통합하여 도출하세요.",
+        ),
+        _REFERENCES_SECTION,
+        _DECISION_TREE_SECTION,
+    ]
+
+
+# 기본 라운드 수 기준 섹션 명세
+SECTIONS: list[SynthesisSection] = build_sections(DEFAULT_MAX_ROUNDS)
+
+# synthesize_report context 키 → 섹션 요청에 붙일 제목
+_CONTEXT_LABELS = {
+    "pi_summaries": "{num_rounds}라운드 팀 회의 전체 요약",
+    "specialist_outputs": "최종 라운드 전문가 분석 (정제본)",
+    "web": "웹 검색 결과 - 최신 정보",
+    "efsa": "EFSA Journal 검색 결과",
+    "team_composition": "연구 팀 구성 과정",
+    "introductions": "전문가 자기소개",
+    "word_counts": "에이전트별 기여도 통계",
+    "sources": "참조 출처 목록",
+}
+
+SUMMARY_SYSTEM_PROMPT = """당신은 연구 프로젝트의 총괄 책임자(PI)입니다.
+섹션별로 작성된 최종 보고서의 결론부를 읽고, 보고서 맨 앞에 들어갈 요약을 작성합니다.
+`## 요약 (Executive Summary)` 제목으로 시작해 5대 핵심 질문별 핵심 결론을 한두 문장씩,
+전체 10-15문장 이내로 작성하세요. 새로운 주장을 추가하지 마세요."""
+
+
+def _section_message(
+    section: SynthesisSection, topic: str, constraints: str, context: dict[str, str], num_rounds: int
+) -> str:
+    parts = [f"연구 주제: {topic}", f"제약 조건: {constraints}"]
+    for key in section.context_keys:
+        if context.get(key, "").strip():
+            label = _CONTEXT_LABELS.get(key, key).format(num_rounds=num_rounds)
+            parts.append(f"[{label}]\n{context[key].strip()}")
+    parts.append(
+        f"위 자료를 바탕으로 최종 보고서의 '## {section.title}' 섹션만 작성하세요.\n\n"
+        f"## 섹션 작성 지침\n{section.instructions}"
+    )
+    return "\n\n".join(parts)
+
+
+def _normalize_section(section: SynthesisSection, text: str) -> str:
+    """보고서 제목(#) 제거, 섹션 제목(##) 보장"""
+    text = re.sub(r"^\s*#\s+[^\n]*\n", "", text.strip()).strip()
+    if not text.startswith("## "):
+        text = f"## {section.title}\n\n{text}"
+    return text
+
+
+def _generate_section(section: SynthesisSection, message: str, on_delta) -> str:
+    text = call_gpt(
+        SECTION_SYSTEM_PROMPT,
+        message,
+        max_tokens=section.max_tokens,
+        on_delta=on_delta,
+        continuations=LONG_OUTPUT_CONTINUATIONS,
+        call_site="synthesis.section",
+    )
+    print(f"  [SYNTHESIS] {section.key}: {len(text)} chars")
+    return _normalize_section(section, text)
+
+
+def _executive_summary(sections: list[SynthesisSection], texts: list[str]) -> str:
+    """섹션별 결론부만 모아 짧은 요약 생성 (실패 시 빈 문자열)"""
+    excerpts = "\n\n".join(
+        f"=== {section.title} (결론부) ===\n{text[-SUMMARY_EXCERPT_CHARS:]}"
+        for section, text in zip(sections, texts)
+        if section.key.startswith("q")
+    )
+    try:
+        summary = call_gpt(
+            SUMMARY_SYSTEM_PROMPT, excerpts, max_tokens=SUMMARY_MAX_TOKENS, call_site="synthesis.summary"
+        )
+        return summary.strip()
+    except Exception as e:
+        logger.warning(f"Executive summary generation failed: {e}")
+        return ""
+
+
+def synthesize_report(
+    topic: str, constraints: str, context: dict[str, str], num_rounds: int = DEFAULT_MAX_ROUNDS
+) -> str:
+    """섹션별 동시 생성 후 하나의 보고서로 결합
+
+    반드시 LangGraph 노드 스레드에서 호출해야 섹션별 delta 스트리밍이 동작합니다.
+
+    Args:
+        topic: 연구 주제
+        constraints: 제약 조건
+        context: 섹션별로 골라 넘길 컨텍스트 텍스트
+            (pi_summaries, specialist_outputs, web, efsa, team_composition,
+            introductions, word_counts, sources)
+        num_rounds: 실제 진행된 팀 회의 라운드 수 (질문별 회의록 구조와 방법론 서술에 반영)
+
+    Returns:
+        str: 결합된 Markdown 보고서 (Mermaid 정리 전)
+
+    Raises:
+        RuntimeError: 섹션 생성이 하나라도 실패한 경우 (호출자가 단일 호출로 대체)
+    """
+    sections = build_sections(num_rounds)
+    print(f"[SYNTHESIS] Generating {len(sections)} sections concurrently ({num_rounds} rounds)")
+
+    # emitter는 노드 스레드에서 생성 (섹션마다 별도 타임라인 패널)
+    emitters = [make_delta_emitter(f"PI · {s.title}", "synthesis") for s in sections]
+    messages = [_section_message(s, topic, constraints, context, num_rounds) for s in sections]
+
+    executor = get_agent_executor()
+    futures = [
+        executor.submit(_generate_section, section, message, emitter, priority=Priority.CRITICAL)
+        for section, message, emitter in zip(sections, messages, emitters)
+    ]
+    texts, failed = [], []
+    for section, future in zip(sections, futures):
+        try:
+            texts.append(future.result())
+        except Exception as e:
+            logger.warning(f"Synthesis section '{section.key}' failed: {e}")
+            failed.append(section.key)
+
+    if failed:
+        raise RuntimeError(f"synthesis sections failed: {', '.join(failed)}")
+
+    summary = _executive_summary(sections, texts)
+    parts = [REPORT_TITLE] + ([summary] if summary else []) + texts
+    return "\n\n---\n\n".join(parts) + "\n"
@@ -16,7 +16,7 @@ import { useEffect, useState, useRef } from 'react';
 
 // 타임라인 이벤트 타입
 interface TimelineEvent {
-  type: 'start' | 'phase' | 'agent' | 'decision' | 'iteration' | 'complete' | 'error';
+  type: 'start' | 'phase' | 'agent' | 'decision' | 'iteration' | 'complete' | 'error' | 'delta' | 'carried_forward';
   timestamp: number;
   message: string;
   agent?: 'scientist' | 'critic' | 'pi' | 'specialist';
@@ -31,8 +31,24 @@ interface TimelineEvent {
   saved_filename?: string;
   specialist_name?: string;
   specialist_focus?: string;
+  // start/error 이벤트: 체크포인트 재개용 실행 ID (/api/research/{run_id}/resume)
+  run_id?: string;
+  resumed?: boolean;
+  // delta 이벤트 (LLM 생성 중 텍스트 조각)
+  name?: string;
+  delta?: string;
 }
 
+// 생성 중인 LLM 출력 (발화자별 누적)
+interface LiveOutput {
+  name: string;
+  phase?: string;
+  text: string;
+}
+
+// 라이브 출력 미리보기 최대 길이
+const LIVE_PREVIEW_CHARS = 400;
+
 // Props 타입
 interface ProcessTimelineProps {
   topic: string;
@@ -93,6 +109,7 @@ export default function ProcessTimeline({
   const [events, setEvents] = useState<TimelineEvent[]>([]);
   const [isStreaming, setIsStreaming] = useState(false);
   const [currentReport, setCurrentReport] = useState<string>('');
+  const [liveOutputs, setLiveOutputs] = useState<Record<string, LiveOutput>>({});
   const [expandedMessages, setExpandedMessages] = useState<Set<number>>(new Set());
   const timelineEndRef = useRef<HTMLDivElement>(null);
   const abortControllerRef = useRef<AbortController | null>(null);
@@ -132,6 +149,7 @@ export default function ProcessTimeline({
       isStreamingRef.current = true;
       setIsStreaming(true);
       setEvents([]);
+      setLiveOutputs({});
       setCurrentReport('');
       setExpandedMessages(new Set());
 
@@ -169,7 +187,24 @@ export default function ProcessTimeline({
             if (line.startsWith('data: ')) {
               try {
                 const event: TimelineEvent = JSON.parse(line.slice(6));
+
+                // delta는 타임라인 항목이 아니라 진행 중 출력으로 누적
+                if (event.type === 'delta') {
+                  const key = `${event.phase}:${event.name}`;
+                  setLiveOutputs((prev) => ({
+                    ...prev,
+                    [key]: {
+                      name: event.name || '',
+                      phase: event.phase,
+                      text: (prev[key]?.text || '') + (event.delta || ''),
+                    },
+                  }));
+                  continue;
+                }
+
                 setEvents((prev) => [...prev, event]);
+                // 노드가 끝나면 해당 단계의 라이브 출력은 정식 메시지로 대체됨
+                setLiveOutputs({});
 
                 if (event.type === 'complete' && event.report) {
                   setCurrentReport(event.report);
@@ -259,6 +294,18 @@ export default function ProcessTimeline({
           </div>
         )}
 
+        {/* 생성 중인 LLM 출력 */}
+        {isStreaming && Object.entries(liveOutputs).map(([key, live]) => (
+          <div key={key} className="glass-panel-light rounded-lg px-4 py-3 border border-white/5">
+            <div className="text-xs text-cyan-400 font-mono mb-1">
+              {live.name} {live.phase && <span className="text-gray-500">· {live.phase}</span>}
+            </div>
+            <p className="text-sm text-gray-300 whitespace-pre-wrap break-words">
+              {live.text.length > LIVE_PREVIEW_CHARS ? '…' + live.text.slice(-LIVE_PREVIEW_CHARS) : live.text}
+            </p>
+          </div>
+        ))}
+
         <div ref={timelineEndRef} />
       </div>
 
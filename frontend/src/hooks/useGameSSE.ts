@@ -11,7 +11,7 @@ import {
 
 // SSE event from backend (same as ProcessTimeline)
 interface SSEEvent {
-  type: 'start' | 'phase' | 'agent' | 'decision' | 'iteration' | 'complete' | 'error';
+  type: 'start' | 'phase' | 'agent' | 'decision' | 'iteration' | 'complete' | 'error' | 'delta' | 'carried_forward';
   timestamp: number;
   message: string;
   agent?: 'scientist' | 'critic' | 'pi' | 'specialist';
@@ -26,6 +26,9 @@ interface SSEEvent {
   saved_filename?: string;
   specialist_name?: string;
   specialist_focus?: string;
+  // start/error 이벤트: 체크포인트 재개용 실행 ID (/api/research/{run_id}/resume)
+  run_id?: string;
+  resumed?: boolean;
 }
 
 type GameAction =
@@ -320,6 +323,8 @@ export function useGameSSE({ topic, constraints, onComplete, onError }: UseGameS
             if (line.startsWith('data: ')) {
               try {
                 const event: SSEEvent = JSON.parse(line.slice(6));
+                // 토큰 delta는 게임 화면에서 사용하지 않음
+                if (event.type === 'delta') continue;
                 dispatch({ type: 'SSE_EVENT', event });
 
                 if (event.type === 'complete' && event.report) {
@@ -45,6 +45,10 @@ CREATE TRIGGER update_sessions_updated_at
     FOR EACH ROW
     EXECUTE FUNCTION update_updated_at_column();
 
+-- LangGraph checkpoint tables (checkpoints, checkpoint_blobs, checkpoint_writes, checkpoint_migrations)
+-- are created and migrated by PostgresSaver.setup() when the server starts with
+-- CHECKPOINT_BACKEND=postgres (workflow/checkpoint.py). Runs are keyed by thread_id = run_id.
+
 -- Insert sample data for testing (optional)
 -- INSERT INTO sessions (user_query, final_report, status)
 -- VALUES
@@ -1,4 +1,5 @@
 """Pinecone Vector Database Client"""
+from concurrent.futures import ThreadPoolExecutor
 from pinecone.grpc import PineconeGRPC as Pinecone
 from openai import OpenAI
 from config import settings
@@ -29,6 +30,14 @@ class PineconeRAGClient:
         )
         return response.data[0].embedding
 
+    def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """여러 텍스트를 한 번의 임베딩 요청으로 벡터로 변환 (입력 순서 유지)"""
+        response = self.openai.embeddings.create(
+            model=settings.EMBEDDING_MODEL,
+            input=texts
+        )
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
     def upsert_documents(self, documents: List[Dict]):
         """문서 추가 (PDF 청크)
 
@@ -79,7 +88,36 @@ class PineconeRAGClient:
             include_metadata=True
         )
 
-        # 결과 포맷팅
+        documents = self._to_documents(results)
+        logger.info(f"🔍 검색 완료: {len(documents)}개 문서 발견")
+        return documents
+
+    def search_many(self, queries: List[str], top_k: int = 5) -> List[List[Dict]]:
+        """여러 쿼리 검색 (임베딩 1회 배치 + 벡터별 조회 동시 실행)
+
+        Pinecone query는 요청당 벡터 1개만 받으므로, 임베딩은 한 번에 만들고
+        조회는 gRPC 커넥션을 공유해 동시에 보냅니다.
+
+        Returns:
+            queries와 같은 순서의 문서 목록 리스트
+        """
+        if not queries:
+            return []
+        embeddings = self.embed_texts(queries)
+
+        def _query(vector: List[float]):
+            return self.index.query(vector=vector, top_k=top_k, include_metadata=True)
+
+        with ThreadPoolExecutor(max_workers=len(embeddings)) as executor:
+            results = list(executor.map(_query, embeddings))
+
+        documents = [self._to_documents(r) for r in results]
+        logger.info(f"🔍 다중 검색 완료: {len(queries)}개 쿼리, {sum(len(d) for d in documents)}개 문서")
+        return documents
+
+    @staticmethod
+    def _to_documents(results) -> List[Dict]:
+        """Pinecone 조회 결과 → [{"text", "source", "page", "score"}, ...]"""
         documents = []
         for match in results["matches"]:
             documents.append({
@@ -88,8 +126,6 @@ class PineconeRAGClient:
                 "page": match["metadata"].get("page", 0),
                 "score": match["score"]
             })
-
-        logger.info(f"🔍 검색 완료: {len(documents)}개 문서 발견")
         return documents
 
 
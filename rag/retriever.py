@@ -7,7 +7,7 @@ RAG Retriever
 from typing import List, Dict, Optional
 
 from .chroma_client import get_chroma_client, get_or_create_collection
-from .embeddings import get_single_embedding
+from .embeddings import get_embedding_function, get_single_embedding
 
 
 def retrieve(
@@ -56,3 +56,46 @@ def retrieve(
             })
 
     return documents
+
+
+def retrieve_many(
+    queries: List[str],
+    top_k: int = 5,
+    filter: Optional[Dict] = None
+) -> List[List[Dict]]:
+    """
+    여러 쿼리를 한 번에 검색 (임베딩 1회 배치 + ChromaDB 다중 벡터 조회 1회)
+
+    Args:
+        queries: 검색 쿼리 리스트
+        top_k: 쿼리별 반환할 문서 수
+        filter: 메타데이터 필터
+
+    Returns:
+        queries와 같은 순서의 문서 목록 리스트 (각 항목은 retrieve()와 같은 형식)
+    """
+    if not queries:
+        return []
+
+    query_embeddings = get_embedding_function()(queries)
+
+    client = get_chroma_client()
+    collection = get_or_create_collection(client)
+    results = collection.query(
+        query_embeddings=query_embeddings,
+        n_results=top_k,
+        where=filter
+    )
+
+    all_documents = []
+    for q in range(len(queries)):
+        documents = []
+        for i in range(len(results['documents'][q])):
+            documents.append({
+                'text': results['documents'][q][i],
+                'metadata': results['metadatas'][q][i],
+                'distance': results['distances'][q][i]
+            })
+        all_documents.append(documents)
+
+    return all_documents
@@ -8,6 +8,8 @@ import asyncio
 from typing import Dict, List, Optional, Any
 from tavily import TavilyClient
 
+from utils.rate_limiter import get_rate_limiter
+
 
 class TavilySearchClient:
     """
@@ -97,6 +99,9 @@ class TavilySearchClient:
         """
         # Rate limiting
         await self._apply_rate_limit()
+        limiter = get_rate_limiter("tavily")
+        if limiter:
+            await limiter.acquire_async(1)
 
         # Use provided parameters or defaults
         _max_results = max_results or self.max_results
@@ -152,6 +157,11 @@ class TavilySearchClient:
         _max_results = max_results or self.max_results
         _include_domains = include_domains or self.include_domains
 
+        # Process-wide (or Redis-shared) Tavily quota
+        limiter = get_rate_limiter("tavily")
+        if limiter:
+            limiter.acquire(1)
+
         try:
             results = self.client.search(
                 query=query,
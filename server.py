@@ -11,6 +11,9 @@ import json
 import logging
 import os
 import sys
+import threading
+import uuid
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import AsyncGenerator
@@ -28,13 +31,15 @@ os.environ["LANGCHAIN_TRACING"] = "false"
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse, FileResponse
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 # 보고서 저장 디렉토리
 REPORTS_DIR = Path(__file__).parent / "reports"
 REPORTS_DIR.mkdir(exist_ok=True)
 
-from workflow.graph import create_workflow
+from workflow.checkpoint import checkpoint_value, get_checkpointer, run_config
+from workflow.graph import create_workflow, get_workflow_mode
+from workflow.rounds import ROUND_LIMIT, round_bounds
 from workflow.state import AgentState
 
 # Celery는 선택적 (Redis 없이도 서버 시작 가능)
@@ -51,7 +56,17 @@ logging.basicConfig(
     format="%(asctime)s [%(name)s] %(levelname)s: %(message)s",
 )
 
-app = FastAPI(title="Virtual Lab API")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """서버 종료 시 비동기 LLM 클라이언트(utils.llm.acall_llm) 커넥션 정리"""
+    yield
+    from utils.llm import aclose_async_http_client
+
+    await aclose_async_http_client()
+
+
+app = FastAPI(title="Virtual Lab API", lifespan=lifespan)
 
 # 서버 시작 시 로드된 모듈 검증
 startup_logger = logging.getLogger("startup")
@@ -102,6 +117,7 @@ class ResearchRequest(BaseModel):
     """연구 요청 스키마"""
     topic: str
     constraints: str = ""
+    max_rounds: int | None = Field(default=None, ge=1, le=ROUND_LIMIT)  # 없으면 ROUND_MAX
 
 
 class ResearchResponse(BaseModel):
@@ -109,6 +125,7 @@ class ResearchResponse(BaseModel):
     report: str
     messages: list[dict]
     rounds: int
+    run_id: str = ""  # 실패 시 /api/research/{run_id}/resume으로 재개
 
 
 class AsyncResearchRequest(BaseModel):
@@ -163,6 +180,12 @@ class TranslateResponse(BaseModel):
     translated: str
 
 
+class RoleMergeRequest(BaseModel):
+    """역할명 정규화 사전 병합 요청 스키마"""
+    source: str
+    target: str
+
+
 def save_report_to_file(report: str, topic: str) -> str:
     """최종 보고서를 텍스트 파일로 저장합니다."""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -215,7 +238,7 @@ def debug_modules():
     # LLM 빠른 테스트 (실제 OpenAI 호출)
     try:
         from utils.llm import call_gpt
-        test_result = call_gpt("Say 'OK'", "Test", max_tokens=5)
+        test_result = call_gpt("Say 'OK'", "Test", max_tokens=5, cache=False)
         results["llm_test"] = {"status": "ok", "response": test_result[:50]}
     except Exception as e:
         results["llm_test"] = {"status": "error", "error": str(e)}
@@ -223,6 +246,84 @@ def debug_modules():
     return results
 
 
+@app.get("/api/debug/llm-cache")
+def debug_llm_cache():
+    """LLM 응답 캐시 상태 (hit/miss 카운터)"""
+    from utils.llm_cache import get_llm_cache
+
+    llm_cache = get_llm_cache()
+    if llm_cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **llm_cache.stats()}
+
+
+@app.get("/api/debug/planning-cache")
+def debug_planning_cache():
+    """PI 기획 단계 캐시 상태 (hit/miss 카운터)"""
+    from utils.planning_cache import get_planning_cache
+
+    planning_cache = get_planning_cache()
+    if planning_cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **planning_cache.stats()}
+
+
+@app.get("/api/debug/executor")
+def debug_executor():
+    """공용 에이전트 실행기 상태 (큐 깊이, 동시 실행 수)"""
+    from utils.executor import get_agent_executor
+
+    return get_agent_executor().stats()
+
+
+@app.get("/api/debug/rate-limiter")
+def debug_rate_limiter():
+    """OpenAI 속도 제한기 상태 (대기열 대기 시간 지표 포함)"""
+    from utils.rate_limiter import get_rate_limiter
+
+    limiter = get_rate_limiter("openai")
+    if limiter is None:
+        return {"enabled": False}
+    return {"enabled": True, **limiter.stats()}
+
+
+@app.get("/api/debug/call-scheduler")
+def debug_call_scheduler():
+    """LLM 호출 스케줄러 상태 (호출 지점별 응답 시간·토큰 기록, 순서 변경 횟수)"""
+    from utils.call_scheduler import get_call_scheduler
+
+    scheduler = get_call_scheduler()
+    if scheduler is None:
+        return {"enabled": False}
+    return {"enabled": True, **scheduler.stats()}
+
+
+@app.get("/api/admin/roles")
+def list_canonical_roles():
+    """역할명 정규화 사전 조회 ({대표 역할명: [역할명, ...]})"""
+    from utils.role_registry import get_role_registry
+
+    registry = get_role_registry()
+    if registry is None:
+        return {"enabled": False, "roles": {}}
+    return {"enabled": True, "roles": registry.groups()}
+
+
+@app.post("/api/admin/roles/merge")
+def merge_canonical_roles(request: RoleMergeRequest):
+    """source 대표 역할명을 target으로 병합 (source를 가리키던 역할명 모두 이동)"""
+    from utils.role_registry import get_role_registry
+
+    registry = get_role_registry()
+    if registry is None:
+        raise HTTPException(status_code=503, detail="Role registry disabled (ROLE_REGISTRY_PATH)")
+    try:
+        updated = registry.merge(request.source, request.target)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=f"Unknown role: {e.args[0]}")
+    return {"updated": updated, "roles": registry.groups()}
+
+
 @app.post("/api/research", response_model=ResearchResponse)
 def run_research(request: ResearchRequest):
     """워크플로우 실행
@@ -230,8 +331,10 @@ def run_research(request: ResearchRequest):
     LangGraph 워크플로우를 생성하고 초기 상태로 실행합니다.
     Scientist -> Critic -> PI 흐름을 거쳐 최종 보고서를 반환합니다.
     """
-    # 워크플로우 생성
-    workflow = create_workflow()
+    # 워크플로우 생성 (노드마다 run_id 기준 체크포인트 저장)
+    workflow_mode = get_workflow_mode()
+    workflow = create_workflow(mode=workflow_mode, checkpointer=get_checkpointer())
+    run_id = uuid.uuid4().hex
 
     # 초기 상태
     initial_state: AgentState = {
@@ -251,10 +354,18 @@ def run_research(request: ResearchRequest):
         "team_selection_data": None,
         "specialist_introductions": [],
         "word_counts": {},
+        "run_id": run_id,
+        "workflow_mode": workflow_mode,
     }
+    if request.max_rounds:
+        initial_state["max_rounds"] = request.max_rounds
 
-    # 실행
-    result = workflow.invoke(initial_state)
+    # 실행 (실패 시 run_id로 /api/research/{run_id}/resume 재개 가능)
+    try:
+        result = workflow.invoke(initial_state, run_config(run_id))
+    except Exception as e:
+        logging.getLogger("research").error(f"Research run {run_id} failed: {e}")
+        raise HTTPException(status_code=500, detail={"error": f"{type(e).__name__}: {e}", "run_id": run_id})
 
     # 보고서 파일 저장
     if result["final_report"]:
@@ -267,6 +378,7 @@ def run_research(request: ResearchRequest):
         report=result["final_report"],
         messages=result["messages"],
         rounds=result.get("current_round", 3),
+        run_id=run_id,
     )
 
 
@@ -363,9 +475,41 @@ import traceback
 
 sse_logger = logging.getLogger("sse")
 
+# 이 프로세스에서 스트리밍 중인 실행 (같은 thread_id로 그래프 두 개가 동시에 돌지 않도록 재개를 막음)
+_active_runs: set[str] = set()
+_active_runs_lock = threading.Lock()
+
+
+def _claim_run(run_id: str) -> bool:
+    """실행을 진행 중으로 표시 (이미 진행 중이면 False)"""
+    with _active_runs_lock:
+        if run_id in _active_runs:
+            return False
+        _active_runs.add(run_id)
+        return True
+
+
+def _release_run(run_id: str) -> None:
+    with _active_runs_lock:
+        _active_runs.discard(run_id)
 
-async def generate_research_events(topic: str, constraints: str) -> AsyncGenerator[str, None]:
-    """연구 프로세스 이벤트를 SSE 형식으로 스트리밍합니다."""
+
+async def generate_research_events(
+    topic: str,
+    constraints: str,
+    max_rounds: int | None = None,
+    resume_run_id: str | None = None,
+    workflow_mode: str | None = None,
+) -> AsyncGenerator[str, None]:
+    """연구 프로세스 이벤트를 SSE 형식으로 스트리밍합니다.
+
+    resume_run_id를 주면 새로 시작하지 않고 해당 실행의 체크포인트에서
+    마지막으로 완료된 노드 다음부터 이어서 실행합니다. 이때 workflow_mode는 중단된 실행의
+    실행 방식이어야 합니다 (없으면 WORKFLOW_MODE 환경 변수).
+
+    실행은 스트림이 끝날 때까지 진행 중(_active_runs)으로 표시됩니다. 재개할 때는 호출 측
+    (resume_research)이 미리 _claim_run으로 표시하고, 해제는 여기서 합니다.
+    """
     import time
 
     def send_event(event_type: str, data: dict):
@@ -377,6 +521,10 @@ async def generate_research_events(topic: str, constraints: str) -> AsyncGenerat
         }
         return f"data: {json.dumps(event_data, ensure_ascii=False)}\n\n"
 
+    run_id = resume_run_id or uuid.uuid4().hex
+    if not resume_run_id:
+        _claim_run(run_id)
+
     try:
         print(f"\n{'*'*80}")
         print(f"[SSE STREAM] Starting research workflow stream")
@@ -384,51 +532,84 @@ async def generate_research_events(topic: str, constraints: str) -> AsyncGenerat
         print(f"  Constraints: {constraints}")
         print(f"{'*'*80}\n")
 
-        # 시작 이벤트
-        yield send_event("start", {
-            "message": "연구 프로세스를 시작합니다...",
-            "topic": topic
-        })
-
-        # 워크플로우 생성
+        # 워크플로우 생성 (노드마다 run_id 기준 체크포인트 저장)
         print(f"[SSE STREAM] Creating workflow graph...")
-        workflow = create_workflow()
+        workflow_mode = get_workflow_mode(workflow_mode)
+        workflow = create_workflow(mode=workflow_mode, checkpointer=get_checkpointer())
         print(f"[SSE STREAM] Workflow graph created successfully\n")
 
-        # 초기 상태
-        initial_state: AgentState = {
-            "topic": topic,
-            "constraints": constraints,
-            "team": [],
-            "specialist_outputs": [],
-            "draft": "",
-            "critique": None,
-            "current_round": 1,
-            "meeting_history": [],
-            "final_report": "",
-            "messages": [],
-            "parallel_views": [],
-            "sources": [],
-        }
-
-        # Phase 1: Planning 시작
-        yield send_event("phase", {
-            "phase": "planning",
-            "agent": "pi",
-            "message": "PI: 연구 주제를 분석하고 전문가 팀을 구성 중..."
-        })
+        config = run_config(run_id)
+
+        if resume_run_id:
+            # 체크포인트 상태에서 재개 (입력 None = 저장된 다음 노드부터 실행)
+            snapshot = await asyncio.to_thread(workflow.get_state, config)
+            initial_state = snapshot.values
+            stream_input = None
+            yield send_event("start", {
+                "message": f"중단된 연구 프로세스를 재개합니다... (다음 단계: {', '.join(snapshot.next) or '없음'})",
+                "topic": topic,
+                "run_id": run_id,
+                "resumed": True,
+            })
+        else:
+            # 시작 이벤트
+            yield send_event("start", {
+                "message": "연구 프로세스를 시작합니다...",
+                "topic": topic,
+                "run_id": run_id,
+            })
+
+            # 초기 상태
+            initial_state: AgentState = {
+                "topic": topic,
+                "constraints": constraints,
+                "team": [],
+                "specialist_outputs": [],
+                "draft": "",
+                "critique": None,
+                "current_round": 1,
+                "meeting_history": [],
+                "final_report": "",
+                "messages": [],
+                "parallel_views": [],
+                "sources": [],
+                "run_id": run_id,
+                "workflow_mode": workflow_mode,
+            }
+            if max_rounds:
+                initial_state["max_rounds"] = max_rounds
+            stream_input = initial_state
+
+        # 라운드 표기용 최대 라운드 수 (ROUND_MODE=adaptive면 더 일찍 끝날 수 있음)
+        round_cap = round_bounds(initial_state)[1]
+
+        if not resume_run_id:
+            # Phase 1: Planning 시작
+            yield send_event("phase", {
+                "phase": "planning",
+                "agent": "pi",
+                "message": "PI: 연구 주제를 분석하고 전문가 팀을 구성 중..."
+            })
 
         await asyncio.sleep(0.1)
 
         # 워크플로우 실행 (스트림 모드)
-        current_round = 1
-        final_report = ""
-        all_messages: list[dict] = []
+        current_round = initial_state.get("current_round", 1)
+        final_report = initial_state.get("final_report", "")
+        all_messages: list[dict] = list(initial_state.get("messages", []))
 
         sse_logger.info(f"Starting workflow stream for topic: {topic}")
         print(f"[SSE STREAM] Starting workflow.stream()...\n")
 
-        for event in workflow.stream(initial_state):
+        # updates: 노드 완료 상태, custom: 노드 실행 중 LLM 토큰 delta (utils.streaming)
+        for stream_item in workflow.stream(stream_input, config, stream_mode=["updates", "custom"]):
+            mode, event = stream_item if isinstance(stream_item, tuple) else ("updates", stream_item)
+
+            if mode == "custom":
+                if isinstance(event, dict) and event.get("type") == "delta":
+                    yield send_event("delta", {k: v for k, v in event.items() if k != "type"})
+                continue
+
             for node_name, node_state in event.items():
                 print(f"\n{'*'*80}")
                 print(f"[SSE STREAM] Node event received")
@@ -450,10 +631,17 @@ async def generate_research_events(topic: str, constraints: str) -> AsyncGenerat
                         yield send_event("team_selection", {
                             "agent": "pi",
                             "phase": "planning",
-                            "message": f"10회 독립적 팀 구성 실험 완료 ({tsd.get('n_trials', 0)}회 성공)",
+                            "message": (
+                                f"{tsd.get('trials_requested', 10)}회 중 {tsd.get('n_trials', 0)}회 독립적 팀 구성 실험 완료"
+                                + (" (순위 안정, 조기 종료)" if tsd.get("stopped_early") else "")
+                                + (" (이전 기획 결과 재사용)" if tsd.get("cache_hit") else "")
+                            ),
                             "frequency_table": tsd.get("frequency_table", ""),
                             "rationale": tsd.get("rationale", ""),
                             "team_sizes": tsd.get("team_sizes", ""),
+                            "n_trials": tsd.get("n_trials", 0),
+                            "stopped_early": tsd.get("stopped_early", False),
+                            "cache_hit": tsd.get("cache_hit", False),
                         })
 
                     yield send_event("agent", {
@@ -479,7 +667,7 @@ async def generate_research_events(topic: str, constraints: str) -> AsyncGenerat
                     # Round 1 시작 알림
                     yield send_event("iteration", {
                         "round": 1,
-                        "message": "===== 팀 회의 - 라운드 1/3 =====",
+                        "message": f"===== 팀 회의 - 라운드 1/{round_cap} =====",
                     })
                     # researching phase 시작 알림
                     yield send_event("phase", {
@@ -536,7 +724,7 @@ async def generate_research_events(topic: str, constraints: str) -> AsyncGenerat
                     sse_logger.info(f"Round incremented to {current_round}")
                     yield send_event("iteration", {
                         "round": current_round,
-                        "message": f"===== 팀 회의 - 라운드 {current_round}/3 =====",
+                        "message": f"===== 팀 회의 - 라운드 {current_round}/{round_cap} =====",
                     })
 
                 elif node_name == "round_revision":
@@ -548,6 +736,16 @@ async def generate_research_events(topic: str, constraints: str) -> AsyncGenerat
                         "message": f"라운드 {current_round}: 전문가들이 피드백을 반영하여 수정·보완 중..."
                     })
                     for so in specialist_outputs:
+                        if so.get("carried_forward"):
+                            yield send_event("carried_forward", {
+                                "agent": "specialist",
+                                "phase": "round_revision",
+                                "message": f"[라운드 {current_round}] [{so.get('role', '전문가')}] 이전 분석이 수렴하여 수정 없이 유지합니다.",
+                                "specialist_name": so.get("role", ""),
+                                "specialist_focus": so.get("focus", ""),
+                                "round": current_round,
+                            })
+                            continue
                         yield send_event("agent", {
                             "agent": "specialist",
                             "phase": "round_revision",
@@ -558,12 +756,72 @@ async def generate_research_events(topic: str, constraints: str) -> AsyncGenerat
                             "round": current_round,
                         })
 
+                elif node_name == "meeting":
+                    # WORKFLOW_MODE=pipelined: 전문가별 트랙이 끝난 뒤 라운드별 기록을 순서대로 전송
+                    # (진행 중 출력은 delta 이벤트로 이미 전달됨)
+                    rounds = list(node_state.get("meeting_history", []))
+                    rounds.append({
+                        "round": node_state.get("current_round", current_round),
+                        "specialist_outputs": node_state.get("specialist_outputs", []),
+                        "critique": node_state.get("critique"),
+                        "pi_summary": node_state.get("draft", ""),
+                    })
+                    for record in rounds:
+                        current_round = record["round"]
+                        if current_round > 1:
+                            yield send_event("iteration", {
+                                "round": current_round,
+                                "message": f"===== 팀 회의 - 라운드 {current_round}/{round_cap} =====",
+                            })
+                        phase = "researching" if current_round == 1 else "round_revision"
+                        for so in record.get("specialist_outputs", []):
+                            if so.get("carried_forward"):
+                                yield send_event("carried_forward", {
+                                    "agent": "specialist",
+                                    "phase": phase,
+                                    "message": f"[라운드 {current_round}] [{so.get('role', '전문가')}] 이전 분석이 수렴하여 수정 없이 유지합니다.",
+                                    "specialist_name": so.get("role", ""),
+                                    "specialist_focus": so.get("focus", ""),
+                                    "round": current_round,
+                                })
+                                continue
+                            yield send_event("agent", {
+                                "agent": "specialist",
+                                "phase": phase,
+                                "message": f"[라운드 {current_round}] [{so.get('role', '전문가')}] 분석을 완료했습니다.",
+                                "content": so.get("output", ""),
+                                "specialist_name": so.get("role", ""),
+                                "specialist_focus": so.get("focus", ""),
+                                "round": current_round,
+                            })
+                        critique = record.get("critique")
+                        scores = critique.scores if critique else record.get("critique_scores", {})
+                        if scores:
+                            yield send_event("decision", {
+                                "agent": "critic",
+                                "decision": critique.decision if critique else "continue",
+                                "message": f"[라운드 {current_round}] 전문가 분석을 검토했습니다.",
+                                "scores": scores,
+                                "round": current_round,
+                                "content": critique.feedback if critique else record.get("critique_feedback", ""),
+                                "specialist_feedback": (
+                                    critique.specialist_feedback if critique else record.get("specialist_feedback", {})
+                                ),
+                            })
+                        yield send_event("agent", {
+                            "agent": "pi",
+                            "phase": "pi_summary",
+                            "message": f"[라운드 {current_round}] PI: 라운드 {current_round} 임시 결론을 도출했습니다.",
+                            "content": record.get("pi_summary", ""),
+                            "round": current_round,
+                        })
+
                 elif node_name == "final_synthesis":
                     final = node_state.get("final_report", "")
                     yield send_event("agent", {
                         "agent": "pi",
                         "phase": "final_synthesis",
-                        "message": "PI: 3라운드 팀 회의 결과를 종합하여 최종 보고서를 작성했습니다.",
+                        "message": f"PI: {current_round}라운드 팀 회의 결과를 종합하여 최종 보고서를 작성했습니다.",
                         "content": final,
                     })
 
@@ -609,9 +867,14 @@ async def generate_research_events(topic: str, constraints: str) -> AsyncGenerat
         # 에러 이벤트 - 상세 정보 포함
         yield send_event("error", {
             "message": f"에러 발생: {str(e)}",
-            "error": f"{type(e).__name__}: {str(e)}\n{error_detail}"
+            "error": f"{type(e).__name__}: {str(e)}\n{error_detail}",
+            # 체크포인트가 있으면 /api/research/{run_id}/resume으로 재개 가능
+            "run_id": run_id,
         })
 
+    finally:
+        _release_run(run_id)
+
 
 @app.post("/api/research/stream")
 async def stream_research(request: ResearchRequest):
@@ -629,7 +892,55 @@ async def stream_research(request: ResearchRequest):
     - error: 에러 발생
     """
     return StreamingResponse(
-        generate_research_events(request.topic, request.constraints),
+        generate_research_events(request.topic, request.constraints, request.max_rounds),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",  # Nginx 버퍼링 방지
+        }
+    )
+
+
+@app.post("/api/research/{run_id}/resume")
+async def resume_research(run_id: str):
+    """중단된 연구 프로세스를 마지막으로 완료된 노드 다음부터 재개합니다 (SSE).
+
+    서버 재시작이나 노드 실패로 끊긴 실행을 체크포인트(workflow.checkpoint)에서 이어서 실행하므로
+    실패한 노드의 호출만 다시 발생합니다. 이벤트 형식은 /api/research/stream과 같습니다.
+    이미 완료된 실행이면 저장된 보고서로 complete 이벤트만 보냅니다.
+    아직 스트리밍 중이거나 이미 재개 중인 실행이면 409를 반환합니다.
+    """
+    checkpointer = get_checkpointer()
+    if checkpointer is None:
+        raise HTTPException(status_code=503, detail="Checkpointing is disabled (CHECKPOINT_BACKEND)")
+
+    def _load_snapshot():
+        # 실행 당시의 방식으로 그래프를 만들어야 저장된 다음 노드와 구조가 맞음
+        # (workflow_mode가 없는 이전 체크포인트는 현재 WORKFLOW_MODE 사용)
+        mode = checkpoint_value(checkpointer, run_id, "workflow_mode")
+        return mode, create_workflow(mode=mode, checkpointer=checkpointer).get_state(run_config(run_id))
+
+    if not _claim_run(run_id):
+        raise HTTPException(status_code=409, detail=f"Run is already in progress: {run_id}")
+    try:
+        # 체크포인트 조회는 디스크·DB I/O이므로 이벤트 루프 밖에서 실행
+        workflow_mode, snapshot = await asyncio.to_thread(_load_snapshot)
+        if not snapshot.values:
+            raise HTTPException(status_code=404, detail=f"No checkpoint for run: {run_id}")
+    except BaseException:
+        _release_run(run_id)
+        raise
+
+    state = snapshot.values
+    return StreamingResponse(
+        generate_research_events(
+            state.get("topic", ""),
+            state.get("constraints", ""),
+            state.get("max_rounds"),
+            resume_run_id=run_id,
+            workflow_mode=workflow_mode,
+        ),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -640,7 +951,7 @@ async def stream_research(request: ResearchRequest):
 
 
 @app.post("/api/report/regenerate", response_model=RegenerateResponse)
-def regenerate_section(request: RegenerateRequest):
+async def regenerate_section(request: RegenerateRequest):
     """보고서 특정 섹션을 재생성합니다.
 
     사용자 피드백을 받아 해당 섹션만 다시 작성합니다.
@@ -652,7 +963,7 @@ def regenerate_section(request: RegenerateRequest):
     Returns:
         업데이트된 보고서 전체
     """
-    from utils.llm import call_gpt
+    from utils.llm import acall_gpt
 
     try:
         system_prompt = "당신은 보고서 편집 전문가입니다."
@@ -676,7 +987,7 @@ def regenerate_section(request: RegenerateRequest):
 개선된 전체 보고서를 출력하세요.
 """
 
-        updated_report = call_gpt(system_prompt, user_message, temperature=0.3)
+        updated_report = await acall_gpt(system_prompt, user_message, temperature=0.3)
 
         return RegenerateResponse(
             updated_report=updated_report,
@@ -692,12 +1003,12 @@ def regenerate_section(request: RegenerateRequest):
 
 
 @app.post("/api/reports/translate", response_model=TranslateResponse)
-def translate_report(request: TranslateRequest):
+async def translate_report(request: TranslateRequest):
     """보고서를 학술 논문체 영어로 번역합니다.
 
     GPT-4o를 사용하여 높은 품질의 학술 영어 번역을 생성합니다.
     """
-    from utils.llm import call_gpt
+    from utils.llm import acall_gpt
 
     try:
         system_prompt = (
@@ -710,7 +1021,7 @@ def translate_report(request: TranslateRequest):
         )
         user_message = request.content
 
-        translated = call_gpt(system_prompt, user_message, temperature=0.3)
+        translated = await acall_gpt(system_prompt, user_message, temperature=0.3)
 
         return TranslateResponse(translated=translated)
 
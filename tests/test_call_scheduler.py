@@ -0,0 +1,80 @@
+"""임계 경로 기반 LLM 호출 스케줄러 테스트 (utils.call_scheduler)"""
+import json
+import threading
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+import utils.llm as llm
+from utils.call_scheduler import CriticalPathScheduler, set_call_scheduler
+from utils.rate_limiter import set_rate_limiter
+
+
+class TestRemainingPath:
+
+    def test_later_stages_have_shorter_remaining_path(self):
+        scheduler = CriticalPathScheduler()
+
+        assert scheduler.remaining_path("synthesis") < scheduler.remaining_path("critique.summary")
+        assert scheduler.remaining_path("critique.summary") < scheduler.remaining_path("introduction")
+
+    def test_history_replaces_defaults(self):
+        scheduler = CriticalPathScheduler()
+        before = scheduler.remaining_path("revision")
+        scheduler.record("synthesis.section", 120.0, 4000)
+
+        # 같은 단계의 세부 호출 기록이 단계 예상 시간으로 쓰임
+        assert scheduler.estimate("synthesis") == 120.0
+        assert scheduler.remaining_path("revision") > before
+        assert scheduler.stats()["call_sites"]["synthesis.section"]["avg_output_tokens"] == 4000
+
+
+class TestAdmissionOrder:
+
+    def test_shorter_remaining_path_is_admitted_first(self):
+        scheduler = CriticalPathScheduler()
+        order = []
+
+        def call(site):
+            with scheduler.admit(site):
+                order.append(site)
+
+        with scheduler.admit("specialist"):
+            threads = [threading.Thread(target=call, args=(site,)) for site in ("introduction", "synthesis")]
+            for thread in threads:
+                thread.start()
+                # 도착 순서 고정 (introduction이 먼저 대기)
+                while scheduler.stats()["waiting"] < threads.index(thread) + 1:
+                    time.sleep(0.01)
+        for thread in threads:
+            thread.join(5)
+
+        assert order == ["synthesis", "introduction"]
+        assert scheduler.stats()["reordered"] == 1
+
+
+@pytest.fixture
+def _client(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-key")
+    set_rate_limiter("openai", None)
+    body = {"model": "gpt-4o", "choices": [{"message": {"content": "ok"}, "finish_reason": "stop"}],
+            "usage": {"completion_tokens": 7}}
+    client = httpx.Client(transport=httpx.MockTransport(lambda r: httpx.Response(200, text=json.dumps(body))))
+    with patch.object(llm, "_get_http_client", return_value=client):
+        yield
+    set_call_scheduler(None)
+
+
+class TestCallLLMRecording:
+
+    def test_call_site_latency_and_tokens_are_recorded(self, _client):
+        scheduler = CriticalPathScheduler()
+        set_call_scheduler(scheduler)
+
+        llm.call_llm("sys", "user", cache=False, call_site="pi_summary")
+
+        recorded = scheduler.stats()["call_sites"]["pi_summary"]
+        assert recorded["count"] == 1
+        assert recorded["avg_output_tokens"] == 7
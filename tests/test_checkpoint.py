@@ -0,0 +1,139 @@
+"""체크포인트 기반 실행 재개 테스트 (workflow.checkpoint + /api/research/{run_id}/resume)"""
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+import workflow.graph as graph
+from workflow.checkpoint import _memory_saver, run_config, set_checkpointer
+from workflow.state import CritiqueResult
+
+
+def _nodes(fail_synthesis: list[bool]):
+    """LLM 호출 없는 노드 (최종 합성은 fail_synthesis[0]이 True인 동안 실패)"""
+
+    def synthesis(state):
+        if fail_synthesis[0]:
+            raise RuntimeError("OpenAI API request timed out")
+        return {"final_report": f"# 보고서 ({state['current_round']}라운드)"}
+
+    return {
+        "run_pi_planning": MagicMock(return_value={"team": [{"role": "독성학자", "focus": "독성"}]}),
+        "run_specialists": MagicMock(return_value={"specialist_outputs": [{"role": "독성학자", "output": "r1"}]}),
+        "run_critic": MagicMock(return_value={"critique": CritiqueResult("continue", "보강", {"독성학자": 3})}),
+        "run_pi_summary": MagicMock(side_effect=lambda state: {"draft": f"요약 {state['current_round']}"}),
+        "run_round_revision": MagicMock(return_value={"specialist_outputs": [{"role": "독성학자", "output": "r2"}]}),
+        "run_final_synthesis": MagicMock(side_effect=synthesis),
+    }
+
+
+@pytest.fixture
+def nodes(monkeypatch):
+    monkeypatch.delenv("ROUND_MODE", raising=False)
+    monkeypatch.setenv("ROUND_MAX", "2")
+    monkeypatch.setenv("WORKFLOW_MODE", "lockstep")
+    fail = [True]
+    mocks = _nodes(fail)
+    with patch.multiple(graph, **mocks):
+        yield mocks, fail
+
+
+def _initial_state(run_id):
+    return {"topic": "NGT", "constraints": "", "current_round": 1, "meeting_history": [], "messages": [], "run_id": run_id}
+
+
+class TestCheckpointResume:
+
+    def test_resume_reruns_only_the_failed_node(self, nodes):
+        mocks, fail = nodes
+        workflow = graph.create_workflow(checkpointer=_memory_saver())
+        config = run_config("run-1")
+
+        with pytest.raises(RuntimeError):
+            workflow.invoke(_initial_state("run-1"), config)
+        assert workflow.get_state(config).next == ("final_synthesis",)
+
+        fail[0] = False
+        result = workflow.invoke(None, config)
+
+        assert result["final_report"] == "# 보고서 (2라운드)"
+        # 체크포인트 복원 시 상태 타입 유지
+        assert isinstance(result["critique"], CritiqueResult)
+        for name in ("run_pi_planning", "run_specialists", "run_round_revision"):
+            assert mocks[name].call_count == 1
+        assert mocks["run_critic"].call_count == 2
+        assert mocks["run_final_synthesis"].call_count == 2
+
+
+class TestResumeEndpoint:
+
+    @pytest.fixture
+    def client(self):
+        from server import app
+
+        set_checkpointer(_memory_saver())
+        yield TestClient(app)
+        set_checkpointer(None)
+
+    def _events(self, response):
+        return [json.loads(line[6:]) for line in response.text.splitlines() if line.startswith("data: ")]
+
+    def test_unknown_run_returns_404(self, client):
+        assert client.post("/api/research/missing/resume").status_code == 404
+
+    def test_failed_stream_is_resumed_from_checkpoint(self, client, nodes):
+        mocks, fail = nodes
+
+        first = self._events(client.post("/api/research/stream", json={"topic": "NGT", "constraints": ""}))
+        run_id = first[0]["run_id"]
+        assert first[-1]["type"] == "error" and first[-1]["run_id"] == run_id
+
+        fail[0] = False
+        resumed = self._events(client.post(f"/api/research/{run_id}/resume"))
+
+        assert resumed[0]["type"] == "start" and resumed[0]["resumed"] is True
+        assert resumed[-1]["type"] == "complete"
+        assert resumed[-1]["report"] == "# 보고서 (2라운드)"
+        assert mocks["run_pi_planning"].call_count == 1
+
+    def test_resume_uses_the_runs_workflow_mode(self, client, nodes, monkeypatch):
+        mocks, fail = nodes
+        fail[0] = False
+        meeting = MagicMock(side_effect=[RuntimeError("OpenAI API request timed out"), {"current_round": 3}])
+        monkeypatch.setattr(graph, "run_pipelined_meeting", meeting)
+        monkeypatch.setenv("WORKFLOW_MODE", "pipelined")
+
+        first = self._events(client.post("/api/research/stream", json={"topic": "NGT", "constraints": ""}))
+        run_id = first[0]["run_id"]
+        assert first[-1]["type"] == "error"
+
+        # 재개 시점의 WORKFLOW_MODE가 달라도 실행 당시(pipelined) 그래프의 meeting 노드부터 이어서 실행
+        monkeypatch.setenv("WORKFLOW_MODE", "lockstep")
+        resumed = self._events(client.post(f"/api/research/{run_id}/resume"))
+
+        assert resumed[-1]["type"] == "complete"
+        assert resumed[-1]["report"] == "# 보고서 (3라운드)"
+        assert meeting.call_count == 2
+        assert mocks["run_pi_planning"].call_count == 1
+        assert mocks["run_specialists"].call_count == 0
+
+    def test_active_run_cannot_be_resumed_twice(self, client, nodes):
+        import server
+
+        mocks, fail = nodes
+        first = self._events(client.post("/api/research/stream", json={"topic": "NGT", "constraints": ""}))
+        run_id = first[0]["run_id"]
+
+        # 스트림 진행 중(또는 재개 중)인 실행은 거부
+        assert server._claim_run(run_id)
+        try:
+            assert client.post(f"/api/research/{run_id}/resume").status_code == 409
+        finally:
+            server._release_run(run_id)
+
+        fail[0] = False
+        resumed = self._events(client.post(f"/api/research/{run_id}/resume"))
+        assert resumed[-1]["type"] == "complete"
+        # 스트림이 끝나면 진행 중 표시 해제
+        assert run_id not in server._active_runs
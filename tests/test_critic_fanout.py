@@ -0,0 +1,122 @@
+"""전문가별 동시 비평 + 요약 병합 테스트 (agents.critic.run_critic fan-out 모드)"""
+from unittest.mock import MagicMock, patch
+
+import agents.critic as critic
+from agents.schemas import CritiqueSummary, CritiqueVerdict, SpecialistVerdict
+
+OUTPUTS = [
+    {"role": "독성학자", "focus": "독성 평가", "output": "독성 분석 본문"},
+    {"role": "규제과학 전문가", "focus": "국제 규제 비교", "output": "규제 분석 본문"},
+    {"role": "분자생물학자", "focus": "오프타겟", "output": "분자 분석 본문"},
+]
+
+
+def _state():
+    return {"topic": "NGT", "current_round": 1, "specialist_outputs": OUTPUTS, "messages": [], "meeting_history": []}
+
+
+def _fake_llm(calls, fail_role=None):
+    def call(system, user, output_type, **kwargs):
+        calls.append((output_type, user))
+        if output_type is SpecialistVerdict:
+            role = next(so["role"] for so in OUTPUTS if so["output"] in user)
+            if role == fail_role:
+                raise ValueError("invalid")
+            return SpecialistVerdict(role="응답 역할명", score=4, feedback=f"{role} 피드백")
+        if output_type is CritiqueSummary:
+            return CritiqueSummary(decision="continue", feedback="공통 쟁점 요약")
+        specialists = [
+            SpecialistVerdict(role=so["role"], score=3, feedback="단일 호출 피드백") for so in OUTPUTS if so["output"] in user
+        ]
+        return CritiqueVerdict(decision="continue", feedback="단일 호출", specialists=specialists)
+
+    return call
+
+
+class TestCriticFanout:
+
+    def _run(self, monkeypatch, calls, fail_role=None, mode=None, state=None):
+        if mode:
+            monkeypatch.setenv("CRITIC_MODE", mode)
+        else:
+            monkeypatch.delenv("CRITIC_MODE", raising=False)
+        with patch.object(critic, "call_gpt_json", side_effect=_fake_llm(calls, fail_role)), \
+                patch.object(critic, "web_search", MagicMock(invoke=MagicMock(return_value="웹 검증 자료"))):
+            return critic.run_critic(state or _state())["critique"]
+
+    def test_each_specialist_is_critiqued_separately_then_merged(self, monkeypatch):
+        calls = []
+        critique = self._run(monkeypatch, calls)
+
+        per_specialist = [user for output_type, user in calls if output_type is SpecialistVerdict]
+        assert len(per_specialist) == len(OUTPUTS)
+        # 각 호출에는 자기 분석만 포함되고, 앞부분(공통 맥락)은 모두 같음
+        assert all(sum(so["output"] in user for so in OUTPUTS) == 1 for user in per_specialist)
+        prefix = per_specialist[0].split("[평가 대상 전문가]")[0]
+        assert "웹 검증 자료" in prefix and all(user.startswith(prefix) for user in per_specialist)
+
+        # 역할명은 입력 기준으로 고정되고 요약 호출로 전체 피드백 구성
+        assert list(critique.scores) == [so["role"] for so in OUTPUTS]
+        assert critique.specialist_feedback["독성학자"] == "독성학자 피드백"
+        assert critique.feedback == "공통 쟁점 요약"
+
+    def test_fanout_uses_per_specialist_prompt(self, monkeypatch):
+        monkeypatch.delenv("CRITIC_MODE", raising=False)
+        verdict = SpecialistVerdict(role="독성학자", score=4, feedback="피드백")
+        with patch.object(critic, "call_gpt_json", return_value=verdict) as gpt:
+            critic.critique_specialist(_state(), OUTPUTS[0], "")
+
+        system = gpt.call_args.args[0]
+        assert system == critic.SPECIALIST_SYSTEM_PROMPT
+        # 단일 호출용 출력 형식(specialists 배열)을 요구하지 않음
+        assert "specialists" not in system
+        assert system.startswith(critic.SYSTEM_PROMPT.split("## 당신의 임무")[0])
+
+    def test_structured_response_is_not_streamed(self, monkeypatch):
+        verdict = SpecialistVerdict(role="응답 역할명", score=4, feedback="남은 약점: 용량 근거")
+        deltas = []
+        with patch.object(critic, "call_gpt_json", return_value=verdict) as gpt:
+            critic.critique_specialist(_state(), OUTPUTS[0], "", deltas.append)
+
+        # JSON 조각 스트리밍 없이 검증된 점수·피드백을 한 번만 전달
+        assert "on_delta" not in gpt.call_args.kwargs
+        assert deltas == ["### 독성학자 (4/5)\n남은 약점: 용량 근거"]
+
+    def test_failed_specialist_falls_back_to_single_call(self, monkeypatch):
+        calls = []
+        critique = self._run(monkeypatch, calls, fail_role="규제과학 전문가")
+
+        # 실패한 전문가만 단일 호출로 다시 평가되어 점수가 빠지지 않음
+        single = [user for output_type, user in calls if output_type is CritiqueVerdict]
+        assert len(single) == 1
+        assert "규제 분석 본문" in single[0] and "독성 분석 본문" not in single[0]
+        assert list(critique.scores) == [so["role"] for so in OUTPUTS]
+        assert critique.scores["규제과학 전문가"] == 3
+        assert critique.specialist_feedback["규제과학 전문가"] == "단일 호출 피드백"
+
+    def test_single_mode_uses_one_call(self, monkeypatch):
+        calls = []
+        critique = self._run(monkeypatch, calls, mode="single")
+
+        assert [output_type for output_type, _ in calls] == [CritiqueVerdict]
+        assert critique.feedback == "단일 호출"
+
+    def test_carried_forward_specialist_reuses_previous_verdict(self, monkeypatch):
+        calls = []
+        outputs = [{**OUTPUTS[0], "carried_forward": True}] + OUTPUTS[1:]
+        history = [{
+            "round": 1,
+            "critique_scores": {"독성학자": 5, "규제과학 전문가": 3, "분자생물학자": 3},
+            "specialist_feedback": {"독성학자": "수렴", "규제과학 전문가": "보강", "분자생물학자": "보강"},
+        }]
+        state = {**_state(), "current_round": 2, "specialist_outputs": outputs, "meeting_history": history}
+        critique = self._run(monkeypatch, calls, state=state)
+
+        # 수정을 생략한 전문가는 다시 채점하지 않고 이전 라운드 평가를 그대로 사용
+        per_specialist = [user for output_type, user in calls if output_type is SpecialistVerdict]
+        assert len(per_specialist) == 2
+        assert not any("독성 분석 본문" in user for user in per_specialist)
+        assert list(critique.scores) == [so["role"] for so in OUTPUTS]
+        assert critique.scores["독성학자"] == 5
+        assert critique.specialist_feedback["독성학자"] == "수렴"
+        assert critique.scores["규제과학 전문가"] == 4
@@ -0,0 +1,73 @@
+"""공용 에이전트 실행기 테스트 (utils.executor.AgentExecutor)"""
+import threading
+
+from utils.executor import AgentExecutor, Priority, current_run_id, run_context
+
+
+class TestAgentExecutor:
+
+    def test_queued_work_runs_by_priority_then_submission_order(self):
+        executor = AgentExecutor(max_workers=1)
+        release = threading.Event()
+        order = []
+        blocker = executor.submit(release.wait, 5)
+        futures = [
+            executor.submit(order.append, "background", priority=Priority.BACKGROUND),
+            executor.submit(order.append, "critical-1", priority=Priority.CRITICAL),
+            executor.submit(order.append, "normal"),
+            executor.submit(order.append, "critical-2", priority=Priority.CRITICAL),
+        ]
+        release.set()
+        blocker.result()
+        for future in futures:
+            future.result(timeout=5)
+
+        assert order == ["critical-1", "critical-2", "normal", "background"]
+        executor.shutdown()
+
+    def test_per_run_limit_caps_concurrency(self):
+        executor = AgentExecutor(max_workers=8, per_run_limit=2)
+        lock = threading.Lock()
+        running = {"now": 0, "peak": 0}
+        release = threading.Event()
+
+        def task():
+            with lock:
+                running["now"] += 1
+                running["peak"] = max(running["peak"], running["now"])
+            release.wait(0.2)
+            with lock:
+                running["now"] -= 1
+
+        futures = [executor.submit(task, run_id="run-a") for _ in range(6)]
+        other = executor.submit(lambda: current_run_id.get(), run_id="run-b")
+        assert other.result(timeout=5) == "run-b"
+        release.set()
+        for future in futures:
+            future.result(timeout=5)
+
+        assert running["peak"] <= 2
+        stats = executor.stats()
+        assert stats["submitted"] == 7 and stats["completed"] == 7
+        assert stats["queued"] == 0 and stats["active"] == 0
+        executor.shutdown()
+
+    def test_nested_wait_does_not_deadlock_on_full_pool(self):
+        executor = AgentExecutor(max_workers=1)
+
+        def parent():
+            # 유일한 워커를 부모 작업이 차지해도 자식 작업은 기다리는 스레드에서 실행됨
+            children = [executor.submit(lambda i=i: i * 2) for i in range(3)]
+            return sum(child.result() for child in children)
+
+        assert executor.submit(parent).result(timeout=5) == 6
+        assert executor.stats()["inline_runs"] >= 1
+        executor.shutdown()
+
+    def test_run_id_is_inherited_from_context(self):
+        executor = AgentExecutor(max_workers=2)
+        with run_context("run-x"):
+            future = executor.submit(lambda: current_run_id.get())
+
+        assert future.result() == "run-x"
+        executor.shutdown()
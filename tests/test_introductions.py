@@ -0,0 +1,71 @@
+"""전문가 자기소개 일괄 생성 + (역할, 집중 분야) 캐시 테스트"""
+import pytest
+from unittest.mock import patch
+
+import agents.pi as pi
+from agents.schemas import IntroductionBatch
+from utils.cache import MemoryLRUBackend
+
+TEAM = [
+    {"role": "독성학자", "focus": "독성 평가"},
+    {"role": "규제과학 전문가", "focus": "국제 규제 비교"},
+]
+
+
+def _batch(*args, **kwargs):
+    roster = args[1]
+    return IntroductionBatch(introductions=[
+        {"role": m["role"], "introduction": f"저는 {m['role']}입니다."} for m in TEAM if m["role"] in roster
+    ])
+
+
+@pytest.fixture
+def intro_cache():
+    cache = MemoryLRUBackend(max_entries=50)
+    pi.set_introduction_cache(cache)
+    yield cache
+    pi.set_introduction_cache(None)
+
+
+class TestGenerateSelfIntroductions:
+
+    def test_batched_mode_uses_single_call(self, intro_cache):
+        with patch.object(pi, "call_gpt_json", side_effect=_batch) as batched, \
+                patch.object(pi, "call_gpt") as single:
+            intros = pi.generate_self_introductions(TEAM)
+
+        batched.assert_called_once()
+        single.assert_not_called()
+        assert [i["role"] for i in intros] == ["독성학자", "규제과학 전문가"]
+        assert intros[0]["introduction"] == "저는 독성학자입니다."
+
+    def test_recurring_specialist_served_from_cache(self, intro_cache):
+        with patch.object(pi, "call_gpt_json", side_effect=_batch):
+            pi.generate_self_introductions(TEAM[:1])
+
+        with patch.object(pi, "call_gpt_json", side_effect=_batch) as batched:
+            intros = pi.generate_self_introductions(TEAM)
+
+        # 두 번째 실행에서는 캐시에 없는 전문가만 요청
+        assert "독성학자" not in batched.call_args.args[1]
+        assert intros[0]["introduction"] == "저는 독성학자입니다."
+
+        with patch.object(pi, "call_gpt_json") as batched:
+            pi.generate_self_introductions(TEAM)
+        batched.assert_not_called()
+
+    def test_batch_failure_falls_back_to_parallel(self, intro_cache):
+        with patch.object(pi, "call_gpt_json", side_effect=ValueError("schema")), \
+                patch.object(pi, "call_gpt", return_value="저는 전문가입니다.") as single:
+            intros = pi.generate_self_introductions(TEAM)
+
+        assert single.call_count == 2
+        assert [i["role"] for i in intros] == ["독성학자", "규제과학 전문가"]
+
+    def test_fallback_text_is_not_cached(self, intro_cache, monkeypatch):
+        monkeypatch.setenv("INTRODUCTION_MODE", "parallel")
+        with patch.object(pi, "call_gpt", side_effect=RuntimeError("API down")):
+            intros = pi.generate_self_introductions(TEAM)
+
+        assert intros[0]["introduction"] == "독성학자으로서 독성 평가 분야를 담당합니다."
+        assert len(intro_cache) == 0
@@ -0,0 +1,115 @@
+"""LLM 응답 캐시 및 캐시 백엔드 테스트"""
+import httpx
+import pytest
+from unittest.mock import patch
+
+import utils.llm as llm
+from utils.cache import CacheBackend, MemoryLRUBackend, SQLiteBackend
+from utils.llm_cache import LLMResponseCache, make_cache_key, set_llm_cache
+from utils.rate_limiter import set_rate_limiter
+
+
+@pytest.fixture(autouse=True)
+def _reset_cache(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-key")
+    set_rate_limiter("openai", None)
+    yield
+    set_llm_cache(None)
+
+
+class TestBackends:
+    """캐시 백엔드 테스트"""
+
+    def test_memory_lru_evicts_least_recently_used(self):
+        backend = MemoryLRUBackend(max_entries=2)
+        backend.set("a", "1")
+        backend.set("b", "2")
+        backend.get("a")  # a를 최근 사용으로
+        backend.set("c", "3")
+        assert backend.get("a") == "1"
+        assert backend.get("b") is None
+        assert len(backend) == 2
+
+    def test_memory_ttl_expires(self):
+        backend = MemoryLRUBackend()
+        with patch("utils.cache.time.time", return_value=1000.0):
+            backend.set("k", "v", ttl=10)
+        with patch("utils.cache.time.time", return_value=1011.0):
+            assert backend.get("k") is None
+
+    def test_sqlite_persists_and_evicts(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        backend = SQLiteBackend(path, namespace="llm", max_entries=2)
+        backend.set("a", "1")
+        backend.set("b", "2")
+        backend.set("c", "3")
+        assert len(backend) == 2
+
+        reopened = SQLiteBackend(path, namespace="llm", max_entries=2)
+        assert reopened.get("c") == "3"
+        # 다른 namespace와 분리
+        assert SQLiteBackend(path, namespace="other").get("c") is None
+
+    def test_incomplete_backend_fails_at_creation(self):
+        class GetOnlyBackend(CacheBackend):
+            def get(self, key):
+                return None
+
+        with pytest.raises(TypeError):
+            GetOnlyBackend()
+
+
+class TestCacheKey:
+    """캐시 키 테스트"""
+
+    def test_key_depends_on_params(self):
+        base = llm._build_payload("sys", "user", "gpt-4o", 0.7, 100)
+        other = llm._build_payload("sys", "user", "gpt-4o", 0.2, 100)
+        assert make_cache_key(base) == make_cache_key(dict(base))
+        assert make_cache_key(base) != make_cache_key(other)
+
+    def test_cache_tag_separates_entries(self):
+        payload = llm._build_payload("sys", "user", "gpt-4o", 0.7, 100)
+        assert make_cache_key(payload, "team-trial-0") != make_cache_key(payload, "team-trial-1")
+
+
+class TestCallLLMCache:
+    """call_llm 캐시 통합 테스트"""
+
+    def _client(self, calls: list) -> httpx.Client:
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={"choices": [{"message": {"content": f"resp{len(calls)}"}}]})
+
+        return httpx.Client(transport=httpx.MockTransport(handler))
+
+    def test_second_call_hits_cache(self):
+        cache = LLMResponseCache(MemoryLRUBackend())
+        set_llm_cache(cache)
+        calls = []
+        with patch.object(llm, "_get_http_client", return_value=self._client(calls)):
+            first = llm.call_llm("sys", "user", model="gpt-4o")
+            second = llm.call_llm("sys", "user", model="gpt-4o")
+
+        assert first == second == "resp1"
+        assert len(calls) == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_bypass_flag_skips_cache(self):
+        set_llm_cache(LLMResponseCache(MemoryLRUBackend()))
+        calls = []
+        with patch.object(llm, "_get_http_client", return_value=self._client(calls)):
+            llm.call_llm("sys", "user", model="gpt-4o")
+            llm.call_llm("sys", "user", model="gpt-4o", cache=False)
+
+        assert len(calls) == 2
+
+    def test_disabled_cache_always_calls_api(self):
+        set_llm_cache(None)
+        calls = []
+        with patch.object(llm, "_get_http_client", return_value=self._client(calls)):
+            llm.call_llm("sys", "user", model="gpt-4o")
+            llm.call_llm("sys", "user", model="gpt-4o")
+
+        assert len(calls) == 2
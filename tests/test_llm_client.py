@@ -0,0 +1,314 @@
+"""utils.llm httpx 직접 호출 테스트 (sync + asyncio)
+
+실제 OpenAI 호출 없이 httpx.MockTransport로 응답을 흉내냅니다.
+"""
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import pytest
+from unittest.mock import patch
+
+import utils.llm as llm
+from utils.cache import MemoryLRUBackend
+from utils.llm_cache import LLMResponseCache, set_llm_cache
+from utils.rate_limiter import set_rate_limiter
+
+
+def _ok(content: str = "OK", finish_reason: str = "stop") -> httpx.Response:
+    return httpx.Response(200, json={
+        "model": "gpt-4o",
+        "choices": [{"message": {"content": content}, "finish_reason": finish_reason}],
+        "usage": {"prompt_tokens": 10, "completion_tokens": 2},
+    })
+
+
+def _sse(*deltas: str) -> httpx.Response:
+    """stream=true 응답 (SSE data 라인)"""
+    lines = [
+        "data: " + json.dumps({"model": "gpt-4o", "choices": [{"delta": {"content": d}, "finish_reason": None}]})
+        for d in deltas
+    ]
+    lines.append("data: " + json.dumps({"model": "gpt-4o", "choices": [{"delta": {}, "finish_reason": "stop"}]}))
+    lines.append("data: " + json.dumps({"model": "gpt-4o", "choices": [], "usage": {"completion_tokens": len(deltas)}}))
+    lines.append("data: [DONE]")
+    return httpx.Response(200, text="\n\n".join(lines) + "\n\n", headers={"content-type": "text/event-stream"})
+
+
+def _rate_limited() -> httpx.Response:
+    return httpx.Response(429, json={"error": {"message": "Rate limit. Please try again in 0.5s."}})
+
+
+@pytest.fixture(autouse=True)
+def _api_key(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-key")
+    monkeypatch.setenv("GPT_MODEL", "gpt-4o")
+    # 재시도 대기 검증을 위해 사전 속도 제한은 끔
+    set_rate_limiter("openai", None)
+
+
+class TestCallLLM:
+    """동기 call_llm 테스트"""
+
+    def test_returns_content_and_sends_two_messages(self):
+        sent = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(json.loads(request.content))
+            return _ok("안녕하세요")
+
+        with patch.object(llm, "_get_http_client", return_value=httpx.Client(transport=httpx.MockTransport(handler))):
+            assert llm.call_llm("sys", "user") == "안녕하세요"
+
+        assert len(sent[0]["messages"]) == 2
+        assert "tools" not in sent[0]
+
+    def test_retries_on_429(self):
+        responses = iter([_rate_limited(), _ok("재시도 성공")])
+        client = httpx.Client(transport=httpx.MockTransport(lambda r: next(responses)))
+
+        with patch.object(llm, "_get_http_client", return_value=client), \
+                patch.object(llm.time, "sleep") as mock_sleep:
+            assert llm.call_llm("sys", "user") == "재시도 성공"
+
+        # "try again in 0.5s" + 여유 1초
+        mock_sleep.assert_called_once_with(1.5)
+
+    def test_new_models_use_max_completion_tokens(self):
+        payload = llm._build_payload("sys", "user", "gpt-5", 0.7, 100)
+        assert payload["max_completion_tokens"] == 100
+        assert "temperature" not in payload
+
+
+class TestStreaming:
+    """on_delta 스트리밍 테스트"""
+
+    def test_stream_forwards_deltas_and_returns_full_text(self):
+        sent = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(json.loads(request.content))
+            return _sse("안녕", "하세요", "!")
+
+        deltas = []
+        with patch.object(llm, "_get_http_client", return_value=httpx.Client(transport=httpx.MockTransport(handler))), \
+                patch.object(llm, "DELTA_FLUSH_CHARS", 1):
+            assert llm.call_llm("sys", "user", on_delta=deltas.append) == "안녕하세요!"
+
+        assert sent[0]["stream"] is True
+        assert len(sent[0]["messages"]) == 2
+        assert deltas == ["안녕", "하세요", "!"]
+
+    def test_small_deltas_are_coalesced(self):
+        client = httpx.Client(transport=httpx.MockTransport(lambda r: _sse("a", "b", "c")))
+        deltas = []
+        with patch.object(llm, "_get_http_client", return_value=client):
+            llm.call_llm("sys", "user", on_delta=deltas.append)
+
+        assert deltas == ["abc"]
+
+    def test_stream_retries_on_429(self):
+        responses = iter([_rate_limited(), _sse("ok")])
+        client = httpx.Client(transport=httpx.MockTransport(lambda r: next(responses)))
+        deltas = []
+
+        with patch.object(llm, "_get_http_client", return_value=client), \
+                patch.object(llm.time, "sleep"):
+            assert llm.call_llm("sys", "user", on_delta=deltas.append) == "ok"
+
+        assert deltas == ["ok"]
+
+    def test_async_stream(self):
+        deltas = []
+
+        async def main():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(lambda r: _sse("비동기", " 응답")))
+            with patch.object(llm, "_get_async_http_client", return_value=client):
+                return await llm.acall_llm("sys", "user", on_delta=deltas.append)
+
+        assert asyncio.run(main()) == "비동기 응답"
+        assert "".join(deltas) == "비동기 응답"
+
+
+class TestAsyncCallLLM:
+    """asyncio acall_llm 테스트"""
+
+    def test_gather_runs_concurrently(self):
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.05)
+            return _ok(json.loads(request.content)["messages"][1]["content"])
+
+        async def main():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            with patch.object(llm, "_get_async_http_client", return_value=client):
+                return await asyncio.gather(*(llm.acall_llm("sys", f"q{i}") for i in range(5)))
+
+        assert asyncio.run(main()) == [f"q{i}" for i in range(5)]
+
+    def test_async_retries_on_429(self):
+        responses = iter([_rate_limited(), _ok("ok")])
+
+        async def main():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(lambda r: next(responses)))
+            with patch.object(llm, "_get_async_http_client", return_value=client), \
+                    patch.object(llm.asyncio, "sleep") as mock_sleep:
+                mock_sleep.return_value = None
+                result = await llm.acall_llm("sys", "user")
+            return result, mock_sleep
+
+        result, mock_sleep = asyncio.run(main())
+        assert result == "ok"
+        mock_sleep.assert_called_once_with(1.5)
+
+    def test_async_client_is_per_event_loop(self):
+        async def get():
+            return llm._get_async_http_client()
+
+        first = asyncio.run(get())
+        second = asyncio.run(get())
+        assert first is not second
+
+    def test_replaced_client_is_closed_on_its_own_loop(self):
+        async def get():
+            return llm._get_async_http_client()
+
+        background = asyncio.new_event_loop()
+        thread = threading.Thread(target=background.run_forever, daemon=True)
+        thread.start()
+        try:
+            first = asyncio.run_coroutine_threadsafe(get(), background).result(5)
+            second = asyncio.run(get())
+            # 이전 클라이언트의 aclose()는 그 클라이언트가 생성된 루프에서 실행됨
+            for _ in range(50):
+                if first.is_closed:
+                    break
+                time.sleep(0.01)
+            assert first.is_closed and not second.is_closed
+        finally:
+            background.call_soon_threadsafe(background.stop)
+            thread.join(5)
+            background.close()
+
+    def test_limiter_is_updated_off_the_event_loop(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test-key")
+        loop_threads, limiter_threads = [], []
+
+        class _Limiter:
+            async def acquire_async(self, tokens):
+                loop_threads.append(threading.get_ident())
+                return 0.0
+
+            def update_from_headers(self, headers):
+                limiter_threads.append(threading.get_ident())
+
+            def backoff(self, seconds):
+                limiter_threads.append(threading.get_ident())
+
+        responses = iter([httpx.Response(429, json={}), _ok()])
+        set_rate_limiter("openai", _Limiter())
+        try:
+            async def main():
+                client = httpx.AsyncClient(transport=httpx.MockTransport(lambda r: next(responses)))
+                with patch.object(llm, "_get_async_http_client", return_value=client), \
+                        patch.object(llm, "get_call_scheduler", return_value=None), \
+                        patch.object(llm, "_rate_limit_wait", return_value=0.0):
+                    return await llm.acall_llm("sys", "user", cache=False)
+
+            assert asyncio.run(main()) == "OK"
+        finally:
+            set_rate_limiter("openai", None)
+
+        # update_from_headers x2 + backoff x1, 모두 이벤트 루프 스레드가 아닌 곳에서 실행
+        assert len(limiter_threads) == 3
+        assert set(limiter_threads).isdisjoint(loop_threads)
+
+    def test_cache_is_accessed_off_the_event_loop(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test-key")
+        set_rate_limiter("openai", None)
+        loop_threads, cache_threads = [], []
+
+        class _Backend(MemoryLRUBackend):
+            def get(self, key):
+                cache_threads.append(threading.get_ident())
+                return super().get(key)
+
+            def set(self, key, value, ttl=None):
+                cache_threads.append(threading.get_ident())
+                super().set(key, value, ttl)
+
+        set_llm_cache(LLMResponseCache(_Backend()))
+        try:
+            async def main():
+                loop_threads.append(threading.get_ident())
+                client = httpx.AsyncClient(transport=httpx.MockTransport(lambda r: _ok()))
+                with patch.object(llm, "_get_async_http_client", return_value=client):
+                    first = await llm.acall_llm("sys", "user")
+                    second = await llm.acall_llm("sys", "user")
+                return first, second
+
+            assert asyncio.run(main()) == ("OK", "OK")
+        finally:
+            set_llm_cache(None)
+
+        # 조회 2회 + 저장 1회 (두 번째 호출은 캐시 적중)
+        assert len(cache_threads) == 3
+        assert set(cache_threads).isdisjoint(loop_threads)
+
+
+class TestContinuation:
+    """finish_reason=length 잘린 응답 이어쓰기 테스트"""
+
+    def test_truncated_response_is_continued(self):
+        sent = []
+        responses = iter([_ok("## 1. 서론\n첫 문단이 중간에", "length"), _ok(" 끊긴 뒤 이어집니다.")])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(json.loads(request.content))
+            return next(responses)
+
+        with patch.object(llm, "_get_http_client", return_value=httpx.Client(transport=httpx.MockTransport(handler))):
+            result = llm.call_llm("sys", "보고서 작성", continuations=2)
+
+        assert result == "## 1. 서론\n첫 문단이 중간에 끊긴 뒤 이어집니다."
+        assert result.finish_reason == "stop"
+        assert len(sent) == 2
+        # 이어쓰기 요청도 messages 2개, 잘린 끝부분과 제목 목록 포함
+        follow_up = sent[1]["messages"]
+        assert len(follow_up) == 2
+        assert "첫 문단이 중간에" in follow_up[1]["content"]
+        assert "## 1. 서론" in follow_up[1]["content"]
+
+    def test_truncation_surfaced_without_continuation(self):
+        cache = LLMResponseCache(MemoryLRUBackend())
+        set_llm_cache(cache)
+        try:
+            client = httpx.Client(transport=httpx.MockTransport(lambda r: _ok("잘린 응답", "length")))
+            with patch.object(llm, "_get_http_client", return_value=client):
+                result = llm.call_llm("sys", "user")
+        finally:
+            set_llm_cache(None)
+
+        assert result.truncated
+        # 잘린 응답은 캐시하지 않음
+        assert len(cache.backend) == 0
+
+    def test_overlapping_prefix_is_removed(self):
+        partial = "위험 평가는 단계적으로 수행되어야 하며"
+        addition = "단계적으로 수행되어야 하며, 각 단계는 비례적이어야 한다."
+        assert llm._merge_continuation(partial, addition) == (
+            "위험 평가는 단계적으로 수행되어야 하며, 각 단계는 비례적이어야 한다."
+        )
+        # 짧은 우연한 일치는 그대로 이어 붙임
+        assert llm._merge_continuation("가나다", "다라마") == "가나다다라마"
+
+    def test_async_continuation(self):
+        responses = iter([_ok("앞부분", "length"), _ok(" 뒷부분")])
+
+        async def main():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(lambda r: next(responses)))
+            with patch.object(llm, "_get_async_http_client", return_value=client):
+                return await llm.acall_llm("sys", "user", continuations=1)
+
+        assert asyncio.run(main()) == "앞부분 뒷부분"
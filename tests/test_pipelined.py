@@ -0,0 +1,155 @@
+"""전문가별 파이프라인 팀 회의 테스트 (workflow.pipelined.run_pipelined_meeting)"""
+import threading
+from unittest.mock import patch
+
+import pytest
+
+import workflow.pipelined as pipelined
+from agents.critic import CONVERGED_FEEDBACK_MARKER
+from agents.schemas import SpecialistVerdict
+from workflow.checkpoint import _memory_saver, load_meeting_progress
+from workflow.state import CritiqueResult
+
+TEAM = [
+    {"role": "독성학자", "focus": "독성 평가"},
+    {"role": "규제과학 전문가", "focus": "국제 규제 비교"},
+]
+
+
+def _state(run_id=""):
+    return {"topic": "NGT", "constraints": "", "team": TEAM, "messages": [], "sources": [], "run_id": run_id}
+
+
+class _FakeSearches:
+    def __init__(self, *args):
+        pass
+
+    def context(self, index):
+        return "RAG", "WEB", "EFSA"
+
+    def final(self):
+        return "RAG", "WEB", "EFSA"
+
+
+def _specialist(profile, topic, constraints, rag, web, index, total, on_delta=None):
+    return {"role": profile["role"], "focus": profile["focus"], "output": f"{profile['role']} r1", "message": None}
+
+
+def _revision(state):
+    so = state["specialist_outputs"][0]
+    return {
+        "specialist_outputs": [{**so, "output": f"{so['role']} r{state['current_round']}"}],
+        "messages": [],
+    }
+
+
+def _merge(state, verdicts):
+    if state["current_round"] in _FAIL_MERGE_ROUNDS:
+        raise RuntimeError("OpenAI API request timed out")
+    return CritiqueResult(
+        decision="continue",
+        feedback=f"라운드 {state['current_round']} 요약",
+        scores={v.role: v.score for v in verdicts},
+        specialist_feedback={v.role: v.feedback for v in verdicts},
+    )
+
+
+_FAIL_MERGE_ROUNDS: set[int] = set()
+
+
+def _run(specialist=_specialist, revision=_revision, critique=None, summaries=None, checkpointer=None, run_id=""):
+    summaries = summaries if summaries is not None else []
+
+    def pi_summary(state):
+        summaries.append(state["current_round"])
+        return {"draft": f"PI 라운드 {state['current_round']}", "messages": []}
+
+    critique = critique or (lambda state, so, web, on_delta=None: SpecialistVerdict(role=so["role"], score=3, feedback="보강"))
+    with patch.object(pipelined, "_SearchPipeline", _FakeSearches), \
+            patch.object(pipelined, "_run_single_specialist", side_effect=specialist), \
+            patch.object(pipelined, "run_round_revision", side_effect=revision) as revise, \
+            patch.object(pipelined, "critique_specialist", side_effect=critique), \
+            patch.object(pipelined, "merge_critiques", side_effect=_merge), \
+            patch.object(pipelined, "run_pi_summary", side_effect=pi_summary), \
+            patch.object(pipelined, "critic_web_context", return_value="검증 자료"):
+        return pipelined.run_pipelined_meeting(_state(run_id), checkpointer=checkpointer), revise
+
+
+class TestPipelinedMeeting:
+
+    def test_tracks_advance_without_waiting_for_slowest_specialist(self, monkeypatch):
+        monkeypatch.delenv("ROUND_MODE", raising=False)
+        monkeypatch.delenv("ROUND_MAX", raising=False)
+        monkeypatch.setenv("REVISION_SKIP_POLICY", "off")
+        fast_revised = threading.Event()
+        slow_started_after = []
+
+        def specialist(profile, *args, **kwargs):
+            if profile["role"] == "독성학자":
+                # 다른 전문가의 Round 2 수정이 시작될 때까지 Round 1 분석을 끝내지 않음
+                slow_started_after.append(fast_revised.wait(5))
+            return _specialist(profile, *args, **kwargs)
+
+        def revision(state):
+            if state["team"][0]["role"] == "규제과학 전문가":
+                fast_revised.set()
+            return _revision(state)
+
+        summaries = []
+        result, _ = _run(specialist=specialist, revision=revision, summaries=summaries)
+
+        assert slow_started_after == [True]
+        assert result["current_round"] == 3
+        assert [r["round"] for r in result["meeting_history"]] == [1, 2]
+        assert summaries == [1, 2, 3]
+        assert result["draft"] == "PI 라운드 3"
+        assert {so["output"] for so in result["specialist_outputs"]} == {"독성학자 r3", "규제과학 전문가 r3"}
+        assert result["critique"].feedback == "라운드 3 요약"
+
+    def test_converged_track_stops_and_is_carried_forward(self, monkeypatch):
+        monkeypatch.delenv("ROUND_MODE", raising=False)
+        monkeypatch.delenv("REVISION_SKIP_POLICY", raising=False)
+
+        def critique(state, so, web, on_delta=None):
+            if so["role"] == "독성학자":
+                return SpecialistVerdict(role=so["role"], score=5, feedback=CONVERGED_FEEDBACK_MARKER)
+            return SpecialistVerdict(role=so["role"], score=3, feedback="보강")
+
+        result, revise = _run(critique=critique)
+
+        revised_roles = {call.args[0]["team"][0]["role"] for call in revise.call_args_list}
+        assert revised_roles == {"규제과학 전문가"}
+        outputs = {so["role"]: so for so in result["specialist_outputs"]}
+        assert outputs["독성학자"]["carried_forward"] is True
+        assert outputs["독성학자"]["output"] == "독성학자 r1"
+        assert result["meeting_history"][1]["carried_forward"] == ["독성학자"]
+        assert result["critique"].scores["독성학자"] == 5
+
+    def test_resume_skips_rounds_saved_before_failure(self, monkeypatch):
+        monkeypatch.delenv("ROUND_MODE", raising=False)
+        monkeypatch.delenv("ROUND_MAX", raising=False)
+        monkeypatch.setenv("REVISION_SKIP_POLICY", "off")
+        checkpointer = _memory_saver()
+        _FAIL_MERGE_ROUNDS.add(3)
+        try:
+            with pytest.raises(RuntimeError):
+                _run(checkpointer=checkpointer, run_id="run-1")
+        finally:
+            _FAIL_MERGE_ROUNDS.clear()
+        assert sorted(load_meeting_progress(checkpointer, "run-1")["rounds"], key=int) == ["1", "2"]
+
+        analyzed, summaries = [], []
+
+        def specialist(profile, *args, **kwargs):
+            analyzed.append(profile["role"])
+            return _specialist(profile, *args, **kwargs)
+
+        result, revise = _run(specialist=specialist, checkpointer=checkpointer, run_id="run-1", summaries=summaries)
+
+        # 라운드 1~2는 다시 실행하지 않고 라운드 3 수정·요약만 진행
+        assert analyzed == []
+        assert [call.args[0]["current_round"] for call in revise.call_args_list] == [3, 3]
+        assert summaries == [3]
+        assert result["current_round"] == 3
+        assert [r["pi_summary"] for r in result["meeting_history"]] == ["PI 라운드 1", "PI 라운드 2"]
+        assert {so["output"] for so in result["specialist_outputs"]} == {"독성학자 r3", "규제과학 전문가 r3"}
@@ -0,0 +1,84 @@
+"""PI 기획 단계 캐시 테스트 (utils.planning_cache + run_pi_planning 통합)"""
+import pytest
+from unittest.mock import patch
+
+import agents.pi as pi
+from utils.cache import MemoryLRUBackend
+from utils.embeddings import EmbeddingClient, set_embedding_client
+from utils.planning_cache import PlanningCache, make_planning_key, set_planning_cache
+
+TEAM = [
+    {"role": "독성학자", "focus": "독성 평가"},
+    {"role": "규제과학 전문가", "focus": "국제 규제 비교"},
+]
+INTRODUCTIONS = [{"role": m["role"], "introduction": f"{m['role']}입니다."} for m in TEAM]
+PLANNING = {
+    "team": TEAM,
+    "team_selection_data": {"final_team": TEAM, "n_trials": 6, "trials_requested": 10},
+    "specialist_introductions": INTRODUCTIONS,
+}
+
+
+@pytest.fixture
+def planning_cache():
+    cache = PlanningCache(MemoryLRUBackend(max_entries=50), ttl=3600)
+    set_planning_cache(cache)
+    yield cache
+    set_planning_cache(None)
+
+
+class TestPlanningCache:
+    """캐시 키 정규화 / 만료 / 근접 중복 조회"""
+
+    def test_normalized_variants_share_key(self):
+        assert make_planning_key("유전자편집 식품의  안전성 평가!", "CRISPR") == make_planning_key(
+            "유전자편집 식품의 안전성 평가", "crispr."
+        )
+        assert make_planning_key("유전자편집 식품", "") != make_planning_key("유전자변형 식품", "")
+
+    def test_expired_entry_is_miss(self):
+        cache = PlanningCache(MemoryLRUBackend(max_entries=10), ttl=60)
+        cache.set("주제", "", PLANNING)
+
+        with patch("utils.cache.time.time", return_value=10**12):
+            assert cache.get("주제", "") is None
+        assert cache.stats()["misses"] == 1
+
+    def test_similarity_lookup_finds_near_duplicate(self):
+        set_embedding_client(EmbeddingClient(backend="local"))
+        try:
+            cache = PlanningCache(MemoryLRUBackend(max_entries=10), similarity_threshold=0.8)
+            cache.set("유전자편집 식품의 안전성 평가 프레임워크", "", PLANNING)
+
+            hit = cache.get("유전자편집 식품 안전성 평가 프레임워크", "")
+            assert hit["team"] == TEAM
+            assert cache.get("반도체 공정 수율 개선", "") is None
+            assert cache.stats()["similar_hits"] == 1
+        finally:
+            set_embedding_client(None)
+
+
+class TestRunPiPlanningCache:
+    """run_pi_planning 캐시 통합 테스트"""
+
+    def test_second_run_skips_selection(self, planning_cache):
+        state = {"topic": "유전자편집 식품 안전성", "constraints": "", "messages": []}
+        with patch.object(pi, "decide_team_statistically", return_value=PLANNING["team_selection_data"]) as decide, \
+                patch.object(pi, "generate_self_introductions", return_value=INTRODUCTIONS) as intro:
+            first = pi.run_pi_planning(state)
+            second = pi.run_pi_planning(state)
+
+        decide.assert_called_once()
+        intro.assert_called_once()
+        assert second["team"] == first["team"] == TEAM
+        assert second["specialist_introductions"] == INTRODUCTIONS
+        assert second["team_selection_data"]["cache_hit"] is True
+        assert "cache_hit" not in first["team_selection_data"]
+
+    def test_default_team_is_not_cached(self, planning_cache):
+        state = {"topic": "유전자편집 식품 안전성", "constraints": "", "messages": []}
+        with patch.object(pi, "decide_team_statistically", side_effect=RuntimeError("API down")), \
+                patch.object(pi, "generate_self_introductions", return_value=INTRODUCTIONS):
+            pi.run_pi_planning(state)
+
+        assert planning_cache.get("유전자편집 식품 안전성", "") is None
@@ -0,0 +1,75 @@
+"""최종 합성 검색 prefetch 테스트 (utils.prefetch + PI 기획/합성 통합)"""
+import threading
+from unittest.mock import MagicMock, patch
+
+import agents.pi as pi
+from utils.prefetch import discard_run, prefetch, resolve_prefetched
+
+
+class TestPrefetchRegistry:
+
+    def test_prefetched_result_is_reused(self):
+        fn = MagicMock(return_value="검색 결과")
+        prefetch("run-a", "web:q", fn, "q").result()
+
+        assert resolve_prefetched("run-a", "web:q", fn, "q") == "검색 결과"
+        fn.assert_called_once_with("q")
+        discard_run("run-a")
+
+    def test_same_key_shares_one_future(self):
+        release = threading.Event()
+        fn = MagicMock(side_effect=lambda q: release.wait(1) and "결과")
+        first = prefetch("run-b", "efsa:q", fn, "q")
+        second = prefetch("run-b", "efsa:q", fn, "q")
+        release.set()
+
+        assert first is second
+        assert resolve_prefetched("run-b", "efsa:q", fn, "q") == "결과"
+        fn.assert_called_once()
+        discard_run("run-b")
+
+    def test_missing_or_failed_prefetch_calls_directly(self):
+        failing = MagicMock(side_effect=RuntimeError("Tavily down"))
+        prefetch("run-c", "web:q", failing, "q").exception()
+
+        direct = MagicMock(return_value="직접 검색")
+        assert resolve_prefetched("run-c", "web:q", direct, "q") == "직접 검색"
+        assert resolve_prefetched("run-c", "other", direct, "q") == "직접 검색"
+        assert prefetch("", "web:q", direct, "q") is None
+        discard_run("run-c")
+
+
+class TestSynthesisPrefetch:
+
+    def test_planning_prefetch_feeds_final_synthesis(self):
+        web = MagicMock(invoke=MagicMock(return_value="웹 결과"))
+        efsa = MagicMock(invoke=MagicMock(return_value="EFSA 결과"))
+        state = {"topic": "NGT", "constraints": "", "messages": []}
+
+        with patch.object(pi, "web_search", web), \
+                patch("tools.web_search.efsa_search", efsa), \
+                patch.object(pi, "get_planning_cache", return_value=None), \
+                patch.object(pi, "decide_team_statistically", side_effect=RuntimeError("offline")), \
+                patch.object(pi, "generate_self_introductions", return_value=[]):
+            planning = pi.run_pi_planning(state)
+
+        assert planning["run_id"]
+
+        synthesis_state = {
+            **state,
+            "run_id": planning["run_id"],
+            "meeting_history": [],
+            "specialist_outputs": [],
+            "draft": "",
+        }
+        with patch.object(pi, "web_search", web), \
+                patch("tools.web_search.efsa_search", efsa), \
+                patch.object(pi, "synthesize_report", return_value="# 보고서\n") as sectioned:
+            pi.run_final_synthesis(synthesis_state)
+
+        # 검색은 기획 직후 한 번씩만 실행되고 합성 단계는 그 결과를 사용
+        web.invoke.assert_called_once()
+        efsa.invoke.assert_called_once()
+        context = sectioned.call_args.args[2]
+        assert context["web"] == "웹 결과"
+        assert "EFSA 결과" in context["efsa"]
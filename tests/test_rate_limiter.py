@@ -0,0 +1,335 @@
+"""OpenAI 사전 속도 제한기(Token Bucket) 테스트"""
+import asyncio
+
+import httpx
+import pytest
+from unittest.mock import patch
+
+import utils.llm as llm
+from utils.rate_limiter import (
+    TokenBucketRateLimiter,
+    WatchError,
+    parse_reset,
+    estimate_tokens,
+    set_rate_limiter,
+)
+
+
+class _Clock:
+    """time.monotonic 대체용 가짜 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    c = _Clock()
+    with patch("utils.rate_limiter.time.monotonic", c):
+        yield c
+
+
+class TestTokenBucket:
+    """Token Bucket 예약 테스트"""
+
+    def test_within_budget_has_no_wait(self, clock):
+        limiter = TokenBucketRateLimiter(rpm=60, tpm=6000)
+        assert limiter.reserve(100) == 0.0
+
+    def test_request_budget_queues_fifo(self, clock):
+        limiter = TokenBucketRateLimiter(rpm=2, tpm=1_000_000)
+        assert limiter.reserve(1) == 0.0
+        assert limiter.reserve(1) == 0.0
+        # 분당 2건 → 다음 요청은 30초, 그 다음은 60초 뒤
+        assert limiter.reserve(1) == pytest.approx(30.0)
+        assert limiter.reserve(1) == pytest.approx(60.0)
+
+    def test_token_budget_refills_over_time(self, clock):
+        limiter = TokenBucketRateLimiter(rpm=1000, tpm=600)
+        assert limiter.reserve(600) == 0.0
+        assert limiter.reserve(60) == pytest.approx(6.0)
+        clock.now = 60.0
+        assert limiter.reserve(60) == 0.0
+
+    def test_oversized_request_is_clamped(self, clock):
+        limiter = TokenBucketRateLimiter(rpm=1000, tpm=100)
+        assert limiter.reserve(65536) == 0.0
+        assert limiter.reserve(10) == pytest.approx(6.0)
+
+    def test_headers_calibrate_limits(self, clock):
+        limiter = TokenBucketRateLimiter(rpm=500, tpm=200000)
+        limiter.update_from_headers({
+            "x-ratelimit-limit-requests": "60",
+            "x-ratelimit-limit-tokens": "30000",
+            "x-ratelimit-remaining-requests": "0",
+            "x-ratelimit-remaining-tokens": "30000",
+        })
+        stats = limiter.stats()
+        assert stats["rpm_limit"] == 60
+        assert stats["tpm_limit"] == 30000
+        assert limiter.reserve(1) == pytest.approx(1.0)
+
+    def test_backoff_delays_everyone(self, clock):
+        limiter = TokenBucketRateLimiter(rpm=600, tpm=1_000_000)
+        limiter.backoff(5.0)
+        assert limiter.reserve(1) >= 5.0
+
+    def test_queue_wait_metrics(self, clock):
+        limiter = TokenBucketRateLimiter(rpm=1, tpm=1_000_000)
+        limiter.reserve(1)
+        limiter.reserve(1)
+        stats = limiter.stats()
+        assert stats["total_requests"] == 2
+        assert stats["max_queue_wait_s"] == pytest.approx(60.0)
+
+
+class TestHelpers:
+    def testparse_reset(self):
+        assert parse_reset("6m0s") == 360
+        assert parse_reset("20ms") == pytest.approx(0.02)
+        assert parse_reset("") is None
+
+    def test_estimate_tokens_counts_korean_denser(self):
+        assert estimate_tokens("가" * 100) > estimate_tokens("a" * 100)
+
+
+class TestCallLLMIntegration:
+    """call_llm이 호출 전 예산을 확보하고 헤더로 보정하는지 확인"""
+
+    def test_call_llm_acquires_and_calibrates(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test-key")
+        limiter = TokenBucketRateLimiter(rpm=500, tpm=200000)
+        set_rate_limiter("openai", limiter)
+
+        def handler(request):
+            return httpx.Response(
+                200,
+                headers={"x-ratelimit-limit-requests": "100", "x-ratelimit-remaining-requests": "99"},
+                json={"choices": [{"message": {"content": "ok"}}]},
+            )
+
+        try:
+            with patch.object(llm, "_get_http_client", return_value=httpx.Client(transport=httpx.MockTransport(handler))):
+                assert llm.call_llm("sys", "user", model="gpt-4o", max_tokens=10, cache=False) == "ok"
+        finally:
+            set_rate_limiter("openai", None)
+
+        stats = limiter.stats()
+        assert stats["total_requests"] == 1
+        assert stats["rpm_limit"] == 100
+        assert stats["calibrations"] == 1
+
+    def test_async_acquire_does_not_block_loop(self):
+        limiter = TokenBucketRateLimiter(rpm=600, tpm=1_000_000)
+
+        async def main():
+            limiter.backoff(0.05)
+            return await asyncio.gather(limiter.acquire_async(1), asyncio.sleep(0, result="free"))
+
+        waited, other = asyncio.run(main())
+        assert waited > 0
+        assert other == "free"
+
+
+class FakeRedis:
+    """RedisRateLimiter가 사용하는 명령만 구현한 로컬 가짜 Redis"""
+
+    def __init__(self):
+        self.data: dict = {}
+        self.fail = False
+        # 남은 WATCH 충돌 횟수 (충돌 시 on_conflict로 다른 클라이언트의 예약을 흉내)
+        self.conflicts = 0
+        self.on_conflict = lambda: None
+        self.pending_conflict = False
+
+    def _check(self):
+        if self.fail:
+            raise ConnectionError("redis down")
+
+    def get(self, key):
+        self._check()
+        return self.data.get(key)
+
+    def set(self, key, value, px=None):
+        self._check()
+        self.data[key] = value
+
+    def incr(self, key):
+        return self.incrby(key, 1)
+
+    def incrby(self, key, amount):
+        self._check()
+        self.data[key] = int(self.data.get(key, 0)) + amount
+        return self.data[key]
+
+    def decr(self, key):
+        return self.incrby(key, -1)
+
+    def decrby(self, key, amount):
+        return self.incrby(key, -amount)
+
+    def expire(self, key, seconds):
+        self._check()
+        return True
+
+    def hgetall(self, key):
+        self._check()
+        return dict(self.data.get(key, {}))
+
+    def hset(self, key, mapping):
+        self._check()
+        self.data.setdefault(key, {}).update(mapping)
+
+    def ping(self):
+        self._check()
+        return True
+
+    def pipeline(self):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    """redis-py 파이프라인 흉내: WATCH 이후 명령은 즉시 실행, MULTI 이후는 execute()까지 모아서 실행"""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+        self.immediate = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.ops = []
+        self.immediate = False
+
+    def watch(self, *keys):
+        self.redis._check()
+        self.immediate = True
+        if self.redis.conflicts:
+            # 다른 클라이언트가 WATCH 직후 같은 키를 갱신한 상황
+            self.redis.conflicts -= 1
+            self.redis.on_conflict()
+
+    def multi(self):
+        self.immediate = False
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            if self.immediate:
+                return getattr(self.redis, name)(*args, **kwargs)
+            self.ops.append((name, args, kwargs))
+        return queue
+
+    def execute(self):
+        if self.redis.pending_conflict:
+            self.redis.pending_conflict = False
+            self.ops = []
+            raise WatchError("watched key changed")
+        results = [getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.ops]
+        self.ops = []
+        return results
+
+
+class TestRedisRateLimiter:
+    """Redis 공유 카운터 분산 속도 제한기 테스트"""
+
+    def test_processes_share_window_budget(self):
+        from utils.rate_limiter import RedisRateLimiter
+
+        redis = FakeRedis()
+        # 두 워커 프로세스가 같은 Redis를 공유: 10초 버스트 예산 = 60 RPM * 10/60 = 10건
+        workers = [
+            RedisRateLimiter(redis, "openai", rpm=60, tpm=1_000_000, window_seconds=10, headroom=1.0)
+            for _ in range(2)
+        ]
+        with patch("utils.rate_limiter.time.time", return_value=1000.0):
+            granted = [w.reserve(1) for _ in range(6) for w in workers]
+
+        assert granted.count(0.0) == 10
+        # 예산 초과분은 도착 순서대로 1초(= 60/RPM) 간격으로 예약됨
+        assert granted[10:] == [pytest.approx(1.0), pytest.approx(2.0)]
+
+    def test_large_request_is_not_starved_by_small_ones(self):
+        from utils.rate_limiter import RedisRateLimiter
+
+        redis = FakeRedis()
+        # 10초 버스트 예산 = 60,000 TPM * 10/60 = 10,000 토큰
+        limiter = RedisRateLimiter(redis, "openai", rpm=10_000, tpm=60_000, window_seconds=10, headroom=1.0)
+        now = [1000.0]
+        with patch("utils.rate_limiter.time.time", side_effect=lambda: now[0]):
+            for _ in range(5):
+                limiter.reserve(2_000)
+            # 예산보다 큰 요청도 잘리지 않고 대기열에 예약됨
+            large = limiter.reserve(30_000)
+            small_after = []
+            for _ in range(20):
+                # 작은 요청이 계속 도착해도 큰 요청 앞으로 끼어들지 못함
+                now[0] += 0.5
+                small_after.append(now[0] + limiter.reserve(2_000))
+
+        large_start = 1000.0 + large
+        assert large == pytest.approx(30.0)
+        assert min(small_after) >= large_start
+
+    def test_conflicting_reservation_is_retried_behind_the_winner(self):
+        from utils.rate_limiter import RedisRateLimiter
+
+        redis = FakeRedis()
+        first = RedisRateLimiter(redis, "openai", rpm=60, tpm=1_000_000, window_seconds=1, headroom=1.0)
+        second = RedisRateLimiter(redis, "openai", rpm=60, tpm=1_000_000, window_seconds=1, headroom=1.0)
+
+        def winner_reserves():
+            first.reserve(1)
+            redis.pending_conflict = True
+
+        redis.conflicts = 1
+        redis.on_conflict = winner_reserves
+        with patch("utils.rate_limiter.time.time", return_value=1000.0):
+            delay = second.reserve(1)
+
+        # 먼저 커밋한 예약(0초) 뒤의 다음 슬롯
+        assert delay == pytest.approx(1.0)
+        assert second.stats()["reserve_conflicts"] == 1
+
+    def test_calibration_is_shared(self):
+        from utils.rate_limiter import RedisRateLimiter
+
+        redis = FakeRedis()
+        first = RedisRateLimiter(redis, "openai", rpm=500, tpm=200000)
+        second = RedisRateLimiter(redis, "openai", rpm=500, tpm=200000)
+        first.update_from_headers({"x-ratelimit-limit-requests": "60", "x-ratelimit-limit-tokens": "30000"})
+        assert second.stats()["rpm_limit"] == 60
+        assert second.stats()["tpm_limit"] == 30000
+
+    def test_backoff_is_shared(self):
+        from utils.rate_limiter import RedisRateLimiter
+
+        redis = FakeRedis()
+        first = RedisRateLimiter(redis, "openai", rpm=600, tpm=1_000_000)
+        second = RedisRateLimiter(redis, "openai", rpm=600, tpm=1_000_000)
+        with patch("utils.rate_limiter.time.time", return_value=1000.0):
+            first.backoff(5.0)
+            assert second.reserve(1) == pytest.approx(5.0)
+
+    def test_falls_back_to_local_when_redis_fails(self):
+        from utils.rate_limiter import RedisRateLimiter
+
+        redis = FakeRedis()
+        redis.fail = True
+        fallback = TokenBucketRateLimiter(rpm=600, tpm=1_000_000)
+        limiter = RedisRateLimiter(redis, "openai", rpm=600, tpm=1_000_000, fallback=fallback)
+        assert limiter.acquire(10) == 0.0
+        assert limiter.stats()["redis_errors"] == 1
+        assert fallback.stats()["total_requests"] == 1
+
+    def test_factory_falls_back_without_redis(self, monkeypatch):
+        from utils import rate_limiter
+
+        monkeypatch.setenv("RATE_LIMIT_BACKEND", "redis")
+        with patch("utils.cache.get_redis_client", side_effect=ValueError("REDIS_URL must be set")):
+            limiter = rate_limiter._create_limiter("tavily")
+        assert isinstance(limiter, TokenBucketRateLimiter)
@@ -0,0 +1,106 @@
+"""라운드 수정 패치 테스트 (agents.revision + run_round_revision patch 모드)"""
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import agents.scientist as scientist
+from agents.revision import apply_edits, outline, split_sections
+from agents.schemas import RevisionPatch, SectionEdit
+from workflow.state import CritiqueResult
+
+PREVIOUS = """도입 문단
+
+## 1. 위해성 평가
+기존 평가 내용
+
+## 2. 규제 비교
+EU와 미국 비교
+"""
+
+
+class TestApplyEdits:
+
+    def test_split_sections_round_trips(self):
+        sections = split_sections(PREVIOUS)
+        assert "".join(body for _, body in sections) == PREVIOUS
+        assert outline(PREVIOUS) == ["## 1. 위해성 평가", "## 2. 규제 비교"]
+
+    def test_replace_keeps_heading_when_only_body_sent(self):
+        edits = [SectionEdit(op="replace", section="1. 위해성 평가", content="보강된 평가 [출처: EFSA]")]
+        result = apply_edits(PREVIOUS, edits)
+
+        assert "## 1. 위해성 평가\n\n보강된 평가 [출처: EFSA]" in result
+        assert "기존 평가 내용" not in result
+        assert "EU와 미국 비교" in result and result.startswith("도입 문단")
+
+    def test_insert_after_and_append(self):
+        edits = [
+            SectionEdit(op="insert_after", section="## 1. 위해성 평가", content="## 1-1. SDN별 차이\nSDN-1 설명"),
+            SectionEdit(op="replace", section="1-1. SDN별 차이", content="## 1-1. SDN별 차이\nSDN-1/2/3 설명"),
+            SectionEdit(op="append", section="", content="## 3. 결론\n요약"),
+        ]
+        result = apply_edits(PREVIOUS, edits)
+
+        assert outline(result) == ["## 1. 위해성 평가", "## 1-1. SDN별 차이", "## 2. 규제 비교", "## 3. 결론"]
+        assert "SDN-1/2/3 설명" in result
+
+    def test_unknown_section_raises(self):
+        with pytest.raises(ValueError):
+            apply_edits(PREVIOUS, [SectionEdit(op="replace", section="없는 섹션", content="x")])
+        with pytest.raises(ValueError):
+            apply_edits("제목 없는 분석", [SectionEdit(op="append", section="", content="x")])
+
+
+def _state():
+    return {
+        "topic": "NGT",
+        "constraints": "",
+        "team": [{"role": "독성학자", "focus": "독성 평가"}],
+        "current_round": 2,
+        "critique": CritiqueResult(
+            decision="continue", feedback="", scores={"독성학자": 3}, specialist_feedback={"독성학자": "근거 보강"}
+        ),
+        "draft": "",
+        "specialist_outputs": [{"role": "독성학자", "focus": "독성 평가", "output": PREVIOUS}],
+        "messages": [],
+        "meeting_history": [],
+    }
+
+
+class TestPatchRevision:
+
+    def test_patch_mode_applies_edits_without_rewrite(self, monkeypatch):
+        monkeypatch.delenv("REVISION_MODE", raising=False)
+        agent = MagicMock()
+        agent.invoke_json.return_value = RevisionPatch(
+            summary="근거 보강",
+            edits=[SectionEdit(op="replace", section="1. 위해성 평가", content="보강된 평가")],
+        )
+        with patch.object(scientist, "create_specialist", return_value=agent):
+            result = scientist.run_round_revision(_state())
+
+        agent.invoke.assert_not_called()
+        assert "## 1. 위해성 평가" in agent.invoke_json.call_args.args[0]
+        output = result["specialist_outputs"][0]["output"]
+        assert "보강된 평가" in output and "EU와 미국 비교" in output
+
+    def test_failed_patch_falls_back_to_rewrite(self, monkeypatch):
+        monkeypatch.delenv("REVISION_MODE", raising=False)
+        agent = MagicMock(invoke=MagicMock(return_value="전체 재작성"))
+        agent.invoke_json.return_value = RevisionPatch(
+            summary="", edits=[SectionEdit(op="replace", section="없는 섹션", content="x")]
+        )
+        with patch.object(scientist, "create_specialist", return_value=agent):
+            result = scientist.run_round_revision(_state())
+
+        agent.invoke.assert_called_once()
+        assert result["specialist_outputs"][0]["output"] == "전체 재작성"
+
+    def test_rewrite_mode_skips_patch(self, monkeypatch):
+        monkeypatch.setenv("REVISION_MODE", "rewrite")
+        agent = MagicMock(invoke=MagicMock(return_value="전체 재작성"))
+        with patch.object(scientist, "create_specialist", return_value=agent):
+            scientist.run_round_revision(_state())
+
+        agent.invoke_json.assert_not_called()
+        agent.invoke.assert_called_once()
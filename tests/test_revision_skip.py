@@ -0,0 +1,69 @@
+"""수렴한 전문가의 라운드 수정 생략 테스트 (run_round_revision + increment_round)"""
+from unittest.mock import MagicMock, patch
+
+import agents.scientist as scientist
+from agents.critic import CONVERGED_FEEDBACK_MARKER
+from workflow.graph import increment_round
+from workflow.state import CritiqueResult
+
+TEAM = [
+    {"role": "독성학자", "focus": "독성 평가"},
+    {"role": "규제과학 전문가", "focus": "국제 규제 비교"},
+]
+
+
+def _state(scores, feedback):
+    return {
+        "topic": "NGT",
+        "constraints": "",
+        "team": TEAM,
+        "current_round": 2,
+        "critique": CritiqueResult(decision="continue", feedback="", scores=scores, specialist_feedback=feedback),
+        "draft": "",
+        "specialist_outputs": [{**p, "output": f"{p['role']} 이전 분석"} for p in TEAM],
+        "messages": [],
+        "meeting_history": [],
+    }
+
+
+def _run(state):
+    agent = MagicMock(invoke=MagicMock(return_value="수정된 분석"))
+    with patch.object(scientist, "create_specialist", return_value=agent) as create:
+        result = scientist.run_round_revision(state)
+    return result, create
+
+
+class TestRevisionSkip:
+
+    def test_converged_specialist_is_carried_forward(self, monkeypatch):
+        monkeypatch.delenv("REVISION_SKIP_POLICY", raising=False)
+        state = _state(
+            {"독성학자": 5, "규제과학 전문가": 3},
+            {"독성학자": f"근거가 충분합니다. {CONVERGED_FEEDBACK_MARKER}", "규제과학 전문가": "비교 보강 필요"},
+        )
+        result, create = _run(state)
+
+        create.assert_called_once_with(TEAM[1])
+        outputs = {so["role"]: so for so in result["specialist_outputs"]}
+        assert outputs["독성학자"]["carried_forward"] is True
+        assert outputs["독성학자"]["output"] == "독성학자 이전 분석"
+        assert outputs["규제과학 전문가"]["output"] == "수정된 분석"
+
+        # 생략 기록은 다음 라운드 전환 시 meeting_history에 남음
+        archived = increment_round({**state, **result})
+        assert archived["meeting_history"][-1]["carried_forward"] == ["독성학자"]
+
+    def test_perfect_score_with_open_feedback_is_revised(self, monkeypatch):
+        monkeypatch.delenv("REVISION_SKIP_POLICY", raising=False)
+        state = _state({"독성학자": 5, "규제과학 전문가": 5}, {"독성학자": "최신 연구 인용 추가", "규제과학 전문가": ""})
+        result, create = _run(state)
+
+        # 피드백이 남은 전문가만 수정, 빈 피드백은 수렴으로 간주
+        create.assert_called_once_with(TEAM[0])
+        assert [so["role"] for so in result["specialist_outputs"] if so.get("carried_forward")] == ["규제과학 전문가"]
+
+    def test_policy_off_revises_everyone(self, monkeypatch):
+        monkeypatch.setenv("REVISION_SKIP_POLICY", "off")
+        _, create = _run(_state({"독성학자": 5, "규제과학 전문가": 5}, {}))
+
+        assert create.call_count == len(TEAM)
@@ -0,0 +1,96 @@
+"""역할명 임베딩 군집화 테스트 (utils.embeddings + utils.clustering)"""
+import json
+
+import httpx
+import numpy as np
+import pytest
+from unittest.mock import patch
+
+import agents.pi as pi
+import utils.llm as llm
+from utils.cache import MemoryLRUBackend
+from utils.clustering import cluster_by_similarity
+from utils.embeddings import EmbeddingClient, set_embedding_client
+from utils.rate_limiter import set_rate_limiter
+
+
+@pytest.fixture(autouse=True)
+def _reset(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-key")
+    set_rate_limiter("openai", None)
+    yield
+    set_embedding_client(None)
+
+
+class TestClusterBySimilarity:
+    """코사인 유사도 군집화 테스트"""
+
+    def test_groups_by_threshold_and_picks_medoid(self):
+        labels = ["독성학자", "독성 전문가", "영양학자"]
+        vectors = np.array([[1.0, 0.1], [1.0, 0.0], [0.0, 1.0]])
+        mapping = cluster_by_similarity(labels, vectors, threshold=0.9)
+        assert mapping["독성학자"] == mapping["독성 전문가"]
+        assert mapping["영양학자"] == "영양학자"
+
+    def test_average_linkage_does_not_chain(self):
+        # a~b, b~c는 가깝지만 a~c는 멀다
+        angles = np.radians([0, 30, 60])
+        vectors = np.stack([np.cos(angles), np.sin(angles)], axis=1)
+        mapping = cluster_by_similarity(["a", "b", "c"], vectors, threshold=0.8)
+        assert len(set(mapping.values())) == 2
+
+    def test_result_independent_of_input_order(self):
+        rng = np.random.default_rng(0)
+        labels = [f"role{i}" for i in range(8)]
+        vectors = rng.normal(size=(8, 4))
+        first = cluster_by_similarity(labels, vectors, 0.3)
+        reverse = cluster_by_similarity(labels[::-1], vectors[::-1], 0.3)
+        assert first == reverse
+
+
+class TestEmbeddingClient:
+    """임베딩 배치 + 캐시 테스트"""
+
+    def test_local_backend_is_deterministic(self):
+        client = EmbeddingClient(backend="local")
+        assert np.array_equal(client.embed(["식품안전성 평가 전문가"]), client.embed(["식품안전성 평가 전문가"]))
+
+    def test_openai_backend_batches_and_caches(self):
+        requests = []
+
+        def handler(request):
+            body = json.loads(request.content)
+            requests.append(body)
+            return httpx.Response(200, json={"data": [
+                {"index": i, "embedding": [float(len(t)), 1.0]} for i, t in enumerate(body["input"])
+            ]})
+
+        client = EmbeddingClient(backend="openai", cache=MemoryLRUBackend())
+        with patch.object(llm, "_get_http_client", return_value=httpx.Client(transport=httpx.MockTransport(handler))):
+            client.embed(["a", "bb"])
+            vectors = client.embed(["bb", "ccc", "a"])
+
+        assert [r["input"] for r in requests] == [["a", "bb"], ["ccc"]]
+        assert vectors[:, 0].tolist() == [2.0, 3.0, 1.0]
+
+
+class TestClusterSimilarRoles:
+    """PI 역할 클러스터링 통합 테스트"""
+
+    def test_uses_embeddings_without_llm_call(self, monkeypatch):
+        monkeypatch.delenv("ROLE_CLUSTERING", raising=False)
+        set_embedding_client(EmbeddingClient(backend="local"))
+        with patch.object(pi, "call_gpt_json") as gpt:
+            mapping = pi._cluster_similar_roles(["독성학 전문가", "독성학자", "국제 규제과학 전문가"])
+
+        gpt.assert_not_called()
+        assert mapping["독성학 전문가"] == mapping["독성학자"]
+        assert mapping["국제 규제과학 전문가"] != mapping["독성학자"]
+
+    def test_falls_back_to_local_when_api_fails(self, monkeypatch):
+        monkeypatch.delenv("ROLE_CLUSTERING", raising=False)
+        client = httpx.Client(transport=httpx.MockTransport(lambda r: httpx.Response(500, text="down")))
+        set_embedding_client(EmbeddingClient(backend="openai"))
+        with patch.object(llm, "_get_http_client", return_value=client):
+            mapping = pi._cluster_similar_roles(["독성학자", "영양학자"])
+        assert set(mapping) == {"독성학자", "영양학자"}
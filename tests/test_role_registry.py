@@ -0,0 +1,84 @@
+"""역할명 정규화 사전 테스트 (utils.role_registry + PI 통합 + 관리 API)"""
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import patch
+
+import agents.pi as pi
+from utils.role_registry import RoleRegistry, set_role_registry
+
+
+@pytest.fixture
+def registry(tmp_path):
+    registry = RoleRegistry(str(tmp_path / "roles.db"))
+    set_role_registry(registry)
+    yield registry
+    set_role_registry(None)
+
+
+class TestRoleRegistry:
+    """SQLite 사전 테스트"""
+
+    def test_add_and_lookup_persist(self, tmp_path):
+        path = str(tmp_path / "roles.db")
+        RoleRegistry(path).add({"식품 안전성 전문가": "식품안전성 평가 전문가"})
+
+        reopened = RoleRegistry(path)
+        assert reopened.lookup(["식품 안전성 전문가", "영양학자"]) == {"식품 안전성 전문가": "식품안전성 평가 전문가"}
+        # 대표명 자신도 등록됨
+        assert reopened.lookup(["식품안전성 평가 전문가"]) == {"식품안전성 평가 전문가": "식품안전성 평가 전문가"}
+
+    def test_merge_repoints_all_aliases(self, registry):
+        registry.add({"독성 전문가": "독성학자", "독성학 연구자": "독성 평가 전문가"})
+        updated = registry.merge("독성학 연구자", "독성 전문가")
+
+        assert updated == 2
+        assert registry.groups() == {"독성학자": ["독성 전문가", "독성 평가 전문가", "독성학 연구자", "독성학자"]}
+
+    def test_merge_unknown_role_raises(self, registry):
+        with pytest.raises(KeyError):
+            registry.merge("없는 역할", "독성학자")
+
+
+class TestCanonicalizeRoles:
+    """PI 역할 정규화 통합 테스트"""
+
+    def test_second_run_skips_clustering(self, registry):
+        roles = ["식품안전성 평가 전문가", "식품 안전성 전문가", "규제과학자"]
+        mapping = {"식품안전성 평가 전문가": "식품안전성 평가 전문가", "식품 안전성 전문가": "식품안전성 평가 전문가", "규제과학자": "규제과학자"}
+        with patch.object(pi, "_cluster_similar_roles", return_value=mapping) as cluster:
+            first = pi._canonicalize_roles(roles)
+            second = pi._canonicalize_roles(roles)
+
+        assert first == second == mapping
+        cluster.assert_called_once()
+
+    def test_unseen_role_joins_existing_canonical(self, registry):
+        registry.add({"식품 안전성 전문가": "식품안전성 평가 전문가"})
+
+        def cluster(roles):
+            assert "식품안전성 평가 전문가" in roles
+            return {r: "식품 안전 전문가" for r in roles}
+
+        with patch.object(pi, "_cluster_similar_roles", side_effect=cluster):
+            result = pi._canonicalize_roles(["식품 안전성 전문가", "식품 안전 전문가"])
+
+        assert result == {"식품 안전성 전문가": "식품안전성 평가 전문가", "식품 안전 전문가": "식품안전성 평가 전문가"}
+        assert registry.lookup(["식품 안전 전문가"]) == {"식품 안전 전문가": "식품안전성 평가 전문가"}
+
+
+class TestRoleAdminEndpoints:
+    """관리 API 테스트"""
+
+    def test_list_and_merge(self, registry):
+        from server import app
+
+        registry.add({"독성 전문가": "독성학자", "영양 전문가": "영양학자"})
+        client = TestClient(app)
+
+        assert client.get("/api/admin/roles").json()["roles"]["독성학자"] == ["독성 전문가", "독성학자"]
+
+        response = client.post("/api/admin/roles/merge", json={"source": "영양학자", "target": "독성학자"})
+        assert response.status_code == 200
+        assert response.json()["updated"] == 2
+
+        assert client.post("/api/admin/roles/merge", json={"source": "없음", "target": "독성학자"}).status_code == 404
@@ -0,0 +1,67 @@
+"""팀 회의 라운드 수 결정 테스트 (workflow.rounds + check_round)"""
+from workflow.graph import check_round
+from workflow.rounds import decide_next_round, round_bounds, round_label
+from workflow.state import CritiqueResult
+
+
+def _state(current_round, scores, previous=None, **extra):
+    history = [{"round": current_round - 1, "critique_scores": previous}] if previous else []
+    return {
+        "current_round": current_round,
+        "critique": CritiqueResult(decision="continue", feedback="", scores=scores),
+        "meeting_history": history,
+        **extra,
+    }
+
+
+class TestFixedRounds:
+
+    def test_fixed_mode_runs_to_max_rounds(self, monkeypatch):
+        monkeypatch.delenv("ROUND_MODE", raising=False)
+        monkeypatch.delenv("ROUND_MAX", raising=False)
+
+        assert check_round(_state(2, {"독성학자": 5})) == "increment_round"
+        assert check_round(_state(3, {"독성학자": 2})) == "final_synthesis"
+        assert round_label(_state(2, {})) == "2/3"
+
+
+class TestAdaptiveRounds:
+
+    def test_stops_when_every_score_reaches_target(self, monkeypatch):
+        monkeypatch.setenv("ROUND_MODE", "adaptive")
+        monkeypatch.delenv("ROUND_MIN", raising=False)
+
+        assert decide_next_round(_state(1, {"독성학자": 5, "규제과학 전문가": 5})) == (False, "target")
+
+    def test_missing_score_is_not_treated_as_target(self, monkeypatch):
+        monkeypatch.setenv("ROUND_MODE", "adaptive")
+        monkeypatch.delenv("ROUND_MIN", raising=False)
+        outputs = [{"role": "독성학자"}, {"role": "규제과학 전문가"}]
+
+        assert decide_next_round(_state(1, {"독성학자": 5}, specialist_outputs=outputs)) == (True, "improving")
+
+    def test_min_rounds_is_respected(self, monkeypatch):
+        monkeypatch.setenv("ROUND_MODE", "adaptive")
+        monkeypatch.setenv("ROUND_MIN", "2")
+
+        assert decide_next_round(_state(1, {"독성학자": 5})) == (True, "min_rounds")
+
+    def test_stops_on_plateau_and_continues_while_rising(self, monkeypatch):
+        monkeypatch.setenv("ROUND_MODE", "adaptive")
+        monkeypatch.delenv("ROUND_MIN", raising=False)
+
+        plateau = _state(2, {"독성학자": 4, "규제과학 전문가": 5}, previous={"독성학자": 4, "규제과학 전문가": 4})
+        rising = _state(2, {"독성학자": 4, "규제과학 전문가": 3}, previous={"독성학자": 3, "규제과학 전문가": 3})
+
+        assert decide_next_round(plateau) == (False, "plateau")
+        assert decide_next_round(rising) == (True, "improving")
+
+    def test_per_request_max_rounds_raises_cap(self, monkeypatch):
+        monkeypatch.setenv("ROUND_MODE", "adaptive")
+        monkeypatch.delenv("ROUND_MAX", raising=False)
+        rising = _state(3, {"독성학자": 4}, previous={"독성학자": 3})
+
+        assert decide_next_round(rising) == (False, "max_rounds")
+        assert decide_next_round({**rising, "max_rounds": 5}) == (True, "improving")
+        # 요청별 값도 ROUND_LIMIT을 넘을 수 없음
+        assert round_bounds({"max_rounds": 100})[1] == 6
@@ -0,0 +1,112 @@
+"""라운드 1 검색→전문가 파이프라인 테스트 (agents.scientist.run_specialists)"""
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import agents.scientist as scientist
+
+TEAM = [
+    {"role": "독성학자", "focus": "독성 평가"},
+    {"role": "규제과학 전문가", "focus": "국제 규제 비교"},
+]
+
+
+def _state():
+    return {"topic": "NGT", "constraints": "", "team": TEAM, "messages": [], "current_round": 1, "run_id": ""}
+
+
+class TestSearchPipeline:
+
+    def test_slow_web_search_does_not_block_specialists(self, monkeypatch):
+        monkeypatch.setenv("SEARCH_DEADLINE_SECONDS", "0.5")
+        release_web = threading.Event()
+        queries = []
+
+        def slow_web(args):
+            release_web.wait(5)
+            return "늦은 웹 결과"
+
+        def specialist(profile):
+            agent = MagicMock()
+
+            def invoke(query, on_delta=None):
+                queries.append(query)
+                return f"{profile['role']} 분석"
+
+            agent.invoke.side_effect = invoke
+            return agent
+
+        def release_after_specialists(*args, **kwargs):
+            # 전문가가 모두 시작한 뒤에 웹 검색이 끝나도록 함
+            while len(queries) < len(TEAM):
+                time.sleep(0.01)
+            release_web.set()
+
+        threading.Thread(target=release_after_specialists, daemon=True).start()
+        with patch.object(scientist, "rag_search_many", return_value=["규제 문서"] * len(TEAM)), \
+                patch.object(scientist, "web_search", MagicMock(invoke=MagicMock(side_effect=slow_web))), \
+                patch.object(scientist, "efsa_search", MagicMock(invoke=MagicMock(return_value="EFSA 자료"))), \
+                patch.object(scientist, "create_specialist", side_effect=specialist):
+            started = time.monotonic()
+            result = scientist.run_specialists(_state())
+
+        # 전문가는 RAG(필수) + 마감 전 도착한 EFSA만으로 시작
+        assert all("규제 문서" in q and "늦은 웹 결과" not in q for q in queries)
+        assert all("EFSA 자료" in q for q in queries)
+        assert time.monotonic() - started < 5
+        # 늦게 도착한 웹 결과도 Round 2, 3 캐시에는 포함
+        assert "늦은 웹 결과" in result["cached_web_context"]
+        assert len(result["specialist_outputs"]) == len(TEAM)
+
+    def test_later_rounds_use_cached_context(self):
+        state = {**_state(), "current_round": 2, "cached_rag_context": "캐시 RAG", "cached_web_context": "캐시 웹"}
+        searches = MagicMock()
+        agent = MagicMock(invoke=MagicMock(return_value="분석"))
+        with patch.object(scientist, "rag_search_tool", searches), \
+                patch.object(scientist, "web_search", searches), \
+                patch.object(scientist, "create_specialist", return_value=agent):
+            scientist.run_specialists(state)
+
+        searches.invoke.assert_not_called()
+        assert "캐시 RAG" in agent.invoke.call_args.args[0]
+
+
+class TestSpecialistRetrieval:
+
+    def _run(self, rag_search_many, rag_tool=None):
+        queries = {}
+
+        def specialist(profile):
+            def invoke(query, on_delta=None):
+                queries[profile["role"]] = query
+                return "분석"
+
+            return MagicMock(invoke=MagicMock(side_effect=invoke))
+
+        with patch.object(scientist, "rag_search_many", rag_search_many), \
+                patch.object(scientist, "rag_search_tool", rag_tool or MagicMock()), \
+                patch.object(scientist, "web_search", MagicMock(invoke=MagicMock(return_value="웹"))), \
+                patch.object(scientist, "efsa_search", MagicMock(invoke=MagicMock(return_value="EFSA"))), \
+                patch.object(scientist, "create_specialist", side_effect=specialist):
+            result = scientist.run_specialists(_state())
+        return queries, result
+
+    def test_each_specialist_gets_own_rag_context(self):
+        search = MagicMock(side_effect=lambda queries, top_k: [f"{q} 문서" for q in queries])
+        queries, result = self._run(search)
+
+        # 전문가별 검색어를 한 번의 호출로 검색
+        search.assert_called_once()
+        sent = search.call_args.args[0]
+        assert len(sent) == len(TEAM) and "독성 평가" in sent[0] and "국제 규제 비교" in sent[1]
+        assert "독성 평가 - NGT" in queries["독성학자"]
+        assert "국제 규제 비교 - NGT" not in queries["독성학자"]
+        # 캐시에는 전문가별 결과를 모두 포함
+        assert "독성 평가" in result["cached_rag_context"] and "국제 규제 비교" in result["cached_rag_context"]
+
+    def test_batch_failure_falls_back_to_shared_query(self):
+        shared = MagicMock(invoke=MagicMock(return_value="공통 규제 문서"))
+        queries, _ = self._run(MagicMock(side_effect=RuntimeError("index down")), shared)
+
+        shared.invoke.assert_called_once()
+        assert all("공통 규제 문서" in q for q in queries.values())
@@ -230,3 +230,24 @@ class TestStreamEndpoint:
         # 여러 이벤트가 전송되었는지 확인
         event_count = content.count("data: ")
         assert event_count >= 4  # start + drafting + critique + increment
+
+    @patch("server.create_workflow")
+    def test_stream_forwards_llm_deltas(self, mock_workflow, client):
+        """custom 스트림의 LLM delta가 delta 이벤트로 전달되는지 테스트"""
+        mock_wf = Mock()
+        mock_wf.stream.return_value = iter([
+            ("custom", {"type": "delta", "name": "PI", "phase": "synthesis", "delta": "# 보고"}),
+            ("updates", {"finalizing": {"final_report": "# 보고서", "messages": []}}),
+        ])
+        mock_workflow.return_value = mock_wf
+
+        response = client.post(
+            "/api/research/stream",
+            json={"topic": "NGT", "constraints": ""}
+        )
+
+        content = response.text
+        assert '"type": "delta"' in content
+        assert '"delta": "# 보고"' in content
+        assert content.index('"type": "delta"') < content.index('"type": "complete"')
+        assert mock_wf.stream.call_args.kwargs["stream_mode"] == ["updates", "custom"]
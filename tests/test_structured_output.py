@@ -0,0 +1,162 @@
+"""JSON schema 구조화 출력 테스트 (call_llm_json + agents.schemas)"""
+import json
+
+import httpx
+import pytest
+from unittest.mock import patch
+
+import utils.llm as llm
+from agents.schemas import CritiqueVerdict, RoleClustering, TeamDecision
+from utils.llm_cache import set_llm_cache
+from utils.rate_limiter import set_rate_limiter
+
+
+def _ok(content) -> httpx.Response:
+    if not isinstance(content, str):
+        content = json.dumps(content, ensure_ascii=False)
+    return httpx.Response(200, json={"choices": [{"message": {"content": content}, "finish_reason": "stop"}]})
+
+
+@pytest.fixture(autouse=True)
+def _env(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-key")
+    set_rate_limiter("openai", None)
+    set_llm_cache(None)
+
+
+class TestCallLLMJson:
+    """call_llm_json 테스트"""
+
+    def test_sends_strict_schema_and_parses(self):
+        sent = []
+
+        def handler(request):
+            sent.append(json.loads(request.content))
+            return _ok({"team": [{"role": "독성학자", "focus": "알레르기"}]})
+
+        with patch.object(llm, "_get_http_client", return_value=httpx.Client(transport=httpx.MockTransport(handler))):
+            result = llm.call_llm_json("sys", "user", TeamDecision)
+
+        assert result.to_profiles() == [{"role": "독성학자", "focus": "알레르기"}]
+        response_format = sent[0]["response_format"]
+        assert response_format["type"] == "json_schema"
+        assert response_format["json_schema"]["strict"] is True
+        assert response_format["json_schema"]["schema"]["additionalProperties"] is False
+
+    def test_retries_once_on_invalid_response(self):
+        responses = iter([
+            _ok('{"team": [{"role": "독성학'),  # max_tokens로 잘린 응답
+            _ok({"team": [{"role": "독성학자", "focus": "알레르기"}]}),
+        ])
+        client = httpx.Client(transport=httpx.MockTransport(lambda r: next(responses)))
+
+        with patch.object(llm, "_get_http_client", return_value=client):
+            result = llm.call_llm_json("sys", "user", TeamDecision)
+
+        assert len(result.team) == 1
+
+    def test_raises_value_error_after_attempts(self):
+        client = httpx.Client(transport=httpx.MockTransport(lambda r: _ok({"team": []})))
+
+        with patch.object(llm, "_get_http_client", return_value=client):
+            with pytest.raises(ValueError):
+                llm.call_llm_json("sys", "user", TeamDecision)
+
+    def test_refusal_raises_runtime_error(self):
+        client = httpx.Client(transport=httpx.MockTransport(lambda r: httpx.Response(200, json={
+            "choices": [{"message": {"content": None, "refusal": "I can't help"}}],
+        })))
+
+        with patch.object(llm, "_get_http_client", return_value=client):
+            with pytest.raises(RuntimeError, match="refusal"):
+                llm.call_llm_json("sys", "user", TeamDecision)
+
+
+class TestSchemas:
+    """에이전트 스키마 변환 테스트"""
+
+    def test_critique_verdict_to_result(self):
+        verdict = CritiqueVerdict.model_validate({
+            "decision": "continue",
+            "feedback": "요약",
+            "specialists": [
+                {"role": "A", "score": 4, "feedback": "좋음"},
+                {"role": "B", "score": 2, "feedback": "근거 부족"},
+            ],
+        })
+        result = verdict.to_critique_result()
+        assert result.scores == {"A": 4, "B": 2}
+        assert result.specialist_feedback["B"] == "근거 부족"
+
+    def test_critique_score_out_of_range_rejected(self):
+        with pytest.raises(ValueError):
+            CritiqueVerdict.model_validate({
+                "decision": "continue",
+                "feedback": "",
+                "specialists": [{"role": "A", "score": 7, "feedback": ""}],
+            })
+
+    def test_role_clustering_mapping_keeps_unclustered_roles(self):
+        clustering = RoleClustering.model_validate({
+            "clusters": [{"canonical": "독성학자", "members": ["독성학자", "독성 전문가"]}],
+        })
+        mapping = clustering.to_mapping(["독성학자", "독성 전문가", "영양학자"])
+        assert mapping == {"독성학자": "독성학자", "독성 전문가": "독성학자", "영양학자": "영양학자"}
+
+
+class TestSamples:
+    """n choices 샘플링 테스트"""
+
+    def setup_method(self):
+        llm._n_unsupported_models.clear()
+
+    def test_single_request_with_n_choices(self):
+        sent = []
+
+        def handler(request):
+            body = json.loads(request.content)
+            sent.append(body)
+            return httpx.Response(200, json={"choices": [
+                {"index": i, "message": {"content": json.dumps({"team": [{"role": f"R{i}", "focus": "f"}]})}}
+                for i in range(body["n"])
+            ]})
+
+        with patch.object(llm, "_get_http_client", return_value=httpx.Client(transport=httpx.MockTransport(handler))):
+            teams = llm.call_llm_json_samples("sys", "user", TeamDecision, 4, model="gpt-4o")
+
+        assert len(sent) == 1
+        assert sent[0]["n"] == 4
+        assert [t.team[0].role for t in teams] == ["R0", "R1", "R2", "R3"]
+
+    def test_falls_back_to_separate_requests_when_n_unsupported(self):
+        sent = []
+
+        def handler(request):
+            body = json.loads(request.content)
+            sent.append(body)
+            if "n" in body:
+                return httpx.Response(400, json={"error": {
+                    "message": "Unsupported value: 'n' does not support 4 with this model.",
+                    "param": "n",
+                }})
+            return _ok({"team": [{"role": "R", "focus": "f"}]})
+
+        with patch.object(llm, "_get_http_client", return_value=httpx.Client(transport=httpx.MockTransport(handler))):
+            teams = llm.call_llm_json_samples("sys", "user", TeamDecision, 4, model="o3")
+            assert len(teams) == 4
+            # 미지원 모델은 기억되어 다음 호출부터 n 요청을 생략
+            llm.call_llm_json_samples("sys", "user", TeamDecision, 2, model="o3")
+
+        assert len(sent) == 1 + 4 + 2
+        assert "o3" in llm._n_unsupported_models
+
+    def test_invalid_samples_are_dropped(self):
+        client = httpx.Client(transport=httpx.MockTransport(lambda r: httpx.Response(200, json={"choices": [
+            {"message": {"content": json.dumps({"team": [{"role": "R", "focus": "f"}]})}},
+            {"message": {"content": '{"team": ['}},
+        ]})))
+
+        with patch.object(llm, "_get_http_client", return_value=client):
+            teams = llm.call_llm_json_samples("sys", "user", TeamDecision, 2, model="gpt-4o")
+
+        assert len(teams) == 1
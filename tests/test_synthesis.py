@@ -0,0 +1,150 @@
+"""최종 보고서 섹션 병렬 합성 테스트 (agents.synthesis + run_final_synthesis)"""
+import pytest
+from unittest.mock import MagicMock, patch
+
+import agents.pi as pi
+import agents.synthesis as synthesis
+
+CONTEXT = {
+    "pi_summaries": "라운드 1 요약: 위험 요소 합의",
+    "specialist_outputs": "독성학자 최종 분석 본문",
+    "web": "웹 검색 결과 본문",
+    "efsa": "EFSA 검색 결과 본문",
+    "team_composition": "10회 독립적 팀 구성 실험 수행",
+    "introductions": "🤖 **독성학자**\n저는 독성학자입니다.",
+    "word_counts": "| PI | 3회 | 1,000자 |",
+    "sources": "1. https://example.org/efsa",
+}
+
+
+def _fake_gpt(system_prompt, user_message, **kwargs):
+    if system_prompt == synthesis.SUMMARY_SYSTEM_PROMPT:
+        return "## 요약 (Executive Summary)\n요약 본문"
+    title = user_message.split("'## ", 1)[1].split("'", 1)[0]
+    # 일부 섹션은 보고서 제목을 붙이거나 섹션 제목을 빠뜨리는 경우를 흉내냄
+    if "핵심 질문 2" in title:
+        return f"# 최종 보고서\n## {title}\n본문"
+    if "참고문헌" in title:
+        return "### 5-1. Web Search Sources\n1. https://example.org/efsa"
+    return f"## {title}\n본문"
+
+
+class TestSynthesizeReport:
+
+    def test_sections_assembled_in_order(self):
+        with patch.object(synthesis, "call_gpt", side_effect=_fake_gpt) as gpt:
+            report = synthesis.synthesize_report("NGT", "", CONTEXT)
+
+        # 섹션 8개 + 요약 1회
+        assert gpt.call_count == len(synthesis.SECTIONS) + 1
+        assert report.count("\n# ") + report.startswith("# ") == 1
+        positions = [report.index(f"## {s.title}") for s in synthesis.SECTIONS]
+        assert positions == sorted(positions)
+        assert report.index("## 요약 (Executive Summary)") < positions[0]
+
+    def test_each_section_gets_only_its_context(self):
+        with patch.object(synthesis, "call_gpt", side_effect=_fake_gpt) as gpt:
+            synthesis.synthesize_report("NGT", "", CONTEXT)
+
+        messages = {
+            call.args[1].split("'## ", 1)[1].split("'", 1)[0]: call.args[1]
+            for call in gpt.call_args_list
+            if call.args[0] == synthesis.SECTION_SYSTEM_PROMPT
+        }
+        methodology = messages["연구 방법론 (Research Methodology)"]
+        assert "10회 독립적 팀 구성 실험" in methodology
+        assert "독성학자 최종 분석 본문" not in methodology
+        decision_tree = messages["의사결정 흐름도 (Decision Tree)"]
+        assert "위험 요소 합의" in decision_tree
+        assert "웹 검색 결과 본문" not in decision_tree
+
+    def test_round_structure_follows_completed_rounds(self):
+        with patch.object(synthesis, "call_gpt", side_effect=_fake_gpt) as gpt:
+            synthesis.synthesize_report("NGT", "", CONTEXT, num_rounds=2)
+
+        messages = {
+            call.args[1].split("'## ", 1)[1].split("'", 1)[0]: call.args[1]
+            for call in gpt.call_args_list
+            if call.args[0] == synthesis.SECTION_SYSTEM_PROMPT
+        }
+        question = messages["핵심 질문 1: 식품에 적용되는 유전자편집기술의 분류 기준과 특성"]
+        assert "[2라운드 팀 회의 전체 요약]" in question
+        assert "### 라운드 2: 최종 정제" in question
+        assert "라운드 3" not in question
+        assert "### 2라운드 반복 심화 프로세스" in messages["연구 방법론 (Research Methodology)"]
+
+    def test_failed_section_raises(self):
+        def gpt(system_prompt, user_message, **kwargs):
+            if "핵심 질문 3" in user_message.split("'## ", 1)[1]:
+                raise RuntimeError("timeout")
+            return _fake_gpt(system_prompt, user_message, **kwargs)
+
+        with patch.object(synthesis, "call_gpt", side_effect=gpt):
+            with pytest.raises(RuntimeError, match="q3"):
+                synthesis.synthesize_report("NGT", "", CONTEXT)
+
+
+class TestRunFinalSynthesisModes:
+
+    @pytest.fixture
+    def state(self):
+        return {
+            "topic": "NGT",
+            "constraints": "",
+            "meeting_history": [],
+            "current_round": 3,
+            "draft": "최종 라운드 요약",
+            "specialist_outputs": [{"role": "독성학자", "focus": "독성", "output": "분석"}],
+            "cached_efsa_context": "EFSA",
+            "messages": [],
+        }
+
+    def test_sectioned_is_default(self, state, monkeypatch):
+        monkeypatch.delenv("SYNTHESIS_MODE", raising=False)
+        with patch.object(pi, "web_search", MagicMock(invoke=MagicMock(return_value="web"))), \
+                patch.object(pi, "synthesize_report", return_value="# 보고서\n") as sectioned, \
+                patch.object(pi, "call_gpt") as single:
+            result = pi.run_final_synthesis(state)
+
+        sectioned.assert_called_once()
+        single.assert_not_called()
+        assert result["final_report"].startswith("# 보고서")
+
+    def test_adaptive_stop_is_reflected_in_both_paths(self, state, monkeypatch):
+        monkeypatch.delenv("SYNTHESIS_MODE", raising=False)
+        state.update(current_round=2, meeting_history=[{"round": 1, "pi_summary": "1라운드 요약"}])
+        with patch.object(pi, "web_search", MagicMock(invoke=MagicMock(return_value="web"))), \
+                patch.object(pi, "synthesize_report", side_effect=RuntimeError("sections failed")) as sectioned, \
+                patch.object(pi, "call_gpt", return_value="# 단일 보고서\n") as single:
+            pi.run_final_synthesis(state)
+
+        assert sectioned.call_args.kwargs["num_rounds"] == 2
+        system_prompt, user_message = single.call_args.args[:2]
+        assert "### 2라운드 반복 심화 프로세스" in system_prompt
+        assert "라운드 3" not in system_prompt
+        assert "라운드 3" not in user_message
+
+    def test_team_composition_reports_actual_trials(self, state, monkeypatch):
+        monkeypatch.delenv("SYNTHESIS_MODE", raising=False)
+        state["team_selection_data"] = {
+            "n_trials": 6, "trials_requested": 10, "stopped_early": True,
+            "all_teams": [[{"role": "독성학자"}]] * 6, "frequency_analysis": [],
+        }
+        with patch.object(pi, "web_search", MagicMock(invoke=MagicMock(return_value="web"))), \
+                patch.object(pi, "synthesize_report", return_value="# 보고서\n") as sectioned:
+            pi.run_final_synthesis(state)
+
+        team_composition = sectioned.call_args.args[2]["team_composition"]
+        assert team_composition.startswith("최대 10회 중 6회 독립적 팀 구성 실험 수행 (역할 순위가 안정되어 조기 종료)")
+        assert "6회 실험에서 총 6명" in team_composition
+        assert "10회" not in pi.build_system_prompt(3)
+
+    def test_falls_back_to_single_call(self, state, monkeypatch):
+        monkeypatch.delenv("SYNTHESIS_MODE", raising=False)
+        with patch.object(pi, "web_search", MagicMock(invoke=MagicMock(return_value="web"))), \
+                patch.object(pi, "synthesize_report", side_effect=RuntimeError("sections failed")), \
+                patch.object(pi, "call_gpt", return_value="# 단일 보고서\n") as single:
+            result = pi.run_final_synthesis(state)
+
+        single.assert_called_once()
+        assert result["final_report"].startswith("# 단일 보고서")
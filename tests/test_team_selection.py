@@ -0,0 +1,96 @@
+"""PI 통계적 팀 선별 테스트 (fixed / adaptive 조기 종료)"""
+import pytest
+from unittest.mock import patch
+
+import agents.pi as pi
+from agents.schemas import TeamSelection
+from utils.role_registry import set_role_registry
+
+TEAM_A = [{"role": "독성학자", "focus": "독성"}, {"role": "규제과학자", "focus": "규제"}]
+TEAM_B = [{"role": "독성 전문가", "focus": "독성"}, {"role": "규제과학자", "focus": "국제 규제"}]
+TEAM_C = [{"role": "영양학자", "focus": "영양"}, {"role": "분자생물학자", "focus": "off-target"}]
+
+
+def _selection(*args, **kwargs):
+    return TeamSelection(team=TEAM_A, rationale="빈도 상위")
+
+
+@pytest.fixture
+def mock_llm():
+    set_role_registry(None)
+    mapping = {"독성학자": "독성학자", "독성 전문가": "독성학자"}
+    with patch.object(pi, "call_gpt_json", side_effect=_selection), \
+            patch.object(pi, "_cluster_similar_roles", side_effect=lambda roles: {r: mapping.get(r, r) for r in roles}) as cluster:
+        yield cluster
+
+
+class TestAdaptiveSelection:
+    """adaptive 모드 조기 종료 테스트"""
+
+    def test_stops_after_stable_wave(self, mock_llm, monkeypatch):
+        monkeypatch.setenv("TEAM_TRIALS_WAVE_SIZE", "3")
+        waves = iter([[TEAM_A, TEAM_B, TEAM_A], [TEAM_B, TEAM_A, TEAM_A]])
+        with patch.object(pi, "decide_teams", side_effect=lambda q, n, cache_tag: next(waves)) as decide:
+            data = pi.decide_team_statistically("NGT", n_trials=10, adaptive=True)
+
+        assert data["n_trials"] == 6
+        assert data["waves"] == 2
+        assert data["stopped_early"] is True
+        assert data["selection_mode"] == "adaptive"
+        # 웨이브마다 다른 캐시 태그로 요청
+        assert [c.kwargs["cache_tag"] for c in decide.call_args_list] == ["team-wave-0", "team-wave-1"]
+        # 비교 시점에 한 번만 클러스터링하고 최종 빈도 분석에 재사용
+        assert mock_llm.call_count == 1
+
+    def test_runs_to_max_when_ranking_shifts(self, mock_llm, monkeypatch):
+        monkeypatch.setenv("TEAM_TRIALS_WAVE_SIZE", "2")
+        waves = iter([[TEAM_A, TEAM_A], [TEAM_C, TEAM_C], [TEAM_C, TEAM_C]])
+        with patch.object(pi, "decide_teams", side_effect=lambda q, n, cache_tag: next(waves)):
+            data = pi.decide_team_statistically("NGT", n_trials=6, adaptive=True)
+
+        assert data["n_trials"] == 6
+        assert data["waves"] == 3
+        assert data["stopped_early"] is False
+
+    def test_empty_wave_stops_trials(self, mock_llm, monkeypatch):
+        monkeypatch.setenv("TEAM_TRIALS_WAVE_SIZE", "3")
+        with patch.object(pi, "decide_teams", return_value=[]) as decide:
+            with pytest.raises(RuntimeError):
+                pi.decide_team_statistically("NGT", n_trials=10, adaptive=True)
+
+        assert decide.call_count == 1
+
+    def test_short_waves_are_capped(self, mock_llm, monkeypatch):
+        monkeypatch.setenv("TEAM_TRIALS_WAVE_SIZE", "3")
+        # 웨이브마다 검증을 통과한 팀이 1개뿐이어도 ceil(10 / 3) = 4 웨이브에서 중단
+        waves = iter([[TEAM_A], [TEAM_C], [TEAM_A], [TEAM_C], [TEAM_A]])
+        with patch.object(pi, "decide_teams", side_effect=lambda q, n, cache_tag: next(waves)) as decide:
+            data = pi.decide_team_statistically("NGT", n_trials=10, adaptive=True)
+
+        assert decide.call_count == 4
+        assert data["waves"] == 4
+        assert data["n_trials"] == 4
+        assert data["stopped_early"] is False
+
+    def test_fixed_mode_uses_single_batch(self, mock_llm, monkeypatch):
+        monkeypatch.delenv("TEAM_SELECTION_MODE", raising=False)
+        with patch.object(pi, "decide_teams", return_value=[TEAM_A] * 10) as decide:
+            data = pi.decide_team_statistically("NGT")
+
+        decide.assert_called_once_with("NGT", 10)
+        assert data["selection_mode"] == "fixed"
+        assert data["trials_requested"] == 10
+        assert data["final_team"] == TEAM_A
+
+
+class TestRankingStability:
+    """순위 안정성 판정 테스트"""
+
+    def test_threshold_allows_partial_overlap(self):
+        before = (3, {"a", "b", "c"})
+        after = (3, {"a", "b", "d"})
+        assert not pi._is_ranking_stable(before, after, 1.0)
+        assert pi._is_ranking_stable(before, after, 0.5)
+
+    def test_modal_size_change_is_unstable(self):
+        assert not pi._is_ranking_stable((2, {"a", "b"}), (3, {"a", "b"}), 0.0)
@@ -11,6 +11,52 @@ from config import settings
 logger = logging.getLogger(__name__)
 
 
+def format_rag_documents(docs: list[dict]) -> str:
+    """검색 문서 목록을 에이전트 프롬프트용 컨텍스트(출처 포함)로 변환"""
+    if not docs:
+        logger.warning("RAG Hit: 0 documents")
+        return "관련 규제 문서를 찾을 수 없습니다."
+
+    result = []
+    for i, doc in enumerate(docs, start=1):
+        score = doc.get('score', 0)
+        source = doc.get('source', 'unknown')
+        page = doc.get('page', 0)
+        text = doc.get('text', '')
+
+        result.append(f"""
+### 문서 {i} (유사도: {score:.2f})
+**출처**: {source} (p.{page})
+
+{text}
+""")
+
+    return "\n\n".join(result)
+
+
+def rag_search_many(queries: list[str], top_k: int | None = None) -> list[str]:
+    """여러 쿼리를 한 번에 검색하여 쿼리별 컨텍스트 반환
+
+    쿼리 임베딩은 배치 요청 1회로 만들고, 벡터 DB에는 다중 벡터 조회로 보냅니다
+    (ChromaDB는 요청 1회, Pinecone은 벡터별 조회 동시 실행).
+    rag_search_tool과 달리 오류를 문자열로 바꾸지 않고 예외로 전달합니다.
+
+    Returns:
+        queries와 같은 순서의 컨텍스트 문자열 리스트
+    """
+    top_k = top_k or settings.TOP_K
+    logger.info(f"RAG Multi-Search ({settings.VECTOR_DB_TYPE}): {len(queries)} queries")
+
+    if settings.VECTOR_DB_TYPE == "pinecone":
+        from rag.pinecone_client import get_pinecone_client
+        results = get_pinecone_client().search_many(queries, top_k=top_k)
+    else:  # chromadb
+        from rag.retriever import retrieve_many
+        results = retrieve_many(queries, top_k=top_k)
+
+    return [format_rag_documents(docs) for docs in results]
+
+
 @tool
 def rag_search_tool(query: str) -> str:
     """
@@ -35,28 +81,9 @@ def rag_search_tool(query: str) -> str:
             from rag.retriever import retrieve
             docs = retrieve(query, top_k=settings.TOP_K)
 
-        if not docs:
-            logger.warning("RAG Hit: 0 documents")
-            return "관련 규제 문서를 찾을 수 없습니다."
-
-        logger.info(f"RAG Hit: {len(docs)} documents")
-
-        # 결과 포맷팅
-        result = []
-        for i, doc in enumerate(docs, start=1):
-            score = doc.get('score', 0)
-            source = doc.get('source', 'unknown')
-            page = doc.get('page', 0)
-            text = doc.get('text', '')
-
-            result.append(f"""
-### 문서 {i} (유사도: {score:.2f})
-**출처**: {source} (p.{page})
-
-{text}
-""")
-
-        return "\n\n".join(result)
+        if docs:
+            logger.info(f"RAG Hit: {len(docs)} documents")
+        return format_rag_documents(docs)
 
     except Exception as e:
         logger.error(f"RAG 검색 오류: {str(e)}")
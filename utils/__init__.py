@@ -1,4 +1,30 @@
 # utils 패키지 초기화
-from utils.llm import call_gpt, call_gpt4o, call_gpt4o_mini, call_llm
+from utils.llm import (
+    LLMText,
+    acall_gpt,
+    acall_llm,
+    call_gpt,
+    call_gpt4o,
+    call_gpt4o_mini,
+    call_gpt_json,
+    call_gpt_json_samples,
+    call_llm,
+    call_llm_json,
+    call_llm_json_samples,
+    call_llm_samples,
+)
 
-__all__ = ["call_gpt", "call_gpt4o", "call_gpt4o_mini", "call_llm"]
+__all__ = [
+    "LLMText",
+    "acall_gpt",
+    "acall_llm",
+    "call_gpt",
+    "call_gpt4o",
+    "call_gpt4o_mini",
+    "call_gpt_json",
+    "call_gpt_json_samples",
+    "call_llm",
+    "call_llm_json",
+    "call_llm_json_samples",
+    "call_llm_samples",
+]
@@ -0,0 +1,268 @@
+"""Key-Value 캐시 백엔드
+
+LLM 응답 캐시 등에서 공용으로 사용하는 문자열 Key-Value 저장소입니다.
+모든 백엔드는 TTL 만료와 최대 항목 수 기반 LRU 축출을 지원합니다.
+
+- memory: 프로세스 내 LRU (OrderedDict)
+- sqlite: 로컬 파일 (재시작 후에도 유지)
+- redis: settings.REDIS_URL (여러 워커가 공유)
+"""
+import logging
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(ABC):
+    """캐시 백엔드 공통 인터페이스 (메서드가 빠진 백엔드는 생성 시점에 TypeError)"""
+
+    @abstractmethod
+    def get(self, key: str) -> str | None:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: str, ttl: float | None = None) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+
+class MemoryLRUBackend(CacheBackend):
+    """프로세스 내 LRU 캐시 (thread-safe)"""
+
+    def __init__(self, max_entries: int = 1000):
+        self.max_entries = max_entries
+        self._data: OrderedDict[str, tuple[str, float | None]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            value, expires_at = item
+            if expires_at is not None and expires_at <= time.time():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, ttl: float | None = None) -> None:
+        expires_at = time.time() + ttl if ttl else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+class SQLiteBackend(CacheBackend):
+    """SQLite 파일 기반 캐시
+
+    namespace별로 같은 파일을 공유할 수 있으며, 접근 시각 기준으로 LRU 축출합니다.
+    """
+
+    def __init__(self, path: str, namespace: str = "default", max_entries: int = 1000):
+        self.path = path
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS kv_cache ("
+                " namespace TEXT NOT NULL,"
+                " key TEXT NOT NULL,"
+                " value TEXT NOT NULL,"
+                " expires_at REAL,"
+                " accessed_at REAL NOT NULL,"
+                " PRIMARY KEY (namespace, key))"
+            )
+            self._conn.commit()
+
+    def get(self, key: str) -> str | None:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM kv_cache WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._conn.execute(
+                    "DELETE FROM kv_cache WHERE namespace = ? AND key = ?", (self.namespace, key)
+                )
+                self._conn.commit()
+                return None
+            self._conn.execute(
+                "UPDATE kv_cache SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                (now, self.namespace, key),
+            )
+            self._conn.commit()
+            return value
+
+    def set(self, key: str, value: str, ttl: float | None = None) -> None:
+        now = time.time()
+        expires_at = now + ttl if ttl else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO kv_cache (namespace, key, value, expires_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (self.namespace, key, value, expires_at, now),
+            )
+            # 만료 항목 정리 후 초과분은 오래 접근하지 않은 순으로 축출
+            self._conn.execute(
+                "DELETE FROM kv_cache WHERE namespace = ? AND expires_at IS NOT NULL AND expires_at <= ?",
+                (self.namespace, now),
+            )
+            self._conn.execute(
+                "DELETE FROM kv_cache WHERE namespace = ? AND key IN ("
+                " SELECT key FROM kv_cache WHERE namespace = ?"
+                " ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.namespace, self.namespace, self.max_entries),
+            )
+            self._conn.commit()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM kv_cache WHERE namespace = ? AND key = ?", (self.namespace, key)
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM kv_cache WHERE namespace = ?", (self.namespace,))
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) FROM kv_cache WHERE namespace = ?", (self.namespace,)
+            ).fetchone()
+            return row[0]
+
+
+class RedisBackend(CacheBackend):
+    """Redis 기반 캐시 (여러 uvicorn/Celery 워커가 공유)
+
+    TTL은 Redis 만료로 처리하고, 항목 수 제한은 접근 시각 Sorted Set으로 LRU 축출합니다.
+    """
+
+    def __init__(self, client, namespace: str = "default", max_entries: int = 1000):
+        self.client = client
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self._index_key = f"vlab:cache:{namespace}:__index__"
+
+    def _key(self, key: str) -> str:
+        return f"vlab:cache:{self.namespace}:{key}"
+
+    def get(self, key: str) -> str | None:
+        value = self.client.get(self._key(key))
+        if value is None:
+            self.client.zrem(self._index_key, key)
+            return None
+        self.client.zadd(self._index_key, {key: time.time()})
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+
+    def set(self, key: str, value: str, ttl: float | None = None) -> None:
+        if ttl:
+            self.client.set(self._key(key), value, px=int(ttl * 1000))
+        else:
+            self.client.set(self._key(key), value)
+        self.client.zadd(self._index_key, {key: time.time()})
+        overflow = self.client.zcard(self._index_key) - self.max_entries
+        if overflow > 0:
+            for old_key, _ in self.client.zpopmin(self._index_key, overflow):
+                if isinstance(old_key, bytes):
+                    old_key = old_key.decode("utf-8")
+                self.client.delete(self._key(old_key))
+
+    def delete(self, key: str) -> None:
+        self.client.delete(self._key(key))
+        self.client.zrem(self._index_key, key)
+
+    def clear(self) -> None:
+        keys = self.client.zrange(self._index_key, 0, -1)
+        for key in keys:
+            if isinstance(key, bytes):
+                key = key.decode("utf-8")
+            self.client.delete(self._key(key))
+        self.client.delete(self._index_key)
+
+    def __len__(self) -> int:
+        return self.client.zcard(self._index_key)
+
+
+def get_redis_client():
+    """settings.REDIS_URL로 Redis 클라이언트 생성
+
+    Raises:
+        ValueError: REDIS_URL이 설정되지 않은 경우
+        ImportError: redis 패키지가 설치되지 않은 경우
+    """
+    # Lazy import: config 로드 시 OPENAI_API_KEY 검증이 일어나므로 필요할 때만 로드
+    from config import settings
+
+    if not settings.REDIS_URL:
+        raise ValueError("REDIS_URL must be set to use the redis cache backend")
+
+    import redis
+
+    return redis.Redis.from_url(settings.REDIS_URL)
+
+
+def create_cache_backend(
+    kind: str,
+    namespace: str = "default",
+    max_entries: int = 1000,
+    path: str = "cache.db",
+) -> CacheBackend:
+    """백엔드 종류 문자열로 캐시 백엔드 생성
+
+    Args:
+        kind: "memory" | "sqlite" | "redis"
+        namespace: 같은 저장소를 공유할 때 키 충돌을 막는 이름공간
+        max_entries: 최대 항목 수 (초과 시 LRU 축출)
+        path: sqlite 파일 경로
+
+    Raises:
+        ValueError: 알 수 없는 백엔드 종류
+    """
+    kind = kind.lower()
+    if kind == "memory":
+        return MemoryLRUBackend(max_entries=max_entries)
+    if kind == "sqlite":
+        return SQLiteBackend(path, namespace=namespace, max_entries=max_entries)
+    if kind == "redis":
+        return RedisBackend(get_redis_client(), namespace=namespace, max_entries=max_entries)
+    raise ValueError(f"Unknown cache backend: {kind} (memory | sqlite | redis)")
@@ -0,0 +1,238 @@
+"""임계 경로 기반 LLM 호출 스케줄러
+
+속도 제한기(utils.rate_limiter)는 요청을 도착 순서(FIFO)로 예약하므로, 한도가 포화되면
+다른 실행의 자기소개 호출 뒤에 거의 끝난 실행의 최종 보고서 호출이 줄을 서게 됩니다.
+이 스케줄러는 속도 제한기 앞에서 대기 중인 호출을 "남은 임계 경로"가 짧은 순서로
+한 건씩 들여보냅니다 (남은 작업이 가장 적은 실행부터 끝내면 평균 완료 시간이 줄어듦).
+
+- 호출 지점(call_site)별 응답 시간·출력 토큰 수를 지수 이동 평균(EWMA)으로 기록합니다.
+- call_site는 "단계" 또는 "단계.세부" 형식이며(예: "critique.summary"), 단계는 CRITICAL_PATH 순서를
+  따릅니다. 남은 임계 경로 = 이 호출의 예상 시간 + 이후 단계들의 예상 시간 합입니다.
+  같은 단계의 호출은 동시에 실행되므로 단계 예상 시간은 그 단계 호출 지점 중 가장 긴 값입니다.
+- 라운드 반복(critique → pi_summary → revision)은 한 번으로 근사합니다.
+- 순서 키는 (도착 시각 + 남은 임계 경로)이므로 남은 경로가 긴 호출도 기다린 만큼 앞으로 당겨져
+  무한히 밀리지 않습니다.
+
+한도에 여유가 있으면 진입 즉시 속도 제한기를 통과하므로 추가 지연은 없습니다.
+
+환경 변수:
+    CALL_SCHEDULER_ENABLED=true
+"""
+import asyncio
+import heapq
+import itertools
+import logging
+import os
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+
+logger = logging.getLogger(__name__)
+
+# 실행 한 번의 LLM 호출 단계 (앞 단계일수록 남은 경로가 김)
+CRITICAL_PATH = ("planning", "introduction", "specialist", "critique", "pi_summary", "revision", "synthesis")
+
+# 기록이 없을 때 쓰는 단계별 예상 응답 시간 (초)
+DEFAULT_LATENCY_SECONDS = {
+    "planning": 6.0,
+    "introduction": 4.0,
+    "specialist": 45.0,
+    "critique": 15.0,
+    "pi_summary": 20.0,
+    "revision": 30.0,
+    "synthesis": 40.0,
+}
+# 단계가 없는 호출 (보고서 수정·번역 등 단발성 요청)
+DEFAULT_UNKNOWN_LATENCY_SECONDS = 10.0
+
+# EWMA 가중치 (최근 기록 비중)
+HISTORY_ALPHA = 0.3
+
+
+def call_stage(call_site: str) -> str:
+    """call_site의 단계 이름 ("critique.summary" -> "critique")"""
+    return (call_site or "").split(".", 1)[0]
+
+
+class _History:
+    __slots__ = ("count", "latency", "tokens")
+
+    def __init__(self):
+        self.count = 0
+        self.latency = 0.0
+        self.tokens = 0.0
+
+    def add(self, latency: float, tokens: int) -> None:
+        if self.count == 0:
+            self.latency, self.tokens = latency, float(tokens)
+        else:
+            self.latency += HISTORY_ALPHA * (latency - self.latency)
+            self.tokens += HISTORY_ALPHA * (tokens - self.tokens)
+        self.count += 1
+
+
+class CriticalPathScheduler:
+    """속도 제한기 진입 순서를 남은 임계 경로 기준으로 정하는 스케줄러 (thread-safe)"""
+
+    def __init__(self):
+        self._histories: dict[str, _History] = {}
+        self._cond = threading.Condition()
+        self._heap: list[tuple[float, int]] = []
+        self._seq = itertools.count()
+        # 현재 블록 안에 있는 호출의 ticket
+        self._holder: tuple[float, int] | None = None
+
+        # 지표
+        self.admitted = 0
+        self.reordered = 0
+        self.total_wait = 0.0
+
+    # ── 기록 / 추정 ──────────────────────────────────────────────────────
+
+    def record(self, call_site: str, latency: float, tokens: int) -> None:
+        """호출 완료 기록 (응답 시간은 속도 제한 대기를 제외한 요청 시간)"""
+        with self._cond:
+            self._histories.setdefault(call_site or "", _History()).add(latency, tokens)
+
+    def estimate(self, call_site: str) -> float:
+        """호출 지점의 예상 응답 시간 (초)"""
+        with self._cond:
+            return self._estimate(call_site or "")
+
+    def _estimate(self, call_site: str) -> float:
+        history = self._histories.get(call_site)
+        if history and history.count:
+            return history.latency
+        # 세부 호출 지점 기록이 없으면 같은 단계의 기록, 그것도 없으면 기본값
+        stage = call_stage(call_site)
+        stage_latencies = [h.latency for site, h in self._histories.items() if h.count and call_stage(site) == stage]
+        if stage and stage_latencies:
+            return max(stage_latencies)
+        return DEFAULT_LATENCY_SECONDS.get(stage, DEFAULT_UNKNOWN_LATENCY_SECONDS)
+
+    def _stage_estimate(self, stage: str) -> float:
+        sites = [site for site in self._histories if call_stage(site) == stage]
+        return max([self._estimate(site) for site in sites] or [self._estimate(stage)])
+
+    def remaining_path(self, call_site: str) -> float:
+        """이 호출부터 실행이 끝날 때까지 남은 임계 경로 예상 시간 (초)"""
+        with self._cond:
+            call_site = call_site or ""
+            remaining = self._estimate(call_site)
+            stage = call_stage(call_site)
+            if stage in CRITICAL_PATH:
+                for later in CRITICAL_PATH[CRITICAL_PATH.index(stage) + 1:]:
+                    remaining += self._stage_estimate(later)
+            return remaining
+
+    # ── 진입 순서 ────────────────────────────────────────────────────────
+
+    def _enqueue(self, call_site: str) -> tuple[float, int]:
+        ticket = (time.monotonic() + self.remaining_path(call_site), next(self._seq))
+        with self._cond:
+            heapq.heappush(self._heap, ticket)
+        return ticket
+
+    def _wait_turn(self, ticket: tuple[float, int]) -> None:
+        started = time.monotonic()
+        with self._cond:
+            while self._holder is not None or self._heap[0] != ticket:
+                if ticket not in self._heap:
+                    # 대기가 취소됨 (_discard)
+                    return
+                self._cond.wait()
+            heapq.heappop(self._heap)
+            self._holder = ticket
+            self.admitted += 1
+            self.total_wait += time.monotonic() - started
+            # 먼저 도착한 호출이 아직 대기 중이면 순서가 바뀐 것
+            if any(seq < ticket[1] for _, seq in self._heap):
+                self.reordered += 1
+
+    def _release(self) -> None:
+        with self._cond:
+            self._holder = None
+            self._cond.notify_all()
+
+    @contextmanager
+    def admit(self, call_site: str):
+        """차례가 될 때까지 대기 후 블록 실행 (블록 안에서 속도 제한기 예산을 확보)
+
+        한 번에 한 호출만 블록 안에 있으므로 속도 제한기의 대기열 순서가 곧 이 스케줄러의 순서입니다.
+        """
+        ticket = self._enqueue(call_site)
+        try:
+            self._wait_turn(ticket)
+        except BaseException:
+            self._discard(ticket)
+            raise
+        try:
+            yield
+        finally:
+            self._release()
+
+    @asynccontextmanager
+    async def admit_async(self, call_site: str):
+        """admit()의 asyncio 버전 (차례 대기는 스레드에서 수행)"""
+        ticket = self._enqueue(call_site)
+        try:
+            await asyncio.to_thread(self._wait_turn, ticket)
+        except BaseException:
+            # 취소되어도 대기 스레드는 계속 실행되므로, 차례를 이미 받았다면 여기서 반납
+            self._discard(ticket)
+            raise
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _discard(self, ticket: tuple[float, int]) -> None:
+        """대기 취소 (차례를 이미 받았으면 반납)"""
+        with self._cond:
+            if ticket in self._heap:
+                self._heap.remove(ticket)
+                heapq.heapify(self._heap)
+            elif self._holder == ticket:
+                self._holder = None
+            self._cond.notify_all()
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "waiting": len(self._heap),
+                "admitted": self.admitted,
+                "reordered": self.reordered,
+                "avg_admission_wait_s": round(self.total_wait / self.admitted, 3) if self.admitted else 0.0,
+                "call_sites": {
+                    site or "(none)": {
+                        "count": h.count,
+                        "avg_latency_s": round(h.latency, 2),
+                        "avg_output_tokens": round(h.tokens),
+                    }
+                    for site, h in sorted(self._histories.items())
+                },
+            }
+
+
+_scheduler: CriticalPathScheduler | None = None
+_scheduler_initialized = False
+_scheduler_lock = threading.Lock()
+
+
+def get_call_scheduler() -> CriticalPathScheduler | None:
+    """프로세스 전역 호출 스케줄러 (CALL_SCHEDULER_ENABLED=false면 None)"""
+    global _scheduler, _scheduler_initialized
+    with _scheduler_lock:
+        if not _scheduler_initialized:
+            enabled = os.environ.get("CALL_SCHEDULER_ENABLED", "true").strip().lower()
+            _scheduler = CriticalPathScheduler() if enabled not in ("false", "0", "no", "off") else None
+            _scheduler_initialized = True
+        return _scheduler
+
+
+def set_call_scheduler(scheduler: CriticalPathScheduler | None) -> None:
+    """호출 스케줄러 교체 (테스트 및 런타임 설정용)"""
+    global _scheduler, _scheduler_initialized
+    with _scheduler_lock:
+        _scheduler = scheduler
+        _scheduler_initialized = True
@@ -0,0 +1,70 @@
+"""임베딩 코사인 유사도 기반 텍스트 클러스터링
+
+같은 입력(텍스트 집합 + 임베딩 + 임계값)에 대해 항상 같은 결과를 냅니다.
+"""
+import numpy as np
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def cluster_by_similarity(labels: list[str], vectors: np.ndarray, threshold: float) -> dict[str, str]:
+    """코사인 유사도 threshold 이상인 텍스트를 묶어 대표 텍스트로 매핑
+
+    평균 연결(average linkage) 병합 군집화입니다. 두 클러스터 간 평균 유사도가
+    가장 높은 쌍부터 threshold 이상인 동안 병합하므로, 단일 연결처럼
+    A~B~C로 이어지는 사슬이 하나로 뭉치지 않습니다.
+    대표 텍스트는 클러스터 내 다른 멤버와의 평균 유사도가 가장 높은 멤버(medoid)이며,
+    동률이면 짧은 이름, 그다음 사전순을 택합니다.
+
+    Args:
+        labels: 클러스터링할 텍스트 (중복 없음)
+        vectors: labels와 같은 순서의 임베딩 행렬 (n, dim)
+        threshold: 병합 기준 코사인 유사도 (0~1)
+
+    Returns:
+        dict: {텍스트: 대표 텍스트}
+    """
+    if not labels:
+        return {}
+
+    # 입력 순서와 무관한 결과를 위해 정렬
+    order = sorted(range(len(labels)), key=lambda i: labels[i])
+    labels = [labels[i] for i in order]
+    unit = _normalize(np.asarray(vectors, dtype=np.float64)[order])
+    sim = unit @ unit.T
+
+    clusters: list[list[int]] = [[i] for i in range(len(labels))]
+    while len(clusters) > 1:
+        # 클러스터 간 평균 유사도 행렬 (벡터화)
+        membership = np.zeros((len(clusters), len(labels)))
+        for c, members in enumerate(clusters):
+            membership[c, members] = 1.0 / len(members)
+        linkage = membership @ sim @ membership.T
+        np.fill_diagonal(linkage, -np.inf)
+
+        a, b = np.unravel_index(np.argmax(linkage), linkage.shape)
+        if linkage[a, b] < threshold:
+            break
+        a, b = min(a, b), max(a, b)
+        clusters[a] = sorted(clusters[a] + clusters[b])
+        del clusters[b]
+
+    mapping = {}
+    for members in clusters:
+        if len(members) == 1:
+            canonical = labels[members[0]]
+        else:
+            sub = sim[np.ix_(members, members)]
+            centrality = (sub.sum(axis=1) - 1.0) / (len(members) - 1)
+            ranked = sorted(
+                zip(members, centrality),
+                key=lambda mc: (-round(float(mc[1]), 9), len(labels[mc[0]]), labels[mc[0]]),
+            )
+            canonical = labels[ranked[0][0]]
+        for m in members:
+            mapping[labels[m]] = canonical
+    return mapping
@@ -0,0 +1,156 @@
+"""텍스트 임베딩 (배치 + 캐시)
+
+역할명 클러스터링처럼 짧은 텍스트를 한 번에 임베딩합니다.
+같은 텍스트는 캐시에서 재사용하므로 재실행 시 결과가 재현됩니다.
+
+백엔드 (EMBEDDING_BACKEND):
+- openai: OpenAI embeddings API (httpx 직접 호출, 속도 제한 적용)
+- local: 결정적 해시 n-gram 벡터 (네트워크 없음, 테스트/오프라인용)
+
+캐시 (EMBEDDING_CACHE_BACKEND): memory(기본) | sqlite | redis | none
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+
+import numpy as np
+
+from utils.cache import CacheBackend, create_cache_backend
+
+logger = logging.getLogger(__name__)
+
+OPENAI_EMBEDDINGS_URL = "https://api.openai.com/v1/embeddings"
+DEFAULT_EMBEDDING_MODEL = "text-embedding-3-small"
+
+# local 백엔드 벡터 차원
+LOCAL_EMBEDDING_DIM = 512
+
+# 역할명에서 의미 구분에 기여하지 않는 일반 단어 (local 백엔드 전용)
+_GENERIC_TOKENS = {
+    "전문가", "연구자", "연구원", "과학자", "분석가", "담당",
+    "specialist", "expert", "scientist", "researcher", "analyst",
+}
+
+
+def _local_embedding(text: str) -> np.ndarray:
+    """문자 1~3-gram을 MD5로 해싱한 결정적 벡터 (프로세스/실행 간 동일)"""
+    tokens = [t for t in re.split(r"[\s/·,()\-]+", text.lower()) if t and t not in _GENERIC_TOKENS]
+    normalized = "".join(tokens) or text.lower()
+
+    vector = np.zeros(LOCAL_EMBEDDING_DIM, dtype=np.float64)
+    for n in (1, 2, 3):
+        for i in range(len(normalized) - n + 1):
+            digest = hashlib.md5(normalized[i:i + n].encode("utf-8")).digest()
+            index = int.from_bytes(digest[:4], "little") % LOCAL_EMBEDDING_DIM
+            sign = 1.0 if digest[4] & 1 else -1.0
+            vector[index] += sign * n  # 긴 n-gram일수록 가중치
+    return vector
+
+
+def _openai_embeddings(texts: list[str], model: str) -> list[list[float]]:
+    """OpenAI embeddings API 배치 호출"""
+    # utils.llm과 같은 httpx 클라이언트·인증·속도 제한 사용
+    from utils.llm import _get_api_key, _get_http_client, _request_headers
+    from utils.rate_limiter import estimate_tokens, get_rate_limiter
+
+    limiter = get_rate_limiter("openai")
+    if limiter:
+        limiter.acquire(sum(estimate_tokens(t) for t in texts))
+
+    response = _get_http_client().post(
+        OPENAI_EMBEDDINGS_URL,
+        headers=_request_headers(_get_api_key()),
+        json={"model": model, "input": texts},
+    )
+    if limiter:
+        limiter.update_from_headers(response.headers)
+    if response.status_code != 200:
+        raise RuntimeError(f"OpenAI embeddings error (HTTP {response.status_code}): {response.text}")
+
+    data = sorted(response.json()["data"], key=lambda item: item["index"])
+    return [item["embedding"] for item in data]
+
+
+class EmbeddingClient:
+    """배치 임베딩 + 텍스트별 캐시"""
+
+    def __init__(
+        self,
+        backend: str = "openai",
+        model: str = DEFAULT_EMBEDDING_MODEL,
+        cache: CacheBackend | None = None,
+    ):
+        self.backend = backend
+        self.model = model if backend == "openai" else f"local-hash-{LOCAL_EMBEDDING_DIM}"
+        self.cache = cache
+
+    def _cache_key(self, text: str) -> str:
+        return hashlib.sha256(f"{self.model}\x00{text}".encode("utf-8")).hexdigest()
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        """텍스트 목록을 (len(texts), dim) 행렬로 임베딩 (캐시 miss만 한 번에 요청)"""
+        if not texts:
+            return np.zeros((0, 0))
+
+        vectors: dict[str, np.ndarray] = {}
+        missing = []
+        for text in dict.fromkeys(texts):
+            cached = self.cache.get(self._cache_key(text)) if self.cache is not None else None
+            if cached is not None:
+                vectors[text] = np.asarray(json.loads(cached), dtype=np.float64)
+            else:
+                missing.append(text)
+
+        if missing:
+            if self.backend == "openai":
+                fresh = [np.asarray(v, dtype=np.float64) for v in _openai_embeddings(missing, self.model)]
+            else:
+                fresh = [_local_embedding(t) for t in missing]
+            for text, vector in zip(missing, fresh):
+                vectors[text] = vector
+                if self.cache is not None:
+                    self.cache.set(self._cache_key(text), json.dumps(vector.tolist()))
+
+        return np.vstack([vectors[t] for t in texts])
+
+
+_embedding_client: EmbeddingClient | None = None
+_init_lock = threading.Lock()
+
+
+def get_embedding_client() -> EmbeddingClient:
+    """환경 변수 설정에 따른 EmbeddingClient 싱글톤"""
+    global _embedding_client
+    if _embedding_client is not None:
+        return _embedding_client
+
+    with _init_lock:
+        if _embedding_client is None:
+            cache = None
+            cache_kind = os.environ.get("EMBEDDING_CACHE_BACKEND", "memory").strip()
+            if cache_kind and cache_kind.lower() not in ("none", "off", "false", "0"):
+                try:
+                    cache = create_cache_backend(
+                        cache_kind,
+                        namespace="embeddings",
+                        max_entries=int(os.environ.get("EMBEDDING_CACHE_MAX_ENTRIES", "10000")),
+                        path=os.environ.get("EMBEDDING_CACHE_PATH", "embedding_cache.db"),
+                    )
+                except Exception as e:
+                    logger.warning(f"[EMBEDDINGS] cache disabled ({cache_kind}): {e}")
+            _embedding_client = EmbeddingClient(
+                backend=os.environ.get("EMBEDDING_BACKEND", "openai").lower(),
+                model=os.environ.get("EMBEDDING_MODEL", DEFAULT_EMBEDDING_MODEL),
+                cache=cache,
+            )
+        return _embedding_client
+
+
+def set_embedding_client(client: EmbeddingClient | None) -> None:
+    """EmbeddingClient 교체 (테스트 및 런타임 설정용)"""
+    global _embedding_client
+    with _init_lock:
+        _embedding_client = client
@@ -0,0 +1,307 @@
+"""프로세스 공용 에이전트 실행기 (bounded executor)
+
+전문가 분석, 비평 fan-out, 자기소개, 검색 등 노드 내부의 병렬 작업을 하나의 스레드 풀에서
+실행합니다. 노드마다 팀 규모만큼 ThreadPoolExecutor를 만들면 동시 실행(run)이 늘어날수록
+스레드와 OpenAI 동시 요청이 제한 없이 늘어나므로, 다음 한도를 둡니다.
+
+- 전체 동시 실행 작업 수: AGENT_EXECUTOR_WORKERS (기본 16)
+- 실행(run_id)별 동시 실행 작업 수: AGENT_EXECUTOR_PER_RUN (기본 8)
+
+대기 작업은 우선순위(Priority) → 제출 순서로 꺼냅니다. 다음 그래프 단계를 막는 호출
+(전문가 분석, 비평, 보고서 섹션, 필수 RAG 검색)은 CRITICAL, 자기소개·prefetch는 BACKGROUND입니다.
+
+작업은 제출한 스레드의 contextvars 복사본에서 실행되므로 LangGraph 스트림 writer와
+실행 식별자(current_run_id)가 그대로 전달됩니다.
+
+중첩 대기로 인한 교착 방지: 작업 안에서 다른 작업의 결과를 기다릴 때(AgentFuture.result,
+AgentExecutor.as_completed) 아직 시작되지 않은 작업이면 기다리는 스레드가 직접 실행합니다.
+따라서 풀이 부모 작업으로 가득 차도 자식 작업은 항상 진행됩니다.
+"""
+import bisect
+import contextvars
+import enum
+import itertools
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Any, Callable, Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_PER_RUN_LIMIT = 8
+
+# 작업이 실행 중인 run_id (제출 시 run_id를 생략하면 이 값을 사용)
+current_run_id: contextvars.ContextVar[str] = contextvars.ContextVar("current_run_id", default="")
+
+
+@contextmanager
+def run_context(run_id: str):
+    """이 블록에서 제출하는 작업에 run_id(실행별 한도)를 적용"""
+    token = current_run_id.set(run_id or "")
+    try:
+        yield
+    finally:
+        current_run_id.reset(token)
+
+
+class Priority(enum.IntEnum):
+    """작은 값이 먼저 실행됨"""
+
+    CRITICAL = 0
+    NORMAL = 1
+    BACKGROUND = 2
+
+
+class _WorkItem:
+    __slots__ = ("key", "future", "fn", "args", "kwargs", "ctx", "run_id", "priority", "claimed", "queued_at")
+
+    def __init__(self, key, future, fn, args, kwargs, ctx, run_id, priority):
+        self.key = key
+        self.future = future
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.ctx = ctx
+        self.run_id = run_id
+        self.priority = priority
+        self.claimed = False
+        self.queued_at = time.monotonic()
+
+    def __lt__(self, other: "_WorkItem") -> bool:
+        return self.key < other.key
+
+
+class AgentFuture(Future):
+    """시작 전이면 기다리는 스레드가 직접 실행하는 Future"""
+
+    def __init__(self, executor: "AgentExecutor"):
+        super().__init__()
+        self._executor = executor
+        self._item: _WorkItem | None = None
+
+    def result(self, timeout: float | None = None) -> Any:
+        # 마감 시간이 있는 대기는 직접 실행하지 않음 (마감을 넘겨 막힐 수 있으므로)
+        if timeout is None and not self.done():
+            self._executor._run_inline(self._item)
+        return super().result(timeout)
+
+    def exception(self, timeout: float | None = None) -> BaseException | None:
+        if timeout is None and not self.done():
+            self._executor._run_inline(self._item)
+        return super().exception(timeout)
+
+
+class AgentExecutor:
+    """우선순위 큐 + 전체/실행별 동시 실행 한도를 가진 스레드 풀"""
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS, per_run_limit: int = DEFAULT_PER_RUN_LIMIT):
+        self.max_workers = max(1, max_workers)
+        self.per_run_limit = max(1, per_run_limit)
+        self._queue: list[_WorkItem] = []
+        self._cond = threading.Condition()
+        self._seq = itertools.count()
+        self._threads: list[threading.Thread] = []
+        self._idle = 0
+        self._active = 0
+        self._active_by_run: Counter = Counter()
+        self._shutdown = False
+        # 지표
+        self.submitted = 0
+        self.completed = 0
+        self.inline_runs = 0
+        self.max_queue_depth = 0
+        self._total_wait = 0.0
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        *args,
+        priority: Priority = Priority.NORMAL,
+        run_id: str | None = None,
+        **kwargs,
+    ) -> AgentFuture:
+        """작업 제출
+
+        Args:
+            priority: 대기 작업 중 실행 순서 (CRITICAL이 먼저)
+            run_id: 실행별 한도를 적용할 실행 식별자 (None이면 현재 작업의 run_id)
+        """
+        future = AgentFuture(self)
+        run_id = current_run_id.get() if run_id is None else run_id
+        item = _WorkItem(
+            (int(priority), next(self._seq)), future, fn, args, kwargs,
+            contextvars.copy_context(), run_id, Priority(priority),
+        )
+        future._item = item
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError("AgentExecutor is shut down")
+            bisect.insort(self._queue, item)
+            self.submitted += 1
+            self.max_queue_depth = max(self.max_queue_depth, len(self._queue))
+            if self._idle == 0 and len(self._threads) < self.max_workers:
+                thread = threading.Thread(
+                    target=self._worker, name=f"agent-{len(self._threads)}", daemon=True
+                )
+                self._threads.append(thread)
+                thread.start()
+            self._cond.notify_all()
+        return future
+
+    def map(
+        self,
+        fn: Callable[..., Any],
+        *iterables: Iterable,
+        priority: Priority = Priority.NORMAL,
+        run_id: str | None = None,
+    ) -> list:
+        """fn을 동시에 실행하고 입력 순서대로 결과 반환 (예외는 그대로 전파)"""
+        futures = [self.submit(fn, *args, priority=priority, run_id=run_id) for args in zip(*iterables)]
+        return [future.result() for future in futures]
+
+    def as_completed(self, futures: Iterable[Future]) -> Iterator[Future]:
+        """완료된 순서대로 반환 (대기 중 시작되지 않은 작업은 직접 실행)"""
+        pending = set(futures)
+        while pending:
+            done = {f for f in pending if f.done()}
+            if not done:
+                # 시작되지 않은 작업 중 우선순위가 가장 높은 것부터 직접 실행
+                unstarted = sorted(
+                    (f._item for f in pending if isinstance(f, AgentFuture) and f._item is not None),
+                    key=lambda item: item.key,
+                )
+                if not any(self._run_inline(item) for item in unstarted):
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                continue
+            pending -= done
+            yield from done
+
+    def stats(self) -> dict:
+        """큐 깊이·동시 실행 지표"""
+        with self._cond:
+            queued_by_priority = Counter(item.priority.name for item in self._queue)
+            return {
+                "max_workers": self.max_workers,
+                "per_run_limit": self.per_run_limit,
+                "workers": len(self._threads),
+                "active": self._active,
+                "active_by_run": {run_id: n for run_id, n in self._active_by_run.items() if n},
+                "queued": len(self._queue),
+                "queued_by_priority": dict(queued_by_priority),
+                "max_queue_depth": self.max_queue_depth,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "inline_runs": self.inline_runs,
+                "avg_queue_wait_ms": round(self._total_wait / self.completed * 1000, 1) if self.completed else 0.0,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._cond:
+            self._shutdown = True
+            self._cond.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def _next_eligible(self) -> _WorkItem | None:
+        """실행별 한도를 넘지 않는 가장 앞의 대기 작업 (_cond 보유 상태에서 호출)"""
+        for index, item in enumerate(self._queue):
+            if not item.run_id or self._active_by_run[item.run_id] < self.per_run_limit:
+                del self._queue[index]
+                item.claimed = True
+                return item
+        return None
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                self._idle += 1
+                item = self._next_eligible()
+                while item is None and not self._shutdown:
+                    self._cond.wait()
+                    item = self._next_eligible()
+                self._idle -= 1
+                if item is None:
+                    return
+                self._active += 1
+                self._active_by_run[item.run_id] += 1
+            try:
+                self._execute(item)
+            finally:
+                with self._cond:
+                    self._active -= 1
+                    self._active_by_run[item.run_id] -= 1
+                    if not self._active_by_run[item.run_id]:
+                        del self._active_by_run[item.run_id]
+                    self._cond.notify_all()
+
+    def _run_inline(self, item: _WorkItem | None) -> bool:
+        """시작되지 않은 작업을 호출 스레드에서 실행 (이미 시작됐으면 False)"""
+        if item is None:
+            return False
+        with self._cond:
+            if item.claimed:
+                return False
+            item.claimed = True
+            self._queue.remove(item)
+            self.inline_runs += 1
+        self._execute(item)
+        return True
+
+    def _execute(self, item: _WorkItem) -> None:
+        future = item.future
+        if not future.set_running_or_notify_cancel():
+            return
+        waited = time.monotonic() - item.queued_at
+
+        def _call():
+            current_run_id.set(item.run_id)
+            return item.fn(*item.args, **item.kwargs)
+
+        try:
+            result = item.ctx.run(_call)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+        finally:
+            with self._cond:
+                self.completed += 1
+                self._total_wait += waited
+            # 작업 참조 해제 (결과만 Future에 유지)
+            item.fn = item.args = item.kwargs = item.ctx = None
+
+
+_agent_executor: AgentExecutor | None = None
+_init_lock = threading.Lock()
+
+
+def get_agent_executor() -> AgentExecutor:
+    """환경 변수 설정에 따른 공용 실행기 싱글톤"""
+    global _agent_executor
+    if _agent_executor is not None:
+        return _agent_executor
+
+    with _init_lock:
+        if _agent_executor is None:
+            try:
+                max_workers = int(os.environ.get("AGENT_EXECUTOR_WORKERS", DEFAULT_MAX_WORKERS))
+                per_run_limit = int(os.environ.get("AGENT_EXECUTOR_PER_RUN", DEFAULT_PER_RUN_LIMIT))
+            except ValueError:
+                logger.warning("[EXECUTOR] invalid AGENT_EXECUTOR_* setting, using defaults")
+                max_workers, per_run_limit = DEFAULT_MAX_WORKERS, DEFAULT_PER_RUN_LIMIT
+            _agent_executor = AgentExecutor(max_workers, per_run_limit)
+            print(f"[EXECUTOR] agent executor: {max_workers} workers, {per_run_limit} per run")
+        return _agent_executor
+
+
+def set_agent_executor(executor: AgentExecutor | None) -> None:
+    """공용 실행기 교체 (테스트 및 런타임 설정용, None이면 다음 조회 시 다시 생성)"""
+    global _agent_executor
+    with _init_lock:
+        _agent_executor = executor
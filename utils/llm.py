@@ -4,15 +4,22 @@ OpenAI SDK 대신 httpx로 직접 HTTP 요청을 보냅니다.
 SDK 레벨의 auto-instrumentation, monkey-patching 등을
 완전히 우회하여 tool_calls 관련 문제를 근본적으로 방지합니다.
 """
+import asyncio
 import os
 import sys
 import json
 import logging
 import time
 import traceback
+from typing import Callable, TypeVar
 
 from dotenv import load_dotenv
 import httpx
+from pydantic import BaseModel, ValidationError
+
+from utils.call_scheduler import get_call_scheduler
+from utils.llm_cache import get_llm_cache, make_cache_key
+from utils.rate_limiter import estimate_tokens, get_rate_limiter, parse_reset
 
 load_dotenv()
 
@@ -21,12 +28,60 @@ sys.dont_write_bytecode = True
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T", bound=BaseModel)
+
 # OpenAI API 엔드포인트
 OPENAI_API_URL = "https://api.openai.com/v1/chat/completions"
 
+# 429/타임아웃 최대 재시도 횟수
+MAX_RETRIES = 5
+
+# 구조화 출력 스키마 검증 실패 시 최대 시도 횟수 (잘린 응답 대비)
+STRUCTURED_MAX_ATTEMPTS = 2
+
+# 스트리밍 delta 묶음 전달 기준
+DELTA_FLUSH_CHARS = 64
+DELTA_FLUSH_SECONDS = 0.25
+
+# max_tokens로 잘린 응답을 이어서 요청할 때 사용할 기본 횟수 (긴 보고서/분석용)
+LONG_OUTPUT_CONTINUATIONS = 2
+
+# 이어쓰기 요청에 넘길 잘린 응답의 끝부분 길이 (글자)
+CONTINUATION_TAIL_CHARS = 6000
+
+# 이어쓰기 응답 앞부분이 기존 응답 끝과 겹칠 때 제거할 최대 길이 (글자)
+CONTINUATION_OVERLAP_CHARS = 300
+
+# n 파라미터를 거부한 모델 (이후 요청은 바로 개별 요청으로 대체)
+_n_unsupported_models: set[str] = set()
+
 # httpx 클라이언트 (싱글톤, 커넥션 풀 재사용)
 _http_client: httpx.Client | None = None
 
+# httpx 비동기 클라이언트 (이벤트 루프별 싱글톤)
+# AsyncClient의 커넥션 풀은 생성된 루프에 묶이므로 루프가 바뀌면 새로 만들고 이전 클라이언트는 닫습니다.
+_async_http_client: httpx.AsyncClient | None = None
+_async_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+class LLMText(str):
+    """finish_reason을 함께 전달하는 응답 텍스트 (str과 동일하게 사용)
+
+    finish_reason이 "length"이면 max_tokens에 걸려 잘린 응답입니다.
+    캐시에서 반환된 응답은 finish_reason이 None입니다.
+    """
+
+    finish_reason: str | None
+
+    def __new__(cls, text: str, finish_reason: str | None = None):
+        obj = super().__new__(cls, text)
+        obj.finish_reason = finish_reason
+        return obj
+
+    @property
+    def truncated(self) -> bool:
+        return self.finish_reason == "length"
+
 
 def _get_http_client() -> httpx.Client:
     """httpx 클라이언트 싱글톤 반환"""
@@ -36,26 +91,74 @@ def _get_http_client() -> httpx.Client:
     return _http_client
 
 
-def call_llm(
-    system_prompt: str,
-    user_message: str,
-    model: str | None = None,
-    temperature: float = 0.7,
-    max_tokens: int = 32768,
-) -> str:
-    """OpenAI Chat Completion 직접 호출 (httpx)
+def _get_async_http_client() -> httpx.AsyncClient:
+    """현재 이벤트 루프에 묶인 httpx.AsyncClient 싱글톤 반환"""
+    global _async_http_client, _async_client_loop
+    loop = asyncio.get_running_loop()
+    if _async_http_client is None or _async_client_loop is not loop:
+        if _async_http_client is not None:
+            _close_stale_async_client(_async_http_client, _async_client_loop)
+        _async_http_client = httpx.AsyncClient(
+            timeout=600.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+        _async_client_loop = loop
+    return _async_http_client
 
-    SDK를 거치지 않고 httpx로 직접 HTTP POST를 보냅니다.
-    messages 배열은 항상 정확히 2개 (system + user)입니다.
-    tools 파라미터를 절대 포함하지 않아 tool_calls 응답을 방지합니다.
+
+def _close_stale_async_client(client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop | None) -> None:
+    """다른 루프에 묶인 이전 클라이언트 닫기
+
+    커넥션은 생성된 루프에서만 닫을 수 있으므로 그 루프가 아직 실행 중이면 그 루프에 aclose()를 예약합니다.
+    이미 닫힌 루프라면 커넥션의 transport도 함께 정리되었으므로 참조만 버립니다.
     """
+    if loop is not None and loop.is_running() and not loop.is_closed():
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+    else:
+        logger.debug("[LLM] dropping async client of a closed event loop")
+
+
+async def aclose_async_http_client() -> None:
+    """현재 루프의 httpx.AsyncClient 닫기 (서버 종료 시 호출)"""
+    global _async_http_client, _async_client_loop
+    client, loop = _async_http_client, _async_client_loop
+    if client is None:
+        return
+    _async_http_client, _async_client_loop = None, None
+    if loop is asyncio.get_running_loop():
+        await client.aclose()
+    else:
+        _close_stale_async_client(client, loop)
+
+
+def _resolve_model(model: str | None) -> str:
+    """모델명 결정 (미지정 시 GPT_MODEL 환경 변수)"""
+    if model is None:
+        model = os.environ.get("GPT_MODEL", "gpt-4o")
+    return model
+
+
+def _get_api_key() -> str:
     api_key = os.environ.get("OPENAI_API_KEY")
     if not api_key:
         raise ValueError("OPENAI_API_KEY 환경 변수가 설정되지 않았습니다.")
+    return api_key
 
-    if model is None:
-        model = os.environ.get("GPT_MODEL", "gpt-4o")
 
+def _build_payload(
+    system_prompt: str,
+    user_message: str,
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    response_format: dict | None = None,
+) -> dict:
+    """Chat Completion 요청 페이로드 구성 (sync/async 공용)
+
+    messages 배열은 항상 정확히 2개 (system + user)입니다.
+    tools 파라미터를 절대 포함하지 않아 tool_calls 응답을 방지합니다.
+    response_format이 주어지면 그대로 포함합니다 (JSON schema 구조화 출력).
+    """
     # 메시지 배열: 정확히 2개만
     messages = [
         {"role": "system", "content": system_prompt},
@@ -75,6 +178,8 @@ def call_llm(
     # GPT-5/o3/o4는 temperature 커스텀 미지원 (기본값 1만 허용)
     if not use_new_api:
         payload["temperature"] = temperature
+    if response_format:
+        payload["response_format"] = response_format
 
     # 상세 로깅: 요청 전 정보
     print(f"\n{'='*80}")
@@ -92,92 +197,316 @@ def call_llm(
     logger.info(f"[LLM] System prompt: {len(system_prompt)} chars")
     logger.info(f"[LLM] User message: {len(user_message)} chars")
 
+    return payload
+
+
+def _request_headers(api_key: str) -> dict:
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    }
+
+
+def _rate_limit_wait(response: httpx.Response) -> float:
+    """429 응답 본문에서 재시도 대기 시간(초)을 추출합니다."""
+    retry_after = 10  # 기본 대기 시간
+    # 헤더의 reset 시각이 있으면 우선 사용
+    resets = [
+        parse_reset(response.headers.get(h, ""))
+        for h in ("x-ratelimit-reset-requests", "x-ratelimit-reset-tokens")
+    ]
+    resets = [r for r in resets if r]
+    if resets:
+        retry_after = max(resets) + 1
+    try:
+        err = response.json().get("error", {})
+        msg = err.get("message", "")
+        # "Please try again in 3.396s" 에서 대기 시간 추출
+        if "try again in" in msg:
+            wait_str = msg.split("try again in ")[1].split("s")[0]
+            retry_after = float(wait_str) + 1  # 여유 1초 추가
+    except Exception:
+        pass
+    return min(retry_after, 60)  # 최대 60초
+
+
+def _parse_completion(response: httpx.Response) -> dict:
+    """200이 아닌 응답/API 에러를 RuntimeError로 변환하고 응답 본문(JSON)을 반환합니다."""
+    # HTTP 에러 체크
+    if response.status_code != 200:
+        error_body = response.text
+        print(f"\n{'!'*80}")
+        print(f"[LLM ERROR] OpenAI API returned error!")
+        print(f"  Status: {response.status_code}")
+        print(f"  Error body: {error_body}")
+        print(f"{'!'*80}\n")
+        logger.error(f"[LLM] OpenAI API HTTP {response.status_code}: {error_body}")
+        raise RuntimeError(
+            f"OpenAI API error (HTTP {response.status_code}): {error_body}"
+        )
+
+    data = response.json()
+
+    # API 레벨 에러 체크
+    if "error" in data:
+        error_msg = data["error"].get("message", str(data["error"]))
+        logger.error(f"[LLM] OpenAI API Error: {error_msg}")
+        raise RuntimeError(f"OpenAI API error: {error_msg}")
+
+    return data
+
+
+def _log_success(data: dict, contents: list[str]) -> None:
+    lengths = ", ".join(str(len(c)) for c in contents)
+    print(f"\n{'='*80}")
+    print(f"[LLM SUCCESS] API call completed successfully")
+    print(f"  Content length: {lengths} chars")
+    print(f"  Model used: {data.get('model', 'unknown')}")
+    print(f"  Usage: {data.get('usage', {})}")
+    print(f"{'='*80}\n")
+
+    logger.info(
+        f"[LLM] Response: {lengths} chars, "
+        f"model={data.get('model', 'unknown')}, "
+        f"usage={data.get('usage', {})}"
+    )
+
+
+def _parse_response(response: httpx.Response) -> LLMText:
+    """200이 아닌 응답/API 에러를 RuntimeError로 변환하고 본문 content를 반환합니다."""
+    data = _parse_completion(response)
+
+    # 응답 파싱
+    choice = data["choices"][0]
+    if choice["message"].get("refusal"):
+        # 구조화 출력 요청을 모델이 거부한 경우 (content 없음)
+        logger.error(f"[LLM] OpenAI refusal: {choice['message']['refusal']}")
+        raise RuntimeError(f"OpenAI refusal: {choice['message']['refusal']}")
+    content = choice["message"].get("content") or ""
+
+    _log_success(data, [content])
+    return LLMText(content, choice.get("finish_reason"))
+
+
+def _parse_choices(response: httpx.Response) -> list[str]:
+    """n개 choice 응답의 content 목록 (거부된 choice는 제외)"""
+    data = _parse_completion(response)
+
+    contents = []
+    for choice in data["choices"]:
+        if choice["message"].get("refusal"):
+            logger.warning(f"[LLM] OpenAI refusal (choice {choice.get('index')}): {choice['message']['refusal']}")
+            continue
+        contents.append(choice["message"].get("content") or "")
+
+    _log_success(data, contents)
+    return contents
+
+
+def _log_response_received(response: httpx.Response) -> None:
+    # 상세 로깅: 응답 받음
+    print(f"\n{'='*80}")
+    print(f"[LLM RESPONSE] Received response from OpenAI")
+    print(f"  Status code: {response.status_code}")
+    print(f"{'='*80}\n")
+
+
+class _StreamAccumulator:
+    """stream=true 응답의 SSE 라인을 파싱하여 content를 누적합니다.
+
+    토큰 단위 delta를 그대로 넘기면 콜백 호출이 과도하므로,
+    DELTA_FLUSH_CHARS 이상 쌓이거나 DELTA_FLUSH_SECONDS가 지나면 묶어서 on_delta로 전달합니다.
+    """
+
+    def __init__(self, on_delta: Callable[[str], None]):
+        self.on_delta = on_delta
+        self.parts: list[str] = []
+        self.model = "unknown"
+        self.usage: dict = {}
+        self.finish_reason: str | None = None
+        self._pending: list[str] = []
+        self._pending_chars = 0
+        self._last_flush = time.monotonic()
+
+    def feed(self, line: str) -> None:
+        line = line.strip()
+        if not line.startswith("data:"):
+            return
+        data = line[len("data:"):].strip()
+        if not data or data == "[DONE]":
+            return
+        chunk = json.loads(data)
+        if "error" in chunk:
+            error_msg = chunk["error"].get("message", str(chunk["error"]))
+            logger.error(f"[LLM] OpenAI API stream error: {error_msg}")
+            raise RuntimeError(f"OpenAI API error: {error_msg}")
+
+        self.model = chunk.get("model", self.model)
+        if chunk.get("usage"):
+            self.usage = chunk["usage"]
+        for choice in chunk.get("choices", []):
+            delta = (choice.get("delta") or {}).get("content")
+            if delta:
+                self.parts.append(delta)
+                self._pending.append(delta)
+                self._pending_chars += len(delta)
+            if choice.get("finish_reason"):
+                self.finish_reason = choice["finish_reason"]
+
+        if self._pending_chars >= DELTA_FLUSH_CHARS or time.monotonic() - self._last_flush >= DELTA_FLUSH_SECONDS:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending:
+            text = "".join(self._pending)
+            self._pending = []
+            self._pending_chars = 0
+            try:
+                self.on_delta(text)
+            except Exception as e:
+                # 스트리밍 소비자 오류가 LLM 호출 자체를 실패시키지 않도록 함
+                logger.warning(f"[LLM] on_delta callback failed: {e}")
+        self._last_flush = time.monotonic()
+
+    def finish(self) -> LLMText:
+        self.flush()
+        content = LLMText("".join(self.parts), self.finish_reason)
+
+        print(f"\n{'='*80}")
+        print(f"[LLM SUCCESS] API stream completed successfully")
+        print(f"  Content length: {len(content)} chars")
+        print(f"  Model used: {self.model}")
+        print(f"  Usage: {self.usage}")
+        print(f"  Finish reason: {self.finish_reason}")
+        print(f"{'='*80}\n")
+
+        logger.info(
+            f"[LLM] Streamed response: {len(content)} chars, "
+            f"model={self.model}, usage={self.usage}"
+        )
+        return content
+
+
+def _stream_payload(payload: dict) -> dict:
+    return {**payload, "stream": True, "stream_options": {"include_usage": True}}
+
+
+def _post_stream(
+    client: httpx.Client, api_key: str, payload: dict, on_delta: Callable[[str], None]
+) -> tuple[httpx.Response, str | None]:
+    """stream=true로 요청하고 delta를 on_delta로 전달합니다.
+
+    Returns:
+        (response, content): 200이 아니면 content는 None이고 response 본문은 읽힌 상태입니다.
+    """
+    with client.stream(
+        "POST", OPENAI_API_URL, headers=_request_headers(api_key), json=_stream_payload(payload)
+    ) as response:
+        if response.status_code != 200:
+            response.read()
+            return response, None
+        accumulator = _StreamAccumulator(on_delta)
+        for line in response.iter_lines():
+            accumulator.feed(line)
+        return response, accumulator.finish()
+
+
+async def _apost_stream(
+    client: httpx.AsyncClient, api_key: str, payload: dict, on_delta: Callable[[str], None]
+) -> tuple[httpx.Response, str | None]:
+    """_post_stream()의 asyncio 버전"""
+    async with client.stream(
+        "POST", OPENAI_API_URL, headers=_request_headers(api_key), json=_stream_payload(payload)
+    ) as response:
+        if response.status_code != 200:
+            await response.aread()
+            return response, None
+        accumulator = _StreamAccumulator(on_delta)
+        async for line in response.aiter_lines():
+            accumulator.feed(line)
+        return response, accumulator.finish()
+
+
+def _output_tokens(response: httpx.Response, streamed: str | None) -> int:
+    """호출 기록용 출력 토큰 수 (usage가 없으면 본문 길이로 추정)"""
+    if streamed is not None:
+        return estimate_tokens(streamed)
+    try:
+        return int(response.json().get("usage", {}).get("completion_tokens", 0))
+    except Exception:
+        return 0
+
+
+def _record_call(call_site: str, started: float, response: httpx.Response, streamed: str | None) -> None:
+    """호출 스케줄러에 호출 지점별 응답 시간·출력 토큰 기록 (정상 응답만)"""
+    scheduler = get_call_scheduler()
+    if scheduler and response.status_code == 200:
+        scheduler.record(call_site, time.monotonic() - started, _output_tokens(response, streamed))
+
+
+def _send_with_retries(
+    api_key: str,
+    payload: dict,
+    budget_tokens: int,
+    on_delta: Callable[[str], None] | None = None,
+    call_site: str = "",
+) -> tuple[httpx.Response, str | None]:
+    """속도 제한·429·타임아웃 재시도를 거쳐 요청을 보내고 최종 응답을 반환합니다.
+
+    속도 제한기 대기열 진입 순서는 호출 스케줄러(utils.call_scheduler)가 call_site의
+    남은 임계 경로 기준으로 정합니다.
+
+    Returns:
+        (response, streamed): on_delta 스트리밍 시 streamed는 누적된 전체 텍스트,
+        아니면 None이며 response 본문을 파싱해야 합니다.
+    """
     client = _get_http_client()
-    max_retries = 5
+    limiter = get_rate_limiter("openai")
+    scheduler = get_call_scheduler()
 
-    for attempt in range(max_retries):
+    for attempt in range(MAX_RETRIES):
         try:
-            response = client.post(
-                OPENAI_API_URL,
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json",
-                },
-                json=payload,
-            )
-
-            # 상세 로깅: 응답 받음
-            print(f"\n{'='*80}")
-            print(f"[LLM RESPONSE] Received response from OpenAI")
-            print(f"  Status code: {response.status_code}")
-            print(f"{'='*80}\n")
+            if limiter and scheduler:
+                with scheduler.admit(call_site):
+                    limiter.acquire(budget_tokens)
+            elif limiter:
+                limiter.acquire(budget_tokens)
+            started = time.monotonic()
+            streamed = None
+            if on_delta:
+                response, streamed = _post_stream(client, api_key, payload, on_delta)
+            else:
+                response = client.post(
+                    OPENAI_API_URL,
+                    headers=_request_headers(api_key),
+                    json=payload,
+                )
+            _log_response_received(response)
+            if limiter:
+                limiter.update_from_headers(response.headers)
 
             # Rate Limit (429) 자동 재시도
             if response.status_code == 429:
-                retry_after = 10  # 기본 대기 시간
-                try:
-                    err = response.json().get("error", {})
-                    msg = err.get("message", "")
-                    # "Please try again in 3.396s" 에서 대기 시간 추출
-                    if "try again in" in msg:
-                        wait_str = msg.split("try again in ")[1].split("s")[0]
-                        retry_after = float(wait_str) + 1  # 여유 1초 추가
-                except Exception:
-                    pass
-                retry_after = min(retry_after, 60)  # 최대 60초
-
-                if attempt < max_retries - 1:
-                    print(f"[LLM RATE LIMIT] 429 - waiting {retry_after:.1f}s before retry ({attempt+1}/{max_retries})")
+                retry_after = _rate_limit_wait(response)
+                if limiter:
+                    # 다른 호출자도 함께 대기시켜 동시 재시도 폭주 방지
+                    limiter.backoff(retry_after)
+                if attempt < MAX_RETRIES - 1:
+                    print(f"[LLM RATE LIMIT] 429 - waiting {retry_after:.1f}s before retry ({attempt+1}/{MAX_RETRIES})")
                     logger.warning(f"[LLM] Rate limit hit, retrying in {retry_after:.1f}s (attempt {attempt+1})")
                     time.sleep(retry_after)
                     continue
                 else:
                     error_body = response.text
-                    raise RuntimeError(f"OpenAI API rate limit exceeded after {max_retries} retries: {error_body}")
-
-            # HTTP 에러 체크
-            if response.status_code != 200:
-                error_body = response.text
-                print(f"\n{'!'*80}")
-                print(f"[LLM ERROR] OpenAI API returned error!")
-                print(f"  Status: {response.status_code}")
-                print(f"  Error body: {error_body}")
-                print(f"{'!'*80}\n")
-                logger.error(f"[LLM] OpenAI API HTTP {response.status_code}: {error_body}")
-                raise RuntimeError(
-                    f"OpenAI API error (HTTP {response.status_code}): {error_body}"
-                )
+                    raise RuntimeError(f"OpenAI API rate limit exceeded after {MAX_RETRIES} retries: {error_body}")
 
-            data = response.json()
-
-            # API 레벨 에러 체크
-            if "error" in data:
-                error_msg = data["error"].get("message", str(data["error"]))
-                logger.error(f"[LLM] OpenAI API Error: {error_msg}")
-                raise RuntimeError(f"OpenAI API error: {error_msg}")
-
-            # 응답 파싱
-            choice = data["choices"][0]
-            content = choice["message"].get("content") or ""
-
-            print(f"\n{'='*80}")
-            print(f"[LLM SUCCESS] API call completed successfully")
-            print(f"  Content length: {len(content)} chars")
-            print(f"  Model used: {data.get('model', 'unknown')}")
-            print(f"  Usage: {data.get('usage', {})}")
-            print(f"{'='*80}\n")
-
-            logger.info(
-                f"[LLM] Response: {len(content)} chars, "
-                f"model={data.get('model', 'unknown')}, "
-                f"usage={data.get('usage', {})}"
-            )
-            return content
+            _record_call(call_site, started, response, streamed)
+            return response, streamed
 
         except httpx.TimeoutException as e:
             print(f"[LLM TIMEOUT] Request timed out after 600 seconds")
             logger.error("[LLM] OpenAI API request timed out (600s)")
-            if attempt < max_retries - 1:
+            if attempt < MAX_RETRIES - 1:
                 time.sleep(5)
                 continue
             raise RuntimeError("OpenAI API request timed out")
@@ -194,12 +523,437 @@ def call_llm(
     raise RuntimeError("OpenAI API call failed after all retries")
 
 
-def call_gpt(system_prompt: str, user_message: str, **kwargs) -> str:
+async def _asend_with_retries(
+    api_key: str,
+    payload: dict,
+    budget_tokens: int,
+    on_delta: Callable[[str], None] | None = None,
+    call_site: str = "",
+) -> tuple[httpx.Response, str | None]:
+    """_send_with_retries()의 asyncio 버전"""
+    client = _get_async_http_client()
+    limiter = get_rate_limiter("openai")
+    scheduler = get_call_scheduler()
+
+    for attempt in range(MAX_RETRIES):
+        try:
+            if limiter and scheduler:
+                async with scheduler.admit_async(call_site):
+                    await limiter.acquire_async(budget_tokens)
+            elif limiter:
+                await limiter.acquire_async(budget_tokens)
+            started = time.monotonic()
+            streamed = None
+            if on_delta:
+                response, streamed = await _apost_stream(client, api_key, payload, on_delta)
+            else:
+                response = await client.post(
+                    OPENAI_API_URL,
+                    headers=_request_headers(api_key),
+                    json=payload,
+                )
+            _log_response_received(response)
+            # 속도 제한기 갱신은 Redis 왕복이 있을 수 있으므로 이벤트 루프 밖에서 실행
+            if limiter:
+                await asyncio.to_thread(limiter.update_from_headers, response.headers)
+
+            # Rate Limit (429) 자동 재시도
+            if response.status_code == 429:
+                retry_after = _rate_limit_wait(response)
+                if limiter:
+                    # 다른 호출자도 함께 대기시켜 동시 재시도 폭주 방지
+                    await asyncio.to_thread(limiter.backoff, retry_after)
+                if attempt < MAX_RETRIES - 1:
+                    print(f"[LLM RATE LIMIT] 429 - waiting {retry_after:.1f}s before retry ({attempt+1}/{MAX_RETRIES})")
+                    logger.warning(f"[LLM] Rate limit hit, retrying in {retry_after:.1f}s (attempt {attempt+1})")
+                    await asyncio.sleep(retry_after)
+                    continue
+                else:
+                    error_body = response.text
+                    raise RuntimeError(f"OpenAI API rate limit exceeded after {MAX_RETRIES} retries: {error_body}")
+
+            _record_call(call_site, started, response, streamed)
+            return response, streamed
+
+        except httpx.TimeoutException:
+            print(f"[LLM TIMEOUT] Request timed out after 600 seconds")
+            logger.error("[LLM] OpenAI API request timed out (600s)")
+            if attempt < MAX_RETRIES - 1:
+                await asyncio.sleep(5)
+                continue
+            raise RuntimeError("OpenAI API request timed out")
+
+        except RuntimeError:
+            raise
+
+        except Exception as e:
+            print(f"[LLM EXCEPTION] {type(e).__name__}: {e}")
+            logger.error(f"[LLM] Unexpected error: {type(e).__name__}: {e}")
+            raise
+
+    raise RuntimeError("OpenAI API call failed after all retries")
+
+
+def _continuation_message(user_message: str, partial: str) -> str:
+    """잘린 응답을 이어 쓰도록 요청하는 user 메시지 (messages 2개 규칙 유지)
+
+    잘린 응답 전체 대신 끝부분과 지금까지의 Markdown 제목 목록만 넘겨 입력을 줄입니다.
+    """
+    headings = [line for line in partial.splitlines() if line.startswith("#")]
+    outline = "\n".join(headings) if headings else "(제목 없음)"
+    tail = partial[-CONTINUATION_TAIL_CHARS:]
+    return (
+        f"{user_message}\n\n"
+        f"[이전 응답 - 출력 길이 제한으로 중간에 끊김]\n"
+        f"지금까지 작성한 제목 목록:\n{outline}\n\n"
+        f"마지막 부분:\n{tail}\n\n"
+        f"위 응답이 끊긴 지점 바로 다음부터 이어서 작성하세요. "
+        f"이미 작성한 내용을 반복하거나 서두를 붙이지 말고, 끊긴 문장부터 그대로 이어가세요."
+    )
+
+
+def _merge_continuation(partial: str, addition: str) -> str:
+    """이어쓰기 응답을 붙이되, 앞부분이 기존 응답 끝과 겹치면 겹친 부분 제거"""
+    limit = min(len(partial), len(addition), CONTINUATION_OVERLAP_CHARS)
+    # 10자 미만의 우연한 일치는 겹침으로 보지 않음
+    for size in range(limit, 9, -1):
+        if partial.endswith(addition[:size]):
+            return partial + addition[size:]
+    return partial + addition
+
+
+def _log_truncation(content: LLMText, max_tokens: int, remaining: int) -> None:
+    print(f"[LLM TRUNCATED] finish_reason=length at max_tokens={max_tokens} ({len(content)} chars), continuations left: {remaining}")
+    logger.warning(f"[LLM] Response truncated at max_tokens={max_tokens}, continuations left: {remaining}")
+
+
+def call_llm(
+    system_prompt: str,
+    user_message: str,
+    model: str | None = None,
+    temperature: float = 0.7,
+    max_tokens: int = 32768,
+    cache: bool = True,
+    cache_tag: str = "",
+    on_delta: Callable[[str], None] | None = None,
+    response_format: dict | None = None,
+    continuations: int = 0,
+    call_site: str = "",
+) -> LLMText:
+    """OpenAI Chat Completion 직접 호출 (httpx)
+
+    SDK를 거치지 않고 httpx로 직접 HTTP POST를 보냅니다.
+    messages 배열은 항상 정확히 2개 (system + user)입니다.
+    tools 파라미터를 절대 포함하지 않아 tool_calls 응답을 방지합니다.
+
+    LLM 응답 캐시가 켜져 있으면(LLM_CACHE_BACKEND) 동일 요청은 캐시에서 반환합니다.
+    cache=False로 호출 지점별 캐시를 우회할 수 있고, cache_tag로 같은 요청을
+    별도 항목으로 저장할 수 있습니다 (예: 독립 시행 번호).
+
+    on_delta가 주어지면 stream=true로 요청하여 생성되는 텍스트 조각을 콜백으로 전달하고,
+    완료 후 전체 텍스트를 반환합니다.
+
+    response_format은 OpenAI 구조화 출력 설정입니다. 스키마를 강제하려면
+    call_llm_json()을 사용하세요.
+
+    반환값은 finish_reason을 담은 LLMText(str)입니다. 응답이 max_tokens에 걸려
+    잘리면(finish_reason="length") 최대 continuations회까지 이어쓰기 요청을 보내
+    잘린 지점부터 이어 붙입니다. 잘린 채로 끝난 응답은 캐시하지 않습니다.
+
+    call_site는 호출 지점 이름입니다 (예: "specialist", "critique.summary").
+    속도 제한이 포화되면 남은 임계 경로가 짧은 호출부터 보냅니다 (utils.call_scheduler).
+    """
+    api_key = _get_api_key()
+    model = _resolve_model(model)
+    payload = _build_payload(
+        system_prompt, user_message, model, temperature, max_tokens, response_format
+    )
+
+    llm_cache = get_llm_cache() if cache else None
+    cache_key = make_cache_key(payload, cache_tag) if llm_cache else ""
+    if llm_cache:
+        cached = llm_cache.get(cache_key)
+        if cached is not None:
+            print(f"[LLM CACHE HIT] {len(cached)} chars (model={model})")
+            if on_delta:
+                on_delta(cached)
+            return LLMText(cached)
+
+    budget_tokens = estimate_tokens(system_prompt + user_message) + max_tokens
+    response, streamed = _send_with_retries(api_key, payload, budget_tokens, on_delta, call_site)
+    content = streamed if streamed is not None else _parse_response(response)
+
+    for remaining in range(continuations, 0, -1):
+        if not content.truncated:
+            break
+        _log_truncation(content, max_tokens, remaining)
+        message = _continuation_message(user_message, content)
+        payload = _build_payload(system_prompt, message, model, temperature, max_tokens, response_format)
+        budget_tokens = estimate_tokens(system_prompt + message) + max_tokens
+        response, streamed = _send_with_retries(api_key, payload, budget_tokens, on_delta, call_site)
+        addition = streamed if streamed is not None else _parse_response(response)
+        content = LLMText(_merge_continuation(content, addition), addition.finish_reason)
+
+    if content.truncated:
+        _log_truncation(content, max_tokens, 0)
+    elif llm_cache:
+        llm_cache.set(cache_key, content)
+    return content
+
+
+async def acall_llm(
+    system_prompt: str,
+    user_message: str,
+    model: str | None = None,
+    temperature: float = 0.7,
+    max_tokens: int = 32768,
+    cache: bool = True,
+    cache_tag: str = "",
+    on_delta: Callable[[str], None] | None = None,
+    response_format: dict | None = None,
+    continuations: int = 0,
+    call_site: str = "",
+) -> LLMText:
+    """call_llm()의 asyncio 버전 (httpx.AsyncClient)
+
+    페이로드, 429 재시도, 타임아웃 재시도 규칙은 call_llm과 동일합니다.
+    응답 대기 중 스레드를 점유하지 않으므로 asyncio.gather로 다수 호출을 동시에 진행할 수 있습니다.
+    서버의 async 엔드포인트(보고서 섹션 재생성·번역)가 사용합니다. LangGraph 노드는 동기 그래프
+    실행(workflow.stream)의 스레드에서 돌기 때문에 call_llm을 그대로 사용합니다.
+    on_delta를 주면 call_llm과 같이 스트리밍으로, continuations를 주면 잘린 응답을 이어서 받습니다.
+    """
+    api_key = _get_api_key()
+    model = _resolve_model(model)
+    payload = _build_payload(
+        system_prompt, user_message, model, temperature, max_tokens, response_format
+    )
+
+    llm_cache = get_llm_cache() if cache else None
+    cache_key = make_cache_key(payload, cache_tag) if llm_cache else ""
+    # 캐시 백엔드(SQLite/Redis)는 디스크·네트워크 I/O가 있으므로 이벤트 루프 밖에서 조회·저장
+    if llm_cache:
+        cached = await asyncio.to_thread(llm_cache.get, cache_key)
+        if cached is not None:
+            print(f"[LLM CACHE HIT] {len(cached)} chars (model={model})")
+            if on_delta:
+                on_delta(cached)
+            return LLMText(cached)
+
+    budget_tokens = estimate_tokens(system_prompt + user_message) + max_tokens
+    response, streamed = await _asend_with_retries(api_key, payload, budget_tokens, on_delta, call_site)
+    content = streamed if streamed is not None else _parse_response(response)
+
+    for remaining in range(continuations, 0, -1):
+        if not content.truncated:
+            break
+        _log_truncation(content, max_tokens, remaining)
+        message = _continuation_message(user_message, content)
+        payload = _build_payload(system_prompt, message, model, temperature, max_tokens, response_format)
+        budget_tokens = estimate_tokens(system_prompt + message) + max_tokens
+        response, streamed = await _asend_with_retries(api_key, payload, budget_tokens, on_delta, call_site)
+        addition = streamed if streamed is not None else _parse_response(response)
+        content = LLMText(_merge_continuation(content, addition), addition.finish_reason)
+
+    if content.truncated:
+        _log_truncation(content, max_tokens, 0)
+    elif llm_cache:
+        await asyncio.to_thread(llm_cache.set, cache_key, content)
+    return content
+
+
+def call_gpt(system_prompt: str, user_message: str, **kwargs) -> LLMText:
     """GPT 모델 호출 (단일 모델 사용)"""
     model = os.environ.get("GPT_MODEL", "gpt-4o")
     return call_llm(system_prompt, user_message, model=model, **kwargs)
 
 
+async def acall_gpt(system_prompt: str, user_message: str, **kwargs) -> LLMText:
+    """call_gpt()의 asyncio 버전"""
+    model = os.environ.get("GPT_MODEL", "gpt-4o")
+    return await acall_llm(system_prompt, user_message, model=model, **kwargs)
+
+
+def json_schema_format(output_type: type[BaseModel]) -> dict:
+    """Pydantic 모델로 strict JSON schema response_format 구성
+
+    strict 모드는 모든 필드가 required이고 additionalProperties가 false여야 하므로
+    모델은 기본값 없는 필드와 extra="forbid"로 정의합니다.
+    """
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": output_type.__name__,
+            "strict": True,
+            "schema": output_type.model_json_schema(),
+        },
+    }
+
+
+def call_llm_json(
+    system_prompt: str,
+    user_message: str,
+    output_type: type[T],
+    **kwargs,
+) -> T:
+    """JSON schema 구조화 출력으로 LLM을 호출하고 Pydantic 모델로 파싱합니다.
+
+    strict 스키마를 서버에서 강제하므로 정상 응답은 항상 파싱됩니다.
+    max_tokens 도달 등으로 잘린 응답만 검증에 실패하며, 이때는 캐시를 우회해 재요청합니다.
+
+    Args:
+        output_type: 응답 스키마 (Pydantic BaseModel)
+        **kwargs: call_llm() 인자 (model, temperature, max_tokens, cache, cache_tag, on_delta, call_site)
+
+    Raises:
+        ValueError: STRUCTURED_MAX_ATTEMPTS회 모두 스키마 검증에 실패한 경우
+    """
+    response_format = json_schema_format(output_type)
+    last_error: ValidationError | None = None
+
+    for attempt in range(STRUCTURED_MAX_ATTEMPTS):
+        if attempt > 0:
+            kwargs["cache"] = False
+        content = call_llm(system_prompt, user_message, response_format=response_format, **kwargs)
+        try:
+            return output_type.model_validate_json(content)
+        except ValidationError as e:
+            last_error = e
+            logger.warning(
+                f"[LLM] {output_type.__name__} validation failed "
+                f"(attempt {attempt+1}/{STRUCTURED_MAX_ATTEMPTS}): {e}"
+            )
+
+    raise ValueError(f"{output_type.__name__} 스키마 검증 실패: {last_error}")
+
+
+def _is_n_unsupported(response: httpx.Response) -> bool:
+    """n 파라미터를 지원하지 않는 모델에 대한 400 응답인지 확인"""
+    if response.status_code != 400:
+        return False
+    try:
+        error = response.json().get("error", {})
+    except Exception:
+        return False
+    return error.get("param") == "n" or "'n'" in error.get("message", "")
+
+
+def call_llm_samples(
+    system_prompt: str,
+    user_message: str,
+    n: int,
+    model: str | None = None,
+    temperature: float = 0.7,
+    max_tokens: int = 32768,
+    cache: bool = True,
+    cache_tag: str = "",
+    response_format: dict | None = None,
+    call_site: str = "",
+) -> list[str]:
+    """같은 프롬프트로 독립 샘플 n개를 생성합니다.
+
+    한 번의 요청에 n choices로 받아 프롬프트 전송·과금이 1회로 끝납니다.
+    모델이 n을 지원하지 않으면(400) 해당 모델을 기억해 두고 call_llm 동시 호출
+    n회로 대체합니다 (cache_tag에 샘플 번호를 붙여 샘플마다 별도 캐시 항목).
+
+    Returns:
+        list[str]: 샘플 content 목록 (거부된 choice는 빠질 수 있음)
+    """
+    api_key = _get_api_key()
+    model = _resolve_model(model)
+
+    if n > 1 and model not in _n_unsupported_models:
+        payload = _build_payload(
+            system_prompt, user_message, model, temperature, max_tokens, response_format
+        )
+        payload["n"] = n
+
+        llm_cache = get_llm_cache() if cache else None
+        cache_key = make_cache_key(payload, cache_tag) if llm_cache else ""
+        if llm_cache:
+            cached = llm_cache.get(cache_key)
+            if cached is not None:
+                print(f"[LLM CACHE HIT] {n} samples (model={model})")
+                return json.loads(cached)
+
+        # 완성 토큰은 샘플 수만큼, 프롬프트 토큰은 1회만 과금됨
+        budget_tokens = estimate_tokens(system_prompt + user_message) + max_tokens * n
+        response, _ = _send_with_retries(api_key, payload, budget_tokens, call_site=call_site)
+        if not _is_n_unsupported(response):
+            contents = _parse_choices(response)
+            if llm_cache:
+                llm_cache.set(cache_key, json.dumps(contents, ensure_ascii=False))
+            return contents
+
+        logger.warning(f"[LLM] Model {model} does not support n, falling back to {n} requests")
+        _n_unsupported_models.add(model)
+
+    def _one(idx: int) -> str:
+        return call_llm(
+            system_prompt,
+            user_message,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            cache=cache,
+            cache_tag=f"{cache_tag}-{idx}" if cache_tag else str(idx),
+            response_format=response_format,
+            call_site=call_site,
+        )
+
+    # 공용 실행기에서 실행 (전체·실행별 동시 요청 한도 적용)
+    from utils.executor import get_agent_executor
+
+    executor = get_agent_executor()
+    futures = [executor.submit(_one, i) for i in range(n)]
+    contents = []
+    for future in futures:
+        try:
+            contents.append(future.result())
+        except Exception as e:
+            logger.warning(f"[LLM] Sample request failed: {e}")
+    return contents
+
+
+def call_llm_json_samples(
+    system_prompt: str,
+    user_message: str,
+    output_type: type[T],
+    n: int,
+    **kwargs,
+) -> list[T]:
+    """JSON schema 구조화 출력으로 독립 샘플 n개를 생성하고 검증을 통과한 것만 반환합니다.
+
+    Args:
+        output_type: 응답 스키마 (Pydantic BaseModel)
+        n: 샘플 수
+        **kwargs: call_llm_samples() 인자
+    """
+    contents = call_llm_samples(
+        system_prompt, user_message, n, response_format=json_schema_format(output_type), **kwargs
+    )
+    results = []
+    for idx, content in enumerate(contents):
+        try:
+            results.append(output_type.model_validate_json(content))
+        except ValidationError as e:
+            logger.warning(f"[LLM] {output_type.__name__} sample {idx+1} invalid: {e}")
+    return results
+
+
+def call_gpt_json_samples(
+    system_prompt: str, user_message: str, output_type: type[T], n: int, **kwargs
+) -> list[T]:
+    """GPT 모델 구조화 출력 n샘플 호출"""
+    model = os.environ.get("GPT_MODEL", "gpt-4o")
+    return call_llm_json_samples(system_prompt, user_message, output_type, n, model=model, **kwargs)
+
+
+def call_gpt_json(system_prompt: str, user_message: str, output_type: type[T], **kwargs) -> T:
+    """GPT 모델 구조화 출력 호출 (call_gpt()의 JSON schema 버전)"""
+    model = os.environ.get("GPT_MODEL", "gpt-4o")
+    return call_llm_json(system_prompt, user_message, output_type, model=model, **kwargs)
+
+
 # 하위 호환성을 위한 alias
 def call_gpt4o(system_prompt: str, user_message: str, **kwargs) -> str:
     """call_gpt()의 alias (하위 호환성)"""
@@ -0,0 +1,123 @@
+"""LLM 응답 캐시 (content-addressed)
+
+동일한 모델·프롬프트·생성 파라미터 요청은 같은 응답을 재사용합니다.
+같은 주제를 재실행하거나 회귀 테스트를 돌릴 때 수 분 걸리던 호출이 즉시 반환됩니다.
+
+기본값은 비활성화이며, 환경 변수로 켭니다:
+    LLM_CACHE_BACKEND=memory | sqlite | redis
+    LLM_CACHE_TTL=86400            # 초 (0이면 만료 없음)
+    LLM_CACHE_MAX_ENTRIES=1000
+    LLM_CACHE_PATH=llm_cache.db    # sqlite 전용
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+
+from utils.cache import CacheBackend, create_cache_backend
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(payload: dict, cache_tag: str = "") -> str:
+    """요청 페이로드(모델, 메시지, 생성 파라미터)의 SHA-256 해시
+
+    Args:
+        payload: OpenAI Chat Completion 요청 본문
+        cache_tag: 같은 요청을 서로 다른 항목으로 저장해야 할 때의 구분자
+            (예: 독립 시행 trial 번호)
+    """
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    digest = hashlib.sha256()
+    digest.update(canonical.encode("utf-8"))
+    if cache_tag:
+        digest.update(b"\x00")
+        digest.update(cache_tag.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class LLMResponseCache:
+    """LLM 응답 캐시 + hit/miss 카운터"""
+
+    def __init__(self, backend: CacheBackend, ttl: float | None = None):
+        self.backend = backend
+        self.ttl = ttl or None
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        try:
+            value = self.backend.get(key)
+        except Exception as e:
+            # 캐시 장애가 LLM 호출을 막지 않도록 miss로 처리
+            logger.warning(f"[LLM CACHE] get failed: {e}")
+            value = None
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        try:
+            self.backend.set(key, value, ttl=self.ttl)
+        except Exception as e:
+            logger.warning(f"[LLM CACHE] set failed: {e}")
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "backend": type(self.backend).__name__,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0,
+                "entries": len(self.backend),
+                "ttl": self.ttl,
+            }
+
+
+_llm_cache: LLMResponseCache | None = None
+_llm_cache_initialized = False
+_init_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMResponseCache | None:
+    """환경 변수 설정에 따른 LLM 응답 캐시 싱글톤 (비활성화 시 None)"""
+    global _llm_cache, _llm_cache_initialized
+    if _llm_cache_initialized:
+        return _llm_cache
+
+    with _init_lock:
+        if _llm_cache_initialized:
+            return _llm_cache
+
+        kind = os.environ.get("LLM_CACHE_BACKEND", "").strip()
+        if kind and kind.lower() not in ("none", "off", "false", "0"):
+            try:
+                backend = create_cache_backend(
+                    kind,
+                    namespace="llm",
+                    max_entries=int(os.environ.get("LLM_CACHE_MAX_ENTRIES", "1000")),
+                    path=os.environ.get("LLM_CACHE_PATH", "llm_cache.db"),
+                )
+                _llm_cache = LLMResponseCache(
+                    backend, ttl=float(os.environ.get("LLM_CACHE_TTL", "86400"))
+                )
+                logger.info(f"[LLM CACHE] enabled: backend={kind}")
+            except Exception as e:
+                logger.warning(f"[LLM CACHE] disabled, backend init failed ({kind}): {e}")
+                _llm_cache = None
+        _llm_cache_initialized = True
+        return _llm_cache
+
+
+def set_llm_cache(cache: LLMResponseCache | None) -> None:
+    """LLM 응답 캐시 교체 (테스트 및 런타임 설정용)"""
+    global _llm_cache, _llm_cache_initialized
+    with _init_lock:
+        _llm_cache = cache
+        _llm_cache_initialized = True
@@ -0,0 +1,188 @@
+"""PI 기획 단계(팀 구성) 캐시
+
+같은 주제·제약 조건으로 다시 실행하면 통계적 팀 선별(시행, 클러스터링, 최종 선정)과
+자기소개 생성을 건너뛰고 저장된 결과를 사용합니다.
+
+키는 정규화한 topic + constraints의 SHA-256입니다 (유니코드 NFKC, 소문자,
+공백/문장부호 정리). PLANNING_CACHE_SIMILARITY를 지정하면 정확히 일치하는 항목이
+없을 때 임베딩 코사인 유사도가 그 이상인 가장 가까운 항목을 사용합니다.
+
+기본값은 비활성화이며, 환경 변수로 켭니다:
+    PLANNING_CACHE_BACKEND=memory | sqlite | redis
+    PLANNING_CACHE_TTL=604800          # 초 (0이면 만료 없음)
+    PLANNING_CACHE_MAX_ENTRIES=200
+    PLANNING_CACHE_PATH=planning_cache.db
+    PLANNING_CACHE_SIMILARITY=0.95     # 비우면 정확 일치만
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+import unicodedata
+
+from utils.cache import CacheBackend, create_cache_backend
+
+logger = logging.getLogger(__name__)
+
+# 유사도 조회용 항목 목록을 저장하는 예약 키
+_INDEX_KEY = "__index__"
+
+
+def normalize_planning_text(topic: str, constraints: str = "") -> str:
+    """주제·제약 조건 정규화 (표기 차이만 있는 요청을 같은 키로)"""
+    text = f"{topic}\n{constraints}"
+    text = unicodedata.normalize("NFKC", text).lower()
+    text = re.sub(r"[^\w\s]", " ", text)
+    return " ".join(text.split())
+
+
+def make_planning_key(topic: str, constraints: str = "") -> str:
+    return hashlib.sha256(normalize_planning_text(topic, constraints).encode("utf-8")).hexdigest()
+
+
+class PlanningCache:
+    """팀 구성 결과 캐시 + hit/miss 카운터"""
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        ttl: float | None = None,
+        similarity_threshold: float | None = None,
+        max_entries: int = 200,
+    ):
+        self.backend = backend
+        self.ttl = ttl or None
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        self.hits = 0
+        self.similar_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _load_index(self) -> list[dict]:
+        raw = self.backend.get(_INDEX_KEY)
+        return json.loads(raw) if raw else []
+
+    def _find_similar(self, text: str) -> str | None:
+        """유사도 임계값 이상인 가장 가까운 항목의 키"""
+        index = self._load_index()
+        if not index:
+            return None
+
+        # Lazy import: 유사도 조회를 켠 경우에만 numpy/임베딩 로드
+        import numpy as np
+
+        from utils.embeddings import get_embedding_client
+
+        vectors = get_embedding_client().embed([text] + [entry["text"] for entry in index])
+        norms = np.linalg.norm(vectors, axis=1)
+        norms[norms == 0] = 1.0
+        unit = vectors / norms[:, None]
+        scores = unit[1:] @ unit[0]
+        best = int(np.argmax(scores))
+        if scores[best] >= self.similarity_threshold:
+            logger.info(f"[PLANNING CACHE] near-duplicate match (cosine={scores[best]:.3f})")
+            return index[best]["key"]
+        return None
+
+    def get(self, topic: str, constraints: str = "") -> dict | None:
+        """캐시된 기획 결과 ({team, team_selection_data, specialist_introductions, ...})"""
+        value = None
+        similar = False
+        try:
+            value = self.backend.get(make_planning_key(topic, constraints))
+            if value is None and self.similarity_threshold:
+                key = self._find_similar(normalize_planning_text(topic, constraints))
+                if key:
+                    value = self.backend.get(key)
+                    similar = value is not None
+        except Exception as e:
+            # 캐시 장애가 기획 단계를 막지 않도록 miss로 처리
+            logger.warning(f"[PLANNING CACHE] get failed: {e}")
+            value = None
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.similar_hits += int(similar)
+        return json.loads(value) if value is not None else None
+
+    def set(self, topic: str, constraints: str, planning: dict) -> None:
+        key = make_planning_key(topic, constraints)
+        entry = {**planning, "topic": topic, "constraints": constraints, "cached_at": time.time()}
+        try:
+            self.backend.set(key, json.dumps(entry, ensure_ascii=False), ttl=self.ttl)
+            if self.similarity_threshold:
+                with self._lock:
+                    index = [e for e in self._load_index() if e["key"] != key]
+                    index.append({"key": key, "text": normalize_planning_text(topic, constraints)})
+                    self.backend.set(_INDEX_KEY, json.dumps(index[-self.max_entries:], ensure_ascii=False))
+        except Exception as e:
+            logger.warning(f"[PLANNING CACHE] set failed: {e}")
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "backend": type(self.backend).__name__,
+                "hits": self.hits,
+                "similar_hits": self.similar_hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0,
+                "ttl": self.ttl,
+                "similarity_threshold": self.similarity_threshold,
+            }
+
+
+_planning_cache: PlanningCache | None = None
+_planning_cache_initialized = False
+_init_lock = threading.Lock()
+
+
+def get_planning_cache() -> PlanningCache | None:
+    """환경 변수 설정에 따른 기획 캐시 싱글톤 (비활성화 시 None)"""
+    global _planning_cache, _planning_cache_initialized
+    if _planning_cache_initialized:
+        return _planning_cache
+
+    with _init_lock:
+        if _planning_cache_initialized:
+            return _planning_cache
+
+        kind = os.environ.get("PLANNING_CACHE_BACKEND", "").strip()
+        if kind and kind.lower() not in ("none", "off", "false", "0"):
+            try:
+                max_entries = int(os.environ.get("PLANNING_CACHE_MAX_ENTRIES", "200"))
+                backend = create_cache_backend(
+                    kind,
+                    namespace="planning",
+                    # 유사도 조회용 인덱스 항목 1개 여유
+                    max_entries=max_entries + 1,
+                    path=os.environ.get("PLANNING_CACHE_PATH", "planning_cache.db"),
+                )
+                similarity = os.environ.get("PLANNING_CACHE_SIMILARITY", "").strip()
+                _planning_cache = PlanningCache(
+                    backend,
+                    ttl=float(os.environ.get("PLANNING_CACHE_TTL", "604800")),
+                    similarity_threshold=float(similarity) if similarity else None,
+                    max_entries=max_entries,
+                )
+                logger.info(f"[PLANNING CACHE] enabled: backend={kind}")
+            except Exception as e:
+                logger.warning(f"[PLANNING CACHE] disabled, backend init failed ({kind}): {e}")
+                _planning_cache = None
+        _planning_cache_initialized = True
+        return _planning_cache
+
+
+def set_planning_cache(cache: PlanningCache | None) -> None:
+    """기획 캐시 교체 (테스트 및 런타임 설정용)"""
+    global _planning_cache, _planning_cache_initialized
+    with _init_lock:
+        _planning_cache = cache
+        _planning_cache_initialized = True
@@ -0,0 +1,84 @@
+"""실행(run) 단위 백그라운드 선행 작업 (prefetch)
+
+결과가 연구 주제에만 의존하는 검색처럼, 나중 노드가 필요로 할 작업을 미리 시작해
+Future를 run_id별로 보관합니다. LangGraph 상태에는 직렬화 가능한 run_id만 두고
+Future는 이 모듈의 레지스트리에 둡니다. 작업은 공용 실행기(utils.executor)에서
+낮은 우선순위(BACKGROUND)로 실행됩니다.
+
+같은 (run_id, key)로 다시 prefetch하면 기존 Future를 재사용하므로,
+같은 검색어를 쓰는 여러 노드가 한 번의 검색 결과를 공유합니다.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable
+
+from utils.executor import Priority, get_agent_executor
+
+logger = logging.getLogger(__name__)
+
+# 정리되지 않은 실행(중단된 요청 등)의 결과를 보관할 최대 시간 (초)
+PREFETCH_TTL_SECONDS = 3600
+
+_runs: dict[str, dict[str, Future]] = {}
+_run_started: dict[str, float] = {}
+_lock = threading.Lock()
+
+
+def _prune_expired() -> None:
+    """TTL이 지난 실행의 Future 제거 (_lock 보유 상태에서 호출)"""
+    now = time.time()
+    for run_id in [r for r, started in _run_started.items() if now - started > PREFETCH_TTL_SECONDS]:
+        for future in _runs.pop(run_id, {}).values():
+            future.cancel()
+        _run_started.pop(run_id, None)
+
+
+def prefetch(run_id: str, key: str, fn: Callable[..., Any], *args, **kwargs) -> Future | None:
+    """fn(*args, **kwargs)를 백그라운드에서 시작하고 Future 보관
+
+    Returns:
+        Future. run_id가 없으면(그래프 밖 직접 호출 등) 실행하지 않고 None.
+    """
+    if not run_id:
+        return None
+    with _lock:
+        _prune_expired()
+        futures = _runs.setdefault(run_id, {})
+        _run_started.setdefault(run_id, time.time())
+        if key not in futures:
+            futures[key] = get_agent_executor().submit(
+                fn, *args, priority=Priority.BACKGROUND, run_id=run_id, **kwargs
+            )
+            print(f"[PREFETCH] started {key} (run={run_id[:8]})")
+        return futures[key]
+
+
+def resolve_prefetched(run_id: str, key: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """prefetch된 결과를 반환하고, 없거나 실패했으면 fn을 직접 호출
+
+    prefetch가 아직 진행 중이면 완료를 기다립니다 (직접 호출보다 먼저 시작했으므로 더 빠름).
+    직접 호출에서 발생한 예외는 그대로 전파됩니다.
+    """
+    with _lock:
+        future = _runs.get(run_id, {}).get(key) if run_id else None
+
+    if future is not None:
+        try:
+            was_done = future.done()
+            result = future.result()
+            print(f"[PREFETCH] {'hit' if was_done else 'joined in-flight'} {key}")
+            return result
+        except Exception as e:
+            logger.warning(f"[PREFETCH] {key} failed in background, retrying directly: {e}")
+
+    return fn(*args, **kwargs)
+
+
+def discard_run(run_id: str) -> None:
+    """실행 종료 시 보관한 Future 정리 (진행 중인 작업은 취소 시도)"""
+    with _lock:
+        for future in _runs.pop(run_id, {}).values():
+            future.cancel()
+        _run_started.pop(run_id, None)
@@ -0,0 +1,463 @@
+"""OpenAI 요청 사전 속도 제한 (Token Bucket)
+
+429 응답을 받은 뒤 재시도하는 대신, 요청 전에 RPM(분당 요청 수)과
+TPM(분당 토큰 수) 예산을 확인하여 필요한 만큼 대기시킵니다.
+
+- 예약 방식: 요청마다 도착 순서대로 예산을 선차감하므로 대기 순서가 공정(FIFO)합니다.
+- 응답 헤더(x-ratelimit-*)로 실제 한도와 잔여량을 보정합니다.
+- 대기 시간(queue wait)을 지표로 집계합니다.
+
+여러 uvicorn/Celery 워커가 같은 OpenAI·Tavily 한도를 나눠 쓰는 운영 환경에서는
+RATE_LIMIT_BACKEND=redis로 Redis 공유 GCRA 예약(RedisRateLimiter)을 사용합니다.
+Redis에 연결할 수 없으면 프로세스 로컬 Token Bucket으로 자동 대체됩니다.
+
+환경 변수:
+    RATE_LIMIT_BACKEND=local          # local | redis (redis는 REDIS_URL 사용)
+    RATE_LIMIT_WINDOW_SECONDS=10      # redis 공유 예산의 버스트 허용 구간 (이 시간만큼의 한도를 즉시 사용 가능)
+    RATE_LIMIT_HEADROOM=0.95          # 조직 한도 대비 사용 비율
+    OPENAI_RATE_LIMIT_ENABLED=true
+    OPENAI_RPM_LIMIT=500
+    OPENAI_TPM_LIMIT=200000
+    TAVILY_RATE_LIMIT_ENABLED=true
+    TAVILY_RPM_LIMIT=100
+"""
+import asyncio
+import logging
+import os
+import re
+import threading
+import time
+
+try:
+    from redis.exceptions import WatchError
+except ImportError:  # redis 미설치 (RATE_LIMIT_BACKEND=local에서는 사용되지 않음)
+    class WatchError(Exception):
+        """redis.exceptions.WatchError 대체 (WATCH한 키가 다른 클라이언트에 의해 변경됨)"""
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_tokens(text: str) -> int:
+    """프롬프트 토큰 수 대략 추정 (tokenizer 없이)
+
+    영문은 약 4자당 1토큰, 한글 등 비 ASCII 문자는 글자당 약 0.7토큰으로 계산합니다.
+    """
+    ascii_chars = sum(1 for c in text if ord(c) < 128)
+    other_chars = len(text) - ascii_chars
+    return int(ascii_chars / 4 + other_chars * 0.7) + 1
+
+
+def parse_reset(value: str) -> float | None:
+    """x-ratelimit-reset-* 헤더 값("1s", "6m0s", "20ms")을 초 단위로 변환"""
+    if not value:
+        return None
+    total = 0.0
+    matched = False
+    for amount, unit in re.findall(r"([\d.]+)(ms|h|m|s)", value):
+        matched = True
+        amount = float(amount)
+        if unit == "ms":
+            total += amount / 1000
+        elif unit == "s":
+            total += amount
+        elif unit == "m":
+            total += amount * 60
+        elif unit == "h":
+            total += amount * 3600
+    return total if matched else None
+
+
+class TokenBucketRateLimiter:
+    """RPM + TPM 이중 Token Bucket (thread-safe, sync/async 공용)
+
+    버킷 잔량은 음수까지 내려갈 수 있으며, 음수 구간은 "예약된 대기열"을 의미합니다.
+    각 호출자는 잔량이 0으로 회복되는 시점까지 대기하므로 도착 순서가 보장됩니다.
+    """
+
+    def __init__(self, rpm: int, tpm: int, name: str = "openai"):
+        self.name = name
+        self.rpm = float(rpm)
+        self.tpm = float(tpm)
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+        # 지표
+        self.total_requests = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.waiting = 0
+        self.calibrations = 0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        if elapsed > 0:
+            self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60.0)
+            self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60.0)
+            self._updated_at = now
+
+    def reserve(self, tokens: int) -> float:
+        """요청 1건과 토큰 예산을 예약하고, 실행 가능 시점까지의 대기 시간(초)을 반환"""
+        # 한 요청이 버킷 용량보다 크면 영원히 대기하므로 용량으로 제한
+        tokens = min(float(tokens), self.tpm)
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._requests -= 1
+            self._tokens -= tokens
+            delay = max(
+                0.0,
+                -self._requests * 60.0 / self.rpm,
+                -self._tokens * 60.0 / self.tpm,
+            )
+            self.total_requests += 1
+            self.total_wait += delay
+            self.max_wait = max(self.max_wait, delay)
+            return delay
+
+    def acquire(self, tokens: int) -> float:
+        """예산이 확보될 때까지 블로킹 대기 (반환값: 대기한 시간)"""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            with self._lock:
+                self.waiting += 1
+            logger.info(f"[RATE LIMIT] {self.name}: queued {delay:.2f}s (tokens={tokens})")
+            try:
+                time.sleep(delay)
+            finally:
+                with self._lock:
+                    self.waiting -= 1
+        return delay
+
+    async def acquire_async(self, tokens: int) -> float:
+        """acquire()의 asyncio 버전 (이벤트 루프를 막지 않음)"""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            with self._lock:
+                self.waiting += 1
+            logger.info(f"[RATE LIMIT] {self.name}: queued {delay:.2f}s (tokens={tokens})")
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                with self._lock:
+                    self.waiting -= 1
+        return delay
+
+    def backoff(self, seconds: float) -> None:
+        """429 수신 시 모든 호출자가 함께 물러나도록 버킷을 비웁니다."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._requests = min(self._requests, -seconds * self.rpm / 60.0)
+
+    def update_from_headers(self, headers) -> None:
+        """응답 헤더(x-ratelimit-*)로 한도와 잔여량을 보정합니다."""
+        def _num(key: str) -> float | None:
+            value = headers.get(key)
+            try:
+                return float(value) if value is not None else None
+            except (TypeError, ValueError):
+                return None
+
+        limit_requests = _num("x-ratelimit-limit-requests")
+        limit_tokens = _num("x-ratelimit-limit-tokens")
+        remaining_requests = _num("x-ratelimit-remaining-requests")
+        remaining_tokens = _num("x-ratelimit-remaining-tokens")
+        if all(v is None for v in (limit_requests, limit_tokens, remaining_requests, remaining_tokens)):
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if limit_requests:
+                self.rpm = limit_requests
+            if limit_tokens:
+                self.tpm = limit_tokens
+            # 서버 잔여량이 로컬 추정보다 적으면 서버 값을 따름 (다른 프로세스의 사용분 반영)
+            if remaining_requests is not None:
+                self._requests = min(self._requests, remaining_requests)
+            if remaining_tokens is not None:
+                self._tokens = min(self._tokens, remaining_tokens)
+            self.calibrations += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._refill(time.monotonic())
+            return {
+                "name": self.name,
+                "backend": "local",
+                "rpm_limit": self.rpm,
+                "tpm_limit": self.tpm,
+                "available_requests": round(self._requests, 2),
+                "available_tokens": round(self._tokens, 1),
+                "total_requests": self.total_requests,
+                "waiting": self.waiting,
+                "total_queue_wait_s": round(self.total_wait, 3),
+                "avg_queue_wait_s": round(self.total_wait / self.total_requests, 3) if self.total_requests else 0.0,
+                "max_queue_wait_s": round(self.max_wait, 3),
+                "calibrations": self.calibrations,
+            }
+
+
+def _hash_field(mapping: dict, name: str):
+    """HGETALL 결과에서 필드 조회 (redis-py는 bytes 키를 반환)"""
+    return mapping.get(name.encode(), mapping.get(name))
+
+
+class RedisRateLimiter:
+    """Redis 공유 GCRA 기반 분산 속도 제한기
+
+    RPM/TPM 각각의 "이론적 도착 시각(TAT)"을 Redis에 두고, 요청마다 비용(요청 1건, 토큰 수)만큼
+    TAT를 뒤로 미루는 GCRA(Generic Cell Rate Algorithm)로 예산을 예약합니다. TAT가 현재보다
+    window_seconds(버스트 허용 구간) 이상 앞서 있으면 그 차이만큼 대기합니다. 로컬 Token Bucket의
+    음수 잔량(예약된 대기열)과 같은 방식이므로 다음이 보장됩니다.
+
+    - 예약은 WATCH/MULTI 트랜잭션으로 한 건씩 커밋되므로 모든 프로세스에 걸쳐 도착 순서(FIFO)입니다.
+    - 큰 요청도 토큰 수를 깎지 않고 한 번에 예약되며, 뒤에 도착한 작은 요청은 그 뒤에 줄을 섭니다.
+
+    보정된 한도와 429 backoff도 Redis로 공유되므로 워커 수와 무관하게 전체 처리량이
+    조직 한도 바로 아래로 유지됩니다. Redis 명령이 실패하면 fallback(프로세스 로컬 Token Bucket)으로 대체합니다.
+    """
+
+    def __init__(
+        self,
+        client,
+        name: str,
+        rpm: int,
+        tpm: int,
+        window_seconds: float = 10.0,
+        headroom: float = 0.95,
+        fallback: TokenBucketRateLimiter | None = None,
+    ):
+        self.client = client
+        self.name = name
+        self.rpm = float(rpm)
+        self.tpm = float(tpm)
+        self.window_seconds = window_seconds
+        self.headroom = headroom
+        self.fallback = fallback or TokenBucketRateLimiter(rpm, tpm, name=name)
+        self._prefix = f"vlab:ratelimit:{name}"
+        self._lock = threading.Lock()
+
+        # 지표 (프로세스 로컬)
+        self.total_requests = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.waiting = 0
+        self.redis_errors = 0
+        self.reserve_conflicts = 0
+
+    def _shared_limits(self) -> tuple[float, float]:
+        """다른 프로세스가 응답 헤더로 보정한 한도를 우선 사용"""
+        limits = self.client.hgetall(f"{self._prefix}:limits") or {}
+        rpm = _hash_field(limits, "rpm")
+        tpm = _hash_field(limits, "tpm")
+        return (float(rpm) if rpm else self.rpm, float(tpm) if tpm else self.tpm)
+
+    def reserve(self, tokens: int) -> float:
+        """요청 1건과 토큰 예산을 공유 대기열에 예약하고, 실행 가능 시점까지의 대기 시간(초)을 반환"""
+        key = f"{self._prefix}:gcra"
+        rpm, tpm = self._shared_limits()
+        request_interval = 60.0 / max(rpm * self.headroom, 1e-9)
+        token_interval = 60.0 / max(tpm * self.headroom, 1e-9)
+
+        with self.client.pipeline() as pipe:
+            while True:
+                try:
+                    # WATCH 이후의 명령은 즉시 실행, MULTI 이후는 EXEC 시 원자적으로 커밋
+                    pipe.watch(key)
+                    now = time.time()
+                    backoff_until = float(self.client.get(f"{self._prefix}:backoff_until") or 0.0)
+                    state = pipe.hgetall(key) or {}
+                    start = max(now, backoff_until)
+                    requests_tat = max(float(_hash_field(state, "requests_tat") or 0.0), start) + request_interval
+                    tokens_tat = max(float(_hash_field(state, "tokens_tat") or 0.0), start) + max(tokens, 0) * token_interval
+
+                    pipe.multi()
+                    pipe.hset(key, mapping={"requests_tat": requests_tat, "tokens_tat": tokens_tat})
+                    pipe.expire(key, int(max(requests_tat, tokens_tat) - now + self.window_seconds) + 1)
+                    pipe.execute()
+                    break
+                except WatchError:
+                    # 다른 프로세스가 먼저 예약함: 갱신된 TAT 뒤에 다시 예약
+                    with self._lock:
+                        self.reserve_conflicts += 1
+
+        return max(
+            0.0,
+            backoff_until - now,
+            requests_tat - self.window_seconds - now,
+            tokens_tat - self.window_seconds - now,
+        )
+
+    def _record(self, waited: float) -> None:
+        with self._lock:
+            self.total_requests += 1
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+
+    def acquire(self, tokens: int) -> float:
+        """공유 예산을 예약하고 차례가 될 때까지 블로킹 대기 (반환값: 대기한 시간)"""
+        try:
+            delay = self.reserve(tokens)
+        except Exception as e:
+            with self._lock:
+                self.redis_errors += 1
+            logger.warning(f"[RATE LIMIT] {self.name}: redis unavailable, using local limiter ({e})")
+            delay = self.fallback.acquire(tokens)
+            self._record(delay)
+            return delay
+
+        if delay > 0:
+            with self._lock:
+                self.waiting += 1
+            logger.info(f"[RATE LIMIT] {self.name}: queued {delay:.2f}s (tokens={tokens})")
+            try:
+                time.sleep(delay)
+            finally:
+                with self._lock:
+                    self.waiting -= 1
+        self._record(delay)
+        return delay
+
+    async def acquire_async(self, tokens: int) -> float:
+        """acquire()의 asyncio 버전 (Redis 예약은 스레드에서 수행)"""
+        try:
+            delay = await asyncio.to_thread(self.reserve, tokens)
+        except Exception as e:
+            with self._lock:
+                self.redis_errors += 1
+            logger.warning(f"[RATE LIMIT] {self.name}: redis unavailable, using local limiter ({e})")
+            delay = await self.fallback.acquire_async(tokens)
+            self._record(delay)
+            return delay
+
+        if delay > 0:
+            with self._lock:
+                self.waiting += 1
+            logger.info(f"[RATE LIMIT] {self.name}: queued {delay:.2f}s (tokens={tokens})")
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                with self._lock:
+                    self.waiting -= 1
+        self._record(delay)
+        return delay
+
+    def backoff(self, seconds: float) -> None:
+        """429 수신 시 모든 프로세스가 함께 물러나도록 backoff 시각을 공유"""
+        try:
+            until = time.time() + seconds
+            self.client.set(f"{self._prefix}:backoff_until", str(until), px=int(seconds * 1000) + 1)
+        except Exception as e:
+            logger.warning(f"[RATE LIMIT] {self.name}: redis backoff failed ({e})")
+            self.fallback.backoff(seconds)
+
+    def update_from_headers(self, headers) -> None:
+        """응답 헤더의 한도 값을 Redis에 기록하여 모든 프로세스가 공유"""
+        self.fallback.update_from_headers(headers)
+        limits = {}
+        for header, field_name in (("x-ratelimit-limit-requests", "rpm"), ("x-ratelimit-limit-tokens", "tpm")):
+            try:
+                value = headers.get(header)
+                if value is not None:
+                    limits[field_name] = float(value)
+            except (TypeError, ValueError):
+                continue
+        if not limits:
+            return
+        try:
+            self.client.hset(f"{self._prefix}:limits", mapping=limits)
+        except Exception as e:
+            logger.warning(f"[RATE LIMIT] {self.name}: redis calibration failed ({e})")
+
+    def stats(self) -> dict:
+        try:
+            rpm, tpm = self._shared_limits()
+        except Exception:
+            rpm, tpm = self.rpm, self.tpm
+        with self._lock:
+            return {
+                "name": self.name,
+                "backend": "redis",
+                "rpm_limit": rpm,
+                "tpm_limit": tpm,
+                "window_seconds": self.window_seconds,
+                "headroom": self.headroom,
+                "total_requests": self.total_requests,
+                "waiting": self.waiting,
+                "total_queue_wait_s": round(self.total_wait, 3),
+                "avg_queue_wait_s": round(self.total_wait / self.total_requests, 3) if self.total_requests else 0.0,
+                "max_queue_wait_s": round(self.max_wait, 3),
+                "redis_errors": self.redis_errors,
+                "reserve_conflicts": self.reserve_conflicts,
+            }
+
+
+_limiters: dict[str, TokenBucketRateLimiter | RedisRateLimiter | None] = {}
+_limiters_lock = threading.Lock()
+
+# 이름별 기본 한도: (활성화 환경 변수, RPM 환경 변수, 기본 RPM, TPM 환경 변수, 기본 TPM)
+_LIMIT_DEFAULTS = {
+    "openai": ("OPENAI_RATE_LIMIT_ENABLED", "OPENAI_RPM_LIMIT", "500", "OPENAI_TPM_LIMIT", "200000"),
+    # Tavily는 요청 수만 제한 (토큰 예산은 사실상 무제한)
+    "tavily": ("TAVILY_RATE_LIMIT_ENABLED", "TAVILY_RPM_LIMIT", "100", None, "1000000000"),
+}
+
+
+def _env_flag(key: str, default: str = "true") -> bool:
+    return os.environ.get(key, default).strip().lower() not in ("false", "0", "no", "off")
+
+
+def _create_limiter(name: str) -> TokenBucketRateLimiter | RedisRateLimiter | None:
+    if name not in _LIMIT_DEFAULTS:
+        return None
+    enabled_key, rpm_key, rpm_default, tpm_key, tpm_default = _LIMIT_DEFAULTS[name]
+    if not _env_flag(enabled_key):
+        return None
+
+    rpm = int(os.environ.get(rpm_key, rpm_default))
+    tpm = int(os.environ.get(tpm_key, tpm_default)) if tpm_key else int(tpm_default)
+    local = TokenBucketRateLimiter(rpm=rpm, tpm=tpm, name=name)
+
+    if os.environ.get("RATE_LIMIT_BACKEND", "local").strip().lower() != "redis":
+        return local
+
+    try:
+        from utils.cache import get_redis_client
+
+        client = get_redis_client()
+        client.ping()
+    except Exception as e:
+        logger.warning(f"[RATE LIMIT] {name}: redis backend unavailable, using local limiter ({e})")
+        return local
+
+    logger.info(f"[RATE LIMIT] {name}: using redis shared limiter")
+    return RedisRateLimiter(
+        client,
+        name=name,
+        rpm=rpm,
+        tpm=tpm,
+        window_seconds=float(os.environ.get("RATE_LIMIT_WINDOW_SECONDS", "10")),
+        headroom=float(os.environ.get("RATE_LIMIT_HEADROOM", "0.95")),
+        fallback=local,
+    )
+
+
+def get_rate_limiter(name: str = "openai") -> TokenBucketRateLimiter | RedisRateLimiter | None:
+    """프로세스 전역 속도 제한기 (비활성화 시 None)
+
+    Args:
+        name: "openai" | "tavily"
+    """
+    with _limiters_lock:
+        if name not in _limiters:
+            _limiters[name] = _create_limiter(name)
+        return _limiters[name]
+
+
+def set_rate_limiter(name: str, limiter: TokenBucketRateLimiter | RedisRateLimiter | None) -> None:
+    """속도 제한기 교체 (테스트 및 런타임 설정용)"""
+    with _limiters_lock:
+        _limiters[name] = limiter
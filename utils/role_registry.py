@@ -0,0 +1,144 @@
+"""역할명 정규화 사전 (실행 간 유지)
+
+통계적 팀 선별에서 얻은 {역할명: 대표 역할명} 매핑을 SQLite에 저장합니다.
+다음 실행에서는 이미 본 역할명을 바로 대표명으로 바꾸고, 처음 보는 역할명만
+클러스터링합니다.
+
+    ROLE_REGISTRY_PATH=role_registry.db   # 비우거나 none이면 비활성화
+"""
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class RoleRegistry:
+    """역할명 → 대표 역할명 SQLite 저장소 (thread-safe)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS role_aliases ("
+                " alias TEXT PRIMARY KEY,"
+                " canonical TEXT NOT NULL,"
+                " updated_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_role_aliases_canonical ON role_aliases (canonical)"
+            )
+            self._conn.commit()
+
+    def lookup(self, roles: list[str]) -> dict[str, str]:
+        """등록된 역할명만 {역할명: 대표 역할명}으로 반환"""
+        if not roles:
+            return {}
+        placeholders = ",".join("?" for _ in roles)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT alias, canonical FROM role_aliases WHERE alias IN ({placeholders})",
+                list(roles),
+            ).fetchall()
+        return dict(rows)
+
+    def canonicals(self) -> list[str]:
+        """등록된 대표 역할명 목록"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT canonical FROM role_aliases ORDER BY canonical"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def add(self, mapping: dict[str, str]) -> None:
+        """{역할명: 대표 역할명} 등록 (대표 역할명 자신도 자기 자신으로 등록)"""
+        if not mapping:
+            return
+        now = time.time()
+        rows = [(alias, canonical, now) for alias, canonical in mapping.items()]
+        rows += [(canonical, canonical, now) for canonical in set(mapping.values()) if canonical not in mapping]
+        with self._lock:
+            # 기존 항목은 유지 (관리자 병합 결과를 덮어쓰지 않음)
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO role_aliases (alias, canonical, updated_at) VALUES (?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+    def merge(self, source: str, target: str) -> int:
+        """대표 역할명 source를 target으로 병합
+
+        source를 대표로 쓰던 모든 역할명이 target을 가리키게 됩니다.
+
+        Returns:
+            int: 변경된 항목 수
+
+        Raises:
+            KeyError: source 또는 target이 등록되지 않은 역할명인 경우
+        """
+        with self._lock:
+            known = dict(self._conn.execute(
+                "SELECT alias, canonical FROM role_aliases WHERE alias IN (?, ?)", (source, target)
+            ).fetchall())
+            for name in (source, target):
+                if name not in known:
+                    raise KeyError(name)
+            # 대표명이 아닌 별칭을 지정한 경우 그 별칭의 대표명 기준으로 병합
+            source_canonical, target_canonical = known[source], known[target]
+            if source_canonical == target_canonical:
+                return 0
+            cursor = self._conn.execute(
+                "UPDATE role_aliases SET canonical = ?, updated_at = ? WHERE canonical = ?",
+                (target_canonical, time.time(), source_canonical),
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def groups(self) -> dict[str, list[str]]:
+        """{대표 역할명: [역할명, ...]} 전체 사전"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT canonical, alias FROM role_aliases ORDER BY canonical, alias"
+            ).fetchall()
+        result: dict[str, list[str]] = {}
+        for canonical, alias in rows:
+            result.setdefault(canonical, []).append(alias)
+        return result
+
+
+_registry: RoleRegistry | None = None
+_registry_initialized = False
+_init_lock = threading.Lock()
+
+
+def get_role_registry() -> RoleRegistry | None:
+    """ROLE_REGISTRY_PATH 설정에 따른 RoleRegistry 싱글톤 (비활성화 시 None)"""
+    global _registry, _registry_initialized
+    if _registry_initialized:
+        return _registry
+
+    with _init_lock:
+        if _registry_initialized:
+            return _registry
+
+        path = os.environ.get("ROLE_REGISTRY_PATH", "role_registry.db").strip()
+        if path and path.lower() not in ("none", "off", "false", "0"):
+            try:
+                _registry = RoleRegistry(path)
+            except Exception as e:
+                logger.warning(f"[ROLE REGISTRY] disabled, open failed ({path}): {e}")
+                _registry = None
+        _registry_initialized = True
+        return _registry
+
+
+def set_role_registry(registry: RoleRegistry | None) -> None:
+    """RoleRegistry 교체 (테스트 및 런타임 설정용)"""
+    global _registry, _registry_initialized
+    with _init_lock:
+        _registry = registry
+        _registry_initialized = True
@@ -0,0 +1,50 @@
+"""LangGraph 노드 → SSE 타임라인 토큰 스트리밍
+
+노드 안에서 LLM 호출의 on_delta 콜백으로 사용할 emitter를 만듭니다.
+emitter는 LangGraph custom 스트림(get_stream_writer)으로 청크를 보내고,
+server.py는 stream_mode=["updates", "custom"]로 받아 "delta" SSE 이벤트로 전달합니다.
+
+노드가 ThreadPoolExecutor로 LLM 호출을 병렬 실행하더라도 동작하도록,
+writer와 실행 컨텍스트를 노드 스레드에서 미리 캡처해 둡니다.
+"""
+import contextvars
+import logging
+import threading
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+def make_delta_emitter(name: str, phase: str, **meta) -> Callable[[str], None] | None:
+    """LLM 응답 조각을 타임라인 delta 이벤트로 보내는 콜백 생성
+
+    반드시 LangGraph 노드 스레드에서 호출해야 합니다 (워커 스레드에서는 writer를 찾지 못함).
+
+    Args:
+        name: 타임라인에 표시할 발화자 이름 (예: 전문가 role, "Critic", "PI")
+        phase: 진행 단계 (예: "specialist", "revision", "critique", "summary", "synthesis")
+        **meta: delta 이벤트에 함께 실을 부가 정보 (예: round)
+
+    Returns:
+        on_delta 콜백. 그래프 실행 중이 아니면(직접 호출, 테스트 등) None.
+    """
+    try:
+        from langgraph.config import get_stream_writer
+
+        writer = get_stream_writer()
+    except Exception:
+        return None
+
+    ctx = contextvars.copy_context()
+    lock = threading.Lock()
+
+    def emit(text: str) -> None:
+        chunk = {"type": "delta", "name": name, "phase": phase, "delta": text, **meta}
+        # 하나의 Context는 동시에 한 스레드에서만 run할 수 있으므로 직렬화
+        with lock:
+            try:
+                ctx.run(writer, chunk)
+            except Exception as e:
+                logger.debug(f"[STREAM] delta emit failed ({name}/{phase}): {e}")
+
+    return emit
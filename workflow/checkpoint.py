@@ -0,0 +1,169 @@
+"""LangGraph 체크포인트 저장소 (중단된 실행 재개)
+
+노드가 끝날 때마다 상태를 run_id(thread_id) 기준으로 저장하므로, 서버가 재시작되거나
+Round 3에서 호출이 실패해도 /api/research/{run_id}/resume으로 마지막으로 완료된 노드
+다음부터 이어서 실행합니다. 실패한 노드만 다시 실행되므로 이전 라운드 호출 비용은 다시 들지 않습니다.
+
+환경 변수:
+    CHECKPOINT_BACKEND=sqlite     # sqlite | postgres | memory | none
+    CHECKPOINT_PATH=checkpoints.db
+    CHECKPOINT_POSTGRES_URL=      # 없으면 DATABASE_URL (postgresql://...) 사용 (init.sql과 같은 DB)
+
+sqlite/postgres 저장소 패키지(langgraph-checkpoint-sqlite, langgraph-checkpoint-postgres)가 없거나
+연결에 실패하면 프로세스 메모리 저장소로 대체됩니다 (서버 재시작 시 재개 불가).
+
+WORKFLOW_MODE=pipelined에서는 meeting 노드 하나가 모든 라운드를 진행하므로, 노드 안에서
+라운드가 끝날 때마다 진행 기록을 같은 저장소의 별도 namespace(MEETING_PROGRESS_NS)에 저장합니다
+(save_meeting_progress). 재개 시 meeting 노드는 저장된 라운드를 건너뛰고 다음 라운드부터 진행합니다.
+"""
+import json
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_BACKEND = "sqlite"
+
+# 체크포인트에서 복원할 상태 타입 (LangGraph msgpack 직렬화 허용 목록)
+CHECKPOINT_STATE_TYPES = [("workflow.state", "CritiqueResult")]
+
+
+def run_config(run_id: str) -> dict:
+    """run_id를 체크포인트 thread_id로 쓰는 그래프 실행 설정"""
+    return {"configurable": {"thread_id": run_id}}
+
+
+def checkpoint_value(checkpointer, run_id: str, key: str):
+    """마지막 체크포인트의 상태 값 하나 (그래프 없이 조회, 없으면 None)"""
+    saved = checkpointer.get_tuple(run_config(run_id))
+    if saved is None:
+        return None
+    return saved.checkpoint.get("channel_values", {}).get(key)
+
+
+# 파이프라인 모드 meeting 노드의 라운드 진행 기록 namespace (그래프 체크포인트와 분리)
+MEETING_PROGRESS_NS = "pipelined-meeting"
+
+
+def _progress_config(run_id: str) -> dict:
+    return {"configurable": {"thread_id": run_id, "checkpoint_ns": MEETING_PROGRESS_NS}}
+
+
+def save_meeting_progress(checkpointer, run_id: str, progress: dict) -> None:
+    """meeting 노드 안에서 완료된 라운드 기록 저장 (progress는 JSON 직렬화 가능해야 함)"""
+    from langgraph.checkpoint.base import empty_checkpoint
+
+    config = _progress_config(run_id)
+    previous = checkpointer.get_tuple(config)
+    version = checkpointer.get_next_version(
+        previous.checkpoint["channel_versions"].get("progress") if previous else None, None
+    )
+    checkpoint = empty_checkpoint()
+    checkpoint["channel_values"] = {"progress": json.dumps(progress, ensure_ascii=False)}
+    checkpoint["channel_versions"] = {"progress": version}
+    checkpointer.put(
+        previous.config if previous else config,
+        checkpoint,
+        {"source": "update", "step": len(progress.get("rounds", {})), "parents": {}},
+        {"progress": version},
+    )
+
+
+def load_meeting_progress(checkpointer, run_id: str) -> dict | None:
+    """save_meeting_progress로 저장한 마지막 라운드 진행 기록 (없으면 None)"""
+    saved = checkpointer.get_tuple(_progress_config(run_id))
+    if saved is None:
+        return None
+    raw = saved.checkpoint.get("channel_values", {}).get("progress")
+    return json.loads(raw) if raw else None
+
+
+def _serializer():
+    from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+    try:
+        return JsonPlusSerializer(allowed_msgpack_modules=CHECKPOINT_STATE_TYPES)
+    except TypeError:
+        # 허용 목록을 지원하지 않는 이전 버전
+        return JsonPlusSerializer()
+
+
+def _memory_saver():
+    from langgraph.checkpoint.memory import MemorySaver
+
+    return MemorySaver(serde=_serializer())
+
+
+def _sqlite_saver():
+    import sqlite3
+
+    from langgraph.checkpoint.sqlite import SqliteSaver
+
+    path = os.environ.get("CHECKPOINT_PATH", "checkpoints.db")
+    # 노드가 스레드 풀(utils.executor)과 SSE 스트림 스레드에서 실행되므로 스레드 검사 해제
+    # (SqliteSaver가 내부 잠금으로 직렬화)
+    conn = sqlite3.connect(path, check_same_thread=False)
+    saver = SqliteSaver(conn, serde=_serializer())
+    saver.setup()
+    return saver
+
+
+def _postgres_saver():
+    from langgraph.checkpoint.postgres import PostgresSaver
+    from psycopg_pool import ConnectionPool
+
+    url = os.environ.get("CHECKPOINT_POSTGRES_URL") or os.environ.get("DATABASE_URL", "")
+    if not url.startswith("postgres"):
+        raise ValueError("CHECKPOINT_POSTGRES_URL or DATABASE_URL must be a postgresql:// URL")
+    pool = ConnectionPool(conninfo=url, kwargs={"autocommit": True, "prepare_threshold": 0}, open=True)
+    saver = PostgresSaver(pool, serde=_serializer())
+    # 체크포인트 테이블 생성/마이그레이션 (init.sql의 애플리케이션 테이블과 같은 DB)
+    saver.setup()
+    return saver
+
+
+_CHECKPOINT_BACKENDS = {
+    "memory": _memory_saver,
+    "sqlite": _sqlite_saver,
+    "postgres": _postgres_saver,
+}
+
+_checkpointer = None
+_checkpointer_initialized = False
+_init_lock = threading.Lock()
+
+
+def get_checkpointer():
+    """환경 변수 설정에 따른 체크포인트 저장소 싱글톤 (비활성화 시 None)"""
+    global _checkpointer, _checkpointer_initialized
+    if _checkpointer_initialized:
+        return _checkpointer
+
+    with _init_lock:
+        if _checkpointer_initialized:
+            return _checkpointer
+
+        kind = os.environ.get("CHECKPOINT_BACKEND", DEFAULT_CHECKPOINT_BACKEND).strip().lower()
+        if kind in ("", "none", "off", "false", "0"):
+            _checkpointer = None
+        elif kind not in _CHECKPOINT_BACKENDS:
+            logger.warning(f"[CHECKPOINT] unknown backend {kind!r}, checkpointing disabled")
+            _checkpointer = None
+        else:
+            try:
+                _checkpointer = _CHECKPOINT_BACKENDS[kind]()
+                logger.info(f"[CHECKPOINT] enabled: backend={kind}")
+            except Exception as e:
+                logger.warning(f"[CHECKPOINT] {kind} backend unavailable, using in-memory checkpoints ({e})")
+                _checkpointer = _memory_saver()
+        _checkpointer_initialized = True
+        return _checkpointer
+
+
+def set_checkpointer(checkpointer) -> None:
+    """체크포인트 저장소 교체 (테스트 및 런타임 설정용)"""
+    global _checkpointer, _checkpointer_initialized
+    with _init_lock:
+        _checkpointer = checkpointer
+        _checkpointer_initialized = True
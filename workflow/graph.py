@@ -9,7 +9,11 @@
 
 모든 에이전트(Specialists + Critic + PI)가 3라운드 팀 회의에 참여하고,
 최종 보고서 작성 시 모든 라운드의 베스트 파트를 선별합니다.
+ROUND_MODE=adaptive이면 점수 수렴에 따라 라운드 수가 달라집니다 (workflow.rounds).
+WORKFLOW_MODE=pipelined이면 라운드 노드 대신 전문가별 트랙으로 진행합니다 (workflow.pipelined).
 """
+import os
+from functools import partial
 from typing import Literal
 
 from langgraph.graph import StateGraph, END
@@ -18,23 +22,44 @@ from workflow.state import AgentState
 from agents.scientist import run_specialists, run_round_revision
 from agents.critic import run_critic
 from agents.pi import run_pi_planning, run_pi_summary, run_final_synthesis
+from workflow.pipelined import run_pipelined_meeting
+from workflow.rounds import DEFAULT_MAX_ROUNDS, decide_next_round, get_round_mode, round_bounds
 
-MAX_ROUNDS = 3
+# 기본 최대 라운드 수 (ROUND_MAX 또는 요청별 max_rounds로 변경 가능, workflow.rounds 참고)
+MAX_ROUNDS = DEFAULT_MAX_ROUNDS
+
+# 실행 방식: lockstep(라운드 노드 그래프) | pipelined(전문가별 트랙)
+DEFAULT_WORKFLOW_MODE = "lockstep"
+
+
+def get_workflow_mode(mode: str | None = None) -> str:
+    """lockstep | pipelined (mode가 없으면 WORKFLOW_MODE 환경 변수)"""
+    mode = (mode or os.environ.get("WORKFLOW_MODE", DEFAULT_WORKFLOW_MODE)).strip().lower()
+    return mode if mode in ("lockstep", "pipelined") else DEFAULT_WORKFLOW_MODE
 
 
 def check_round(state: AgentState) -> Literal["increment_round", "final_synthesis"]:
-    """라운드 확인: 3라운드 미만이면 계속, 아니면 최종 합성"""
+    """라운드 확인: 다음 라운드를 진행할지, 최종 합성으로 넘어갈지 결정
+
+    ROUND_MODE=fixed면 max_rounds까지 진행하고, adaptive면 점수가 목표에 도달하거나
+    정체되면 조기 종료합니다 (workflow.rounds.decide_next_round).
+    """
     current_round = state.get("current_round", 1)
+    min_rounds, max_rounds = round_bounds(state)
 
     print(f"\n{'='*60}")
-    print(f"[CHECK_ROUND] current_round={current_round}, MAX_ROUNDS={MAX_ROUNDS}")
+    print(
+        f"[CHECK_ROUND] current_round={current_round}, mode={get_round_mode()}, "
+        f"min={min_rounds}, max={max_rounds}"
+    )
 
-    if current_round < MAX_ROUNDS:
-        print(f"  -> INCREMENT_ROUND (round {current_round} < {MAX_ROUNDS})")
+    proceed, reason = decide_next_round(state)
+    if proceed:
+        print(f"  -> INCREMENT_ROUND (round {current_round} < {max_rounds}, {reason})")
         print(f"{'='*60}\n")
         return "increment_round"
 
-    print(f"  -> FINAL_SYNTHESIS (round {current_round} >= {MAX_ROUNDS})")
+    print(f"  -> FINAL_SYNTHESIS (round {current_round}, {reason})")
     print(f"{'='*60}\n")
     return "final_synthesis"
 
@@ -53,6 +78,10 @@ def increment_round(state: AgentState) -> dict:
         "critique_scores": critique.scores if critique else {},
         "specialist_feedback": critique.specialist_feedback if critique else {},
         "pi_summary": state.get("draft", ""),
+        # 수렴하여 이번 라운드 수정을 생략한 전문가 (agents.scientist.run_round_revision)
+        "carried_forward": [
+            so.get("role", "") for so in state.get("specialist_outputs", []) if so.get("carried_forward")
+        ],
     }
     meeting_history.append(round_record)
 
@@ -65,7 +94,7 @@ def increment_round(state: AgentState) -> dict:
     }
 
 
-def create_workflow():
+def create_workflow(mode: str | None = None, checkpointer=None):
     """3라운드 팀 회의 LangGraph 워크플로우 생성 및 컴파일
 
     그래프 구조:
@@ -75,11 +104,34 @@ def create_workflow():
                                                                  ↓ (round >= 3)
                                                             final_synthesis -> END
 
+    mode="pipelined"(또는 WORKFLOW_MODE=pipelined)이면:
+        planning -> meeting -> final_synthesis -> END
+
+    checkpointer를 주면 노드가 끝날 때마다 상태를 저장하므로, 실행 시 config의 thread_id(run_id)로
+    중단된 실행을 마지막으로 완료된 노드 다음부터 재개할 수 있습니다 (workflow.checkpoint).
+    pipelined 모드의 meeting 노드는 같은 저장소에 라운드별 진행 기록도 저장합니다.
+    재개할 때는 실행 상태의 workflow_mode로 같은 구조의 그래프를 만들어야 합니다.
+
+    Args:
+        mode: 실행 방식 (None이면 WORKFLOW_MODE 환경 변수, 기본 lockstep)
+        checkpointer: LangGraph 체크포인트 저장소 (None이면 저장하지 않음)
+
     Returns:
         CompiledStateGraph: 컴파일된 LangGraph 워크플로우
     """
+    mode = get_workflow_mode(mode)
     workflow = StateGraph(AgentState)
 
+    if mode == "pipelined":
+        workflow.add_node("planning", run_pi_planning)
+        workflow.add_node("meeting", partial(run_pipelined_meeting, checkpointer=checkpointer))
+        workflow.add_node("final_synthesis", run_final_synthesis)
+        workflow.set_entry_point("planning")
+        workflow.add_edge("planning", "meeting")
+        workflow.add_edge("meeting", "final_synthesis")
+        workflow.add_edge("final_synthesis", END)
+        return workflow.compile(checkpointer=checkpointer)
+
     # 노드 추가
     workflow.add_node("planning", run_pi_planning)
     workflow.add_node("researching", run_specialists)
@@ -106,4 +158,4 @@ def create_workflow():
     workflow.add_edge("round_revision", "critique")
     workflow.add_edge("final_synthesis", END)
 
-    return workflow.compile()
+    return workflow.compile(checkpointer=checkpointer)
@@ -0,0 +1,401 @@
+"""전문가별 파이프라인 팀 회의 (WORKFLOW_MODE=pipelined)
+
+기본 그래프(workflow.graph)는 노드마다 장벽이 있어, 가장 느린 전문가가 끝나야 비평이 시작되고
+비평·PI 요약이 모두 끝나야 수정이 시작됩니다. 이 모드에서는 전문가마다 독립된 트랙
+(라운드 1 분석 → 비평 → 수정 → 비평 → ...)을 진행합니다.
+
+- 비평은 전문가별 개별 평가(agents.critic.critique_specialist)를 트랙 안에서 바로 실행합니다.
+- 라운드의 모든 트랙이 도착하면 전체 비평 요약(merge_critiques)과 PI 요약(run_pi_summary)을
+  백그라운드에서 라운드 순서대로 계산합니다.
+- 수정 단계는 PI 요약을 기다리지 않고 그 시점에 나와 있는 가장 최근 PI 요약을 참고합니다.
+- 트랙은 수렴(REVISION_SKIP_POLICY)하거나 라운드 정책(ROUND_MODE, workflow.rounds)상 종료되면
+  멈추고, 이후 라운드에는 마지막 분석이 그대로 이어집니다 (carried_forward).
+- 체크포인트 저장소가 있으면 라운드가 끝날 때마다 진행 기록을 run_id 기준으로 저장하고
+  (workflow.checkpoint.save_meeting_progress), 재개 시 완료된 라운드는 다시 실행하지 않습니다.
+
+그래프 구조: planning -> meeting -> final_synthesis -> END
+meeting 노드의 반환 상태는 기본 그래프의 마지막 pi_summary 이후 상태와 같은 형태입니다.
+"""
+import contextvars
+import logging
+import os
+import threading
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from agents.critic import critic_web_context, critique_specialist, merge_critiques
+from agents.pi import run_pi_summary
+from agents.schemas import SpecialistVerdict
+from agents.scientist import (
+    DEFAULT_SEARCH_DEADLINE_SECONDS,
+    _SearchPipeline,
+    _extract_sources,
+    _is_converged,
+    _run_single_specialist,
+    run_round_revision,
+)
+from utils.executor import Priority, get_agent_executor
+from utils.streaming import make_delta_emitter
+from workflow.checkpoint import load_meeting_progress, save_meeting_progress
+from workflow.rounds import decide_next_round, round_bounds
+from workflow.state import AgentState, CritiqueResult
+
+logger = logging.getLogger(__name__)
+
+
+def _round_record(round_num: int, outputs: list[dict], critique: CritiqueResult | None, draft: str) -> dict:
+    """meeting_history 라운드 기록 (workflow.graph.increment_round와 같은 형태)"""
+    return {
+        "round": round_num,
+        "specialist_outputs": outputs,
+        "critique_feedback": critique.feedback if critique else "",
+        "critique_scores": critique.scores if critique else {},
+        "specialist_feedback": critique.specialist_feedback if critique else {},
+        "pi_summary": draft,
+        "carried_forward": [so.get("role", "") for so in outputs if so.get("carried_forward")],
+    }
+
+
+class _RoundBoard:
+    """트랙별 라운드 결과 수집 + 라운드가 완료되면 요약 작업 시작
+
+    라운드 r은 모든 트랙이 r을 마쳤거나(land) r 이전에 종료(finish)했을 때 완료됩니다.
+    종료한 트랙은 마지막 결과를 이어받은(carried_forward) 항목으로 채웁니다.
+    요약 작업은 단일 워커에서 라운드 순서대로 실행되므로 이전 라운드 PI 요약을 참고할 수 있습니다.
+    checkpointer가 있으면 라운드 요약이 끝날 때마다 진행 기록을 저장합니다.
+    """
+
+    def __init__(self, state: AgentState, team: list[dict], max_rounds: int, checkpointer=None):
+        self.state = state
+        self.team = team
+        self.max_rounds = max_rounds
+        self.checkpointer = checkpointer if state.get("run_id") else None
+        self.latest_draft = ""
+        self.records: dict[int, dict] = {}
+        self.critiques: dict[int, CritiqueResult | None] = {}
+        self.messages: list[dict] = []
+        # (라운드, 메시지) - 전문가 트랙 메시지 (완료된 라운드분만 진행 기록에 저장)
+        self.track_messages: list[tuple[int, dict]] = []
+        self._landed: dict[int, dict[int, tuple[dict, SpecialistVerdict | None]]] = defaultdict(dict)
+        self._last_round: dict[int, int] = {}
+        # 라운드 정책·수렴으로 멈춘 트랙 (실패로 끝난 트랙은 재개 시 다시 진행)
+        self._stopped: dict[int, int] = {}
+        self._completed = 0
+        self._lock = threading.Lock()
+        self._summaries = ThreadPoolExecutor(max_workers=1, thread_name_prefix="round-summary")
+        self._pending: list[Future] = []
+
+    # ── 라운드 진행 기록 (체크포인트) ─────────────────────────────────────
+
+    def restore(self, progress: dict) -> int:
+        """저장된 진행 기록으로 완료된 라운드를 채움 (반환값: 복원한 마지막 라운드)"""
+        roles = [profile.get("role", "") for profile in self.team]
+        if progress.get("team") != roles:
+            logger.warning("[PIPELINED] saved meeting progress is for a different team, starting over")
+            return 0
+        decisions = progress.get("decisions", {})
+        for key in sorted(progress.get("rounds", {}), key=int):
+            round_num, record = int(key), progress["rounds"][key]
+            self.records[round_num] = record
+            self.critiques[round_num] = (
+                CritiqueResult(
+                    decision=decisions[key],
+                    feedback=record["critique_feedback"],
+                    scores=record["critique_scores"],
+                    specialist_feedback=record["specialist_feedback"],
+                )
+                if decisions.get(key)
+                else None
+            )
+            for index, output in enumerate(record["specialist_outputs"]):
+                self._landed[round_num][index] = (output, self._verdict(record, output.get("role", "")))
+            if record.get("pi_summary"):
+                self.latest_draft = record["pi_summary"]
+            self._completed = round_num
+        self._stopped = {int(i): r for i, r in progress.get("stopped", {}).items() if r <= self._completed}
+        self.messages = list(progress.get("messages", []))
+        self.track_messages = [(r, m) for r, m in progress.get("track_messages", [])]
+        return self._completed
+
+    @staticmethod
+    def _verdict(record: dict, role: str) -> SpecialistVerdict | None:
+        score = record.get("critique_scores", {}).get(role)
+        if score is None:
+            return None
+        return SpecialistVerdict(role=role, score=score, feedback=record.get("specialist_feedback", {}).get(role, ""))
+
+    def resume_point(self, index: int) -> tuple[int, dict, SpecialistVerdict | None, list[dict]] | int | None:
+        """트랙 재개 지점
+
+        Returns:
+            None: 완료된 라운드 없음 (처음부터 진행)
+            int: 이미 멈춘 트랙의 마지막 라운드
+            (라운드, 분석, 비평, 트랙 history): 마지막 완료 라운드의 비평 이후부터 진행
+        """
+        if self._completed == 0:
+            return None
+        if index in self._stopped:
+            return self._stopped[index]
+        role = self.team[index].get("role", "")
+        history = []
+        for round_num in range(1, self._completed):
+            record = self.records[round_num]
+            output, verdict = self._landed[round_num][index]
+            history.append(_round_record(round_num, [output], _track_critique(role, verdict), record["pi_summary"]))
+        output, verdict = self._landed[self._completed][index]
+        output = {k: v for k, v in output.items() if k != "carried_forward"}
+        return self._completed, output, verdict, history
+
+    def stop(self, index: int, round_num: int) -> None:
+        """라운드 정책·수렴으로 트랙 종료 (재개 시 다시 진행하지 않음)"""
+        with self._lock:
+            self._stopped[index] = round_num
+
+    def add_track_messages(self, round_num: int, messages: list[dict]) -> None:
+        with self._lock:
+            self.track_messages.extend((round_num, message) for message in messages)
+
+    def _save(self, round_num: int) -> None:
+        """라운드 round_num까지의 진행 기록 저장 (요약 워커에서 라운드 순서대로 호출)"""
+        if self.checkpointer is None:
+            return
+        with self._lock:
+            progress = {
+                "team": [profile.get("role", "") for profile in self.team],
+                "rounds": {str(r): self.records[r] for r in sorted(self.records)},
+                "decisions": {str(r): c.decision if c else None for r, c in self.critiques.items()},
+                "stopped": {str(i): r for i, r in self._stopped.items() if r <= round_num},
+                "messages": self.messages,
+                "track_messages": [[r, m] for r, m in self.track_messages if r <= round_num],
+            }
+        try:
+            save_meeting_progress(self.checkpointer, self.state["run_id"], progress)
+        except Exception as e:
+            logger.warning(f"[PIPELINED] failed to save progress for round {round_num}: {e}")
+
+    def land(self, round_num: int, index: int, output: dict, verdict: SpecialistVerdict | None) -> None:
+        with self._lock:
+            self._landed[round_num][index] = (output, verdict)
+            self._advance()
+
+    def finish(self, index: int, last_round: int) -> None:
+        with self._lock:
+            self._last_round[index] = last_round
+            self._advance()
+
+    def _latest(self, index: int, before: int) -> tuple[dict, SpecialistVerdict | None]:
+        for r in range(before - 1, 0, -1):
+            if index in self._landed[r]:
+                output, verdict = self._landed[r][index]
+                return {**output, "carried_forward": True}, verdict
+        profile = self.team[index]
+        return {"role": profile.get("role", ""), "focus": profile.get("focus", ""), "output": ""}, None
+
+    def _advance(self) -> None:
+        """완료된 라운드의 요약 작업 시작 (_lock 보유 상태에서 호출)"""
+        while self._completed < self.max_rounds:
+            round_num = self._completed + 1
+            landed = self._landed[round_num]
+            pending = [
+                i for i in range(len(self.team))
+                if i not in landed and self._last_round.get(i, self.max_rounds) >= round_num
+            ]
+            if pending or not landed:
+                return
+            self._completed = round_num
+            entries = [landed[i] if i in landed else self._latest(i, round_num) for i in range(len(self.team))]
+            # 작업을 제출하는 스레드(그래프 실행 컨텍스트)의 컨텍스트에서 요약을 실행해야 스트리밍 가능
+            self._pending.append(
+                self._summaries.submit(contextvars.copy_context().run, self._summarize, round_num, entries)
+            )
+
+    def _summarize(self, round_num: int, entries: list[tuple[dict, SpecialistVerdict | None]]) -> None:
+        outputs = [output for output, _ in entries]
+        verdicts = [verdict for _, verdict in entries if verdict is not None]
+        round_state = {
+            **self.state,
+            "current_round": round_num,
+            "specialist_outputs": outputs,
+            "meeting_history": [self.records[r] for r in sorted(self.records)],
+            "messages": [],
+        }
+        critique = merge_critiques(round_state, verdicts) if verdicts else None
+        if critique is not None:
+            scores_str = ", ".join(f"{k}={v}" for k, v in critique.scores.items())
+            self.messages.append({
+                "role": "critic",
+                "content": f"[라운드 {round_num}] 전문가 분석을 검토했습니다. (점수: {scores_str})\n{critique.feedback}",
+            })
+        try:
+            summary = run_pi_summary({**round_state, "critique": critique})
+            draft = summary["draft"]
+            self.messages.extend(summary.get("messages", []))
+        except Exception as e:
+            logger.error(f"[PIPELINED] PI summary for round {round_num} failed: {e}")
+            draft = ""
+
+        self.records[round_num] = _round_record(round_num, outputs, critique, draft)
+        self.critiques[round_num] = critique
+        if draft:
+            self.latest_draft = draft
+        self._save(round_num)
+        print(f"[PIPELINED] Round {round_num} landed for all tracks (summary {len(draft)} chars)")
+
+    def wait(self) -> int:
+        """모든 요약 작업 완료 대기 후 마지막 라운드 번호 반환"""
+        # 요약 작업이 더 제출되지 않는 시점(모든 트랙 종료 후)에 호출
+        for future in list(self._pending):
+            future.result()
+        self._summaries.shutdown(wait=True)
+        return self._completed
+
+
+def _track_state(state: AgentState, round_num: int, history: list[dict], **extra) -> dict:
+    return {**state, "current_round": round_num, "meeting_history": history, "messages": [], "sources": [], **extra}
+
+
+def _track_critique(role: str, verdict: SpecialistVerdict | None) -> CritiqueResult:
+    """트랙 한 명분의 비평 결과 (라운드 정책 판단·트랙 history용)"""
+    return CritiqueResult(
+        decision="continue",
+        feedback="",
+        scores={role: verdict.score} if verdict else {},
+        specialist_feedback={role: verdict.feedback} if verdict else {},
+    )
+
+
+def run_pipelined_meeting(state: AgentState, checkpointer=None) -> dict:
+    """전문가별 트랙으로 팀 회의 전체 라운드를 진행 (LangGraph 노드)
+
+    Args:
+        state: 기획 이후 상태
+        checkpointer: 라운드별 진행 기록 저장소 (workflow.graph.create_workflow가 그래프 체크포인트 저장소를 전달).
+            저장된 기록이 있으면 완료된 라운드는 건너뛰고 다음 라운드부터 진행합니다.
+
+    Returns:
+        마지막 라운드의 specialist_outputs, critique, draft와 이전 라운드 meeting_history 등
+        (기본 그래프의 마지막 pi_summary 이후 상태와 같은 키)
+    """
+    team = state.get("team", [])
+    topic = state["topic"]
+    constraints = state.get("constraints", "")
+    _, max_rounds = round_bounds(state)
+
+    print(f"\n{'#'*80}")
+    print(f"[PIPELINED MEETING] {len(team)} specialist tracks, up to {max_rounds} rounds")
+    print(f"  Topic: {topic}")
+    print(f"{'#'*80}\n")
+
+    deadline = float(os.environ.get("SEARCH_DEADLINE_SECONDS", DEFAULT_SEARCH_DEADLINE_SECONDS))
+    searches = _SearchPipeline(topic, state, deadline)
+    board = _RoundBoard(state, team, max_rounds, checkpointer)
+    executor = get_agent_executor()
+    run_id = state.get("run_id", "")
+    if board.checkpointer is not None:
+        progress = load_meeting_progress(board.checkpointer, run_id)
+        restored = board.restore(progress) if progress else 0
+        if restored:
+            print(f"[PIPELINED MEETING] Resuming from checkpoint: rounds 1-{restored} already completed")
+    # 비평 검증용 웹 검색은 라운드마다 같은 검색어이므로 트랙 전체에서 한 번만 실행
+    web_check = executor.submit(critic_web_context, topic, priority=Priority.CRITICAL, run_id=run_id)
+
+    def _critique(round_num: int, role: str, output: dict, history: list[dict]) -> SpecialistVerdict | None:
+        try:
+            return critique_specialist(
+                _track_state(state, round_num, history), output, web_check.result(),
+                make_delta_emitter(f"Critic ({role})", "critique", round=round_num),
+            )
+        except Exception as e:
+            logger.warning(f"[PIPELINED] critique failed for {role} (round {round_num}): {e}")
+            return None
+
+    def _track(index: int, profile: dict) -> None:
+        role = profile.get("role", f"전문가 {index+1}")
+        round_num = 1
+        landed_round = 0
+        try:
+            resumed = board.resume_point(index)
+            if isinstance(resumed, int):
+                # 이전 실행에서 이미 멈춘 트랙
+                landed_round = resumed
+                return
+            if resumed is None:
+                history: list[dict] = []
+                rag_context, web_context, efsa_context = searches.context(index)
+                result = _run_single_specialist(
+                    profile, topic, constraints, rag_context, web_context + efsa_context, index, len(team),
+                    make_delta_emitter(role, "specialist", round=1),
+                )
+                output = {"role": result["role"], "focus": result["focus"], "output": result["output"]}
+                if result["message"]:
+                    board.add_track_messages(1, [result["message"]])
+                verdict = _critique(round_num, role, output, history)
+                board.land(round_num, index, output, verdict)
+            else:
+                round_num, output, verdict, history = resumed
+            landed_round = round_num
+
+            while True:
+                critique = _track_critique(role, verdict)
+                proceed, reason = decide_next_round(_track_state(state, round_num, history, critique=critique))
+                if proceed and verdict and _is_converged(verdict.score, verdict.feedback):
+                    proceed, reason = False, "converged"
+                if not proceed:
+                    board.stop(index, round_num)
+                    print(f"  [TRACK] {role}: stopped after round {round_num} ({reason})")
+                    return
+                history.append(_round_record(round_num, [output], critique, board.latest_draft))
+
+                round_num += 1
+                revised = run_round_revision(_track_state(
+                    state, round_num, history,
+                    team=[profile], specialist_outputs=[output], critique=critique, draft=board.latest_draft,
+                ))
+                output = revised["specialist_outputs"][0]
+                board.add_track_messages(round_num, revised["messages"])
+                verdict = _critique(round_num, role, output, history)
+                board.land(round_num, index, output, verdict)
+                landed_round = round_num
+        except Exception as e:
+            logger.error(f"[PIPELINED] track {role} failed at round {round_num}: {e}")
+        finally:
+            # 도착하지 못한 라운드는 기다리지 않도록 마지막으로 도착한 라운드 기준으로 종료
+            board.finish(index, landed_round)
+
+    # 트랙은 공용 실행기에서 노드 컨텍스트 복사본으로 실행 (스트림 writer 사용 가능)
+    futures = [
+        executor.submit(_track, i, profile, priority=Priority.CRITICAL, run_id=run_id)
+        for i, profile in enumerate(team)
+    ]
+    for future in futures:
+        future.result()
+
+    final_round = board.wait()
+    rag_context, web_context, efsa_context = searches.final()
+
+    if final_round == 0:
+        logger.error("[PIPELINED] no round completed")
+        return {"messages": list(state.get("messages", [])) + [m for _, m in board.track_messages]}
+
+    last = board.records[final_round]
+    collected_sources = list(state.get("sources", []))
+    for text in (rag_context, web_context, efsa_context):
+        collected_sources.extend(_extract_sources(text))
+    for record in board.records.values():
+        for so in record["specialist_outputs"]:
+            collected_sources.extend(_extract_sources(so.get("output", "")))
+
+    print(f"\n[PIPELINED MEETING] Completed {final_round} rounds\n")
+
+    return {
+        "specialist_outputs": last["specialist_outputs"],
+        "critique": board.critiques[final_round],
+        "draft": last["pi_summary"],
+        "current_round": final_round,
+        "meeting_history": [board.records[r] for r in range(1, final_round)],
+        "messages": list(state.get("messages", [])) + [m for _, m in board.track_messages] + board.messages,
+        "sources": list(dict.fromkeys(collected_sources)),
+        "cached_rag_context": rag_context,
+        "cached_web_context": web_context,
+        "cached_efsa_context": efsa_context,
+    }
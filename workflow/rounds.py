@@ -0,0 +1,102 @@
+"""팀 회의 라운드 수 결정 (check_round)
+
+ROUND_MODE=fixed(기본)이면 항상 max_rounds 라운드를 진행합니다.
+ROUND_MODE=adaptive이면 min_rounds 이후 다음 중 하나에 해당할 때 회의를 조기 종료합니다.
+  - target: 모든 전문가의 Critic 점수가 목표 점수(ROUND_TARGET_SCORE) 이상
+  - plateau: 목표 미달 전문가 중 직전 라운드보다 점수가 오른 사람이 없음
+점수가 계속 오르는 동안에는 max_rounds까지 진행하므로, 요청별 max_rounds를 높이면
+어려운 주제는 더 많은 라운드를 쓰고 쉬운 주제는 1~2라운드에서 끝납니다.
+
+min/max 라운드는 환경 변수(ROUND_MIN, ROUND_MAX)로 설정하고,
+요청별 값(state의 max_rounds)이 있으면 그 값이 우선합니다 (ROUND_LIMIT 이하로 제한).
+"""
+import os
+
+DEFAULT_ROUND_MODE = "fixed"
+DEFAULT_MIN_ROUNDS = 1
+DEFAULT_MAX_ROUNDS = 3
+DEFAULT_TARGET_SCORE = 5
+
+# 요청별 max_rounds 상한 (비용 보호)
+ROUND_LIMIT = 6
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def get_round_mode() -> str:
+    """fixed | adaptive"""
+    mode = os.environ.get("ROUND_MODE", DEFAULT_ROUND_MODE).lower()
+    return mode if mode in ("fixed", "adaptive") else DEFAULT_ROUND_MODE
+
+
+def round_bounds(state: dict) -> tuple[int, int]:
+    """(min_rounds, max_rounds) - 요청별 max_rounds가 환경 변수 설정보다 우선"""
+    max_rounds = state.get("max_rounds") or _env_int("ROUND_MAX", DEFAULT_MAX_ROUNDS)
+    max_rounds = max(1, min(int(max_rounds), ROUND_LIMIT))
+    min_rounds = max(1, min(_env_int("ROUND_MIN", DEFAULT_MIN_ROUNDS), max_rounds))
+    return min_rounds, max_rounds
+
+
+def round_label(state: dict) -> str:
+    """로그·프롬프트용 라운드 표기 (예: "2/3")"""
+    return f"{state.get('current_round', 1)}/{round_bounds(state)[1]}"
+
+
+def completed_rounds(state: dict) -> int:
+    """실제로 진행된 라운드 수 (적응형 조기 종료·요청별 max_rounds 반영, 최종 합성 시점 기준)"""
+    return max(int(state.get("current_round") or 1), len(state.get("meeting_history") or []) + 1)
+
+
+def _scores(scores: dict | None) -> dict[str, int]:
+    result = {}
+    for role, score in (scores or {}).items():
+        try:
+            result[role] = int(score)
+        except (TypeError, ValueError):
+            continue
+    return result
+
+
+def decide_next_round(state: dict) -> tuple[bool, str]:
+    """다음 라운드 진행 여부와 사유
+
+    Returns:
+        (continue, reason). reason은 "min_rounds" | "max_rounds" | "fixed" | "target" | "plateau" | "improving"
+    """
+    current_round = state.get("current_round", 1)
+    min_rounds, max_rounds = round_bounds(state)
+
+    if current_round >= max_rounds:
+        return False, "max_rounds"
+    if get_round_mode() == "fixed":
+        return True, "fixed"
+    if current_round < min_rounds:
+        return True, "min_rounds"
+
+    critique = state.get("critique")
+    latest = _scores(critique.scores if critique else None)
+    if not latest:
+        # 점수가 없으면 수렴 여부를 판단할 수 없으므로 계속
+        return True, "improving"
+
+    target = _env_int("ROUND_TARGET_SCORE", DEFAULT_TARGET_SCORE)
+    pending = {role: score for role, score in latest.items() if score < target}
+    # 비평에서 점수가 빠진 전문가는 목표 달성으로 보지 않음
+    unscored = {so.get("role") for so in state.get("specialist_outputs", [])} - set(latest)
+    if not pending:
+        if unscored:
+            return True, "improving"
+        return False, "target"
+
+    history = state.get("meeting_history", [])
+    if history:
+        previous = _scores(history[-1].get("critique_scores"))
+        if not any(score > previous.get(role, 0) for role, score in pending.items()):
+            return False, "plateau"
+
+    return True, "improving"
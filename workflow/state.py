@@ -41,3 +41,6 @@ class AgentState(TypedDict):
     team_selection_data: dict | None  # 10팀 통계적 선별 데이터
     specialist_introductions: list[dict]  # 전문가 자기소개
     word_counts: dict  # 에이전트별 발화 통계
+    run_id: str  # 실행 식별자 (utils.prefetch 선행 작업 조회용)
+    max_rounds: int  # 요청별 최대 라운드 수 (없으면 ROUND_MAX, workflow.rounds 참고)
+    workflow_mode: str  # 실행 방식 lockstep | pipelined (재개 시 같은 구조의 그래프 사용)